@@ -6,11 +6,12 @@ financial calculations and analysis capabilities as RESTful endpoints.
 
 from fastapi import FastAPI, HTTPException, Request, WebSocket, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import List, Optional, Dict, Any, Union
 import logging
 import asyncio
+import time
 
 from .endpoints import (
     financial_api,
@@ -21,6 +22,7 @@ from .endpoints import (
 from .export_endpoints import (
     export_api,
     create_download_response,
+    create_streaming_download_response,
     export_templates
 )
 from .websocket_server import (
@@ -37,8 +39,29 @@ from .auth_endpoints import (
     PasswordReset,
     TokenData
 )
+from .auth import run_in_password_pool
+from .batch import (
+    MAX_BATCH_SIZE,
+    BatchValidationError,
+    complete_batch,
+    iter_ndjson,
+    plan_financial_batch,
+    plan_industry_batch
+)
+from .execution import (
+    get_execution_stats,
+    loop_lag_monitor,
+    run_cpu,
+    run_io,
+    shutdown_executors
+)
+from .responses import CompressionMiddleware, FastJSONResponse, FastJSONRoute
 from .audit_endpoints import audit_api
 from .customization_endpoints import customization_api
+from performance.monitor import PROMETHEUS_CONTENT_TYPE, get_metrics
+from performance.telemetry import ENDPOINT_PREFIX, clear_caches, collect_telemetry
+from utils.audit_logger import audit_logger
+from utils.cache_manager import CacheManager, calculation_cache, monte_carlo_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -50,8 +73,11 @@ app = FastAPI(
     description="RESTful API for AI investment analysis and financial calculations with authentication",
     version="1.1.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=FastJSONResponse
 )
+# Render returned payloads with orjson instead of FastAPI's jsonable_encoder
+app.router.route_class = FastJSONRoute
 
 # Configure CORS
 app.add_middleware(
@@ -61,6 +87,22 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(CompressionMiddleware)
+
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """Record per-endpoint latency for the performance telemetry."""
+    start_time = time.perf_counter_ns()
+    response = await call_next(request)
+    # Use the route template so path parameters do not create new series
+    path = getattr(request.scope.get("route"), "path", "unmatched")
+    get_metrics().record_ns(
+        f"{ENDPOINT_PREFIX}{request.method} {path}",
+        time.perf_counter_ns() - start_time,
+        {"status_code": response.status_code}
+    )
+    return response
 
 
 # Pydantic models for request/response validation
@@ -158,7 +200,7 @@ async def health_check():
 @app.post("/api/auth/login")
 async def login(request: LoginRequest):
     """User login endpoint."""
-    result = auth_api.login(request)
+    result = await run_in_password_pool(auth_api.login, request)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -167,7 +209,7 @@ async def login(request: LoginRequest):
 @app.post("/api/auth/register")
 async def register(request: UserCreate):
     """User registration endpoint."""
-    result = auth_api.register(request)
+    result = await run_in_password_pool(auth_api.register, request)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -185,7 +227,7 @@ async def refresh_token(request: Dict[str, str]):
 @app.get("/api/auth/profile")
 async def get_profile(current_user: TokenData = Depends(get_current_user)):
     """Get current user profile."""
-    result = auth_api.get_profile(current_user.username)
+    result = await run_io("auth", auth_api.get_profile, current_user.username)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -197,7 +239,9 @@ async def change_password(
     current_user: TokenData = Depends(get_current_user)
 ):
     """Change user password."""
-    result = auth_api.change_password(current_user.username, request)
+    result = await run_in_password_pool(
+        auth_api.change_password, current_user.username, request
+    )
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -206,7 +250,7 @@ async def change_password(
 @app.get("/api/auth/users")
 async def list_users(current_user: TokenData = Depends(require_permission("admin:users"))):
     """List all users (admin only)."""
-    result = auth_api.list_users()
+    result = await run_io("auth", auth_api.list_users)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -218,7 +262,7 @@ async def create_user_admin(
     current_user: TokenData = Depends(require_permission("admin:users"))
 ):
     """Create new user (admin only)."""
-    result = auth_api.create_user_admin(request)
+    result = await run_in_password_pool(auth_api.create_user_admin, request)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -231,7 +275,7 @@ async def update_user(
     current_user: TokenData = Depends(require_permission("admin:users"))
 ):
     """Update user information (admin only)."""
-    result = auth_api.update_user(username, request)
+    result = await run_io("auth", auth_api.update_user, username, request)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -243,7 +287,7 @@ async def delete_user(
     current_user: TokenData = Depends(require_permission("admin:users"))
 ):
     """Delete user (admin only)."""
-    result = auth_api.delete_user(username)
+    result = await run_io("auth", auth_api.delete_user, username)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -255,7 +299,7 @@ async def generate_api_key(
     current_user: TokenData = Depends(get_current_user)
 ):
     """Generate API key for programmatic access."""
-    result = auth_api.create_api_key(current_user.username, request)
+    result = await run_io("auth", auth_api.create_api_key, current_user.username, request)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -292,10 +336,46 @@ async def calculate_irr(request: IRRRequest):
     return result
 
 
+async def run_cpu_cached(
+    route: str,
+    endpoint: str,
+    cache: CacheManager,
+    func,
+    request_data: Dict[str, Any]
+) -> Dict:
+    """Run an API call in a worker process, caching its response here.
+    
+    Worker processes hold their own copies of the calculation caches, which
+    the cache statistics and clear endpoints never see. Responses are
+    therefore looked up and stored in the API process, around ``run_cpu``.
+    Errors are not cached.
+    """
+    start_time = time.perf_counter()
+    key = cache._make_key(func.__qualname__, (request_data,), {})
+    result = cache.get(key)
+    if result is not None:
+        audit_logger.log_api_call(
+            endpoint=endpoint,
+            method="POST",
+            user="anonymous",
+            status_code=200,
+            duration_ms=(time.perf_counter() - start_time) * 1000
+        )
+        return result
+    
+    result = await run_cpu(route, func, request_data)
+    if result["status"] != "error":
+        cache.set(key, result)
+    return result
+
+
 @app.post("/api/financial/comprehensive-roi")
 async def calculate_comprehensive_roi(request: ComprehensiveROIRequest):
     """Calculate comprehensive ROI metrics."""
-    result = financial_api.comprehensive_roi(request.dict())
+    result = await run_cpu_cached(
+        "financial", "financial/comprehensive_roi", calculation_cache,
+        financial_api.comprehensive_roi, request.dict()
+    )
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -311,7 +391,10 @@ async def get_cache_stats():
 @app.post("/api/scenario/monte-carlo")
 async def run_monte_carlo(request: MonteCarloRequest):
     """Run Monte Carlo simulation."""
-    result = scenario_api.monte_carlo(request.dict())
+    result = await run_cpu_cached(
+        "scenario", "scenario/monte_carlo", monte_carlo_cache,
+        scenario_api.monte_carlo, request.dict()
+    )
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -320,7 +403,10 @@ async def run_monte_carlo(request: MonteCarloRequest):
 @app.post("/api/scenario/sensitivity")
 async def run_sensitivity_analysis(request: SensitivityRequest):
     """Run sensitivity analysis."""
-    result = scenario_api.sensitivity_analysis(request.dict())
+    result = await run_cpu_cached(
+        "scenario", "scenario/sensitivity", monte_carlo_cache,
+        scenario_api.sensitivity_analysis, request.dict()
+    )
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -330,7 +416,7 @@ async def run_sensitivity_analysis(request: SensitivityRequest):
 @app.post("/api/industry/manufacturing/roi")
 async def calculate_manufacturing_roi(request: ManufacturingROIRequest):
     """Calculate manufacturing industry ROI."""
-    result = industry_api.manufacturing_roi(request.dict())
+    result = await run_cpu("industry", industry_api.manufacturing_roi, request.dict())
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -339,7 +425,7 @@ async def calculate_manufacturing_roi(request: ManufacturingROIRequest):
 @app.post("/api/industry/healthcare/roi")
 async def calculate_healthcare_roi(request: HealthcareROIRequest):
     """Calculate healthcare industry ROI."""
-    result = industry_api.healthcare_roi(request.dict())
+    result = await run_cpu("industry", industry_api.healthcare_roi, request.dict())
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -348,7 +434,7 @@ async def calculate_healthcare_roi(request: HealthcareROIRequest):
 @app.post("/api/industry/financial-services/roi")
 async def calculate_financial_services_roi(request: FinancialServicesROIRequest):
     """Calculate financial services industry ROI."""
-    result = industry_api.financial_services_roi(request.dict())
+    result = await run_cpu("industry", industry_api.financial_services_roi, request.dict())
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -357,7 +443,7 @@ async def calculate_financial_services_roi(request: FinancialServicesROIRequest)
 @app.post("/api/industry/retail/roi")
 async def calculate_retail_roi(request: RetailROIRequest):
     """Calculate retail industry ROI."""
-    result = industry_api.retail_roi(request.dict())
+    result = await run_cpu("industry", industry_api.retail_roi, request.dict())
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -375,12 +461,164 @@ async def get_industry_benchmarks(industry: str):
 @app.post("/api/industry/optimal-strategy")
 async def get_optimal_strategy(request: StrategyRequest):
     """Get optimal AI implementation strategy."""
-    result = industry_api.optimal_strategy(request.dict())
+    result = await run_cpu("industry", industry_api.optimal_strategy, request.dict())
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
 
 
+# Batch endpoints
+class FinancialBatchRequest(BaseModel):
+    cash_flows: List[List[float]] = Field(
+        ..., max_length=MAX_BATCH_SIZE, description="Annual cash flows per investment"
+    )
+    initial_investment: List[float] = Field(..., description="Initial investment per investment")
+    discount_rate: Union[float, List[float]] = Field(
+        0.10, description="One discount rate for all investments or one per investment"
+    )
+    metrics: List[str] = Field(["npv", "irr"], description="Outputs to calculate")
+    stream: bool = Field(False, description="Stream one NDJSON row per investment")
+
+
+class IndustryBatchRequest(BaseModel):
+    items: List[Dict[str, Any]] = Field(
+        ..., max_length=MAX_BATCH_SIZE, description="Industry ROI requests naming their industry"
+    )
+    include_details: bool = Field(False, description="Include the full result of every item")
+    stream: bool = Field(False, description="Stream one NDJSON row per item")
+
+
+INDUSTRY_ROI_REQUESTS = {
+    "manufacturing": ManufacturingROIRequest,
+    "healthcare": HealthcareROIRequest,
+    "financial_services": FinancialServicesROIRequest,
+    "retail": RetailROIRequest,
+}
+
+# One validator per industry, so each industry's items are validated in one call
+_industry_batch_adapters = {
+    industry: TypeAdapter(List[model]) for industry, model in INDUSTRY_ROI_REQUESTS.items()
+}
+
+
+def validate_industry_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Validate industry batch items against their industry's request model.
+    
+    Returns the items with defaults filled in; errors are reported with the
+    index of the item in the batch.
+    """
+    rows_by_industry: Dict[Any, List[int]] = {}
+    for row, item in enumerate(items):
+        rows_by_industry.setdefault(item.get("industry"), []).append(row)
+    
+    unknown = [
+        row for industry, rows in rows_by_industry.items()
+        if industry not in INDUSTRY_ROI_REQUESTS for row in rows
+    ]
+    if unknown:
+        raise HTTPException(status_code=422, detail={
+            "message": f"industry must be one of {list(INDUSTRY_ROI_REQUESTS)}",
+            "rows": unknown[:100]
+        })
+    
+    validated: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    for industry, rows in rows_by_industry.items():
+        try:
+            models = _industry_batch_adapters[industry].validate_python(
+                [items[row] for row in rows]
+            )
+        except ValidationError as e:
+            errors = e.errors(include_url=False, include_context=False, include_input=False)
+            raise HTTPException(status_code=422, detail=[
+                {**error, "loc": ["items", rows[error["loc"][0]], *error["loc"][1:]]}
+                for error in errors[:100]
+            ])
+        for row, model in zip(rows, models):
+            validated[row] = {"industry": industry, **model.model_dump()}
+    return validated
+
+
+async def evaluate_batch(
+    route: str,
+    endpoint: str,
+    plan_batch,
+    request_data: Dict[str, Any],
+    user: str
+) -> Dict:
+    """Evaluate a batch, computing only the rows missing from the batch cache.
+    
+    The batch cache lives in the API process, so rows are deduplicated,
+    looked up and cached here, on the thread pool to keep large batches off
+    the event loop, and only the misses are sent to a worker process.
+    """
+    start_time = time.perf_counter()
+    try:
+        plan = await run_io(route, plan_batch, **request_data)
+        computed = []
+        if plan.missing:
+            func, args = plan.task
+            computed = await run_cpu(route, func, *args)
+        result = APIResponse.success(await run_io(route, complete_batch, plan, computed))
+    except BatchValidationError as e:
+        result = APIResponse.error(str(e), 400, {"rows": e.rows})
+    except HTTPException:
+        # Route limiter rejections keep their 503 and Retry-After
+        raise
+    except Exception as e:
+        logger.error(f"Batch calculation failed: {str(e)}", exc_info=True)
+        result = APIResponse.error(f"Batch calculation failed: {str(e)}", 500)
+    
+    audit_logger.log_api_call(
+        endpoint=endpoint,
+        method="POST",
+        user=user,
+        status_code=result.get("code", 200),
+        duration_ms=(time.perf_counter() - start_time) * 1000
+    )
+    return result
+
+
+def batch_response(result: Dict, stream: bool):
+    """Return batch results as JSON columns or streamed NDJSON rows."""
+    if result["status"] == "error":
+        raise HTTPException(
+            status_code=result["code"],
+            detail={"message": result["message"], **result["details"]}
+        )
+    if stream:
+        return StreamingResponse(
+            iter_ndjson(result["data"]["columns"]), media_type="application/x-ndjson"
+        )
+    return result
+
+
+@app.post("/api/financial/batch")
+async def calculate_financial_batch(
+    request: FinancialBatchRequest,
+    current_user: TokenData = Depends(require_permission("read:calculations"))
+):
+    """Calculate NPV and IRR for many investments (requires authentication)."""
+    result = await evaluate_batch(
+        "financial", "financial/batch", plan_financial_batch,
+        request.dict(exclude={"stream"}), current_user.username
+    )
+    return batch_response(result, request.stream)
+
+
+@app.post("/api/industry/batch")
+async def calculate_industry_batch(
+    request: IndustryBatchRequest,
+    current_user: TokenData = Depends(require_permission("read:calculations"))
+):
+    """Calculate industry ROI for many requests (requires authentication)."""
+    items = validate_industry_items(request.items)
+    result = await evaluate_batch(
+        "industry", "industry/batch", plan_industry_batch,
+        {"items": items, "include_details": request.include_details}, current_user.username
+    )
+    return batch_response(result, request.stream)
+
+
 # Export endpoints
 class ExportRequest(BaseModel):
     results: Dict[str, Any] = Field(..., description="Calculation results to export")
@@ -397,7 +635,7 @@ class BatchExportRequest(BaseModel):
 @app.post("/api/export/financial")
 async def export_financial_results(request: ExportRequest):
     """Export financial calculation results."""
-    result = export_api.export_financial_results(request.dict())
+    result = await run_cpu("export", export_api.export_financial_results, request.dict())
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     
@@ -414,7 +652,7 @@ async def export_financial_results(request: ExportRequest):
 @app.post("/api/export/monte-carlo")
 async def export_monte_carlo_results(request: ExportRequest):
     """Export Monte Carlo simulation results."""
-    result = export_api.export_monte_carlo_results(request.dict())
+    result = await run_cpu("export", export_api.export_monte_carlo_results, request.dict())
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     
@@ -430,7 +668,7 @@ async def export_monte_carlo_results(request: ExportRequest):
 @app.post("/api/export/batch")
 async def export_batch_results(request: BatchExportRequest):
     """Export multiple results in batch."""
-    result = export_api.export_batch_results(request.dict())
+    result = await run_cpu("export", export_api.export_batch_results, request.dict())
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     
@@ -449,12 +687,39 @@ async def get_export_formats():
     return export_api.get_supported_formats()
 
 
+# Performance telemetry endpoints (protected)
+@app.get("/api/performance/telemetry")
+async def get_performance_telemetry(
+    current_user: TokenData = Depends(require_permission("read:all"))
+):
+    """Get latency histograms, cache hit rates, worker memory and pool state."""
+    return APIResponse.success({**collect_telemetry(), "execution": get_execution_stats()})
+
+
+@app.get("/api/performance/metrics", response_class=PlainTextResponse)
+async def get_prometheus_metrics(
+    current_user: TokenData = Depends(require_permission("read:all"))
+):
+    """Export operation latency histograms in the Prometheus text format."""
+    return PlainTextResponse(
+        get_metrics().export_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE
+    )
+
+
+@app.post("/api/performance/cache/clear")
+async def clear_performance_caches(
+    current_user: TokenData = Depends(require_permission("admin:settings"))
+):
+    """Flush every registered cache layer (admin only)."""
+    return APIResponse.success(clear_caches(), "Caches cleared")
+
+
 # Error handling
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
     logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=500,
         content=APIResponse.error(
             "An unexpected error occurred",
@@ -476,6 +741,7 @@ async def api_info():
                 "/api/financial/npv",
                 "/api/financial/irr",
                 "/api/financial/comprehensive-roi",
+                "/api/financial/batch",
                 "/api/financial/cache-stats"
             ],
             "scenario": [
@@ -488,7 +754,8 @@ async def api_info():
                 "/api/industry/financial-services/roi",
                 "/api/industry/retail/roi",
                 "/api/industry/{industry}/benchmarks",
-                "/api/industry/optimal-strategy"
+                "/api/industry/optimal-strategy",
+                "/api/industry/batch"
             ],
             "export": [
                 "/api/export/financial",
@@ -496,6 +763,11 @@ async def api_info():
                 "/api/export/batch",
                 "/api/export/formats"
             ],
+            "performance": [
+                "/api/performance/telemetry",
+                "/api/performance/metrics",
+                "/api/performance/cache/clear"
+            ],
             "documentation": [
                 "/api/docs",
                 "/api/redoc"
@@ -538,7 +810,7 @@ async def search_audit_logs(
     current_user: TokenData = Depends(require_permission("read:all"))
 ):
     """Search audit logs (admin only)."""
-    result = audit_api.search_logs(request, current_user)
+    result = await run_io("audit", audit_api.search_logs, request, current_user)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -546,10 +818,11 @@ async def search_audit_logs(
 
 @app.get("/api/audit/stats")
 async def get_audit_stats(
+    window_hours: float = 24,
     current_user: TokenData = Depends(require_permission("read:all"))
 ):
     """Get audit statistics (admin only)."""
-    result = audit_api.get_statistics(current_user=current_user)
+    result = audit_api.get_statistics({"window_hours": window_hours}, current_user=current_user)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -560,7 +833,7 @@ async def get_recent_activity(
     current_user: TokenData = Depends(get_current_user)
 ):
     """Get recent activity."""
-    result = audit_api.get_recent_activity(current_user=current_user)
+    result = await run_io("audit", audit_api.get_recent_activity, current_user=current_user)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -572,7 +845,7 @@ async def get_user_activity(
     current_user: TokenData = Depends(get_current_user)
 ):
     """Get user activity (own activity or admin only)."""
-    result = audit_api.get_user_activity(username, current_user=current_user)
+    result = await run_io("audit", audit_api.get_user_activity, username, current_user=current_user)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -583,19 +856,27 @@ async def export_audit_logs(
     request: Dict[str, Any],
     current_user: TokenData = Depends(require_permission("admin:users"))
 ):
-    """Export audit logs (admin only)."""
-    result = audit_api.export_logs(request, current_user)
+    """Export audit logs (admin only) as a streamed download."""
+    result = await run_io("audit", audit_api.export_logs, request, current_user)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
-    return result
+    export = result["data"]
+    return create_streaming_download_response(
+        export["content"],
+        export["filename"],
+        export["media_type"]
+    )
 
 
 @app.get("/api/audit/calculation-history")
 async def get_calculation_history(
+    window_hours: float = 24,
     current_user: TokenData = Depends(get_current_user)
 ):
     """Get calculation history with performance metrics."""
-    result = audit_api.get_calculation_history(current_user=current_user)
+    result = audit_api.get_calculation_history(
+        {"window_hours": window_hours}, current_user=current_user
+    )
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -606,7 +887,7 @@ async def get_security_events(
     current_user: TokenData = Depends(require_permission("admin:users"))
 ):
     """Get security events (admin only)."""
-    result = audit_api.get_security_events(current_user=current_user)
+    result = await run_io("audit", audit_api.get_security_events, current_user=current_user)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -616,7 +897,7 @@ async def get_security_events(
 @app.get("/api/customization/themes")
 async def get_themes(current_user: TokenData = Depends(get_current_user)):
     """Get available themes."""
-    result = customization_api.get_themes(current_user=current_user)
+    result = await run_io("customization", customization_api.get_themes, current_user=current_user)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -628,7 +909,7 @@ async def create_theme(
     current_user: TokenData = Depends(get_current_user)
 ):
     """Create custom theme."""
-    result = customization_api.create_theme(request, current_user)
+    result = await run_io("customization", customization_api.create_theme, request, current_user)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -637,7 +918,7 @@ async def create_theme(
 @app.get("/api/customization/layouts")
 async def get_layouts(current_user: TokenData = Depends(get_current_user)):
     """Get available layouts."""
-    result = customization_api.get_layouts(current_user=current_user)
+    result = await run_io("customization", customization_api.get_layouts, current_user=current_user)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -649,7 +930,7 @@ async def create_layout(
     current_user: TokenData = Depends(get_current_user)
 ):
     """Create custom layout."""
-    result = customization_api.create_layout(request, current_user)
+    result = await run_io("customization", customization_api.create_layout, request, current_user)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -658,7 +939,9 @@ async def create_layout(
 @app.get("/api/customization/views")
 async def get_saved_views(current_user: TokenData = Depends(get_current_user)):
     """Get saved views."""
-    result = customization_api.get_saved_views(current_user=current_user)
+    result = await run_io(
+        "customization", customization_api.get_saved_views, current_user=current_user
+    )
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -670,7 +953,7 @@ async def save_view(
     current_user: TokenData = Depends(get_current_user)
 ):
     """Save dashboard view."""
-    result = customization_api.save_view(request, current_user)
+    result = await run_io("customization", customization_api.save_view, request, current_user)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -682,7 +965,7 @@ async def apply_view(
     current_user: TokenData = Depends(get_current_user)
 ):
     """Apply saved view."""
-    result = customization_api.apply_view(request, current_user)
+    result = await run_io("customization", customization_api.apply_view, request, current_user)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -694,7 +977,7 @@ async def delete_view(
     current_user: TokenData = Depends(get_current_user)
 ):
     """Delete saved view."""
-    result = customization_api.delete_view(request, current_user)
+    result = await run_io("customization", customization_api.delete_view, request, current_user)
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -703,7 +986,9 @@ async def delete_view(
 @app.get("/api/customization/preferences")
 async def get_preferences(current_user: TokenData = Depends(get_current_user)):
     """Get user preferences."""
-    result = customization_api.get_preferences(current_user=current_user)
+    result = await run_io(
+        "customization", customization_api.get_preferences, current_user=current_user
+    )
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -715,7 +1000,9 @@ async def update_preferences(
     current_user: TokenData = Depends(get_current_user)
 ):
     """Update user preferences."""
-    result = customization_api.update_preferences(request, current_user)
+    result = await run_io(
+        "customization", customization_api.update_preferences, request, current_user
+    )
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -724,7 +1011,9 @@ async def update_preferences(
 @app.get("/api/customization/export")
 async def export_configuration(current_user: TokenData = Depends(get_current_user)):
     """Export customization configuration."""
-    result = customization_api.export_configuration(current_user=current_user)
+    result = await run_io(
+        "customization", customization_api.export_configuration, current_user=current_user
+    )
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -736,7 +1025,9 @@ async def import_configuration(
     current_user: TokenData = Depends(get_current_user)
 ):
     """Import customization configuration."""
-    result = customization_api.import_configuration(request, current_user)
+    result = await run_io(
+        "customization", customization_api.import_configuration, request, current_user
+    )
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -745,7 +1036,9 @@ async def import_configuration(
 @app.get("/api/customization/widgets/types")
 async def get_widget_types(current_user: TokenData = Depends(get_current_user)):
     """Get available widget types."""
-    result = customization_api.get_widget_types(current_user=current_user)
+    result = await run_io(
+        "customization", customization_api.get_widget_types, current_user=current_user
+    )
     if result["status"] == "error":
         raise HTTPException(status_code=result["code"], detail=result["message"])
     return result
@@ -763,6 +1056,7 @@ async def websocket_handler(websocket: WebSocket):
 async def startup_event():
     """Initialize background tasks on startup."""
     await start_background_tasks()
+    loop_lag_monitor.start()
     logger.info("API server started with WebSocket support")
 
 
@@ -770,6 +1064,8 @@ async def startup_event():
 async def shutdown_event():
     """Clean up on shutdown."""
     stop_background_tasks()
+    await loop_lag_monitor.stop()
+    shutdown_executors()
     logger.info("API server shutting down")
 
 
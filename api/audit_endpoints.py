@@ -8,6 +8,7 @@ from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from fastapi import Depends
 
+from utils.audit_export import MEDIA_TYPES
 from utils.audit_logger import audit_logger, AuditEventType, AuditSeverity
 from .endpoints import APIResponse, log_api_call
 from .auth_endpoints import get_current_user, require_permission, TokenData
@@ -84,9 +85,16 @@ class AuditAPI:
         request_data: Dict = None,
         current_user: TokenData = None
     ) -> Dict:
-        """Get audit log statistics."""
+        """Get audit log statistics.
+        
+        Request:
+            {
+                "window_hours": 24  # optional, window of the breakdowns
+            }
+        """
         try:
-            stats = audit_logger.get_stats()
+            window_hours = float((request_data or {}).get("window_hours", 24))
+            stats = audit_logger.get_stats(window=timedelta(hours=window_hours))
             
             return APIResponse.success(stats)
             
@@ -187,17 +195,23 @@ class AuditAPI:
         
         Request:
             {
-                "format": "json",  # or "csv"
+                "format": "json",  # or "ndjson", "csv", "parquet"
                 "filters": {
                     "event_type": "calculation",
+                    "user": "username",
+                    "severity": "error",
                     "start_date": "2024-01-01T00:00:00",
                     "end_date": "2024-01-31T23:59:59"
                 }
             }
+        
+        Returns the export as ``content``, an iterator of encoded chunks read
+        from the audit store as it is consumed.
         """
         try:
             format = request_data.get("format", "json")
-            filters = request_data.get("filters", {})
+            filters = dict(request_data.get("filters", {}))
+            filters.pop("limit", None)
             
             # Parse filters
             if filters.get("start_date"):
@@ -206,32 +220,34 @@ class AuditAPI:
                 filters["end_time"] = datetime.fromisoformat(filters.pop("end_date"))
             if filters.get("event_type"):
                 filters["event_type"] = AuditEventType(filters["event_type"])
+            if filters.get("severity"):
+                filters["severity"] = AuditSeverity(filters["severity"])
+            
+            content = audit_logger.iter_export(format=format, filters=filters)
+            record_count = audit_logger.count(**filters)
             
             # Generate filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"audit_logs_{timestamp}.{format}"
             
-            # Export logs
-            output_path = audit_logger.export_logs(
-                output_file=filename,
-                format=format,
-                filters=filters
-            )
-            
             # Audit the export itself
             audit_logger.log_data_export(
                 export_type="audit_logs",
                 format=format,
                 user=current_user.username if current_user else "anonymous",
-                record_count=len(audit_logger.search(**filters))
+                record_count=record_count
             )
             
             return APIResponse.success({
                 "filename": filename,
                 "format": format,
-                "message": f"Audit logs exported to {filename}"
+                "media_type": MEDIA_TYPES[format],
+                "record_count": record_count,
+                "content": content
             })
             
+        except (ValueError, TypeError) as e:
+            return APIResponse.error(str(e), 400)
         except Exception as e:
             logger.error(f"Audit export error: {e}")
             return APIResponse.error("Failed to export audit logs", 500)
@@ -242,39 +258,27 @@ class AuditAPI:
         request_data: Dict = None,
         current_user: TokenData = None
     ) -> Dict:
-        """Get calculation history with performance metrics."""
+        """Get calculation history with performance metrics.
+        
+        Per-type counts, cache-hit rates and duration percentiles come from
+        the audit rollups, covering every calculation in the window.
+        
+        Request:
+            {
+                "window_hours": 24  # optional
+            }
+        """
         try:
-            # Get calculation entries
+            window_hours = float((request_data or {}).get("window_hours", 24))
+            calc_stats = audit_logger.rollup("calculation", timedelta(hours=window_hours))
+            
             entries = audit_logger.search(
                 event_type=AuditEventType.CALCULATION,
-                limit=100
+                limit=10
             )
             
-            # Analyze performance
-            calc_stats = {}
-            for entry in entries:
-                calc_type = entry.details.get("calculation_type")
-                if calc_type not in calc_stats:
-                    calc_stats[calc_type] = {
-                        "count": 0,
-                        "total_duration_ms": 0,
-                        "cache_hits": 0,
-                        "avg_duration_ms": 0
-                    }
-                
-                stats = calc_stats[calc_type]
-                stats["count"] += 1
-                
-                duration = entry.details.get("duration_ms", 0)
-                stats["total_duration_ms"] += duration
-                
-                if entry.details.get("cache_hit"):
-                    stats["cache_hits"] += 1
-                
-                stats["avg_duration_ms"] = stats["total_duration_ms"] / stats["count"]
-                stats["cache_hit_rate"] = stats["cache_hits"] / stats["count"]
-            
             return APIResponse.success({
+                "window_hours": window_hours,
                 "calculation_stats": calc_stats,
                 "recent_calculations": [
                     {
@@ -284,7 +288,7 @@ class AuditAPI:
                         "duration_ms": e.details.get("duration_ms"),
                         "cache_hit": e.details.get("cache_hit")
                     }
-                    for e in entries[:10]
+                    for e in entries
                 ]
             })
             
@@ -5,15 +5,28 @@ and role-based access control.
 """
 
 import os
+import asyncio
+import atexit
+import hashlib
 import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Callable, Optional, Dict, Any, List, Set, Tuple
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 from pydantic import BaseModel, EmailStr, Field
 import json
 from pathlib import Path
 
+from performance.monitor import get_metrics
+from performance.telemetry import register_cache_layer
+
 logger = logging.getLogger(__name__)
 
 # Security configuration
@@ -21,9 +34,28 @@ SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
+# User database and how often batched last_login values are written
+USER_DB_PATH = os.getenv("USER_DB_PATH", "users.db")
+LAST_LOGIN_FLUSH_SECONDS = float(os.getenv("LAST_LOGIN_FLUSH_SECONDS", "30"))
+# Verified tokens kept in memory (see TokenCache)
+TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000"))
+# Seconds a verified token is trusted before the user is looked up again
+TOKEN_CACHE_TTL = float(os.getenv("AUTH_TOKEN_CACHE_TTL", "30"))
+
+USER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    email TEXT,
+    last_login TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_users_email ON users (email);
+"""
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Concurrent bcrypt operations; each keeps a CPU busy for 100-300 ms
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
 
 # User roles
 class UserRole:
@@ -62,6 +94,39 @@ ROLE_PERMISSIONS = {
     ]
 }
 
+# One bit per permission, and each role's permissions as a bitmask
+PERMISSION_BITS = {
+    permission: 1 << i
+    for i, permission in enumerate(
+        sorted({p for permissions in ROLE_PERMISSIONS.values() for p in permissions})
+    )
+}
+ROLE_PERMISSION_MASKS = {
+    role: sum(PERMISSION_BITS[p] for p in set(permissions))
+    for role, permissions in ROLE_PERMISSIONS.items()
+}
+
+
+@lru_cache(maxsize=256)
+def _granting_mask(permission: str) -> int:
+    """Bits granting a permission: its own and its ``action:all`` wildcard."""
+    mask = PERMISSION_BITS.get(permission, 0)
+    permission_parts = permission.split(":")
+    if len(permission_parts) == 2:
+        mask |= PERMISSION_BITS.get(f"{permission_parts[0]}:all", 0)
+    return mask
+
+
+def role_has_permission(role: Optional[str], permission: str) -> bool:
+    """Check a permission against a role's precomputed bitmask."""
+    return bool(ROLE_PERMISSION_MASKS.get(role, 0) & _granting_mask(permission))
+
+
+def scopes_have_permission(scopes: List[str], permission: str) -> bool:
+    """Check a permission against an explicit list, such as an API key's."""
+    mask = sum(PERMISSION_BITS.get(scope, 0) for scope in set(scopes))
+    return bool(mask & _granting_mask(permission))
+
 
 # Pydantic models
 class UserBase(BaseModel):
@@ -103,6 +168,8 @@ class TokenData(BaseModel):
     """Token payload data."""
     username: Optional[str] = None
     scopes: List[str] = []
+    role: Optional[str] = None
+    token_type: Optional[str] = None
 
 
 class LoginRequest(BaseModel):
@@ -118,35 +185,96 @@ class PasswordReset(BaseModel):
 
 
 class UserDatabase:
-    """Simple file-based user database."""
+    """SQLite user database.
+    
+    Each user is one row, so creating, updating or deleting a user writes
+    only that row. The database runs in WAL mode: several worker processes
+    can read while one writes, and updates run in ``BEGIN IMMEDIATE``
+    transactions so concurrent read-modify-writes do not lose changes.
     
-    def __init__(self, db_path: str = "users.json"):
+    ``last_login`` is recorded in memory by ``record_login`` and written in
+    one batch at most every ``login_flush_interval`` seconds. A legacy
+    ``users.json`` next to the database is imported on first use.
+    """
+    
+    def __init__(
+        self,
+        db_path: str = USER_DB_PATH,
+        login_flush_interval: float = LAST_LOGIN_FLUSH_SECONDS
+    ):
         """Initialize user database."""
         self.db_path = Path(db_path)
-        self.users: Dict[str, Dict[str, Any]] = {}
-        self._load_users()
+        self.login_flush_interval = login_flush_interval
+        self._local = threading.local()
+        self._listeners: List[Callable[[str], None]] = []
+        self._pending_logins: Dict[str, str] = {}
+        self._logins_lock = threading.Lock()
+        self._last_login_flush = time.monotonic()
+        
+        with self._connection() as conn:
+            conn.executescript(USER_SCHEMA)
+        self._import_legacy_json(self.db_path.with_name("users.json"))
         
         # Create default admin user if no users exist
-        if not self.users:
+        if not self._connection().execute("SELECT 1 FROM users LIMIT 1").fetchone():
             self._create_default_admin()
+        
+        atexit.register(self.flush_logins)
     
-    def _load_users(self):
-        """Load users from file."""
-        if self.db_path.exists():
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, reopened after a fork."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+    
+    @contextmanager
+    def _write(self):
+        """Run statements in one immediate (write-locked) transaction."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    
+    def _import_legacy_json(self, json_path: Path):
+        """Import users from the former ``users.json`` store once."""
+        if not json_path.exists() or json_path == self.db_path:
+            return
+        with self._write() as conn:
+            # Workers starting together queue on the write lock; only the
+            # first still finds the file
+            if not json_path.exists():
+                return
             try:
-                with open(self.db_path, 'r') as f:
-                    self.users = json.load(f)
+                with open(json_path, 'r') as f:
+                    users = json.load(f)
             except Exception as e:
                 logger.error(f"Error loading users: {e}")
-                self.users = {}
+                return
+            conn.executemany(
+                "INSERT OR IGNORE INTO users (username, email, last_login, data) "
+                "VALUES (?, ?, ?, ?)",
+                [self._row(user) for user in users.values()]
+            )
+            json_path.rename(json_path.with_suffix(".json.imported"))
+        logger.info(f"Imported {len(users)} users from {json_path}")
     
-    def _save_users(self):
-        """Save users to file."""
-        try:
-            with open(self.db_path, 'w') as f:
-                json.dump(self.users, f, indent=2, default=str)
-        except Exception as e:
-            logger.error(f"Error saving users: {e}")
+    @staticmethod
+    def _row(user: Dict[str, Any]) -> tuple:
+        return (
+            user["username"],
+            user.get("email"),
+            user.get("last_login"),
+            json.dumps(user, default=str)
+        )
     
     def _create_default_admin(self):
         """Create default admin user."""
@@ -160,58 +288,258 @@ class UserDatabase:
             "created_at": datetime.utcnow().isoformat(),
             "last_login": None
         }
-        self.users["admin"] = admin_user
-        self._save_users()
+        with self._write() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO users (username, email, last_login, data) "
+                "VALUES (?, ?, ?, ?)",
+                self._row(admin_user)
+            )
         logger.info("Default admin user created (username: admin, password: admin123)")
     
+    def add_listener(self, callback: Callable[[str], None]):
+        """Call ``callback(username)`` whenever a user is updated or deleted."""
+        self._listeners.append(callback)
+    
+    def _notify(self, username: str):
+        for callback in self._listeners:
+            callback(username)
+    
+    def _load(self, row) -> Dict[str, Any]:
+        user = json.loads(row[0])
+        user["last_login"] = self._pending_logins.get(user["username"], row[1])
+        return user
+    
     def get_user(self, username: str) -> Optional[Dict[str, Any]]:
         """Get user by username."""
-        return self.users.get(username)
+        row = self._connection().execute(
+            "SELECT data, last_login FROM users WHERE username = ?", (username,)
+        ).fetchone()
+        return self._load(row) if row else None
+    
+    def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """Get user by email address."""
+        row = self._connection().execute(
+            "SELECT data, last_login FROM users WHERE email = ?", (email,)
+        ).fetchone()
+        return self._load(row) if row else None
     
     def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create new user."""
         username = user_data["username"]
-        if username in self.users:
+        try:
+            with self._write() as conn:
+                conn.execute(
+                    "INSERT INTO users (username, email, last_login, data) VALUES (?, ?, ?, ?)",
+                    self._row(user_data)
+                )
+        except sqlite3.IntegrityError:
             raise ValueError(f"User {username} already exists")
-        
-        self.users[username] = user_data
-        self._save_users()
         return user_data
     
     def update_user(self, username: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update user data."""
-        if username not in self.users:
-            return None
-        
-        self.users[username].update(updates)
-        self._save_users()
-        return self.users[username]
+        with self._write() as conn:
+            row = conn.execute(
+                "SELECT data, last_login FROM users WHERE username = ?", (username,)
+            ).fetchone()
+            if not row:
+                return None
+            user = self._load(row)
+            user.update(updates)
+            conn.execute(
+                "UPDATE users SET email = ?, last_login = ?, data = ? WHERE username = ?",
+                self._row(user)[1:] + (username,)
+            )
+        if "last_login" in updates:
+            with self._logins_lock:
+                self._pending_logins.pop(username, None)
+        if set(updates) - {"last_login"}:
+            self._notify(username)
+        return user
     
     def delete_user(self, username: str) -> bool:
         """Delete user."""
-        if username in self.users:
-            del self.users[username]
-            self._save_users()
-            return True
-        return False
+        with self._write() as conn:
+            deleted = conn.execute(
+                "DELETE FROM users WHERE username = ?", (username,)
+            ).rowcount
+        if deleted:
+            with self._logins_lock:
+                self._pending_logins.pop(username, None)
+            self._notify(username)
+        return bool(deleted)
     
     def list_users(self) -> List[Dict[str, Any]]:
         """List all users."""
-        return list(self.users.values())
-
-
-# Initialize user database
-user_db = UserDatabase()
+        rows = self._connection().execute(
+            "SELECT data, last_login FROM users ORDER BY username"
+        ).fetchall()
+        return [self._load(row) for row in rows]
+    
+    def record_login(self, username: str, when: Optional[datetime] = None):
+        """Record a successful login; written with the next batch."""
+        with self._logins_lock:
+            self._pending_logins[username] = (when or datetime.utcnow()).isoformat()
+            due = time.monotonic() - self._last_login_flush >= self.login_flush_interval
+        if due:
+            self.flush_logins()
+    
+    def flush_logins(self):
+        """Write pending ``last_login`` values in one transaction."""
+        with self._logins_lock:
+            pending = self._pending_logins
+            self._pending_logins = {}
+            self._last_login_flush = time.monotonic()
+        if not pending:
+            return
+        try:
+            with self._write() as conn:
+                conn.executemany(
+                    "UPDATE users SET last_login = ? WHERE username = ?",
+                    [(when, username) for username, when in pending.items()]
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Error saving last logins: {e}")
+            with self._logins_lock:
+                for username, when in pending.items():
+                    self._pending_logins.setdefault(username, when)
+
+
+class TokenCache:
+    """Bounded LRU of verified tokens, keyed by the token's SHA-256 digest.
+    
+    A hit skips JWT decoding, signature verification and the user lookup.
+    Entries are dropped when their user is updated, deleted or changes
+    password in this process. Other worker processes share the user
+    database but not this cache, so every entry also expires after ``ttl``
+    seconds, or earlier with the token's ``exp`` claim.
+    """
+    
+    def __init__(self, max_entries: int = TOKEN_CACHE_SIZE, ttl: float = TOKEN_CACHE_TTL):
+        """Initialize an empty cache."""
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[TokenData, float]]" = OrderedDict()
+        self._by_user: Dict[str, Set[bytes]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    @staticmethod
+    def key(token: str) -> bytes:
+        """Get the cache key of a token."""
+        return hashlib.sha256(token.encode()).digest()
+    
+    def get(self, key: bytes) -> Optional[TokenData]:
+        """Get the verified token data, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                token_data, expires_at = entry
+                if expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return token_data
+                self._remove(key)
+            self.misses += 1
+            return None
+    
+    def put(self, key: bytes, token_data: TokenData, expires_at: Optional[float]):
+        """Cache a verified token until ``expires_at`` (epoch seconds) or the TTL."""
+        deadline = time.time() + self.ttl
+        expires_at = deadline if expires_at is None else min(expires_at, deadline)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (token_data, expires_at)
+            self._by_user.setdefault(token_data.username, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+    
+    def _remove(self, key: bytes):
+        token_data, _ = self._entries.pop(key)
+        keys = self._by_user.get(token_data.username)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[token_data.username]
+    
+    def invalidate_user(self, username: str):
+        """Drop every cached token of a user."""
+        with self._lock:
+            for key in list(self._by_user.get(username, ())):
+                self._remove(key)
+                self.invalidations += 1
+    
+    def clear(self):
+        """Drop every cached token."""
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+            "max_entries": self.max_entries
+        }
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify password against hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    start = time.perf_counter_ns()
+    try:
+        return pwd_context.verify(plain_password, hashed_password)
+    finally:
+        get_metrics().record_ns("auth.password_verify", time.perf_counter_ns() - start)
 
 
 def get_password_hash(password: str) -> str:
     """Generate password hash."""
-    return pwd_context.hash(password)
+    start = time.perf_counter_ns()
+    try:
+        return pwd_context.hash(password)
+    finally:
+        get_metrics().record_ns("auth.password_hash", time.perf_counter_ns() - start)
+
+
+# bcrypt releases the GIL, so a small thread pool runs hashes in parallel
+# without blocking the event loop; its size bounds concurrent hashing
+_password_pool = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password"
+)
+
+
+async def run_in_password_pool(func: Callable, *args, **kwargs) -> Any:
+    """Run a call that hashes or verifies passwords off the event loop.
+    
+    Time spent waiting for a free worker is recorded as
+    ``auth.password_queue_wait``.
+    """
+    submitted = time.perf_counter_ns()
+    
+    def call():
+        get_metrics().record_ns("auth.password_queue_wait", time.perf_counter_ns() - submitted)
+        return func(*args, **kwargs)
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_pool, call)
+
+
+# Initialize user database
+user_db = UserDatabase()
+
+# Verified tokens, dropped whenever their user changes
+token_cache = TokenCache()
+user_db.add_listener(token_cache.invalidate_user)
+register_cache_layer("auth_tokens", token_cache.stats, token_cache.clear)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -253,8 +581,8 @@ def authenticate_user(username: str, password: str) -> Optional[Dict[str, Any]]:
     if not verify_password(password, user["hashed_password"]):
         return None
     
-    # Update last login
-    user_db.update_user(username, {"last_login": datetime.utcnow().isoformat()})
+    # Update last login (batched)
+    user_db.record_login(username)
     return user
 
 
@@ -302,21 +630,15 @@ def get_current_user_permissions(username: str) -> List[str]:
 
 
 def check_permission(username: str, permission: str) -> bool:
-    """Check if user has specific permission."""
-    permissions = get_current_user_permissions(username)
-    
-    # Check exact match
-    if permission in permissions:
-        return True
+    """Check if user has specific permission.
     
-    # Check wildcard permissions (e.g., "read:all" covers "read:calculations")
-    permission_parts = permission.split(":")
-    if len(permission_parts) == 2:
-        action, resource = permission_parts
-        if f"{action}:all" in permissions:
-            return True
+    Wildcard permissions count too: "read:all" covers "read:calculations".
+    """
+    user = user_db.get_user(username)
+    if not user:
+        return False
     
-    return False
+    return role_has_permission(user.get("role", UserRole.VIEWER), permission)
 
 
 def update_password(username: str, old_password: str, new_password: str) -> bool:
@@ -335,6 +657,27 @@ def update_password(username: str, old_password: str, new_password: str) -> bool
     return True
 
 
+def api_key_digest(api_key: str) -> str:
+    """Get the SHA-256 digest an API key is registered under.
+    
+    API keys are long random-looking tokens, so a fast hash identifies
+    them safely; bcrypt's deliberate slowness only matters for passwords.
+    """
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def _api_key_registered(user: Dict[str, Any], api_key: str, key_name: Optional[str]) -> bool:
+    """Check that an API key has not been removed from its user."""
+    digest = api_key_digest(api_key)
+    for key in user.get("api_keys", []):
+        if key.get("key_digest") == digest:
+            return True
+        # Keys created before digests were stored are matched by name
+        if "key_digest" not in key and key.get("key_name") == key_name:
+            return True
+    return False
+
+
 def generate_api_key(username: str, key_name: str, permissions: List[str]) -> str:
     """Generate API key for programmatic access."""
     # Create a non-expiring token with limited permissions
@@ -355,6 +698,7 @@ def generate_api_key(username: str, key_name: str, permissions: List[str]) -> st
         api_keys.append({
             "key_name": key_name,
             "key_prefix": api_key[:20] + "...",
+            "key_digest": api_key_digest(api_key),
             "permissions": permissions,
             "created_at": datetime.utcnow().isoformat()
         })
@@ -420,7 +764,17 @@ class AuthManager:
     
     @staticmethod
     def validate_token(token: str) -> Optional[TokenData]:
-        """Validate access token and return token data."""
+        """Validate access token and return token data.
+        
+        Verified tokens are cached (see ``TokenCache``); the user's current
+        role is looked up once per token. Tokens of deleted or inactive
+        users are rejected.
+        """
+        key = token_cache.key(token)
+        token_data = token_cache.get(key)
+        if token_data is not None:
+            return token_data
+        
         payload = decode_token(token)
         if not payload:
             return None
@@ -429,10 +783,26 @@ class AuthManager:
         if not username:
             return None
         
-        return TokenData(
+        user = user_db.get_user(username)
+        if not user or not user.get("is_active", True):
+            return None
+        
+        token_type = payload.get("type")
+        scopes = payload.get("scopes", [])
+        if token_type == "api_key":
+            # API keys never touch bcrypt: a SHA-256 lookup in the user's keys
+            if not _api_key_registered(user, token, payload.get("key_name")):
+                return None
+            scopes = payload.get("permissions", [])
+        
+        token_data = TokenData(
             username=username,
-            scopes=payload.get("scopes", [])
+            scopes=scopes,
+            role=user.get("role", UserRole.VIEWER),
+            token_type=token_type
         )
+        token_cache.put(key, token_data, payload.get("exp"))
+        return token_data
 
 
 # Initialize auth manager
@@ -8,7 +8,7 @@ import logging
 from typing import Dict, List, Optional
 from datetime import datetime
 from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.security import APIKeyHeader, HTTPBearer, HTTPAuthorizationCredentials
 
 from .auth import (
     auth_manager,
@@ -21,6 +21,8 @@ from .auth import (
     PasswordReset,
     TokenData,
     check_permission,
+    role_has_permission,
+    scopes_have_permission,
     update_password,
     generate_api_key,
     UserRole
@@ -30,13 +32,27 @@ from utils.audit_logger import audit_logger
 
 logger = logging.getLogger(__name__)
 
-# Security scheme
-security = HTTPBearer()
+# Security schemes: a bearer token or an API key in its own header
+security = HTTPBearer(auto_error=False)
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> TokenData:
-    """Get current authenticated user from JWT token."""
-    token = credentials.credentials
+def get_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    api_key: Optional[str] = Depends(api_key_header)
+) -> TokenData:
+    """Get current authenticated user from a JWT or API key.
+    
+    Neither path hashes passwords, so authenticated requests stay cheap;
+    API keys are checked against the SHA-256 digests stored with the user.
+    """
+    token = credentials.credentials if credentials else api_key
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     token_data = auth_manager.validate_token(token)
     
     if not token_data:
@@ -52,7 +68,15 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
 def require_permission(permission: str):
     """Decorator to require specific permission for endpoint access."""
     def permission_checker(current_user: TokenData = Depends(get_current_user)):
-        has_permission = check_permission(current_user.username, permission)
+        # The role was read when the token was validated; role changes
+        # invalidate the cached token
+        if current_user.role is not None:
+            has_permission = role_has_permission(current_user.role, permission)
+        else:
+            has_permission = check_permission(current_user.username, permission)
+        # API keys are further limited to the permissions they were issued with
+        if has_permission and current_user.token_type == "api_key":
+            has_permission = scopes_have_permission(current_user.scopes, permission)
         
         # Audit permission check
         audit_logger.log_permission_check(
@@ -0,0 +1,364 @@
+"""Batch evaluation of NPV, IRR and industry ROI calculations.
+
+Portfolio screening clients used to call the single-calculation endpoints
+thousands of times, paying request parsing, validation and audit logging on
+every call. The batch endpoints take many calculations at once:
+
+- financial inputs are columnar (one list per parameter) and are range
+  checked with NumPy in one pass, reporting every offending row
+- identical rows are evaluated once, and results are kept in the dedicated
+  ``batch_cache`` so repeated batches skip them entirely
+- the remaining NPVs and IRRs are computed by the vectorized kernels in
+  ``business.financial_calculations``; results match the single endpoints
+
+Industry models are scalar functions with per-industry logic, so industry
+batches are deduplicated and cached but evaluated one unique row at a time.
+
+Evaluation is split in three steps so the API can keep the cache in its own
+process and send only the cache misses to a worker: ``plan_*_batch``
+validates and deduplicates the rows and looks them up in the cache,
+``BatchPlan.task`` computes the misses, and ``complete_batch`` caches them
+and assembles the results. ``evaluate_*_batch`` runs all three in-process.
+
+Results are columnar: one list per output, in input order. ``iter_ndjson``
+turns them into NDJSON rows for streaming very large batches.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from business.financial_calculations import (
+    calculate_irr_batch,
+    calculate_npv_batch,
+    pad_cash_flows
+)
+from business.industry_models import (
+    calculate_financial_services_roi,
+    calculate_healthcare_roi,
+    calculate_manufacturing_roi,
+    calculate_retail_roi
+)
+from performance.serialization import dumps
+from utils.cache_manager import batch_cache
+
+MAX_BATCH_SIZE = int(os.getenv("API_MAX_BATCH_SIZE", "100000"))
+NDJSON_CHUNK_ROWS = 1000
+
+FINANCIAL_METRICS = ("npv", "irr")
+
+INDUSTRY_CALCULATORS = {
+    "manufacturing": calculate_manufacturing_roi,
+    "healthcare": calculate_healthcare_roi,
+    "financial_services": calculate_financial_services_roi,
+    "retail": calculate_retail_roi,
+}
+
+INDUSTRY_METRICS = ("npv", "irr", "payback_years", "total_benefit")
+
+# Rows listed in a validation error
+_MAX_REPORTED_ROWS = 100
+
+
+class BatchValidationError(ValueError):
+    """Invalid batch input, with the indices of the offending rows."""
+
+    def __init__(self, message: str, rows: Sequence[int] = ()):
+        super().__init__(message)
+        self.rows = list(rows)
+
+
+def _check_size(count: int) -> None:
+    if count == 0:
+        raise BatchValidationError("Batch is empty")
+    if count > MAX_BATCH_SIZE:
+        raise BatchValidationError(f"Batch of {count} exceeds the limit of {MAX_BATCH_SIZE}")
+
+
+def _reject_rows(invalid: np.ndarray, message: str) -> None:
+    rows = np.flatnonzero(invalid)
+    if len(rows):
+        raise BatchValidationError(
+            f"{message} ({len(rows)} rows)", rows[:_MAX_REPORTED_ROWS].tolist()
+        )
+
+
+@dataclass
+class BatchPlan:
+    """A validated batch, split into cached results and rows to compute."""
+
+    count: int
+    # Cache key and result of every distinct row; None where not cached
+    cache_keys: List[tuple]
+    values: List[Any]
+    # Distinct row of every input row
+    inverse: List[int]
+    # Distinct rows missing from the cache, in the order ``task`` returns them
+    missing: List[int]
+    # Picklable ``(function, args)`` computing the missing results
+    task: Tuple[Callable, tuple]
+    build_columns: Callable[[List[Any]], Dict[str, List[Any]]]
+
+    def compute(self) -> List[Any]:
+        """Compute the missing results in this process."""
+        if not self.missing:
+            return []
+        func, args = self.task
+        return func(*args)
+
+
+def _plan(
+    namespace: str,
+    keys: List[Any],
+    make_task: Callable[[List[int]], Tuple[Callable, tuple]],
+    build_columns: Callable[[List[Any]], Dict[str, List[Any]]]
+) -> BatchPlan:
+    """Deduplicate rows and look them up in the batch cache.
+
+    Args:
+        namespace: Cache key prefix of this kind of calculation
+        keys: Hashable key of every row
+        make_task: Called with the input rows of the cache misses, returns
+            the call computing their results in the same order
+        build_columns: Turns the results of every row into the output columns
+    """
+    unique: Dict[Any, int] = {}
+    first_rows = []
+    inverse = []
+    for row, key in enumerate(keys):
+        index = unique.get(key)
+        if index is None:
+            index = unique[key] = len(first_rows)
+            first_rows.append(row)
+        inverse.append(index)
+
+    # Row keys are hashable already, so they key the cache directly
+    cache_keys = [(namespace, key) for key in unique]
+    values = [batch_cache.get(cache_key) for cache_key in cache_keys]
+    missing = [index for index, value in enumerate(values) if value is None]
+    return BatchPlan(
+        count=len(keys),
+        cache_keys=cache_keys,
+        values=values,
+        inverse=inverse,
+        missing=missing,
+        task=make_task([first_rows[index] for index in missing]),
+        build_columns=build_columns,
+    )
+
+
+def complete_batch(plan: BatchPlan, computed: List[Any]) -> Dict[str, Any]:
+    """Cache the computed results of a batch and assemble its output.
+
+    Args:
+        plan: The batch plan
+        computed: Results of ``plan.task``, one per missing row
+
+    Returns:
+        ``count``, ``unique`` and ``cache_hits`` of the batch, and its ``columns``
+    """
+    values = list(plan.values)
+    for index, value in zip(plan.missing, computed):
+        values[index] = value
+        batch_cache.set(plan.cache_keys[index], value)
+
+    return {
+        "count": plan.count,
+        "unique": len(values),
+        "cache_hits": len(values) - len(plan.missing),
+        "columns": plan.build_columns([values[index] for index in plan.inverse]),
+    }
+
+
+def compute_financial_rows(
+    matrix: np.ndarray,
+    rates: np.ndarray,
+    investments: np.ndarray,
+    metrics: Tuple[str, ...]
+) -> List[tuple]:
+    """Calculate the requested metrics of padded cash flow rows."""
+    columns = []
+    if "npv" in metrics:
+        npv = calculate_npv_batch(matrix, rates, investments)
+        columns.append([round(value, 2) for value in npv.tolist()])
+    if "irr" in metrics:
+        irr = calculate_irr_batch(matrix, investments)
+        columns.append([None if np.isnan(value) else round(value, 4) for value in irr.tolist()])
+    return list(zip(*columns))
+
+
+def compute_industry_rows(items: List[Dict[str, Any]]) -> List[Dict]:
+    """Run the industry calculation of every item."""
+    results = []
+    for item in items:
+        params = dict(item)
+        results.append(INDUSTRY_CALCULATORS[params.pop("industry")](**params))
+    return results
+
+
+def plan_financial_batch(
+    cash_flows: Sequence[Sequence[float]],
+    initial_investment: Sequence[float],
+    discount_rate: Union[float, Sequence[float]] = 0.10,
+    metrics: Sequence[str] = FINANCIAL_METRICS
+) -> BatchPlan:
+    """Validate a financial batch and look its rows up in the batch cache.
+
+    Arguments are those of ``evaluate_financial_batch``.
+
+    Raises:
+        BatchValidationError: If the columns do not line up or values are
+            out of range
+    """
+    count = len(cash_flows)
+    _check_size(count)
+    if not metrics or any(metric not in FINANCIAL_METRICS for metric in metrics):
+        raise BatchValidationError(f"metrics must be chosen from {list(FINANCIAL_METRICS)}")
+    metrics = tuple(metric for metric in FINANCIAL_METRICS if metric in metrics)
+
+    investments = np.asarray(initial_investment, dtype=float)
+    if investments.shape != (count,):
+        raise BatchValidationError("initial_investment needs one value per cash flow series")
+    rates = np.asarray(discount_rate, dtype=float)
+    if rates.ndim == 0:
+        rates = np.full(count, float(rates))
+    elif rates.shape != (count,):
+        raise BatchValidationError("discount_rate needs one value or one per cash flow series")
+
+    _reject_rows(~(investments > 0), "initial_investment must be positive")
+    _reject_rows(~((rates >= 0) & (rates <= 1)), "discount_rate must be between 0 and 1")
+    _reject_rows(
+        np.fromiter(map(len, cash_flows), dtype=int, count=count) == 0,
+        "cash_flows must not be empty"
+    )
+    matrix = pad_cash_flows(cash_flows)
+    _reject_rows(~np.isfinite(matrix).all(axis=1), "cash_flows must be finite")
+
+    # The discount rate does not affect the IRR
+    keys = [
+        (tuple(flows), rate if "npv" in metrics else None, investment)
+        for flows, rate, investment in zip(cash_flows, rates.tolist(), investments.tolist())
+    ]
+
+    def build_columns(rows: List[tuple]) -> Dict[str, List[Any]]:
+        outputs = dict(zip(metrics, zip(*rows)))
+        columns: Dict[str, List[Any]] = {}
+        if "npv" in outputs:
+            columns["npv"] = list(outputs["npv"])
+            columns["profitable"] = [value > 0 for value in outputs["npv"]]
+        if "irr" in outputs:
+            columns["irr"] = list(outputs["irr"])
+        return columns
+
+    return _plan(
+        f"financial_batch:{','.join(metrics)}",
+        keys,
+        lambda rows: (
+            compute_financial_rows, (matrix[rows], rates[rows], investments[rows], metrics)
+        ),
+        build_columns,
+    )
+
+
+def evaluate_financial_batch(
+    cash_flows: Sequence[Sequence[float]],
+    initial_investment: Sequence[float],
+    discount_rate: Union[float, Sequence[float]] = 0.10,
+    metrics: Sequence[str] = FINANCIAL_METRICS
+) -> Dict[str, Any]:
+    """Calculate NPV and/or IRR for many investments.
+
+    Args:
+        cash_flows: Annual cash flows of each investment
+        initial_investment: Initial investment of each investment
+        discount_rate: One rate for all investments or one per investment
+        metrics: Outputs to calculate, from ``FINANCIAL_METRICS``
+
+    Returns:
+        ``count``, ``unique`` and ``cache_hits`` of the batch, and
+        ``columns``: ``npv`` and ``profitable`` and/or ``irr`` (None where
+        it does not converge), one value per investment
+
+    Raises:
+        BatchValidationError: If the columns do not line up or values are
+            out of range
+    """
+    plan = plan_financial_batch(cash_flows, initial_investment, discount_rate, metrics)
+    return complete_batch(plan, plan.compute())
+
+
+def plan_industry_batch(
+    items: Sequence[Dict[str, Any]],
+    include_details: bool = False
+) -> BatchPlan:
+    """Validate an industry batch and look its rows up in the batch cache.
+
+    Arguments are those of ``evaluate_industry_batch``.
+
+    Raises:
+        BatchValidationError: If an item names an unknown industry
+    """
+    _check_size(len(items))
+    _reject_rows(
+        np.array([item.get("industry") not in INDUSTRY_CALCULATORS for item in items]),
+        f"industry must be one of {list(INDUSTRY_CALCULATORS)}"
+    )
+
+    keys = [json.dumps(item, sort_keys=True) for item in items]
+
+    def build_columns(results: List[Dict]) -> Dict[str, List[Any]]:
+        columns: Dict[str, List[Any]] = {"industry": [item["industry"] for item in items]}
+        for metric in INDUSTRY_METRICS:
+            columns[metric] = [result["financial_metrics"].get(metric) for result in results]
+        columns["risk_level"] = [result.get("risk_level") for result in results]
+        if include_details:
+            columns["details"] = results
+        return columns
+
+    return _plan(
+        "industry_batch",
+        keys,
+        lambda rows: (compute_industry_rows, ([items[row] for row in rows],)),
+        build_columns,
+    )
+
+
+def evaluate_industry_batch(
+    items: Sequence[Dict[str, Any]],
+    include_details: bool = False
+) -> Dict[str, Any]:
+    """Calculate industry ROI for many validated requests.
+
+    Args:
+        items: Complete keyword arguments of the industry calculation, plus
+            ``industry`` naming one of ``INDUSTRY_CALCULATORS``
+        include_details: Also return the full result of every item
+
+    Returns:
+        ``count``, ``unique`` and ``cache_hits`` of the batch, and
+        ``columns``: ``industry``, the financial metrics and ``risk_level``,
+        plus ``details`` if requested
+
+    Raises:
+        BatchValidationError: If an item names an unknown industry
+    """
+    plan = plan_industry_batch(items, include_details)
+    return complete_batch(plan, plan.compute())
+
+
+def iter_ndjson(
+    columns: Dict[str, List[Any]],
+    chunk_rows: int = NDJSON_CHUNK_ROWS
+) -> Iterator[bytes]:
+    """Encode columnar results as NDJSON, one object per row."""
+    names = list(columns)
+    rows = zip(*columns.values())
+    while True:
+        chunk = list(islice(rows, chunk_rows))
+        if not chunk:
+            return
+        yield b"".join(dumps(dict(zip(names, row))) + b"\n" for row in chunk)
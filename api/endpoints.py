@@ -23,6 +23,7 @@ from business.financial_calculations import (
     calculate_ai_productivity_roi
 )
 from utils.audit_logger import audit_logger, AuditEventType, AuditSeverity
+from utils.cache_manager import get_cache_statistics
 from business.scenario_engine_parallel import (
     monte_carlo_simulation_parallel,
     sensitivity_analysis_parallel,
@@ -268,6 +269,11 @@ class FinancialAPI:
         except Exception as e:
             return APIResponse.error(f"Comprehensive ROI calculation failed: {str(e)}", 500)
     
+    @staticmethod
+    def get_cache_stats() -> Dict:
+        """Get statistics of the calculation, Monte Carlo and batch caches."""
+        return APIResponse.success(get_cache_statistics())
+    
     
 
 
@@ -0,0 +1,263 @@
+"""Execution model for API route handlers.
+
+Route handlers are coroutines on the event loop, so anything slow they call
+directly stalls every other request. Work is therefore split three ways:
+
+- CPU-bound calculations and report rendering run in a process pool
+  (``run_cpu``), so they neither block the loop nor contend for the GIL
+- blocking I/O, such as audit store queries, user database updates and
+  customization file writes, runs in a thread pool (``run_io``)
+- fast calls (NPV, IRR, lookups, in-memory statistics) stay inline
+
+Every offloaded call names a route limit, a semaphore bounding how many calls
+of that kind run at once, so one expensive endpoint cannot occupy every
+worker. Calls that wait longer than ``ROUTE_QUEUE_TIMEOUT`` get a 503.
+
+Worker processes do not write audit logs themselves: entries logged during a
+call are captured and logged by the API process when the call returns.
+
+``LoopLagMonitor`` measures how late the event loop wakes from a short sleep
+and records it as ``event_loop.lag``; it stays near zero as long as handlers
+do not block.
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException, status
+
+from performance.monitor import get_metrics
+from utils.audit_logger import audit_logger
+
+logger = logging.getLogger(__name__)
+
+CPU_WORKERS = int(os.getenv("API_CPU_WORKERS", str(os.cpu_count() or 1)))
+IO_WORKERS = int(os.getenv("API_IO_WORKERS", "16"))
+# Seconds a call may wait for its route limit before the request is rejected
+ROUTE_QUEUE_TIMEOUT = float(os.getenv("API_ROUTE_QUEUE_TIMEOUT", "30"))
+LOOP_LAG_INTERVAL = float(os.getenv("API_LOOP_LAG_INTERVAL", "0.25"))
+
+LOOP_LAG_OPERATION = "event_loop.lag"
+
+# Concurrent calls per route group, overridable as API_ROUTE_LIMITS="scenario=4,export=1"
+DEFAULT_ROUTE_LIMITS = {
+    "financial": CPU_WORKERS * 2,
+    "scenario": CPU_WORKERS,
+    "industry": CPU_WORKERS * 2,
+    "export": max(1, CPU_WORKERS // 2),
+    "audit": 4,
+    "auth": 8,
+    "customization": 8,
+}
+
+
+def _parse_route_limits(value: str) -> Dict[str, int]:
+    limits = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        name, _, limit = item.partition("=")
+        limits[name.strip()] = int(limit)
+    return limits
+
+
+ROUTE_LIMITS = {
+    **DEFAULT_ROUTE_LIMITS,
+    **_parse_route_limits(os.getenv("API_ROUTE_LIMITS", "")),
+}
+
+
+class RouteLimiter:
+    """Bounds the concurrent offloaded calls of one route group."""
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(limit)
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+
+    async def __aenter__(self) -> "RouteLimiter":
+        start = time.perf_counter_ns()
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), ROUTE_QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Too many concurrent {self.name} requests",
+                headers={"Retry-After": "1"},
+            )
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        get_metrics().record_ns(f"route_wait.{self.name}", time.perf_counter_ns() - start)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.active -= 1
+        self._semaphore.release()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+        }
+
+
+_limiters: Dict[str, RouteLimiter] = {}
+
+
+def route_limiter(name: str) -> RouteLimiter:
+    """Get the limiter of a route group, creating it on first use."""
+    limiter = _limiters.get(name)
+    if limiter is None:
+        limiter = _limiters[name] = RouteLimiter(name, ROUTE_LIMITS.get(name, CPU_WORKERS))
+    return limiter
+
+
+_io_pool: Optional[ThreadPoolExecutor] = None
+_cpu_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_io_pool() -> ThreadPoolExecutor:
+    global _io_pool
+    with _pool_lock:
+        if _io_pool is None:
+            _io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="api-io")
+        return _io_pool
+
+
+def _get_cpu_pool() -> ProcessPoolExecutor:
+    global _cpu_pool
+    with _pool_lock:
+        if _cpu_pool is None:
+            # Workers are spawned rather than forked: the API process runs
+            # threads (audit writer, I/O pool) that must not be copied mid-state
+            _cpu_pool = ProcessPoolExecutor(
+                max_workers=CPU_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _cpu_pool
+
+
+def _reset_cpu_pool(broken: ProcessPoolExecutor) -> None:
+    global _cpu_pool
+    with _pool_lock:
+        if _cpu_pool is broken:
+            _cpu_pool = None
+    broken.shutdown(wait=False)
+
+
+def _call_in_worker(func: Callable, args: tuple, kwargs: dict):
+    """Run a call in a worker process and return it with its audit entries."""
+    with audit_logger.capture() as entries:
+        try:
+            return func(*args, **kwargs), None, entries
+        except Exception as exc:
+            return None, exc, entries
+
+
+async def run_cpu(route: str, func: Callable, *args, **kwargs) -> Any:
+    """Run a CPU-bound call in the process pool.
+
+    ``func`` and its arguments must be picklable: module-level functions or
+    the static methods of the API classes, called with plain data.
+    """
+    async with route_limiter(route):
+        pool = _get_cpu_pool()
+        loop = asyncio.get_running_loop()
+        try:
+            result, error, entries = await loop.run_in_executor(
+                pool, _call_in_worker, func, args, kwargs
+            )
+        except BrokenProcessPool:
+            logger.error("API worker process died; restarting the process pool")
+            _reset_cpu_pool(pool)
+            raise
+    for entry in entries:
+        audit_logger.log(entry)
+    if error is not None:
+        raise error
+    return result
+
+
+async def run_io(route: str, func: Callable, *args, **kwargs) -> Any:
+    """Run a call that blocks on disk or database I/O in the thread pool."""
+    async with route_limiter(route):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_io_pool(), functools.partial(func, *args, **kwargs)
+        )
+
+
+class LoopLagMonitor:
+    """Records how late the event loop runs a periodic wake-up."""
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL):
+        self.interval = interval
+        self.last_lag_ns = 0
+        self.max_lag_ns = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        interval_ns = int(self.interval * 1e9)
+        metrics = get_metrics()
+        while True:
+            start = time.perf_counter_ns()
+            await asyncio.sleep(self.interval)
+            lag_ns = max(time.perf_counter_ns() - start - interval_ns, 0)
+            self.last_lag_ns = lag_ns
+            self.max_lag_ns = max(self.max_lag_ns, lag_ns)
+            metrics.record_ns(LOOP_LAG_OPERATION, lag_ns)
+
+
+loop_lag_monitor = LoopLagMonitor()
+
+
+def get_execution_stats() -> Dict[str, Any]:
+    """Get worker pool sizes, route limiter state and event loop lag."""
+    return {
+        "cpu_workers": CPU_WORKERS,
+        "io_workers": IO_WORKERS,
+        "routes": {name: limiter.stats() for name, limiter in _limiters.items()},
+        "event_loop_lag_ms": {
+            "last": loop_lag_monitor.last_lag_ns / 1e6,
+            "max": loop_lag_monitor.max_lag_ns / 1e6,
+        },
+    }
+
+
+def shutdown_executors() -> None:
+    """Stop the worker pools, letting running calls finish."""
+    global _cpu_pool, _io_pool
+    with _pool_lock:
+        pools = [_cpu_pool, _io_pool]
+        _cpu_pool = _io_pool = None
+    for pool in pools:
+        if pool is not None:
+            pool.shutdown(wait=True)
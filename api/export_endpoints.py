@@ -6,7 +6,7 @@ in various formats (Excel, CSV, PDF, JSON).
 
 import io
 import base64
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List
 from fastapi import HTTPException
 from fastapi.responses import StreamingResponse, FileResponse
 
@@ -274,6 +274,25 @@ def create_download_response(data: bytes, filename: str, format: str) -> Streami
     )
 
 
+def create_streaming_download_response(
+    chunks: Iterable[bytes],
+    filename: str,
+    media_type: str
+) -> StreamingResponse:
+    """Create a download response sent while ``chunks`` is produced.
+    
+    Args:
+        chunks: Encoded file content, one chunk at a time
+        filename: Filename for download
+        media_type: MIME type of the content
+        
+    Returns:
+        StreamingResponse that never holds the whole file in memory
+    """
+    headers = {"Content-Disposition": f"attachment; filename={filename}"}
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+
 # Export templates for common use cases
 class ExportTemplates:
     """Pre-configured export templates for common scenarios."""
@@ -0,0 +1,250 @@
+"""Fast JSON responses and response compression for the API.
+
+FastAPI passes every value a route returns through ``jsonable_encoder``
+before rendering it. That walks the whole payload in Python, which is slow
+for Monte Carlo histograms and export payloads, and it rejects NumPy
+integers. ``FastJSONRoute`` lets endpoints without a response model skip it:
+their return value is rendered directly by ``FastJSONResponse`` with the
+shared orjson encoder in ``performance.serialization``, which handles NumPy
+and pandas values natively and records encode times and sizes as
+``serialize.api``.
+
+``CompressionMiddleware`` compresses JSON, NDJSON and text responses of at
+least ``COMPRESSION_MINIMUM_SIZE`` bytes, with brotli when the client accepts
+it and the ``brotli`` package is installed, and gzip otherwise. Streamed
+responses are compressed chunk by chunk. Compressed sizes and compression
+times are recorded as ``serialize.api.<encoding>``.
+"""
+
+import asyncio
+import functools
+import os
+import time
+import zlib
+from typing import Any, Callable, Optional
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.dependencies.utils import get_typed_return_annotation
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from performance.monitor import get_metrics
+from performance.serialization import dumps
+from performance.telemetry import SERIALIZE_PREFIX
+
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("API_COMPRESSION_MINIMUM_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("API_GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("API_BROTLI_QUALITY", "4"))
+# Larger bodies are compressed in a thread so they do not block the event loop
+COMPRESSION_THREAD_MINIMUM = 256 * 1024
+
+API_CHANNEL = "api"
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with the shared orjson encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content, API_CHANNEL)
+
+
+def _returns_plain_payload(endpoint: Callable, response_model: Any) -> bool:
+    """Whether FastAPI would only ``jsonable_encoder`` the endpoint's result."""
+    if response_model is not None and not isinstance(response_model, DefaultPlaceholder):
+        return False
+    return get_typed_return_annotation(endpoint) is None
+
+
+def _render_payload(endpoint: Callable, status_code: Optional[int]) -> Callable:
+    """Wrap an endpoint to return its payload as a ``FastJSONResponse``."""
+    status_code = status_code or 200
+
+    def render(content: Any) -> Response:
+        if isinstance(content, Response):
+            return content
+        return FastJSONResponse(content, status_code=status_code)
+
+    if asyncio.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            return render(await endpoint(*args, **kwargs))
+
+    else:
+
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            return render(endpoint(*args, **kwargs))
+
+    return wrapper
+
+
+class FastJSONRoute(APIRoute):
+    """Route whose returned payloads skip FastAPI's ``jsonable_encoder``.
+
+    Endpoints with a response model or return annotation keep FastAPI's
+    validation and encoding.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        if _returns_plain_payload(endpoint, kwargs.get("response_model")):
+            endpoint = _render_payload(endpoint, kwargs.get("status_code"))
+        super().__init__(path, endpoint, **kwargs)
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the response encoding from an ``Accept-Encoding`` header."""
+    accepted = set()
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.partition(";")
+        params = params.replace(" ", "")
+        try:
+            quality = float(params[2:]) if params.startswith("q=") else 1.0
+        except ValueError:
+            quality = 1.0
+        if quality > 0:
+            accepted.add(name.strip())
+    if BROTLI_AVAILABLE and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+class _StreamCompressor:
+    """Incremental gzip or brotli compression of a response body."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, body: bytes, more_body: bool) -> bytes:
+        """Compress a chunk, flushing it so the client can decode it right away."""
+        if self.encoding == "br":
+            if more_body:
+                return self._compressor.process(body) + self._compressor.flush()
+            return self._compressor.process(body) + self._compressor.finish()
+        if more_body:
+            return self._compressor.compress(body) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return self._compressor.compress(body) + self._compressor.flush()
+
+
+class _CompressingResponder:
+    """Compresses the body messages of one response."""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_StreamCompressor] = None
+        self.passthrough = False
+        self.single_chunk = False
+        self.compressed_bytes = 0
+        self.compress_ns = 0
+
+    async def __call__(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Hold the headers until the first body chunk shows its size
+            self.start_message = message
+            return
+        if message_type != "http.response.body" or self.passthrough:
+            await self._flush_start()
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start_message is not None:
+            if not self._should_compress(body, more_body):
+                self.passthrough = True
+                await self._flush_start()
+                await self.send(message)
+                return
+            self._start_compression(more_body)
+
+        message["body"] = await self._compress(body, more_body)
+        await self._flush_start()
+        await self.send(message)
+        if not more_body:
+            self._record()
+
+    def _should_compress(self, body: bytes, more_body: bool) -> bool:
+        headers = Headers(raw=self.start_message["headers"])
+        if "content-encoding" in headers or self.start_message["status"] in (204, 206, 304):
+            return False
+        media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+        if not media_type.startswith(COMPRESSIBLE_TYPES):
+            return False
+        return more_body or len(body) >= self.minimum_size
+
+    def _start_compression(self, more_body: bool) -> None:
+        self.compressor = _StreamCompressor(self.encoding)
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        # The compressed length of a single-chunk body is set once it is known
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        self.single_chunk = not more_body
+
+    async def _compress(self, body: bytes, more_body: bool) -> bytes:
+        start_time = time.perf_counter_ns()
+        if len(body) >= COMPRESSION_THREAD_MINIMUM:
+            compressed = await asyncio.to_thread(self.compressor.compress, body, more_body)
+        else:
+            compressed = self.compressor.compress(body, more_body)
+        self.compress_ns += time.perf_counter_ns() - start_time
+        self.compressed_bytes += len(compressed)
+
+        if self.start_message is not None and self.single_chunk:
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers["Content-Length"] = str(len(compressed))
+        return compressed
+
+    async def _flush_start(self) -> None:
+        if self.start_message is not None:
+            message, self.start_message = self.start_message, None
+            await self.send(message)
+
+    def _record(self) -> None:
+        operation = f"{SERIALIZE_PREFIX}{API_CHANNEL}.{self.encoding}"
+        metrics = get_metrics()
+        metrics.record_ns(operation, self.compress_ns)
+        metrics.record_size(operation, self.compressed_bytes)
+
+
+class CompressionMiddleware:
+    """Compress large responses with brotli or gzip."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, _CompressingResponder(send, encoding, self.minimum_size))
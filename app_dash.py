@@ -211,6 +211,28 @@ class DashboardApp:
             logger.error(f"Error registering callbacks: {str(e)}")
             logger.error(traceback.format_exc())
 
+        # Time every callback; phase timings and profiling are opt-in
+        try:
+            from config.settings import settings
+            from performance.callback_profiler import instrument_callbacks
+
+            instrument_callbacks(
+                self.app,
+                detailed=settings.CALLBACK_PROFILING,
+                profile_top_n=settings.CALLBACK_PROFILE_TOP_N,
+                profile_dir=settings.CALLBACK_PROFILE_DIR,
+            )
+        except Exception as e:
+            logger.warning(f"Callback instrumentation not available: {str(e)}")
+
+        # Encode callback responses (figures, data-store records) with orjson
+        try:
+            from performance.serialization import install_dash_encoder
+
+            install_dash_encoder()
+        except Exception as e:
+            logger.warning(f"Fast callback encoder not available: {str(e)}")
+
     def run(self, debug=True, host="0.0.0.0", port=8050):
         """Run the Dash application."""
         logger.info(f"Starting AI Adoption Dashboard on {host}:{port}")
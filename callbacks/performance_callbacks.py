@@ -4,11 +4,19 @@ Integrates existing performance systems with Dash.
 """
 import dash
 from dash import Input, Output, State, callback, html
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 import psutil
-import time
 import logging
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, List
+
+from performance.telemetry import (
+    LATENCY_BUCKETS_MS,
+    clear_caches,
+    collect_telemetry,
+    merge_histograms,
+    summarize_latency,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,19 +29,24 @@ def register_performance_callbacks(app):
         prevent_initial_call=False
     )
     def render_performance_monitor(n_intervals: int) -> html.Div:
-        """Render performance monitoring widget."""
+        """Render the performance monitoring widget once; later ticks only update its metrics."""
+        if n_intervals:
+            raise PreventUpdate
         return create_performance_monitor()
     
     @app.callback(
         [Output("memory-usage-bar", "children"),
          Output("memory-usage-text", "children"),
+         Output("cpu-usage", "children"),
          Output("cache-status", "children"),
          Output("response-times", "children")],
         Input("performance-interval", "n_intervals")
     )
-    def update_performance_metrics(n_intervals: int) -> Tuple[Any, str, html.Div, html.Div]:
+    def update_performance_metrics(n_intervals: int) -> Tuple[Any, str, html.Div, html.Div, html.Div]:
         """Update performance metrics every 5 seconds."""
         try:
+            telemetry = collect_telemetry()
+            
             # Memory usage
             memory = psutil.virtual_memory()
             memory_percent = memory.percent
@@ -57,39 +70,54 @@ def register_performance_callbacks(app):
                 style={"height": "20px"}
             )
             
-            memory_text = f"{memory_percent:.1f}% ({memory_used_gb:.1f}/{memory_total_gb:.1f} GB)"
-            
-            # Cache status (would connect to actual cache manager in production)
-            cache_stats = get_cache_stats()
+            worker = telemetry["worker"]
+            memory_text = (
+                f"{memory_percent:.1f}% ({memory_used_gb:.1f}/{memory_total_gb:.1f} GB) · "
+                f"worker {worker['pid']}: {worker['rss_mb']:.0f} MB"
+            )
             
-            cache_status = html.Div([
-                html.Small(f"Hit Rate: {cache_stats['hit_rate']:.1f}%", className="d-block"),
-                html.Small(f"Size: {cache_stats['size']}", className="d-block"),
-                html.Small(f"Items: {cache_stats['items']}", className="d-block text-muted")
+            # CPU usage since the previous tick (non-blocking)
+            cpu_percent = psutil.cpu_percent(interval=None)
+            cpu_usage = html.Div([
+                dbc.Progress(
+                    value=cpu_percent,
+                    color="info",
+                    className="mb-1",
+                    style={"height": "15px"}
+                ),
+                html.Small(f"{cpu_percent:.1f}%", className="text-muted")
             ])
             
-            # Response times (would track actual response times in production)
-            response_stats = get_response_stats()
-            
-            response_times = html.Div([
-                html.Small(f"Avg: {response_stats['avg']}ms", className="d-block"),
-                html.Small(f"P95: {response_stats['p95']}ms", className="d-block"),
-                html.Small(f"Max: {response_stats['max']}ms", className="d-block text-muted")
-            ])
+            cache_status = create_cache_status(get_cache_stats(telemetry))
+            response_times = create_response_times(telemetry)
             
-            return memory_bar, memory_text, cache_status, response_times
+            return memory_bar, memory_text, cpu_usage, cache_status, response_times
             
         except Exception as e:
             logger.error(f"Error updating performance metrics: {str(e)}")
             return (
                 dbc.Progress(value=0, color="secondary"),
                 "Error",
+                html.Small("Error loading CPU usage"),
                 html.Small("Error loading cache stats"),
                 html.Small("Error loading response times")
             )
     
-    # Cache clearing is handled via a client-side callback or separate endpoint
-    # to avoid duplicate output conflicts
+    @app.callback(
+        Output("cache-clear-status", "children"),
+        Input("clear-cache-btn", "n_clicks"),
+        prevent_initial_call=True
+    )
+    def handle_clear_cache(n_clicks: int) -> html.Small:
+        """Flush every registered cache layer."""
+        results = clear_application_cache()
+        cleared = [name for name, ok in results.items() if ok]
+        failed = [name for name, ok in results.items() if not ok]
+        
+        message = f"Cleared: {', '.join(cleared) or 'none'}"
+        if failed:
+            message += f" · not cleared: {', '.join(failed)}"
+        return html.Small(message, className="text-muted mt-1 d-block")
 
 
 def create_performance_monitor() -> html.Div:
@@ -110,15 +138,7 @@ def create_performance_monitor() -> html.Div:
         # CPU usage
         html.Div([
             html.Label("CPU Usage:", className="small fw-bold"),
-            html.Div([
-                dbc.Progress(
-                    value=psutil.cpu_percent(interval=0.1),
-                    color="info",
-                    className="mb-1",
-                    style={"height": "15px"}
-                ),
-                html.Small(f"{psutil.cpu_percent():.1f}%", className="text-muted")
-            ])
+            html.Div(id="cpu-usage")
         ], className="mb-3"),
         
         # Cache status
@@ -141,43 +161,112 @@ def create_performance_monitor() -> html.Div:
                 size="sm", 
                 color="warning",
                 outline=True,
-                className="w-100",
-                disabled=True  # Temporarily disabled to avoid callback conflicts
+                className="w-100"
             ),
-            html.Small("(Cache clearing temporarily disabled)", className="text-muted mt-1 d-block")
+            html.Div(id="cache-clear-status")
         ])
     ])
 
 
-def get_cache_stats() -> Dict[str, Any]:
-    """Get cache statistics (mock implementation)."""
-    # In production, this would connect to the actual cache manager
-    # For now, return mock data
+def create_cache_status(cache_stats: Dict[str, Any]) -> html.Div:
+    """Create the cache status block with overall and per-layer hit rates."""
+    layer_rows = [
+        html.Small(
+            f"{name.replace('_', ' ').title()}: {layer['hit_rate']:.0f}% "
+            f"({layer['hits']}/{layer['hits'] + layer['misses']})",
+            className="d-block text-muted"
+        )
+        for name, layer in cache_stats["layers"].items()
+    ]
+    
+    return html.Div([
+        html.Small(f"Hit Rate: {cache_stats['hit_rate']:.1f}%", className="d-block"),
+        html.Small(f"Items: {cache_stats['items']:,}", className="d-block"),
+        *layer_rows
+    ])
+
+
+def create_response_times(telemetry: Dict[str, Any]) -> html.Div:
+    """Create the response time block with a latency histogram."""
+    response_stats = get_response_stats(telemetry)
+    operations = {**telemetry["callbacks"], **telemetry["endpoints"]}
+    
+    if not response_stats["count"]:
+        return html.Small("No requests recorded yet", className="text-muted")
+    
+    slowest = sorted(operations.items(), key=lambda item: item[1]["p95_ms"], reverse=True)[:3]
+    
+    return html.Div([
+        html.Small(f"Avg: {response_stats['avg']}ms", className="d-block"),
+        html.Small(f"P95: {response_stats['p95']}ms", className="d-block"),
+        html.Small(f"Max: {response_stats['max']}ms", className="d-block text-muted"),
+        create_latency_histogram(merge_histograms(operations)),
+        *[
+            html.Small(f"{name}: p95 {op['p95_ms']:.0f}ms", className="d-block text-muted text-truncate")
+            for name, op in slowest
+        ]
+    ])
+
+
+def create_latency_histogram(histogram: List[int]) -> html.Div:
+    """Render a latency histogram as a row of CSS bars."""
+    peak = max(histogram) or 1
+    labels = [f"≤{bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+    
+    bars = [
+        html.Div(
+            title=f"{label}: {count}",
+            style={
+                "flex": "1",
+                "height": f"{max(count / peak * 100, 2):.0f}%",
+                "marginRight": "1px",
+                "backgroundColor": "#0d6efd" if count else "#dee2e6",
+            }
+        )
+        for label, count in zip(labels, histogram)
+    ]
+    
+    return html.Div(
+        bars,
+        className="my-1",
+        style={"display": "flex", "alignItems": "flex-end", "height": "32px"}
+    )
+
+
+def get_cache_stats(telemetry: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Get cache statistics aggregated over all cache layers."""
+    telemetry = telemetry or collect_telemetry()
+    layers = telemetry["caches"]
+    
+    hits = sum(layer["hits"] for layer in layers.values())
+    misses = sum(layer["misses"] for layer in layers.values())
+    total = hits + misses
+    
     return {
-        "hit_rate": 87.5,
-        "size": "42.3 MB",
-        "items": "1,247",
-        "hits": 10234,
-        "misses": 1432
+        "hit_rate": (hits / total * 100) if total > 0 else 0.0,
+        "items": sum(layer["size"] for layer in layers.values()),
+        "hits": hits,
+        "misses": misses,
+        "layers": layers
     }
 
 
-def get_response_stats() -> Dict[str, Any]:
-    """Get response time statistics (mock implementation)."""
-    # In production, this would track actual response times
-    # For now, return mock data
+def get_response_stats(telemetry: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Get response time statistics over all Dash callbacks and API endpoints."""
+    telemetry = telemetry or collect_telemetry()
+    summary = summarize_latency({**telemetry["callbacks"], **telemetry["endpoints"]})
+    
     return {
-        "avg": 145,
-        "p95": 312,
-        "max": 892,
-        "min": 23
+        "avg": round(summary["avg_ms"]),
+        "p95": round(summary["p95_ms"]),
+        "max": round(summary["max_ms"]),
+        "count": summary["count"]
     }
 
 
-def clear_application_cache():
-    """Clear the application cache."""
-    # In production, this would connect to the actual cache manager
-    # and clear all cached data
+def clear_application_cache() -> Dict[str, bool]:
+    """Clear every registered application cache layer."""
     logger.info("Clearing application cache...")
-    time.sleep(0.5)  # Simulate cache clearing
-    logger.info("Cache cleared successfully")
\ No newline at end of file
+    results = clear_caches()
+    logger.info("Cache cleared successfully")
+    return results
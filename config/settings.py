@@ -36,11 +36,43 @@ class Settings:
     CACHE_MEMORY_TTL = int(os.getenv("CACHE_MEMORY_TTL", "600"))
     CACHE_DISK_SIZE = int(os.getenv("CACHE_DISK_SIZE", str(2 * 1024**3)))
     MAX_WORKERS = int(os.getenv("MAX_WORKERS", "4"))
+    # Byte cap of each open PDF document's page cache (see data/extractors/document_session.py)
+    PDF_PAGE_CACHE_BYTES = int(os.getenv("PDF_PAGE_CACHE_BYTES", str(64 * 1024**2)))
+
+    # Snapshot bundle settings (see data/snapshot.py)
+    SNAPSHOT_DIR = Path(os.getenv("AI_ADOPTION_SNAPSHOT_DIR", str(CACHE_DIR / "snapshots")))
+    USE_SNAPSHOT = os.getenv("USE_SNAPSHOT", "True").lower() in ("true", "1", "yes")
+
+    # Dataset dtype enforcement and bulk validation at load time (see data/models/schemas.py)
+    ENFORCE_DATASET_SCHEMAS = os.getenv("ENFORCE_DATASET_SCHEMAS", "True").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+    DATASET_FLOAT_DTYPE = os.getenv("DATASET_FLOAT_DTYPE", "float32")
+
+    # Dash callback instrumentation (see performance/callback_profiler.py)
+    CALLBACK_PROFILING = os.getenv("CALLBACK_PROFILING", "False").lower() in ("true", "1", "yes")
+    CALLBACK_PROFILE_TOP_N = int(os.getenv("CALLBACK_PROFILE_TOP_N", "3"))
+    CALLBACK_PROFILE_DIR = Path(os.getenv("CALLBACK_PROFILE_DIR", str(CACHE_DIR / "profiles")))
 
     # Logging settings
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT = os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
+    # Audit log writer (see utils/audit_writer.py)
+    AUDIT_QUEUE_SIZE = int(os.getenv("AUDIT_QUEUE_SIZE", "10000"))
+    AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "256"))
+    AUDIT_FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL", "0.2"))
+    AUDIT_FSYNC_INTERVAL = float(os.getenv("AUDIT_FSYNC_INTERVAL", "1.0"))
+    # What to do when the queue is full: drop_newest, drop_oldest or block
+    AUDIT_OVERFLOW_POLICY = os.getenv("AUDIT_OVERFLOW_POLICY", "drop_newest")
+    # Indexed SQLite copy of the audit log used by search (see utils/audit_store.py)
+    AUDIT_STORE_ENABLED = os.getenv("AUDIT_STORE_ENABLED", "true").lower() in ("true", "1", "yes")
+    # Retained audit rollup buckets (see utils/audit_rollups.py)
+    AUDIT_ROLLUP_MINUTES = int(os.getenv("AUDIT_ROLLUP_MINUTES", "120"))
+    AUDIT_ROLLUP_HOURS = int(os.getenv("AUDIT_ROLLUP_HOURS", "168"))
+
     # Application settings
     DEBUG = os.getenv("DEBUG", "False").lower() in ("true", "1", "yes")
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
@@ -86,7 +118,23 @@ class Settings:
             "CACHE_MEMORY_TTL": cls.CACHE_MEMORY_TTL,
             "CACHE_DISK_SIZE": cls.CACHE_DISK_SIZE,
             "MAX_WORKERS": cls.MAX_WORKERS,
+            "PDF_PAGE_CACHE_BYTES": cls.PDF_PAGE_CACHE_BYTES,
+            "SNAPSHOT_DIR": str(cls.SNAPSHOT_DIR),
+            "USE_SNAPSHOT": cls.USE_SNAPSHOT,
+            "ENFORCE_DATASET_SCHEMAS": cls.ENFORCE_DATASET_SCHEMAS,
+            "DATASET_FLOAT_DTYPE": cls.DATASET_FLOAT_DTYPE,
+            "CALLBACK_PROFILING": cls.CALLBACK_PROFILING,
+            "CALLBACK_PROFILE_TOP_N": cls.CALLBACK_PROFILE_TOP_N,
+            "CALLBACK_PROFILE_DIR": str(cls.CALLBACK_PROFILE_DIR),
             "LOG_LEVEL": cls.LOG_LEVEL,
+            "AUDIT_QUEUE_SIZE": cls.AUDIT_QUEUE_SIZE,
+            "AUDIT_BATCH_SIZE": cls.AUDIT_BATCH_SIZE,
+            "AUDIT_FLUSH_INTERVAL": cls.AUDIT_FLUSH_INTERVAL,
+            "AUDIT_FSYNC_INTERVAL": cls.AUDIT_FSYNC_INTERVAL,
+            "AUDIT_OVERFLOW_POLICY": cls.AUDIT_OVERFLOW_POLICY,
+            "AUDIT_STORE_ENABLED": cls.AUDIT_STORE_ENABLED,
+            "AUDIT_ROLLUP_MINUTES": cls.AUDIT_ROLLUP_MINUTES,
+            "AUDIT_ROLLUP_HOURS": cls.AUDIT_ROLLUP_HOURS,
             "DEBUG": cls.DEBUG,
             "API_TIMEOUT": cls.API_TIMEOUT,
         }
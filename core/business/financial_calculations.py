@@ -5,7 +5,7 @@ NPV, IRR, TCO, and risk-adjusted returns for AI adoption decisions.
 """
 
 import logging
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 import numpy as np
 from scipy import optimize
 
@@ -80,6 +80,89 @@ def calculate_irr(
         return None
 
 
+def pad_cash_flows(cash_flows: Sequence[Sequence[float]]) -> np.ndarray:
+    """Stack cash flow series of different lengths into a matrix.
+    
+    Shorter series are padded with trailing zeros, which change neither
+    their NPV nor their IRR.
+    
+    Args:
+        cash_flows: One list of annual cash flows per investment
+        
+    Returns:
+        Array of shape (investments, longest series)
+    """
+    lengths = {len(row) for row in cash_flows}
+    if len(lengths) <= 1:
+        return np.asarray(cash_flows, dtype=float).reshape(len(cash_flows), -1)
+    matrix = np.zeros((len(cash_flows), max(lengths)))
+    for i, row in enumerate(cash_flows):
+        matrix[i, :len(row)] = row
+    return matrix
+
+
+def calculate_npv_batch(
+    cash_flows: np.ndarray,
+    discount_rates: np.ndarray,
+    initial_investments: np.ndarray
+) -> np.ndarray:
+    """Calculate the Net Present Value of many investments at once.
+    
+    Vectorized equivalent of ``calculate_npv`` (before rounding).
+    
+    Args:
+        cash_flows: Annual cash flows, one row per investment (see ``pad_cash_flows``)
+        discount_rates: Discount rate per investment
+        initial_investments: Initial investment per investment
+        
+    Returns:
+        Array of NPVs
+    """
+    periods = np.arange(1, cash_flows.shape[1] + 1)
+    discounted = cash_flows / (1 + discount_rates[:, None]) ** periods
+    return discounted.sum(axis=1) - initial_investments
+
+
+def calculate_irr_batch(
+    cash_flows: np.ndarray,
+    initial_investments: np.ndarray,
+    iterations: int = 60
+) -> np.ndarray:
+    """Calculate the Internal Rate of Return of many investments at once.
+    
+    Bisects every row at the same time over the bracket ``calculate_irr``
+    searches (-99% to 1000%); 60 halvings narrow it far below the
+    precision of the rounded result.
+    
+    Args:
+        cash_flows: Annual cash flows, one row per investment (see ``pad_cash_flows``)
+        initial_investments: Initial investment per investment
+        iterations: Number of bisection steps
+        
+    Returns:
+        Array of IRRs, NaN where the NPV does not change sign in the bracket
+    """
+    flows = np.column_stack([-initial_investments, cash_flows])
+    periods = np.arange(flows.shape[1])
+    
+    def npv(rates: np.ndarray) -> np.ndarray:
+        return (flows / (1 + rates[:, None]) ** periods).sum(axis=1)
+    
+    low = np.full(len(flows), -0.99)
+    high = np.full(len(flows), 10.0)
+    with np.errstate(over="ignore", invalid="ignore"):
+        f_low = npv(low)
+        converges = f_low * npv(high) <= 0
+        for _ in range(iterations):
+            mid = (low + high) / 2
+            f_mid = npv(mid)
+            same_sign = np.signbit(f_mid) == np.signbit(f_low)
+            low = np.where(same_sign, mid, low)
+            f_low = np.where(same_sign, f_mid, f_low)
+            high = np.where(same_sign, high, mid)
+    return np.where(converges, (low + high) / 2, np.nan)
+
+
 def calculate_tco(
     initial_cost: float,
     annual_operating_costs: List[float],
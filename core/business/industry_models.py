@@ -183,7 +183,7 @@ def calculate_manufacturing_roi(
     # Calculate metrics
     npv = calculate_npv(annual_cash_flows, 0.10, investment)
     irr = calculate_irr(annual_cash_flows, investment)
-    payback = calculate_payback_period(annual_cash_flows, investment)
+    payback = calculate_payback_period(investment, annual_cash_flows)
     
     # Industry-specific insights
     insights = []
@@ -277,7 +277,7 @@ def calculate_healthcare_roi(
     # Calculate metrics with higher discount rate due to regulatory risk
     npv = calculate_npv(annual_cash_flows, 0.12, investment)
     irr = calculate_irr(annual_cash_flows, investment)
-    payback = calculate_payback_period(annual_cash_flows, investment)
+    payback = calculate_payback_period(investment, annual_cash_flows)
     
     # Healthcare-specific insights
     insights = []
@@ -367,7 +367,7 @@ def calculate_financial_services_roi(
     # Calculate metrics
     npv = calculate_npv(annual_cash_flows, 0.10, investment)
     irr = calculate_irr(annual_cash_flows, investment)
-    payback = calculate_payback_period(annual_cash_flows, investment)
+    payback = calculate_payback_period(investment, annual_cash_flows)
     
     # Financial services insights
     insights = []
@@ -455,7 +455,7 @@ def calculate_retail_roi(
     # Calculate metrics
     npv = calculate_npv(annual_cash_flows, 0.10, investment)
     irr = calculate_irr(annual_cash_flows, investment)
-    payback = calculate_payback_period(annual_cash_flows, investment)
+    payback = calculate_payback_period(investment, annual_cash_flows)
     
     # Retail insights
     insights = []
@@ -5,12 +5,14 @@ import concurrent.futures
 import logging
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 import time
 
+import numpy as np
 import pandas as pd
 
 from config.settings import settings
+from performance.telemetry import register_cache_layer
 
 from .loaders import (
     AcademicPapersLoader,
@@ -24,9 +26,30 @@ from .loaders import (
     RichmondFedLoader,
     StLouisFedLoader,
 )
+from .snapshot import SnapshotBundle, SnapshotLoader
 
 logger = logging.getLogger(__name__)
 
+# Primary data sources - loaders expect specific file paths, not directory,
+# and each factory uses its default PDF path
+LOADER_FACTORIES: Dict[str, Callable[[], BaseDataLoader]] = {
+    "ai_index": AIIndexLoader,
+    "mckinsey": McKinseyLoader,
+    "oecd": OECDLoader,
+    # Federal Reserve loaders
+    "richmond_fed": RichmondFedLoader,
+    "stlouis_fed": StLouisFedLoader,
+    # Academic sources
+    # "nber": NBERPapersLoader,  # Not available
+    "academic": AcademicPapersLoader,
+    # Industry sources
+    "goldman_sachs": GoldmanSachsLoader,
+    "nvidia": NVIDIATokenLoader,
+    "imf": IMFLoader,
+    # Specialized and strategy loaders (industry, regional, skills, ai_strategy,
+    # ai_use_cases, public_sector) are not available
+}
+
 
 class DataManagerDash:
     """
@@ -34,45 +57,44 @@ class DataManagerDash:
     Replaces Streamlit caching with functools.lru_cache.
     """
 
-    def __init__(self, resources_path: Optional[Path] = None):
-        """Initialize the data manager with configured resources path."""
+    def __init__(self, resources_path: Optional[Path] = None, use_snapshot: Optional[bool] = None):
+        """Initialize the data manager with configured resources path.
+
+        Args:
+            resources_path: Directory containing the source PDFs
+            use_snapshot: Serve datasets from the latest snapshot bundle when its
+                sources are unchanged (defaults to settings.USE_SNAPSHOT)
+        """
         self.resources_path = resources_path or settings.get_resources_path()
+        self.use_snapshot = settings.USE_SNAPSHOT if use_snapshot is None else use_snapshot
+        self.snapshot: Optional[SnapshotBundle] = None
         self.loaders: Dict[str, BaseDataLoader] = {}
         self._cache_timestamp = {}
         self._initialize_loaders()
 
     def _initialize_loaders(self):
-        """Initialize all data loaders."""
-        logger.info(f"Initializing data loaders with resources path: {self.resources_path}")
-
-        # Primary data sources - loaders expect specific file paths, not directory
-        self.loaders["ai_index"] = AIIndexLoader()  # Uses default PDF path
-        self.loaders["mckinsey"] = McKinseyLoader()  # Uses default PDF path
-        self.loaders["oecd"] = OECDLoader()  # Uses default PDF path
-        # Federal Reserve loaders
-        self.loaders["richmond_fed"] = RichmondFedLoader()  # Uses default PDF path
-        self.loaders["stlouis_fed"] = StLouisFedLoader()  # Uses default PDF path
-
-        # Academic sources
-        # self.loaders["nber"] = NBERPapersLoader()  # Not available
-        self.loaders["academic"] = AcademicPapersLoader()  # Uses default PDF paths
+        """Initialize all data loaders.
 
-        # Industry sources
-        self.loaders["goldman_sachs"] = GoldmanSachsLoader()  # Uses default PDF path
-        self.loaders["nvidia"] = NVIDIATokenLoader()  # Uses default PDF path
-        self.loaders["imf"] = IMFLoader()  # Uses default PDF path
+        Sources captured in an up-to-date snapshot bundle are served from the
+        bundle; all others construct their live PDF loader.
+        """
+        logger.info(f"Initializing data loaders with resources path: {self.resources_path}")
 
-        # Specialized loaders - commented out as they're not available
-        # self.loaders["industry"] = IndustryLoader(self.resources_path)
-        # self.loaders["regional"] = RegionalLoader(self.resources_path)
-        # self.loaders["skills"] = SkillsLoader(self.resources_path)
+        if self.use_snapshot:
+            self.snapshot = SnapshotBundle.open(settings.SNAPSHOT_DIR)
 
-        # Strategy loaders - commented out as they're not available
-        # self.loaders["ai_strategy"] = AIStrategyLoader(self.resources_path)
-        # self.loaders["ai_use_cases"] = AIUseCaseLoader(self.resources_path)
-        # self.loaders["public_sector"] = PublicSectorLoader(self.resources_path)
+        snapshot_sources = 0
+        for source_name, factory in LOADER_FACTORIES.items():
+            if self.snapshot is not None and self.snapshot.is_source_current(source_name):
+                self.loaders[source_name] = SnapshotLoader(self.snapshot, source_name)
+                snapshot_sources += 1
+            else:
+                self.loaders[source_name] = factory()
 
-        logger.info(f"Initialized {len(self.loaders)} data loaders")
+        logger.info(
+            f"Initialized {len(self.loaders)} data loaders "
+            f"({snapshot_sources} from snapshot)"
+        )
 
     @lru_cache(maxsize=128)
     def get_dataset_cached(self, dataset_name: str, source: Optional[str] = None) -> pd.DataFrame:
@@ -129,6 +151,33 @@ class DataManagerDash:
 
         raise ValueError(f"Dataset '{dataset_name}' not found in any source")
 
+    def get_dataset_array(
+        self, dataset_name: str, column: str, source: Optional[str] = None
+    ) -> np.ndarray:
+        """Get a single dataset column as a NumPy array.
+
+        For datasets served from the snapshot bundle the array is a read-only
+        view of the memory-mapped file, shared across worker processes; other
+        sources fall back to converting the loaded DataFrame column.
+        """
+        if source:
+            if source not in self.loaders:
+                raise ValueError(f"Unknown source: {source}")
+            candidates = [self.loaders[source]]
+        else:
+            candidates = list(self.loaders.values())
+
+        for loader in candidates:
+            if isinstance(loader, SnapshotLoader):
+                if dataset_name in loader.list_datasets():
+                    return loader.get_array(dataset_name, column)
+                continue
+            data = loader.get_dataset(dataset_name)
+            if data is not None:
+                return data[column].to_numpy()
+
+        raise ValueError(f"Dataset '{dataset_name}' not found in any source")
+
     def list_datasets(self, source: Optional[str] = None) -> List[str]:
         """List all available datasets."""
         if source:
@@ -229,6 +278,22 @@ class DataManagerDash:
         logger.info("Data cache cleared")
 
 
+def _dataset_cache_stats() -> Dict[str, Any]:
+    """Get hit statistics of the shared dataset LRU cache."""
+    info = DataManagerDash.get_dataset_cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
+
+
+register_cache_layer(
+    "dataset", _dataset_cache_stats, DataManagerDash.get_dataset_cached.cache_clear
+)
+
+
 # For backward compatibility, create an instance that can be imported
 # This allows existing code to work without modification
 default_data_manager = DataManagerDash()
\ No newline at end of file
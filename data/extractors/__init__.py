@@ -1,8 +1,27 @@
 """PDF and document extraction utilities."""
 
 from .base import PDFExtractor
+from .entity_scanner import EntityHit, EntityScanner, get_scanner
+from .patterns import NumericPattern, PatternMatch, PatternSet, get_pattern_stats
+from .table_backends import TableBackend, TableExtractionEngine, get_backend_stats
+from .table_normalization import ColumnSpec, TableSchema, normalize_table
 
 
 
 
-__all__ = ["PDFExtractor"]
+__all__ = [
+    "PDFExtractor",
+    "EntityHit",
+    "EntityScanner",
+    "get_scanner",
+    "NumericPattern",
+    "PatternMatch",
+    "PatternSet",
+    "get_pattern_stats",
+    "TableBackend",
+    "TableExtractionEngine",
+    "get_backend_stats",
+    "ColumnSpec",
+    "TableSchema",
+    "normalize_table",
+]
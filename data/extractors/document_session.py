@@ -0,0 +1,384 @@
+"""Open-once PDF document sessions with a byte-capped page cache.
+
+Opening a PDF parses its cross-reference table and object tree, which for
+the larger reports costs more than extracting a page. A
+``PDFDocumentSession`` opens the file once, serves every page read from
+that parse, and caches per-page results (text, raw tables) in an LRU that
+is bounded in bytes rather than entries, so a long report cannot grow the
+cache without limit.
+
+A session is safe to share between threads: parser access is serialized by
+a lock, since neither pdfplumber nor PyPDF2 documents are thread-safe.
+Process pools should open one session per worker. Sessions reopen lazily
+after ``close()``, so an extractor can release its file handle between
+loads without losing the ability to read again.
+"""
+
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import pandas as pd
+
+from config.settings import settings
+
+from .parallel_pages import PARALLEL_MIN_PAGES, iter_page_shards, resolve_workers
+from .table_detection import TABLE_SCORE_THRESHOLD, score_page
+
+try:
+    import pdfplumber
+    import PyPDF2
+
+    PDF_LIBS_AVAILABLE = True
+except ImportError:
+    PDF_LIBS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory held by a cached value in bytes."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class LRUByteCache:
+    """Least-recently-used cache bounded by the total size of its values.
+
+    Not thread-safe; ``PDFDocumentSession`` guards it with its own lock.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = estimate_size(value)
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_bytes:
+            # Larger than the whole cache; serve it uncached
+            return
+        self._entries[key] = value
+        self._sizes[key] = size
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        del self._entries[key]
+        self.current_bytes -= self._sizes.pop(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._sizes.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+class PDFDocumentSession:
+    """A PDF opened once and shared by every page read of an extractor."""
+
+    def __init__(self, file_path: Union[str, Path], max_cache_bytes: Optional[int] = None):
+        """Create a session; the file is opened on first use.
+
+        Args:
+            file_path: Path to the PDF file
+            max_cache_bytes: Byte cap of the page cache, defaults to
+                ``settings.PDF_PAGE_CACHE_BYTES``
+        """
+        self.file_path = Path(file_path)
+        if max_cache_bytes is None:
+            max_cache_bytes = settings.PDF_PAGE_CACHE_BYTES
+        self.cache = LRUByteCache(max_cache_bytes)
+        self._lock = threading.RLock()
+        self._plumber = None
+        self._reader_file = None
+        self._reader = None
+        self._page_count: Optional[int] = None
+        self.opens = 0
+
+    def __enter__(self) -> "PDFDocumentSession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    @property
+    def is_open(self) -> bool:
+        """Whether a parser currently holds the file open."""
+        return self._plumber is not None or self._reader is not None
+
+    def _get_plumber(self):
+        if self._plumber is None:
+            self._plumber = pdfplumber.open(self.file_path)
+            self.opens += 1
+        return self._plumber
+
+    def _get_reader(self):
+        if self._reader is None:
+            self._reader_file = open(self.file_path, "rb")
+            self._reader = PyPDF2.PdfReader(self._reader_file)
+            self.opens += 1
+        return self._reader
+
+    @property
+    def reader(self) -> "PyPDF2.PdfReader":
+        """PyPDF2 reader over the session's file, for metadata and fallbacks."""
+        with self._lock:
+            return self._get_reader()
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the document."""
+        with self._lock:
+            if self._page_count is None:
+                try:
+                    self._page_count = len(self._get_plumber().pages)
+                except Exception as e:
+                    logger.warning(f"pdfplumber could not open {self.file_path.name}: {e}")
+                    self._page_count = len(self._get_reader().pages)
+            return self._page_count
+
+    def _cached(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            value = self.cache.get(key)
+            if value is None:
+                value = compute()
+                self.cache.put(key, value)
+            return value
+
+    def page_text(self, page_number: int) -> str:
+        """Get the text of a page (0-indexed), or "" past the last page."""
+        return self._cached(("text", page_number), lambda: self._extract_text(page_number))
+
+    def table_score(self, page_number: int) -> float:
+        """Get how likely a page is to contain a table, between 0 and 1.
+
+        Scores are computed alongside page text whenever pdfplumber parses
+        a page, so this is usually a cache lookup.
+        """
+        return self._cached(("table_score", page_number), lambda: self._score(page_number))
+
+    def likely_table_pages(
+        self, pages: Iterable[int], threshold: float = TABLE_SCORE_THRESHOLD
+    ) -> List[int]:
+        """Filter pages down to those likely to contain a table."""
+        return [page for page in pages if self.table_score(page) >= threshold]
+
+    def page_texts(self, start: int = 0, end: Optional[int] = None) -> List[str]:
+        """Get the texts of pages ``start`` to ``end`` (exclusive)."""
+        return [text for _, text in self.iter_pages(start, end)]
+
+    def iter_pages(
+        self,
+        start: int = 0,
+        end: Optional[int] = None,
+        include_tables: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Tuple[int, str]]:
+        """Yield ``(page number, text)`` in page order, filling the page cache.
+
+        When at least ``PARALLEL_MIN_PAGES`` pages are not cached yet, they
+        are extracted across a process pool (see ``parallel_pages``) and
+        streamed back shard by shard; otherwise pages are read in-process.
+
+        Args:
+            start: First page (0-indexed)
+            end: Page after the last one, defaults to the page count
+            include_tables: Also extract and cache pdfplumber tables
+            max_workers: Worker processes, defaults to ``settings.MAX_WORKERS``
+        """
+        end = self.page_count if end is None else min(end, self.page_count)
+        with self._lock:
+            missing = [
+                i
+                for i in range(start, end)
+                if ("text", i) not in self.cache
+                or (include_tables and ("tables", i) not in self.cache)
+            ]
+        workers = resolve_workers(max_workers)
+
+        if workers < 2 or len(missing) < PARALLEL_MIN_PAGES:
+            for i in range(start, end):
+                if include_tables:
+                    self.page_tables(i)
+                yield i, self.page_text(i)
+            return
+
+        first, last = missing[0], missing[-1] + 1
+        for i in range(start, first):
+            yield i, self.page_text(i)
+
+        next_page = first
+        try:
+            for shard in iter_page_shards(self.file_path, first, last, workers, include_tables):
+                with self._lock:
+                    for offset, text in enumerate(shard.texts):
+                        page = shard.start + offset
+                        self.cache.put(("text", page), text)
+                        if shard.scores[offset] is not None:
+                            self.cache.put(("table_score", page), shard.scores[offset])
+                        if shard.tables is not None:
+                            self.cache.put(("tables", page), shard.tables[offset])
+                for offset, text in enumerate(shard.texts):
+                    yield shard.start + offset, text
+                next_page = shard.end
+        except Exception as e:
+            # A broken pool must not fail the load; finish the range in-process
+            logger.warning(f"Parallel extraction of {self.file_path.name} failed: {e}")
+
+        for i in range(next_page, end):
+            if include_tables:
+                self.page_tables(i)
+            yield i, self.page_text(i)
+
+    def page_tables(self, page_number: int) -> List[List[List[Optional[str]]]]:
+        """Get the raw tables pdfplumber finds on a page."""
+        return self._cached(("tables", page_number), lambda: self._extract_tables(page_number))
+
+    def _extract_text(self, page_number: int) -> str:
+        text, score = self.extract_page(page_number)
+        if score is not None:
+            self.cache.put(("table_score", page_number), score)
+        return text
+
+    def extract_page(self, page_number: int) -> Tuple[str, Optional[float]]:
+        """Extract a page's text and table score without caching them.
+
+        The score is computed while the page's layout objects are parsed,
+        which costs little on top of the text. It is None when pdfplumber
+        cannot read the page.
+        """
+        with self._lock:
+            if page_number >= self.page_count:
+                return "", 0.0
+            try:
+                page = self._get_plumber().pages[page_number]
+                try:
+                    text = page.extract_text() or ""
+                    return text, self._score_parsed(page)
+                finally:
+                    # Drop the page's parsed layout objects; only results are kept
+                    page.close()
+            except Exception as e:
+                logger.warning(
+                    f"pdfplumber extraction failed for page {page_number}, "
+                    f"falling back to PyPDF2: {e}"
+                )
+            try:
+                return self._get_reader().pages[page_number].extract_text() or "", None
+            except Exception as e:
+                logger.error(f"Both PDF extraction methods failed for page {page_number}: {e}")
+                return "", None
+
+    def _score_parsed(self, page) -> float:
+        try:
+            return score_page(page)
+        except Exception as e:
+            # Unknown structure; let the table engines decide
+            logger.debug(f"Table scoring failed for page {page.page_number}: {e}")
+            return 1.0
+
+    def _score(self, page_number: int) -> float:
+        if page_number >= self.page_count:
+            return 0.0
+        try:
+            page = self._get_plumber().pages[page_number]
+        except Exception:
+            return 1.0
+        try:
+            return self._score_parsed(page)
+        finally:
+            page.close()
+
+    def _extract_tables(self, page_number: int) -> List[List[List[Optional[str]]]]:
+        if page_number >= self.page_count:
+            return []
+        page = self._get_plumber().pages[page_number]
+        try:
+            return page.extract_tables()
+        finally:
+            page.close()
+
+    def clear_cache(self) -> None:
+        """Drop cached page results but keep the document open."""
+        with self._lock:
+            self.cache.clear()
+
+    def close(self) -> None:
+        """Release the file handles and cached pages.
+
+        The session stays usable; the next read reopens the file.
+        """
+        with self._lock:
+            if self._plumber is not None:
+                self._plumber.close()
+                self._plumber = None
+            if self._reader_file is not None:
+                self._reader_file.close()
+                self._reader_file = None
+            self._reader = None
+            self._page_count = None
+            self.cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get page cache statistics and the number of times the file was opened."""
+        with self._lock:
+            stats = self.cache.stats()
+            stats["opens"] = self.opens
+            stats["open"] = self.is_open
+            return stats
@@ -0,0 +1,180 @@
+"""Multi-pattern entity scanning for PDF text mining.
+
+Loaders look for fixed vocabularies (country names, research areas, policy
+areas, section keywords) in every extracted page. Testing each entity with
+``entity.lower() in text.lower()`` costs one lowercase copy and one scan of
+the page per entity. ``EntityScanner`` compiles a whole vocabulary into a
+single trie regex run over the page lowercased once, so the cost of a scan
+grows with the text size rather than with text size times vocabulary size.
+Every occurrence is found, including entities that overlap or contain one
+another.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+@dataclass(frozen=True)
+class EntityHit:
+    """One occurrence of an entity in a text."""
+
+    entity: str
+    start: int
+    end: int
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex matching any of the words, factored as a trie.
+
+    Sibling branches start with different characters, so the regex engine
+    never backtracks across alternatives, and optional suffixes are greedy
+    so the longest word at a position wins.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _node_pattern(trie)
+
+
+def _node_pattern(node: Dict[str, dict]) -> str:
+    branches = [
+        re.escape(char) + _node_pattern(child) for char, child in sorted(node.items()) if char
+    ]
+    if not branches:
+        return ""
+    terminal = "" in node
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    pattern = "(?:" + "|".join(branches) + ")"
+    return pattern + "?" if terminal else pattern
+
+
+class EntityScanner:
+    """Finds all occurrences of a fixed set of entities in one pass.
+
+    Matching is case-insensitive substring matching, the same semantics as
+    ``entity.lower() in text.lower()``, so scanner results can replace such
+    loops one for one. The text is lowercased once per scan (callers that
+    already hold lowercased text can pass ``lowered=True``) and offsets refer
+    to the original text.
+    """
+
+    def __init__(self, entities: Iterable[str], whole_words: bool = False):
+        """Compile the scanner.
+
+        Args:
+            entities: Entities to look for; duplicates are ignored
+            whole_words: Only match entities delimited by word boundaries
+        """
+        self.entities: List[str] = []
+        self._canonical: Dict[str, str] = {}
+        for entity in entities:
+            key = _lower(entity)
+            if key and key not in self._canonical:
+                self._canonical[key] = entity
+                self.entities.append(entity)
+
+        # Entities that are prefixes of a longer entity are hidden by the
+        # longest match at a position and are reported alongside it instead
+        self._prefixes: Dict[str, List[str]] = {
+            key: [other for other in self._canonical if other != key and key.startswith(other)]
+            for key in self._canonical
+        }
+
+        pattern = _trie_pattern(self._canonical) or "(?!)"
+        if whole_words:
+            pattern = rf"\b{pattern}\b"
+        self._regex = re.compile(pattern)
+        self._whole_words = whole_words
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def _matches(self, text: str, lowered: bool):
+        """Yield ``(key, start, end)`` for every match, overlapping ones included."""
+        if not text:
+            return
+        haystack = text if lowered else _lower(text)
+
+        position = 0
+        while True:
+            match = self._regex.search(haystack, position)
+            if match is None:
+                return
+            start = match.start()
+            key = match.group()
+            yield key, start, match.end()
+            for prefix in self._prefixes[key]:
+                end = start + len(prefix)
+                if not self._whole_words or _is_word_end(haystack, end):
+                    yield prefix, start, end
+            # Restart right after the match start so overlapping entities are found
+            position = start + 1
+
+    def scan(self, text: str, lowered: bool = False) -> List[EntityHit]:
+        """Find every entity occurrence in a text.
+
+        Args:
+            text: Text to scan
+            lowered: The text is already lowercase
+
+        Returns:
+            Hits ordered by start offset
+        """
+        return [
+            EntityHit(self._canonical[key], start, end)
+            for key, start, end in self._matches(text, lowered)
+        ]
+
+    def found_set(self, text: str, lowered: bool = False) -> Set[str]:
+        """Get the set of entities present in a text."""
+        return {self._canonical[key] for key, _, _ in self._matches(text, lowered)}
+
+    def find_entities(self, text: str, lowered: bool = False) -> List[str]:
+        """Get the distinct entities present in a text, in vocabulary order."""
+        found = self.found_set(text, lowered)
+        return [entity for entity in self.entities if entity in found]
+
+    def first_offsets(self, text: str, lowered: bool = False) -> Dict[str, int]:
+        """Get the offset of the first occurrence of each entity present."""
+        offsets: Dict[str, int] = {}
+        for key, start, _ in self._matches(text, lowered):
+            offsets.setdefault(self._canonical[key], start)
+        return offsets
+
+    def contains_any(self, text: str, lowered: bool = False) -> bool:
+        """Check whether any entity occurs in a text."""
+        return next(self._matches(text, lowered), None) is not None
+
+
+@lru_cache(maxsize=256)
+def get_scanner(entities: Tuple[str, ...], whole_words: bool = False) -> EntityScanner:
+    """Get a compiled scanner for a vocabulary, reusing earlier compilations.
+
+    Args:
+        entities: Entities to look for, as a tuple so it can be cached
+        whole_words: Only match entities delimited by word boundaries
+    """
+    return EntityScanner(entities, whole_words)
+
+
+def _lower(text: str) -> str:
+    """Lowercase a text, keeping its length so offsets still refer to it.
+
+    A few characters lowercase to several ("İ" to "i" plus a combining dot);
+    those are kept as they are.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+
+def _is_word_end(text: str, position: int) -> bool:
+    """Check whether a word boundary follows a position."""
+    return position >= len(text) or not (text[position].isalnum() or text[position] == "_")
@@ -2,41 +2,68 @@
 
 import hashlib
 import logging
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 
-from data.extractors.pdf import PDFExtractor
+from config.settings import settings
+from data.extractors.parallel_pages import plan_shards
+from data.extractors.pdf_extractor import PDFExtractor
+from data.extractors.table_backends import (
+    CamelotBackend,
+    TableExtraction,
+    TableExtractionEngine,
+    TabulaBackend,
+    record_timings,
+)
 from performance.cache_manager import CacheKeyGenerator, get_cache
 from performance.monitor import PerformanceContext, track_performance
 
 logger = logging.getLogger(__name__)
 
 
+# camelot's stream mode first, tabula without a header row as fallback
+TABLE_ENGINE = TableExtractionEngine(
+    [CamelotBackend(flavor="stream"), TabulaBackend(lattice=False, header=None)]
+)
+
+
+def _read_tables_batch(file_path: str, pages: List[int]) -> TableExtraction:
+    """Extract tables from a batch of pages in one backend call.
+
+    This function is designed to be run in parallel processes. Timings are
+    returned rather than recorded, since worker metrics would be lost.
+    """
+    return TABLE_ENGINE.extract(file_path, pages, record=False)
+
+
 class OptimizedPDFExtractor(PDFExtractor):
     """Optimized PDF extractor with performance enhancements."""
 
     def __init__(
-        self, file_path: Union[str, Path], cache_enabled: bool = True, max_workers: int = 2
+        self,
+        file_path: Union[str, Path],
+        cache_enabled: bool = True,
+        max_workers: Optional[int] = None,
     ):
         """Initialize optimized PDF extractor.
 
         Args:
             file_path: Path to PDF file
             cache_enabled: Enable caching
-            max_workers: Max workers for parallel processing
+            max_workers: Max worker processes for parallel processing, defaults
+                to ``settings.MAX_WORKERS``
         """
         super().__init__(file_path)
         self.cache_enabled = cache_enabled
         self.cache = get_cache() if cache_enabled else None
-        self.max_workers = max_workers
+        self.max_workers = max_workers or settings.MAX_WORKERS
 
         # Lazy loading
         self._metadata = None
         self._page_cache = {}
-        self._text_cache = {}
         self._table_cache = {}
 
         # File hash for cache invalidation
@@ -70,28 +97,27 @@ class OptimizedPDFExtractor(PDFExtractor):
 
         # Extract metadata
         try:
-            with open(self.file_path, "rb") as file:
-                reader = PyPDF2.PdfReader(file)
-
-                self._metadata = {
-                    "pages": len(reader.pages),
-                    "title": (
-                        reader.metadata.get("/Title", "Unknown") if reader.metadata else "Unknown"
-                    ),
-                    "author": (
-                        reader.metadata.get("/Author", "Unknown") if reader.metadata else "Unknown"
-                    ),
-                    "subject": reader.metadata.get("/Subject", "") if reader.metadata else "",
-                    "creator": reader.metadata.get("/Creator", "") if reader.metadata else "",
-                    "file_size": Path(self.file_path).stat().st_size,
-                    "file_hash": self._get_file_hash(),
-                }
-
-                # Cache metadata
-                if self.cache_enabled:
-                    self.cache.set(cache_key, self._metadata, memory_ttl=3600)
+            reader = self.session.reader
+
+            self._metadata = {
+                "pages": len(reader.pages),
+                "title": (
+                    reader.metadata.get("/Title", "Unknown") if reader.metadata else "Unknown"
+                ),
+                "author": (
+                    reader.metadata.get("/Author", "Unknown") if reader.metadata else "Unknown"
+                ),
+                "subject": reader.metadata.get("/Subject", "") if reader.metadata else "",
+                "creator": reader.metadata.get("/Creator", "") if reader.metadata else "",
+                "file_size": Path(self.file_path).stat().st_size,
+                "file_hash": self._get_file_hash(),
+            }
+
+            # Cache metadata
+            if self.cache_enabled:
+                self.cache.set(cache_key, self._metadata, memory_ttl=3600)
 
-                return self._metadata
+            return self._metadata
 
         except Exception as e:
             logger.error(f"Error extracting metadata: {e}")
@@ -150,28 +176,24 @@ class OptimizedPDFExtractor(PDFExtractor):
 
     def _extract_page_text_lazy(self, page_num: int) -> str:
         """Extract text from a single page with caching."""
-        # Check page cache
-        if page_num in self._text_cache:
-            return self._text_cache[page_num]
+        # Pages already parsed in this process are held by the session's page cache
+        if ("text", page_num) in self.session.cache:
+            return self.session.page_text(page_num)
 
         # Check disk cache
         if self.cache_enabled:
             cache_key = f"pdf_page:{self._get_file_hash()}:{page_num}"
             cached = self.cache.get(cache_key)
             if cached:
-                self._text_cache[page_num] = cached
                 return cached
 
         # Extract page
         with PerformanceContext(f"extract_page_{page_num}"):
             try:
-                with open(self.file_path, "rb") as file:
-                    reader = PyPDF2.PdfReader(file)
-                    page = reader.pages[page_num]
-                    text = page.extract_text()
+                # Served from the document opened once by the extractor's session
+                text = self.session.page_text(page_num)
 
                 # Cache result
-                self._text_cache[page_num] = text
                 if self.cache_enabled:
                     cache_key = f"pdf_page:{self._get_file_hash()}:{page_num}"
                     self.cache.set(cache_key, text, memory_ttl=600)
@@ -185,15 +207,7 @@ class OptimizedPDFExtractor(PDFExtractor):
     def _extract_text_range(self, start: int, end: int) -> str:
         """Extract text from page range."""
         try:
-            with open(self.file_path, "rb") as file:
-                reader = PyPDF2.PdfReader(file)
-                text_parts = []
-
-                for page_num in range(start, end):
-                    page = reader.pages[page_num]
-                    text_parts.append(page.extract_text())
-
-                return "\n".join(text_parts)
+            return "\n".join(self.session.page_texts(start, end))
 
         except Exception as e:
             logger.error(f"Error extracting text range: {e}")
@@ -201,13 +215,18 @@ class OptimizedPDFExtractor(PDFExtractor):
 
     @track_performance("pdf_extract_tables", threshold=3.0)
     def extract_tables(
-        self, pages: Optional[Union[str, List[int]]] = None, parallel: bool = True
+        self,
+        pages: Optional[Union[str, List[int]]] = None,
+        parallel: bool = True,
+        detect_tables: bool = True,
     ) -> List[pd.DataFrame]:
         """Extract tables from PDF with parallel processing.
 
         Args:
             pages: Page numbers to extract from
             parallel: Use parallel processing
+            detect_tables: Skip pages the table-detection pre-pass scores as
+                having no table
 
         Returns:
             List of DataFrames
@@ -229,6 +248,10 @@ class OptimizedPDFExtractor(PDFExtractor):
         elif isinstance(pages, int):
             pages = [pages]
 
+        # Only run camelot/tabula on pages likely to hold a table
+        if detect_tables:
+            pages = self.session.likely_table_pages(pages)
+
         # Extract tables
         if parallel and len(pages) > 1:
             tables = self._extract_tables_parallel(pages)
@@ -243,80 +266,49 @@ class OptimizedPDFExtractor(PDFExtractor):
         return tables
 
     def _extract_tables_parallel(self, pages: List[int]) -> List[pd.DataFrame]:
-        """Extract tables from multiple pages in parallel."""
-        all_tables = []
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit tasks
-            futures = {executor.submit(self._extract_page_tables, page): page for page in pages}
-
-            # Collect results
-            for future in futures:
-                try:
-                    page_tables = future.result()
-                    all_tables.extend(page_tables)
-                except Exception as e:
-                    page = futures[future]
-                    logger.error(f"Error extracting tables from page {page}: {e}")
+        """Extract tables from multiple pages across a process pool.
 
-        return all_tables
+        Table extraction is CPU-bound, so uncached pages are split into one
+        batch per shard and each worker reads its batch in a single backend
+        call. Results are collected in page order.
+        """
+        pending = [page for page in pages if page not in self._table_cache]
+        shards = plan_shards(0, len(pending), self.max_workers)
+
+        if len(shards) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(shards))) as executor:
+                futures = [
+                    executor.submit(_read_tables_batch, str(self.file_path), pending[first:last])
+                    for first, last in shards
+                ]
+                for future in futures:
+                    try:
+                        self._store_tables(future.result())
+                    except Exception as e:
+                        logger.error(f"Error extracting tables from {self.file_path.name}: {e}")
+        elif pending:
+            self._store_tables(_read_tables_batch(str(self.file_path), pending))
+
+        return [df for page in pages for df in self._table_cache.get(page, [])]
 
     def _extract_tables_sequential(self, pages: List[int]) -> List[pd.DataFrame]:
-        """Extract tables sequentially."""
-        all_tables = []
-
-        for page in pages:
-            try:
-                page_tables = self._extract_page_tables(page)
-                all_tables.extend(page_tables)
-            except Exception as e:
-                logger.error(f"Error extracting tables from page {page}: {e}")
-
-        return all_tables
+        """Extract tables in-process, in one backend call for all uncached pages."""
+        pending = [page for page in pages if page not in self._table_cache]
+        if pending:
+            self._store_tables(_read_tables_batch(str(self.file_path), pending))
+        return [df for page in pages for df in self._table_cache.get(page, [])]
 
     def _extract_page_tables(self, page_num: int) -> List[pd.DataFrame]:
         """Extract tables from a single page."""
-        # Check cache
-        if page_num in self._table_cache:
-            return self._table_cache[page_num]
+        return self._extract_tables_sequential([page_num])
 
-        try:
-            # Use camelot for better table extraction
-            tables = camelot.read_pdf(
-                str(self.file_path),
-                pages=str(page_num + 1),  # camelot uses 1-based indexing
-                flavor="stream",
-                suppress_stdout=True,
-            )
-
-            # Convert to DataFrames
-            dataframes = [table.df for table in tables]
-
-            # Cache result
-            self._table_cache[page_num] = dataframes
-
-            return dataframes
-
-        except Exception as e:
-            logger.debug(f"Camelot failed for page {page_num}, trying tabula: {e}")
-
-            # Fallback to tabula
-            try:
-                tables = tabula.read_pdf(
-                    self.file_path,
-                    pages=page_num + 1,
-                    multiple_tables=True,
-                    pandas_options={"header": None},
-                )
-
-                # Cache result
-                self._table_cache[page_num] = tables
-
-                return tables
-
-            except Exception as e2:
-                logger.error(f"Table extraction failed for page {page_num}: {e2}")
-                return []
+    def _store_tables(self, extraction: TableExtraction) -> None:
+        """Record a batch's backend timings and cache its tables by page."""
+        record_timings(extraction.timings)
+        if extraction.backend is None:
+            # Every backend failed; leave the pages uncached so they are retried
+            return
+        self._table_cache.update(extraction.tables)
 
     def extract_text_chunks(self, chunk_size: int = 1000) -> List[str]:
         """Extract text in chunks for better memory usage.
@@ -391,9 +383,9 @@ class OptimizedPDFExtractor(PDFExtractor):
     def clear_cache(self) -> None:
         """Clear all cached data for this PDF."""
         self._page_cache.clear()
-        self._text_cache.clear()
         self._table_cache.clear()
         self._metadata = None
+        self.session.clear_cache()
 
         # Clear from global cache
         if self.cache_enabled:
@@ -409,15 +401,3 @@ try:
 except ImportError:
     logger.warning("PyPDF2 not available")
     PyPDF2 = None
-
-try:
-    import camelot
-except ImportError:
-    logger.warning("camelot-py not available")
-    camelot = None
-
-try:
-    import tabula
-except ImportError:
-    logger.warning("tabula-py not available")
-    tabula = None
@@ -0,0 +1,136 @@
+"""Process-pool page extraction for large PDF reports.
+
+pdfplumber's layout analysis is CPU-bound Python, so threads do not speed
+it up. Here page ranges are sharded across a process pool sized by
+``settings.MAX_WORKERS``. Each worker process opens a document once,
+keeping a ``PDFDocumentSession`` per file for every shard it handles.
+Results, page texts with their table scores (see ``table_detection``), are
+yielded back in page order as shards complete, so callers can feed them
+straight into their page caches.
+"""
+
+import logging
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
+
+from config.settings import settings
+
+if TYPE_CHECKING:
+    from .document_session import PDFDocumentSession
+
+logger = logging.getLogger(__name__)
+
+# Documents shorter than this are extracted in-process; pool start-up
+# costs more than it saves
+PARALLEL_MIN_PAGES = 24
+
+# Shards per worker; more than one keeps workers busy when pages differ in cost
+SHARDS_PER_WORKER = 2
+
+# Sessions opened by this process when it runs as a pool worker
+_worker_sessions: Dict[str, "PDFDocumentSession"] = {}
+
+
+@dataclass
+class PageShard:
+    """Extraction results for a contiguous run of pages."""
+
+    start: int
+    texts: List[str]
+    scores: List[Optional[float]]
+    tables: Optional[List[List[List[List[Optional[str]]]]]] = None
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.texts)
+
+
+def plan_shards(start: int, end: int, workers: int) -> List[Tuple[int, int]]:
+    """Split pages ``start`` to ``end`` (exclusive) into contiguous shards.
+
+    Args:
+        start: First page (0-indexed)
+        end: Page after the last one
+        workers: Number of worker processes
+
+    Returns:
+        List of (start, end) page ranges in page order
+    """
+    total = end - start
+    if total <= 0:
+        return []
+    shard_count = max(1, min(total, workers * SHARDS_PER_WORKER))
+    size = math.ceil(total / shard_count)
+    return [(first, min(first + size, end)) for first in range(start, end, size)]
+
+
+def _extract_shard(file_path: str, start: int, end: int, include_tables: bool) -> PageShard:
+    """Extract one shard inside a worker process.
+
+    This function is designed to be run in parallel processes.
+    """
+    from .document_session import PDFDocumentSession
+
+    session = _worker_sessions.get(file_path)
+    if session is None:
+        # Workers return results instead of caching them, so no page cache
+        session = _worker_sessions[file_path] = PDFDocumentSession(file_path, max_cache_bytes=0)
+    texts, scores = [], []
+    for i in range(start, end):
+        text, score = session.extract_page(i)
+        texts.append(text)
+        scores.append(score)
+    tables = None
+    if include_tables:
+        tables = []
+        for i in range(start, end):
+            try:
+                tables.append(session.page_tables(i))
+            except Exception as e:
+                logger.debug(f"pdfplumber table extraction failed for page {i}: {e}")
+                tables.append([])
+    return PageShard(start, texts, scores, tables)
+
+
+def resolve_workers(max_workers: Optional[int] = None) -> int:
+    """Get the number of worker processes to use."""
+    return max(1, max_workers or settings.MAX_WORKERS)
+
+
+def iter_page_shards(
+    file_path: Union[str, Path],
+    start: int,
+    end: int,
+    max_workers: Optional[int] = None,
+    include_tables: bool = False,
+) -> Iterator[PageShard]:
+    """Extract a page range across a process pool, yielding shards in page order.
+
+    A shard is yielded as soon as it and every shard before it are done, so
+    consumers can start on the first pages while later ones are extracted.
+
+    Args:
+        file_path: Path to the PDF file
+        start: First page (0-indexed)
+        end: Page after the last one
+        max_workers: Worker processes, defaults to ``settings.MAX_WORKERS``
+        include_tables: Also extract pdfplumber tables for every page
+
+    Yields:
+        PageShard results in page order
+    """
+    workers = resolve_workers(max_workers)
+    shards = plan_shards(start, end, workers)
+    if not shards:
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as executor:
+        futures = [
+            executor.submit(_extract_shard, str(file_path), first, last, include_tables)
+            for first, last in shards
+        ]
+        for future in futures:
+            yield future.result()
@@ -0,0 +1,313 @@
+"""Precompiled regex pattern library for numeric extraction.
+
+Loaders mine PDF pages for figures such as "45% in 2023", "$2.5 billion
+impact" or "280x reduction". Each figure shape is described once here as a
+``NumericPattern``: a regex built from shared fragments plus a typed parser
+that turns the captured groups into a record. Patterns used together are
+grouped in a ``PatternSet``, which compiles them into a single alternation
+so a page is scanned with one ``finditer`` pass instead of one ``findall``
+per pattern.
+
+Every scan updates per-pattern hit counters (see ``get_pattern_stats``) and
+records its duration in the performance metrics under
+``pattern_scan.<set name>``, which makes extraction hot spots measurable.
+"""
+
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+from performance.monitor import get_metrics
+
+# Shared building blocks, each with exactly one capturing group
+NUMBER = r"(\d+(?:\.\d+)?)"
+GROUPED_NUMBER = r"([\d,]+\.?\d*)"
+YEAR = r"(\d{4})"
+SCALE = r"(million|billion|trillion)"
+PERCENT = NUMBER + r"\s*%"
+
+# Non-capturing fragments
+RANGE_SEPARATOR = r"\s*(?:-|–|to)\s*"
+
+# Value followed by an optional unit, used for keyword-anchored extraction
+NUMBER_WITH_UNIT = GROUPED_NUMBER + r"\s*(%|percent|million|billion|trillion)?"
+
+METRIC_PREFIX = "pattern_scan."
+
+_SCALE_IN_MILLIONS = {"million": 1.0, "billion": 1_000.0, "trillion": 1_000_000.0}
+
+Parser = Callable[[Tuple[Optional[str], ...]], Optional[Dict[str, Any]]]
+
+
+def to_float(text: str) -> float:
+    """Parse a captured number, ignoring thousands separators."""
+    return float(text.replace(",", ""))
+
+
+def scale_factor(unit: str, base: str = "million") -> float:
+    """Get the factor converting an amount in ``unit`` to ``base`` units.
+
+    Args:
+        unit: Scale word such as "billion"
+        base: Scale word of the target unit
+    """
+    return _SCALE_IN_MILLIONS[unit.lower()] / _SCALE_IN_MILLIONS[base]
+
+
+@lru_cache(maxsize=512)
+def compile_pattern(pattern: str, flags: int = 0) -> Pattern:
+    """Compile an ad hoc pattern once per process.
+
+    ``re`` keeps its own cache, but it is small and shared with every other
+    module; caller-supplied patterns are compiled through this one instead.
+    """
+    return re.compile(pattern, flags)
+
+
+@dataclass(frozen=True)
+class NumericPattern:
+    """A named regex with a parser for its captured groups.
+
+    The regex must only use positional (unnamed) groups so that patterns can
+    be combined into a ``PatternSet``. The parser returns ``None`` for
+    matches it rejects, such as out-of-range values.
+    """
+
+    name: str
+    regex: str
+    parser: Parser
+    flags: int = re.IGNORECASE
+
+    @property
+    def compiled(self) -> Pattern:
+        return compile_pattern(self.regex, self.flags)
+
+    @property
+    def group_count(self) -> int:
+        return self.compiled.groups
+
+    def parse(self, groups: Tuple[Optional[str], ...]) -> Optional[Dict[str, Any]]:
+        """Run the parser, treating malformed numbers as rejected matches."""
+        try:
+            return self.parser(groups)
+        except (ValueError, TypeError, KeyError, ZeroDivisionError):
+            return None
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    """One match of a ``PatternSet``."""
+
+    pattern: str
+    groups: Tuple[Optional[str], ...]
+    start: int
+    end: int
+    text: str
+    data: Optional[Dict[str, Any]]
+
+
+class PatternStats:
+    """Thread-safe hit counters for the patterns of one set."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits: Counter = Counter()
+        self.rejected: Counter = Counter()
+        self.scans = 0
+        self.scan_ns = 0
+
+    def record_scan(self, hits: Counter, rejected: Counter, elapsed_ns: int) -> None:
+        with self._lock:
+            self.hits.update(hits)
+            self.rejected.update(rejected)
+            self.scans += 1
+            self.scan_ns += elapsed_ns
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "scans": self.scans,
+                "scan_ms": round(self.scan_ns / 1e6, 3),
+                "hits": dict(self.hits),
+                "rejected": dict(self.rejected),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits.clear()
+            self.rejected.clear()
+            self.scans = 0
+            self.scan_ns = 0
+
+
+_stats: Dict[str, PatternStats] = {}
+_stats_lock = threading.Lock()
+
+
+def _get_stats(name: str) -> PatternStats:
+    with _stats_lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = PatternStats()
+        return stats
+
+
+def record_hits(set_name: str, pattern_name: str, hits: int, elapsed_ns: int = 0) -> None:
+    """Count hits for a pattern that is not part of a ``PatternSet``."""
+    _get_stats(set_name).record_scan(Counter({pattern_name: hits}), Counter(), elapsed_ns)
+
+
+def get_pattern_stats() -> Dict[str, Dict[str, Any]]:
+    """Get hit counters and scan totals for every pattern set used so far."""
+    with _stats_lock:
+        items = list(_stats.items())
+    return {name: stats.snapshot() for name, stats in items}
+
+
+def reset_pattern_stats() -> None:
+    """Reset all hit counters."""
+    with _stats_lock:
+        items = list(_stats.values())
+    for stats in items:
+        stats.reset()
+
+
+def _inline_flags(flags: int) -> str:
+    letters = ""
+    if flags & re.IGNORECASE:
+        letters += "i"
+    if flags & re.MULTILINE:
+        letters += "m"
+    if flags & re.DOTALL:
+        letters += "s"
+    return letters
+
+
+class PatternSet:
+    """Patterns compiled into one alternation and scanned in a single pass.
+
+    At each position the patterns are tried in the order given, and matches
+    do not overlap: a span of text is attributed to the first pattern that
+    matches it, so the same figure is not extracted twice by two patterns.
+    """
+
+    def __init__(self, name: str, patterns: Iterable[NumericPattern]):
+        """Compile the set.
+
+        Args:
+            name: Name used for hit counters and the scan-time metric
+            patterns: Patterns in priority order; names must be unique
+        """
+        self.name = name
+        self.patterns: List[NumericPattern] = list(patterns)
+        names = [pattern.name for pattern in self.patterns]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate pattern names in set '{name}'")
+
+        alternatives = []
+        # Maps the outer group index of each alternative to its pattern
+        self._by_group: Dict[int, Tuple[NumericPattern, int]] = {}
+        group = 1
+        for pattern in self.patterns:
+            letters = _inline_flags(pattern.flags)
+            body = f"(?{letters}:{pattern.regex})" if letters else f"(?:{pattern.regex})"
+            alternatives.append(f"({body})")
+            self._by_group[group] = (pattern, pattern.group_count)
+            group += 1 + pattern.group_count
+        self._regex = re.compile("|".join(alternatives) or "(?!)")
+        self._stats = _get_stats(name)
+
+    def finditer(self, text: str) -> Iterator[PatternMatch]:
+        """Scan a text once, yielding parsed matches of every pattern."""
+        if not text:
+            return
+        started = time.perf_counter_ns()
+        hits: Counter = Counter()
+        rejected: Counter = Counter()
+        try:
+            for match in self._regex.finditer(text):
+                outer = match.lastindex
+                # lastindex is the outer group, whose inner groups close before it
+                pattern, count = self._by_group[outer]
+                groups = match.groups()[outer : outer + count]
+                data = pattern.parse(groups)
+                hits[pattern.name] += 1
+                if data is None:
+                    rejected[pattern.name] += 1
+                yield PatternMatch(
+                    pattern.name, groups, match.start(), match.end(), match.group(), data
+                )
+        finally:
+            elapsed = time.perf_counter_ns() - started
+            self._stats.record_scan(hits, rejected, elapsed)
+            get_metrics().record_ns(METRIC_PREFIX + self.name, elapsed)
+
+    def extract(self, text: str) -> List[Dict[str, Any]]:
+        """Scan a text and get the records of every accepted match."""
+        return [match.data for match in self.finditer(text) if match.data is not None]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the hit counters of this set."""
+        return self._stats.snapshot()
+
+
+def _adoption_record(year: str, percentage: str) -> Optional[Dict[str, Any]]:
+    year_value = int(year)
+    rate = float(percentage)
+    if 2010 <= year_value <= 2030 and 0 <= rate <= 100:
+        return {"year": year_value, "adoption_rate": rate}
+    return None
+
+
+# Percent-by-year figures: "2023: 55%", "55% in 2023", "2023 (55%)", "2023 - 55%"
+PERCENT_BY_YEAR = PatternSet(
+    "percent_by_year",
+    [
+        NumericPattern(
+            "year_colon_percent",
+            YEAR + r":\s*" + PERCENT,
+            lambda g: _adoption_record(g[0], g[1]),
+            flags=0,
+        ),
+        NumericPattern(
+            "percent_in_year",
+            PERCENT + r"\s*in\s*" + YEAR,
+            lambda g: _adoption_record(g[1], g[0]),
+            flags=0,
+        ),
+        NumericPattern(
+            "year_paren_percent",
+            YEAR + r"\s*\(" + PERCENT + r"\)",
+            lambda g: _adoption_record(g[0], g[1]),
+            flags=0,
+        ),
+        NumericPattern(
+            "year_dash_percent",
+            YEAR + r"\s*-\s*" + PERCENT,
+            lambda g: _adoption_record(g[0], g[1]),
+            flags=0,
+        ),
+    ],
+)
+
+# Currency amounts with a scale word: "$2.5 billion", "$700 million"
+CURRENCY_AMOUNT = NumericPattern(
+    "currency_amount",
+    r"\$" + NUMBER + r"\s*" + SCALE,
+    lambda g: {"value": to_float(g[0]) * scale_factor(g[1]), "unit": "millions_usd"},
+)
+
+# Percentage ranges: "20-30%", "20% to 30%"
+PERCENT_RANGE = NumericPattern(
+    "percent_range",
+    NUMBER + r"\s*%?" + RANGE_SEPARATOR + PERCENT,
+    lambda g: {"low": float(g[0]), "high": float(g[1]), "unit": "percentage"},
+)
+
+# Time periods
+YEAR_2020S = compile_pattern(r"20[2-3]\d")
+QUARTER = compile_pattern(r"Q[1-4]")
@@ -2,19 +2,31 @@
 
 import logging
 import re
+import time
+import weakref
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 
+from performance.telemetry import register_cache_layer
+
 from .base import PDFExtractor
+from .document_session import PDFDocumentSession
+from .entity_scanner import get_scanner
+from .patterns import NUMBER_WITH_UNIT, compile_pattern, record_hits, to_float
+from .table_backends import (
+    PdfplumberBackend,
+    TableExtractionEngine,
+    TabulaBackend,
+    get_backend_stats,
+)
 
 # Import PDF libraries
 try:
     import fitz  # PyMuPDF for better text extraction
     import pdfplumber
     import PyPDF2
-    import tabula
 
     PDF_LIBS_AVAILABLE = True
 except ImportError as e:
@@ -27,25 +39,110 @@ logger = logging.getLogger(__name__)
 class PDFExtractor:
     """Enhanced PDF extractor with advanced table and data extraction."""
 
+    # Cache statistics shared by all extractors in the process
+    _cache_hits = 0
+    _cache_misses = 0
+    _table_pages_skipped = 0
+    _instances: "weakref.WeakSet[PDFExtractor]" = weakref.WeakSet()
+
+    # Lattice-mode tabula, with pdfplumber's table finder as fallback
+    table_engine = TableExtractionEngine(
+        [TabulaBackend(lattice=True, header=0), PdfplumberBackend(header=0)]
+    )
+
     def __init__(self, file_path: Union[str, Path]):
         """Initialize PDF extractor."""
         self.file_path = Path(file_path)
         self._metadata = None
         self._cached_text = {}
         self._cached_tables = {}
+        # One open document shared by every page read of this extractor
+        self.session = PDFDocumentSession(self.file_path)
+        PDFExtractor._instances.add(self)
+
+    def __enter__(self) -> "PDFExtractor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the PDF file and release cached pages.
+
+        Derived results (full text, tables) stay cached; later page reads
+        reopen the file.
+        """
+        self.session.close()
+
+    @classmethod
+    def _record_cache_access(cls, hit: bool) -> None:
+        """Count a text or table cache lookup."""
+        if hit:
+            PDFExtractor._cache_hits += 1
+        else:
+            PDFExtractor._cache_misses += 1
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, Any]:
+        """Get text and table cache statistics across all extractors."""
+        extractors = list(PDFExtractor._instances)
+        sessions = [e.session.stats() for e in extractors]
+        return {
+            "hits": PDFExtractor._cache_hits + sum(s["hits"] for s in sessions),
+            "misses": PDFExtractor._cache_misses + sum(s["misses"] for s in sessions),
+            "size": sum(len(e._cached_text) + len(e._cached_tables) for e in extractors)
+            + sum(s["size"] for s in sessions),
+            "page_cache_bytes": sum(s["bytes"] for s in sessions),
+            "open_documents": sum(1 for s in sessions if s["open"]),
+            "table_pages_skipped": PDFExtractor._table_pages_skipped,
+            "table_backends": get_backend_stats(),
+            "extractors": len(extractors),
+        }
+
+    @classmethod
+    def clear_all_caches(cls) -> None:
+        """Clear the caches of every live extractor and reset statistics."""
+        for extractor in list(PDFExtractor._instances):
+            extractor.clear_cache()
+        PDFExtractor._cache_hits = 0
+        PDFExtractor._cache_misses = 0
+        PDFExtractor._table_pages_skipped = 0
+
+    def clear_cache(self) -> None:
+        """Clear cached text and tables for this document."""
+        self._cached_text.clear()
+        self._cached_tables.clear()
+        self.session.clear_cache()
 
     def find_pages_with_keyword(self, keyword: str) -> List[int]:
         """Finds page numbers containing a specific keyword."""
-        pages_found = []
+        return self.find_pages_with_keywords([keyword])
+
+    def find_pages_with_keywords(self, keywords: List[str]) -> List[int]:
+        """Find pages containing any of several keywords in one pass.
+
+        Args:
+            keywords: Keywords to search for (case-insensitive)
+
+        Returns:
+            Sorted page numbers (0-indexed) containing at least one keyword
+        """
+        scanner = get_scanner(tuple(keywords))
+        return [
+            i for i, text in enumerate(self.get_page_texts()) if scanner.contains_any(text)
+        ]
+
+    def get_page_texts(self) -> List[str]:
+        """Get the text of every page, extracting each page at most once.
+
+        Page texts live in the document session's page cache, so keyword
+        searches and later per-page reads share one extraction.
+        """
         try:
-            with pdfplumber.open(self.file_path) as pdf:
-                for i, page in enumerate(pdf.pages):
-                    text = page.extract_text()
-                    if text and keyword.lower() in text.lower():
-                        pages_found.append(i)
+            return self.session.page_texts()
         except Exception as e:
-            logger.error(f"Error finding pages with keyword '{keyword}': {e}")
-        return pages_found
+            logger.error(f"Error extracting page texts: {e}")
+            return []
 
     def extract(self) -> Dict[str, Any]:
         """Extract all data from PDF."""
@@ -61,71 +158,40 @@ class PDFExtractor:
         if self._metadata:
             return self._metadata
 
-        with open(self.file_path, "rb") as file:
-            pdf = PyPDF2.PdfReader(file)
-            info = pdf.metadata or {}
-
-            self._metadata = {
-                "title": info.get("/Title", ""),
-                "author": info.get("/Author", ""),
-                "subject": info.get("/Subject", ""),
-                "creator": info.get("/Creator", ""),
-                "creation_date": info.get("/CreationDate", ""),
-                "pages": len(pdf.pages),
-                "file_size": self.file_path.stat().st_size,
-            }
+        pdf = self.session.reader
+        info = pdf.metadata or {}
+
+        self._metadata = {
+            "title": info.get("/Title", ""),
+            "author": info.get("/Author", ""),
+            "subject": info.get("/Subject", ""),
+            "creator": info.get("/Creator", ""),
+            "creation_date": info.get("/CreationDate", ""),
+            "pages": len(pdf.pages),
+            "file_size": self.file_path.stat().st_size,
+        }
 
         return self._metadata
 
     def extract_all_text(self) -> str:
         """Extract all text from PDF."""
         if "all" in self._cached_text:
+            self._record_cache_access(True)
             return self._cached_text["all"]
+        self._record_cache_access(False)
 
-        text_parts = []
-
-        # Try pdfplumber first for better text extraction
-        try:
-            with pdfplumber.open(self.file_path) as pdf:
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        text_parts.append(text)
-        except Exception as e:
-            logger.warning(f"pdfplumber extraction failed, falling back to PyPDF2: {e}")
-            # Fallback to PyPDF2
-            with open(self.file_path, "rb") as file:
-                pdf = PyPDF2.PdfReader(file)
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        text_parts.append(text)
-
-        full_text = "\n\n".join(text_parts)
+        full_text = "\n\n".join(text for text in self.get_page_texts() if text)
         self._cached_text["all"] = full_text
         return full_text
 
     def extract_text_range(self, start_page: int, end_page: int) -> str:
         """Extract text from page range."""
-        cache_key = f"{start_page}-{end_page}"
-        if cache_key in self._cached_text:
-            return self._cached_text[cache_key]
-
-        text_parts = []
-
         try:
-            with pdfplumber.open(self.file_path) as pdf:
-                for i in range(start_page, min(end_page + 1, len(pdf.pages))):
-                    page = pdf.pages[i]
-                    text = page.extract_text()
-                    if text:
-                        text_parts.append(text)
+            texts = self.session.page_texts(start_page, end_page + 1)
         except Exception as e:
             logger.error(f"Error extracting text range: {e}")
-
-        result = "\n\n".join(text_parts)
-        self._cached_text[cache_key] = result
-        return result
+            texts = []
+        return "\n\n".join(text for text in texts if text)
 
     def extract_text_from_page(self, page_number: int) -> str:
         """Extract text from a specific page.
@@ -136,102 +202,78 @@ class PDFExtractor:
         Returns:
             Extracted text from the page
         """
-        cache_key = f"page_{page_number}"
-        if cache_key in self._cached_text:
-            return self._cached_text[cache_key]
-        
-        text = ""
-        
         try:
-            # Use pdfplumber first for better text extraction
-            with pdfplumber.open(self.file_path) as pdf:
-                if page_number < len(pdf.pages):
-                    page = pdf.pages[page_number]
-                    text = page.extract_text() or ""
+            return self.session.page_text(page_number)
         except Exception as e:
-            logger.warning(f"pdfplumber extraction failed for page {page_number}, falling back to PyPDF2: {e}")
-            
-            # Fallback to PyPDF2
-            try:
-                with open(self.file_path, "rb") as file:
-                    pdf = PyPDF2.PdfReader(file)
-                    if page_number < len(pdf.pages):
-                        page = pdf.pages[page_number]
-                        text = page.extract_text() or ""
-            except Exception as e2:
-                logger.error(f"Both PDF extraction methods failed for page {page_number}: {e2}")
-        
-        self._cached_text[cache_key] = text
-        return text
+            logger.error(f"Error extracting page {page_number}: {e}")
+            return ""
 
     def extract_tables(
-        self, page_range: Optional[Tuple[int, int]] = None, table_settings: Optional[Dict] = None
+        self,
+        page_range: Optional[Tuple[int, int]] = None,
+        table_settings: Optional[Dict] = None,
+        detect_tables: bool = True,
     ) -> List[pd.DataFrame]:
         """Extract tables from PDF pages.
 
         Args:
             page_range: Optional tuple of (start_page, end_page)
-            table_settings: Optional tabula settings
+            table_settings: Optional tabula settings; ``pages`` is ignored in
+                favour of ``page_range``
+            detect_tables: Skip pages that the table-detection pre-pass
+                (see ``table_detection``) scores as having no table
 
         Returns:
             List of DataFrames containing table data
         """
         cache_key = str(page_range) if page_range else "all"
         if cache_key in self._cached_tables:
+            self._record_cache_access(True)
             return self._cached_tables[cache_key]
+        self._record_cache_access(False)
 
         tables = []
+        pages = self._candidate_table_pages(page_range, detect_tables)
+        if not pages:
+            self._cached_tables[cache_key] = tables
+            return tables
+
+        engine = self.table_engine
+        if table_settings is not None:
+            options = dict(table_settings)
+            # Pages come from page_range and the detection pre-pass
+            options.pop("pages", None)
+            header = options.pop("pandas_options", {}).get("header", 0)
+            engine = TableExtractionEngine(
+                [TabulaBackend(header=header, **options), PdfplumberBackend(header=header)]
+            )
 
-        # Default table settings
-        if table_settings is None:
-            table_settings = {
-                "lattice": True,  # Use lattice mode for tables with lines
-                "pages": "all" if not page_range else f"{page_range[0]+1}-{page_range[1]+1}",
-                "pandas_options": {"header": 0},
-            }
+        # All candidate pages go to the backend in one batched call
+        tables = engine.extract(self.file_path, pages, self.session).flatten()
 
-        try:
-            # Try tabula for table extraction
-            dfs = tabula.read_pdf(str(self.file_path), **table_settings)
-
-            # Clean and process tables
-            for df in dfs:
-                if not df.empty:
-                    # Clean column names
-                    df.columns = [str(col).strip() for col in df.columns]
-                    # Remove empty rows
-                    df = df.dropna(how="all")
-                    # Reset index
-                    df = df.reset_index(drop=True)
-                    tables.append(df)
+        self._cached_tables[cache_key] = tables
+        return tables
 
+    def _candidate_table_pages(
+        self, page_range: Optional[Tuple[int, int]], detect_tables: bool
+    ) -> List[int]:
+        """Get the pages of a range worth running table extraction on."""
+        try:
+            page_count = self.session.page_count
         except Exception as e:
-            logger.warning(f"Tabula extraction failed: {e}")
-
-            # Fallback to pdfplumber
-            try:
-                with pdfplumber.open(self.file_path) as pdf:
-                    if page_range:
-                        pages = pdf.pages[page_range[0] : page_range[1] + 1]
-                    else:
-                        pages = pdf.pages
-
-                    for page in pages:
-                        page_tables = page.extract_tables()
-                        for table in page_tables:
-                            if table and len(table) > 1:
-                                # Convert to DataFrame
-                                df = pd.DataFrame(table[1:], columns=table[0])
-                                # Clean
-                                df = df.dropna(how="all")
-                                df = df.reset_index(drop=True)
-                                tables.append(df)
-
-            except Exception as e2:
-                logger.error(f"Both table extraction methods failed: {e2}")
+            logger.error(f"Error opening {self.file_path.name}: {e}")
+            return []
 
-        self._cached_tables[cache_key] = tables
-        return tables
+        if page_range:
+            pages = list(range(page_range[0], min(page_range[1] + 1, page_count)))
+        else:
+            pages = list(range(page_count))
+        if not detect_tables:
+            return pages
+
+        likely = self.session.likely_table_pages(pages)
+        PDFExtractor._table_pages_skipped += len(pages) - len(likely)
+        return likely
 
     def extract_all_tables(self) -> List[pd.DataFrame]:
         """Extract all tables from PDF."""
@@ -250,22 +292,19 @@ class PDFExtractor:
             DataFrame if table found, None otherwise
         """
         # Find pages with keywords
-        relevant_pages = set()
-        for keyword in keywords:
-            pages = self.find_pages_with_keyword(keyword)
-            relevant_pages.update(pages)
+        relevant_pages = self.find_pages_with_keywords(keywords)
 
         if not relevant_pages:
             return None
 
         # Extract tables from relevant pages
-        for page_num in sorted(relevant_pages):
+        scanner = get_scanner(tuple(keywords))
+        for page_num in relevant_pages:
             tables = self.extract_tables(page_range=(page_num, page_num))
 
             # Check if any table contains keywords
             for table in tables:
-                table_str = table.to_string().lower()
-                if any(keyword.lower() in table_str for keyword in keywords):
+                if scanner.contains_any(table.to_string()):
                     return table
 
         return None
@@ -328,8 +367,10 @@ class PDFExtractor:
         else:
             text = self.extract_all_text()
 
+        started = time.perf_counter_ns()
         matches = []
-        for match in re.finditer(pattern, text, re.MULTILINE | re.IGNORECASE):
+        regex = compile_pattern(pattern, re.MULTILINE | re.IGNORECASE)
+        for match in regex.finditer(text):
             match_dict = {
                 "match": match.group(0),
                 "groups": match.groups(),
@@ -342,12 +383,14 @@ class PDFExtractor:
 
             matches.append(match_dict)
 
+        elapsed = time.perf_counter_ns() - started
+        record_hits("pdf_extractor", "data_by_pattern", len(matches), elapsed)
         return matches
 
     def extract_numeric_data(
         self,
         keywords: List[str],
-        value_pattern: str = r"([\d,]+\.?\d*)\s*(%|percent|million|billion|trillion)?",
+        value_pattern: str = NUMBER_WITH_UNIT,
     ) -> Dict[str, List[Tuple[float, str]]]:
         """Extract numeric data associated with keywords.
 
@@ -359,26 +402,33 @@ class PDFExtractor:
             Dictionary mapping keywords to list of (value, unit) tuples
         """
         text = self.extract_all_text()
-        results = {}
+        results = {keyword: [] for keyword in keywords}
+        started = time.perf_counter_ns()
+        hits = 0
 
-        for keyword in keywords:
-            results[keyword] = []
+        # Only keywords present in the text can match, so skip the rest unscanned
+        present = get_scanner(tuple(keywords)).found_set(text)
+        for keyword in results:
+            if keyword not in present:
+                continue
 
-            # Find keyword occurrences
-            keyword_pattern = re.compile(
+            keyword_pattern = compile_pattern(
                 rf"{re.escape(keyword)}.{{0,100}}{value_pattern}", re.IGNORECASE
             )
-
-            matches = keyword_pattern.finditer(text)
-            for match in matches:
+            for match in keyword_pattern.finditer(text):
                 try:
                     # Extract number and unit
-                    number_str = match.group(1).replace(",", "")
-                    number = float(number_str)
+                    number = to_float(match.group(1))
                     unit = match.group(2) if match.lastindex >= 2 else ""
 
                     results[keyword].append((number, unit))
+                    hits += 1
                 except ValueError:
                     continue
 
-        return results
\ No newline at end of file
+        record_hits("pdf_extractor", "numeric_data", hits, time.perf_counter_ns() - started)
+        return results
+
+
+# Report the per-document text and table caches in the performance telemetry
+register_cache_layer("pdf", PDFExtractor.get_cache_stats, PDFExtractor.clear_all_caches)
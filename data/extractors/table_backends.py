@@ -0,0 +1,344 @@
+"""Table-extraction backends with batching and per-backend timings.
+
+Extractors used to call ``tabula.read_pdf`` or ``camelot.read_pdf`` once
+per page. Each tabula call could spawn a JVM subprocess, which costs
+seconds. Here each engine is wrapped in a ``TableBackend`` that takes a
+whole batch of pages in one call and returns tables grouped by page:
+
+- ``TabulaBackend`` runs tabula-java in-process through jpype when
+  tabula-py supports it, so one JVM lives for the whole process, and
+  otherwise batches pages so a load spawns one subprocess per batch
+  rather than per page.
+- ``CamelotBackend`` reads the batch in one ``camelot.read_pdf`` call.
+- ``PdfplumberBackend`` reads tables through the extractor's open
+  ``PDFDocumentSession``.
+
+A ``TableExtractionEngine`` tries its backends in order; the first one
+that does not raise handles the batch. Every attempt is timed and
+recorded as ``table_backend.<name>`` in the performance metrics and in
+per-document statistics (see ``get_backend_stats``), which show which
+engine suits which document.
+"""
+
+import inspect
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from performance.monitor import get_metrics
+
+if TYPE_CHECKING:
+    from .document_session import PDFDocumentSession
+
+try:
+    import tabula
+
+    TABULA_AVAILABLE = True
+except ImportError:
+    TABULA_AVAILABLE = False
+
+try:
+    import camelot
+
+    CAMELOT_AVAILABLE = True
+except ImportError:
+    CAMELOT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "table_backend."
+
+PageTables = Dict[int, List[pd.DataFrame]]
+
+
+def _clean_table(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """Normalize an extracted table, or None if it is empty."""
+    if df.empty:
+        return None
+    df.columns = [str(col).strip() for col in df.columns]
+    df = df.dropna(how="all")
+    return df.reset_index(drop=True)
+
+
+def _rows_to_frame(rows: List[List[Any]], header: Optional[int]) -> Optional[pd.DataFrame]:
+    """Build a table from rows of cells, using the first row as header if asked."""
+    if not rows:
+        return None
+    if header == 0:
+        if len(rows) < 2:
+            return None
+        return _clean_table(pd.DataFrame(rows[1:], columns=rows[0]))
+    return _clean_table(pd.DataFrame(rows))
+
+
+class TableBackend(ABC):
+    """A table-extraction engine that handles a batch of pages per call."""
+
+    name = "base"
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def extract(
+        self,
+        file_path: Path,
+        pages: Sequence[int],
+        session: Optional["PDFDocumentSession"] = None,
+    ) -> PageTables:
+        """Extract the tables of several pages in one call.
+
+        Args:
+            file_path: Path to the PDF file
+            pages: Page numbers (0-indexed)
+            session: Open document session of the calling extractor, if any
+
+        Returns:
+            Mapping of page number to the tables found on it
+        """
+        pass
+
+
+class TabulaBackend(TableBackend):
+    """tabula-java, kept in-process through jpype where tabula-py supports it."""
+
+    name = "tabula"
+
+    def __init__(self, lattice: bool = True, header: Optional[int] = 0, **options: Any):
+        """Configure tabula.
+
+        Args:
+            lattice: Use lattice mode for tables with ruling lines
+            header: Row to use as header (0) or None for no header
+            **options: Additional ``tabula.read_pdf`` options
+        """
+        self.lattice = lattice
+        self.header = header
+        self.options = options
+
+    @property
+    def available(self) -> bool:
+        return TABULA_AVAILABLE
+
+    @staticmethod
+    def _jpype_options() -> Dict[str, Any]:
+        # tabula-py 2.8+ runs the JVM in-process via jpype unless forced out
+        if "force_subprocess" in inspect.signature(tabula.read_pdf).parameters:
+            return {"force_subprocess": False}
+        return {}
+
+    def extract(self, file_path, pages, session=None) -> PageTables:
+        results: PageTables = {page: [] for page in pages}
+        if not pages:
+            return results
+        raw_tables = tabula.read_pdf(
+            str(file_path),
+            pages=[page + 1 for page in pages],
+            lattice=self.lattice,
+            multiple_tables=True,
+            output_format="json",
+            **self._jpype_options(),
+            **self.options,
+        )
+        for table in raw_tables:
+            # tabula-java reports the 1-based page of each table
+            page = table.get("page_number", pages[0] + 1) - 1
+            rows = [[cell.get("text", "") for cell in row] for row in table.get("data", [])]
+            df = _rows_to_frame(rows, self.header)
+            if df is not None:
+                results.setdefault(page, []).append(df)
+        return results
+
+
+class CamelotBackend(TableBackend):
+    """camelot, reading the whole batch in one call."""
+
+    name = "camelot"
+
+    def __init__(self, flavor: str = "stream"):
+        self.flavor = flavor
+
+    @property
+    def available(self) -> bool:
+        return CAMELOT_AVAILABLE
+
+    def extract(self, file_path, pages, session=None) -> PageTables:
+        results: PageTables = {page: [] for page in pages}
+        if not pages:
+            return results
+        tables = camelot.read_pdf(
+            str(file_path),
+            pages=",".join(str(page + 1) for page in pages),  # camelot uses 1-based indexing
+            flavor=self.flavor,
+            suppress_stdout=True,
+        )
+        for table in tables:
+            results.setdefault(int(table.page) - 1, []).append(table.df)
+        return results
+
+
+class PdfplumberBackend(TableBackend):
+    """pdfplumber's table finder, read through the open document session."""
+
+    name = "pdfplumber"
+
+    def __init__(self, header: Optional[int] = 0):
+        self.header = header
+
+    def extract(self, file_path, pages, session=None) -> PageTables:
+        if session is None:
+            from .document_session import PDFDocumentSession
+
+            session = PDFDocumentSession(file_path)
+        results: PageTables = {}
+        for page in pages:
+            frames = (_rows_to_frame(table, self.header) for table in session.page_tables(page))
+            results[page] = [df for df in frames if df is not None]
+        return results
+
+
+@dataclass
+class BackendTiming:
+    """One timed backend call."""
+
+    backend: str
+    document: str
+    pages: int
+    tables: int
+    elapsed_ns: int
+    failed: bool = False
+
+
+@dataclass
+class TableExtraction:
+    """Tables found for a batch of pages, and the backend calls it took."""
+
+    tables: PageTables = field(default_factory=dict)
+    backend: Optional[str] = None
+    timings: List[BackendTiming] = field(default_factory=list)
+
+    def flatten(self) -> List[pd.DataFrame]:
+        """Get all tables in page order."""
+        return [df for page in sorted(self.tables) for df in self.tables[page]]
+
+
+_stats: Dict[str, Dict[str, Dict[str, float]]] = {}
+_stats_lock = threading.Lock()
+
+
+def record_timings(timings: Sequence[BackendTiming]) -> None:
+    """Record backend calls, including calls made in worker processes."""
+    metrics = get_metrics()
+    with _stats_lock:
+        for timing in timings:
+            entry = _stats.setdefault(timing.document, {}).setdefault(
+                timing.backend,
+                {"calls": 0, "failures": 0, "pages": 0, "tables": 0, "seconds": 0.0},
+            )
+            entry["calls"] += 1
+            entry["failures"] += int(timing.failed)
+            entry["pages"] += timing.pages
+            entry["tables"] += timing.tables
+            entry["seconds"] += timing.elapsed_ns / 1e9
+    for timing in timings:
+        metadata = {"document": timing.document, "pages": timing.pages, "tables": timing.tables}
+        if timing.failed:
+            metrics.record_error(METRIC_PREFIX + timing.backend, "extraction failed")
+        else:
+            metrics.record_ns(METRIC_PREFIX + timing.backend, timing.elapsed_ns, metadata)
+
+
+def get_backend_stats() -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Get per-document, per-backend call counts, pages, tables and seconds."""
+    with _stats_lock:
+        return {
+            document: {backend: dict(entry) for backend, entry in backends.items()}
+            for document, backends in _stats.items()
+        }
+
+
+def reset_backend_stats() -> None:
+    """Reset the per-document backend statistics."""
+    with _stats_lock:
+        _stats.clear()
+
+
+class TableExtractionEngine:
+    """Runs a batch of pages through the first backend that succeeds."""
+
+    def __init__(self, backends: Sequence[TableBackend]):
+        """Create an engine.
+
+        Args:
+            backends: Backends in order of preference
+        """
+        self.backends = list(backends)
+
+    def extract(
+        self,
+        file_path: Union[str, Path],
+        pages: Sequence[int],
+        session: Optional["PDFDocumentSession"] = None,
+        record: bool = True,
+    ) -> TableExtraction:
+        """Extract the tables of a batch of pages.
+
+        Args:
+            file_path: Path to the PDF file
+            pages: Page numbers (0-indexed)
+            session: Open document session of the calling extractor, if any
+            record: Record timings now; worker processes pass False and
+                return the timings for the parent to record
+
+        Returns:
+            Tables by page, the backend that produced them and call timings
+        """
+        file_path = Path(file_path)
+        result = TableExtraction(tables={page: [] for page in pages})
+        if not pages:
+            return result
+
+        for backend in self.backends:
+            if not backend.available:
+                continue
+            started = time.perf_counter_ns()
+            try:
+                tables = backend.extract(file_path, list(pages), session)
+            except Exception as e:
+                logger.warning(f"{backend.name} table extraction failed for {file_path.name}: {e}")
+                result.timings.append(
+                    BackendTiming(
+                        backend.name,
+                        file_path.name,
+                        len(pages),
+                        0,
+                        time.perf_counter_ns() - started,
+                        failed=True,
+                    )
+                )
+                continue
+            result.timings.append(
+                BackendTiming(
+                    backend.name,
+                    file_path.name,
+                    len(pages),
+                    sum(len(found) for found in tables.values()),
+                    time.perf_counter_ns() - started,
+                )
+            )
+            result.tables.update(tables)
+            result.backend = backend.name
+            break
+        else:
+            logger.error(f"All table extraction backends failed for {file_path.name}")
+
+        if record:
+            record_timings(result.timings)
+        return result
@@ -0,0 +1,72 @@
+"""Cheap detection of pages likely to contain tables.
+
+Table extraction (camelot, tabula's JVM) is the most expensive step of a
+load, and most pages a keyword search turns up have no table at all. This
+module scores a page from objects pdfplumber has already parsed for its
+text: ruling lines and rectangle edges, and words aligned in columns
+across several lines. Extractors run the expensive engines only on pages
+scoring at least ``TABLE_SCORE_THRESHOLD``.
+"""
+
+from collections import Counter
+from typing import Any, Dict, List, Sequence
+
+# Pages scoring below this are assumed to hold no table
+TABLE_SCORE_THRESHOLD = 0.5
+
+# Words on one line closer than this (in points) belong to the same cell
+CELL_GAP = 12.0
+
+# Tolerance (in points) when grouping words into lines and cells into columns
+LINE_TOLERANCE = 3.0
+COLUMN_BUCKET = 10.0
+
+
+def ruling_score(horizontal_edges: int, vertical_edges: int) -> float:
+    """Score ruling lines; lattice tables draw both, booktabs only horizontal ones."""
+    return min(1.0, horizontal_edges / 4) * 0.6 + min(1.0, vertical_edges / 3) * 0.4
+
+
+def alignment_score(words: Sequence[Dict[str, Any]]) -> float:
+    """Score how strongly words line up in columns across lines.
+
+    Args:
+        words: Words with ``x0``, ``x1`` and ``top`` coordinates, as returned
+            by pdfplumber's ``extract_words``
+
+    Returns:
+        Score between 0 and 1
+    """
+    lines: Dict[int, List[Dict[str, Any]]] = {}
+    for word in words:
+        lines.setdefault(round(word["top"] / LINE_TOLERANCE), []).append(word)
+
+    multi_cell_lines = 0
+    column_starts: Counter = Counter()
+    for line_words in lines.values():
+        line_words.sort(key=lambda w: w["x0"])
+        cell_starts = [line_words[0]["x0"]]
+        for previous, word in zip(line_words, line_words[1:]):
+            if word["x0"] - previous["x1"] > CELL_GAP:
+                cell_starts.append(word["x0"])
+        if len(cell_starts) >= 3:
+            multi_cell_lines += 1
+            column_starts.update({round(x / COLUMN_BUCKET) for x in cell_starts})
+
+    columns = sum(1 for count in column_starts.values() if count >= 3)
+    return min(1.0, multi_cell_lines / 6) * min(1.0, columns / 3)
+
+
+def score_page(page: Any) -> float:
+    """Score a pdfplumber page for tabular structure.
+
+    Args:
+        page: pdfplumber page, ideally one whose objects are already parsed
+
+    Returns:
+        Score between 0 (no table) and 1 (almost certainly a table)
+    """
+    ruling = ruling_score(len(page.horizontal_edges), len(page.vertical_edges))
+    if ruling >= 1.0:
+        return ruling
+    return max(ruling, alignment_score(page.extract_words()))
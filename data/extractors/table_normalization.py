@@ -0,0 +1,437 @@
+"""Vectorized normalization of extracted tables.
+
+Loaders turn raw tables from tabula, camelot or pdfplumber into datasets.
+Doing that row by row (``iterrows`` plus ``float()`` per cell) dominates
+cleanup time on table-heavy reports. The helpers here work a column at a
+time with pandas ``str`` accessors and ``pd.to_numeric``:
+
+- ``to_numeric`` parses formatted cells: percentages, currency, thousands
+  separators, parenthesized negatives, scale words and ranges (midpoint);
+- ``extract_number`` takes the first number anywhere in a cell;
+- ``find_label_column``, ``value_columns`` and ``map_columns`` locate
+  columns by their values or headers;
+- ``melt_values`` and ``pivot_columns`` reshape a table into long records
+  or named metric columns;
+- ``TableSchema`` declares a dataset's columns, how to find and parse
+  them, and their valid ranges, and applies all of it in one call.
+
+Dtypes are left to ``BaseDataLoader.apply_schemas``, which stores every
+dataset compactly through ``data.models.schemas.DatasetSchema``.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from .patterns import scale_factor
+
+# A formatted numeric cell: "12.5%", "$1,200", "(3.4)", "2-5%", "$1.2 billion"
+NUMERIC_CELL = re.compile(
+    r"^\s*(?P<open>\()?\s*[$€£]?\s*(?P<low>[-+]?\d[\d,]*(?:\.\d+)?)\s*%?"
+    r"(?:\s*(?:-|–|—|to)\s*[$€£]?\s*(?P<high>[-+]?\d[\d,]*(?:\.\d+)?)\s*%?)?"
+    r"\s*(?P<scale>trillion|billion|million|bn|[tbm])?\s*\)?\s*\*?\s*$",
+    re.IGNORECASE,
+)
+
+_SCALE_WORDS = {"t": "trillion", "b": "billion", "bn": "billion", "m": "million"}
+
+# First number in free text, with or without thousands separators
+_LOOSE_NUMBER = r"(\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)"
+_SIGNED_NUMBER = r"([+-]?(?:\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?))"
+
+# Header names tabula and pandas give unnamed columns
+_PLACEHOLDER_HEADER = re.compile(r"^(?:unnamed(?::\s*\d+)?|\d+|nan|none)?$", re.IGNORECASE)
+
+
+def _to_float(text: pd.Series) -> pd.Series:
+    numbers = pd.to_numeric(text.str.replace(",", "", regex=False), errors="coerce")
+    return numbers.astype("float64")
+
+
+def as_text(values: pd.Series) -> pd.Series:
+    """Get cells as stripped strings, with missing cells as <NA>."""
+    text = values.astype("string").str.strip()
+    return text.mask(text.str.lower().isin(["", "nan", "none"]))
+
+
+def to_numeric(values: pd.Series, scale_to: Optional[str] = None) -> pd.Series:
+    """Parse formatted numeric cells, a whole column at once.
+
+    Cells must be numeric apart from formatting; "Q1 2024" or "n/a" give
+    NaN. Ranges such as "2-5%" parse to their midpoint and parenthesized
+    values are negative.
+
+    Args:
+        values: Column of cells
+        scale_to: Convert scale words ("million", "bn") into this unit, e.g.
+            "billion"; by default scale words are ignored
+
+    Returns:
+        Float series aligned with ``values``
+    """
+    text = as_text(values).str.replace("−", "-", regex=False)
+    parts = text.str.extract(NUMERIC_CELL)
+    low = _to_float(parts["low"])
+    high = _to_float(parts["high"])
+    numbers = low.where(high.isna(), (low + high) / 2)
+    numbers = numbers.where(parts["open"].isna(), -numbers)
+    if scale_to is not None:
+        scales = parts["scale"].str.lower().replace(_SCALE_WORDS)
+        factors = scales.map(
+            {unit: scale_factor(unit, base=scale_to) for unit in scales.dropna().unique()}
+        )
+        numbers = numbers * factors.fillna(1.0).astype("float64")
+    return numbers
+
+
+def extract_number(values: pd.Series, signed: bool = False) -> pd.Series:
+    """Take the first number appearing anywhere in each cell.
+
+    Args:
+        values: Column of cells
+        signed: Keep a leading + or - sign
+
+    Returns:
+        Float series aligned with ``values``
+    """
+    pattern = _SIGNED_NUMBER if signed else _LOOSE_NUMBER
+    found = as_text(values).str.extract(pattern, expand=False)
+    return _to_float(found)
+
+
+def is_percent(values: pd.Series) -> pd.Series:
+    """Get which cells are written as percentages."""
+    return as_text(values).str.contains("%", regex=False).fillna(False).astype(bool)
+
+
+def map_unique(values: pd.Series, func: Callable[[str], Any]) -> pd.Series:
+    """Apply a per-label function once per distinct value.
+
+    Labels such as metric names repeat across value columns and rows, so
+    categorizing the distinct values and mapping back is much cheaper than
+    calling ``func`` per row.
+    """
+    return values.map({value: func(value) for value in values.dropna().unique()})
+
+
+def _terms_pattern(terms: Iterable[str]) -> str:
+    return "|".join(re.escape(term.lower()) for term in terms)
+
+
+def header_matches(column: Any, terms: Iterable[str]) -> bool:
+    """Whether a column name contains any of the terms (case-insensitive)."""
+    name = str(column).lower()
+    return any(term.lower() in name for term in terms)
+
+
+def find_label_column(
+    table: pd.DataFrame, terms: Sequence[str], exclude: Iterable[Any] = ()
+) -> Optional[Any]:
+    """Find the first column with a cell containing any of the terms.
+
+    Args:
+        table: Table to search
+        terms: Substrings identifying label cells (case-insensitive)
+        exclude: Columns to skip
+
+    Returns:
+        Column name, or None
+    """
+    pattern = _terms_pattern(terms)
+    skipped = set(exclude)
+    for column in table.columns:
+        if column in skipped:
+            continue
+        cells = as_text(table[column]).str.lower()
+        if cells.str.contains(pattern, regex=True).any():
+            return column
+    return None
+
+
+def value_columns(
+    table: pd.DataFrame,
+    exclude: Iterable[Any] = (),
+    min_fraction: float = 0.3,
+    percent_only: bool = False,
+) -> List[Any]:
+    """Find columns holding numbers in more than ``min_fraction`` of rows.
+
+    Args:
+        table: Table to search
+        exclude: Columns to skip, typically the label column
+        min_fraction: Share of rows that must hold a value
+        percent_only: Only count cells written as percentages
+
+    Returns:
+        Column names in table order
+    """
+    skipped = set(exclude)
+    threshold = len(table) * min_fraction
+    found = []
+    for column in table.columns:
+        if column in skipped:
+            continue
+        values = table[column]
+        if percent_only:
+            count = is_percent(values).sum()
+        else:
+            count = to_numeric(values).notna().sum()
+        if count > threshold:
+            found.append(column)
+    return found
+
+
+def map_columns(
+    table: pd.DataFrame,
+    mapping: Sequence[Tuple[str, Sequence[str]]],
+    exclude: Iterable[Any] = (),
+) -> Dict[Any, str]:
+    """Assign table columns to output names by header keywords.
+
+    Each column takes the first output name whose keywords appear in its
+    header, like an if/elif chain over ``mapping``.
+
+    Returns:
+        Mapping of table column to output name
+    """
+    skipped = set(exclude)
+    assigned = {}
+    for column in table.columns:
+        if column in skipped:
+            continue
+        for name, keywords in mapping:
+            if header_matches(column, keywords):
+                assigned[column] = name
+                break
+    return assigned
+
+
+def _parse(values: pd.Series, parse: str) -> pd.Series:
+    if parse == "strict":
+        return to_numeric(values)
+    if parse == "signed":
+        return extract_number(values, signed=True)
+    if parse == "text":
+        return as_text(values)
+    return extract_number(values)
+
+
+def melt_values(
+    table: pd.DataFrame,
+    label_column: Any,
+    columns: Sequence[Any],
+    label_name: str = "label",
+    parse: str = "strict",
+) -> pd.DataFrame:
+    """Reshape value columns into one row per label and column.
+
+    Args:
+        table: Source table
+        label_column: Column naming each row
+        columns: Value columns to melt
+        label_name: Output name of the label
+        parse: "strict" for formatted numeric cells, "loose" or "signed" for
+            the first number in each cell
+
+    Returns:
+        Frame with ``label_name``, "column", "value" and "is_percent",
+        dropping rows without a label and cells that do not parse
+    """
+    if not columns:
+        return pd.DataFrame(columns=[label_name, "column", "value", "is_percent"])
+    labels = as_text(table[label_column])
+    parts = []
+    for column in columns:
+        parts.append(
+            pd.DataFrame(
+                {
+                    label_name: labels,
+                    "column": str(column),
+                    "value": _parse(table[column], parse),
+                    "is_percent": is_percent(table[column]),
+                }
+            )
+        )
+    long = pd.concat(parts, ignore_index=True)
+    return long.dropna(subset=[label_name, "value"]).reset_index(drop=True)
+
+
+def pivot_columns(
+    table: pd.DataFrame,
+    key_column: Any,
+    key_name: str,
+    mapping: Sequence[Tuple[str, Sequence[str]]],
+    parse: Union[str, Mapping[str, str]] = "strict",
+    integers: Sequence[str] = (),
+) -> pd.DataFrame:
+    """Build one row per key with metric columns named by header keywords.
+
+    Rows without a key or without any parsed metric are dropped. When
+    several columns map to one metric, the rightmost parsed value wins.
+
+    Args:
+        table: Source table
+        key_column: Column identifying each row, e.g. country
+        key_name: Output name of the key
+        mapping: (metric name, header keywords) pairs, see ``map_columns``
+        parse: "strict", "loose" or "signed" number parsing, or "text" to
+            keep cells as strings; a mapping sets it per metric, defaulting
+            to "strict"
+        integers: Metrics stored as nullable integers
+
+    Returns:
+        Frame with ``key_name`` and the metrics found
+    """
+    result = pd.DataFrame({key_name: as_text(table[key_column])})
+    metrics: List[str] = []
+    for column, name in map_columns(table, mapping, exclude=[key_column]).items():
+        mode = parse.get(name, "strict") if isinstance(parse, Mapping) else parse
+        values = _parse(table[column], mode)
+        result[name] = values.combine_first(result[name]) if name in result else values
+        if name not in metrics:
+            metrics.append(name)
+    if not metrics:
+        return result.iloc[0:0]
+    result = result.dropna(subset=[key_name]).dropna(subset=metrics, how="all")
+    for name in integers:
+        if name in result:
+            result[name] = result[name].round().astype("Int64")
+    return result.reset_index(drop=True)
+
+
+def detect_header(table: pd.DataFrame) -> pd.DataFrame:
+    """Promote the first row to the header when the header is a placeholder.
+
+    Tables read without a header row (tabula with ``header=None``, camelot)
+    have integer or "Unnamed" column names and their real header in the
+    first row. Such a row is promoted when most of its cells are non-numeric
+    text.
+    """
+    if table.empty or not all(_PLACEHOLDER_HEADER.match(str(c).strip()) for c in table.columns):
+        return table
+    first = as_text(table.iloc[0])
+    texts = first.notna() & to_numeric(first).isna()
+    if texts.sum() < max(1, len(first) / 2):
+        return table
+    promoted = table.iloc[1:].reset_index(drop=True)
+    promoted.columns = [
+        name if pd.notna(name) else f"column_{i}" for i, name in enumerate(first.tolist())
+    ]
+    return promoted
+
+
+def normalize_table(table: pd.DataFrame) -> pd.DataFrame:
+    """Detect the header, strip column names and drop empty rows and columns."""
+    table = detect_header(table)
+    table = table.dropna(how="all").dropna(axis=1, how="all")
+    table.columns = [str(column).strip() for column in table.columns]
+    return table.reset_index(drop=True)
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """How to find, parse and bound one dataset column.
+
+    Label columns are found by ``header_terms`` or, failing that, by cells
+    containing ``value_terms``. Numeric columns are found by
+    ``header_terms``; without header terms they take the next unused
+    numeric column. Headers containing ``exclude_terms`` never match. Year
+    columns match "year" headers or cells holding a 20xx year.
+    """
+
+    name: str
+    kind: str = "number"  # "number", "label" or "year"
+    header_terms: Tuple[str, ...] = ()
+    exclude_terms: Tuple[str, ...] = ()
+    value_terms: Tuple[str, ...] = ()
+    bounds: Optional[Tuple[float, float]] = None
+    required: bool = True
+    title_case: bool = False
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    """Declared columns of a dataset extracted from a table."""
+
+    name: str
+    columns: Tuple[ColumnSpec, ...]
+    constants: Mapping[str, Any] = field(default_factory=dict)
+    sort_by: Optional[str] = None
+    numeric_min_fraction: float = 0.5
+
+    def resolve(self, table: pd.DataFrame) -> Dict[str, Any]:
+        """Map each declared column to a table column where one is found."""
+        used: List[Any] = []
+        resolved: Dict[str, Any] = {}
+        for spec in sorted(self.columns, key=lambda s: s.kind == "number" and not s.header_terms):
+            column = self._find(table, spec, used)
+            if column is not None:
+                resolved[spec.name] = column
+                used.append(column)
+        return resolved
+
+    def _find(self, table: pd.DataFrame, spec: ColumnSpec, used: List[Any]) -> Optional[Any]:
+        candidates = [c for c in table.columns if c not in used]
+        by_header = [
+            c
+            for c in candidates
+            if spec.header_terms
+            and header_matches(c, spec.header_terms)
+            and not header_matches(c, spec.exclude_terms)
+        ]
+        if spec.kind == "label":
+            if by_header:
+                return by_header[0]
+            if not spec.value_terms:
+                return None
+            return find_label_column(table, spec.value_terms, exclude=used)
+        if spec.kind == "year":
+            if by_header:
+                return by_header[0]
+            for column in candidates:
+                if as_text(table[column]).str.contains(r"\b20\d{2}\b", regex=True).any():
+                    return column
+            return None
+        if spec.header_terms:
+            return by_header[0] if by_header else None
+        numeric = value_columns(table, exclude=used, min_fraction=self.numeric_min_fraction)
+        return numeric[0] if numeric else None
+
+    def apply(self, table: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Extract, parse and bound the declared columns.
+
+        Returns:
+            Clean dataset, or None if a required column is missing
+        """
+        resolved = self.resolve(table)
+        if any(spec.required and spec.name not in resolved for spec in self.columns):
+            return None
+
+        clean = pd.DataFrame(index=table.index)
+        for spec in self.columns:
+            if spec.name not in resolved:
+                continue
+            values = table[resolved[spec.name]]
+            if spec.kind == "label":
+                text = as_text(values)
+                clean[spec.name] = text.str.title() if spec.title_case else text
+            else:
+                clean[spec.name] = to_numeric(values)
+
+        required = [spec.name for spec in self.columns if spec.required]
+        clean = clean.dropna(subset=required)
+        for spec in self.columns:
+            if spec.bounds and spec.name in clean:
+                low, high = spec.bounds
+                inside = clean[spec.name].between(low, high) | clean[spec.name].isna()
+                clean = clean[inside]
+        for spec in self.columns:
+            if spec.kind == "year" and spec.name in clean:
+                clean[spec.name] = clean[spec.name].astype("int64" if spec.required else "Int64")
+        for name, value in self.constants.items():
+            clean[name] = value
+        if self.sort_by:
+            clean = clean.sort_values(self.sort_by)
+        return clean.reset_index(drop=True)
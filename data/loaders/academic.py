@@ -9,11 +9,44 @@ import pandas as pd
 
 from config.settings import settings
 
+from ..extractors.entity_scanner import get_scanner
 from ..extractors.pdf_extractor import PDFExtractor
+from ..extractors.table_normalization import (
+    find_label_column,
+    header_matches,
+    melt_values,
+    normalize_table,
+    pivot_columns,
+)
 from .base import BaseDataLoader, DataSource
 
 logger = logging.getLogger(__name__)
 
+# Table metrics by header keywords; the first matching metric wins
+MACRO_COLUMNS = [
+    ("global_gdp_impact_2030", ["gdp"]),
+    ("inflation_impact", ["inflation"]),
+    ("unemployment_change", ["unemployment"]),
+    ("developed_markets_impact", ["developed"]),
+    ("emerging_markets_impact", ["emerging"]),
+    ("inequality_gini_change", ["inequality", "gini"]),
+]
+
+FISCAL_COLUMNS = [
+    ("revenue_impact_percent", ["revenue"]),
+    ("spending_change_percent", ["spending", "expenditure"]),
+    ("timeline_years", ["timeline", "years"]),
+    ("policy_readiness_score", ["readiness", "score"]),
+]
+
+EMERGING_MARKET_COLUMNS = [
+    ("ai_readiness_score", ["readiness"]),
+    ("infrastructure_gap", ["infrastructure"]),
+    ("skills_gap", ["skills"]),
+    ("policy_framework_score", ["policy"]),
+    ("growth_potential", ["growth", "potential"]),
+]
+
 
 class AcademicPapersLoader(BaseDataLoader):
     """Loader for academic research papers on AI economics with real PDF extraction."""
@@ -73,6 +106,10 @@ class AcademicPapersLoader(BaseDataLoader):
             except Exception as e:
                 logger.error(f"Failed to initialize PDF extractor for {paper_path}: {e}")
 
+    def source_files(self) -> List[Path]:
+        """List the papers selected for extraction."""
+        return [extractor.file_path for extractor, _ in self.extractors]
+
     def load(self) -> Dict[str, pd.DataFrame]:
         """Load all datasets from academic papers using actual PDF extraction."""
         logger.info(f"Loading data from {self.source.name}")
@@ -160,22 +197,20 @@ class AcademicPapersLoader(BaseDataLoader):
                     "impact",
                 ]
 
-                consensus_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    consensus_pages.extend(pages)
-
-                consensus_pages = sorted(set(consensus_pages))[:10]
+                consensus_pages = self.pages_with_keywords(keywords, extractor)[:10]
 
                 if not consensus_pages:
                     continue
 
                 for page in consensus_pages[:5]:
-                    text = extractor.extract_text_from_page(page)
+                    text = self.page_text(page, extractor)
 
+                    mentioned = get_scanner(
+                        tuple(word.lower() for item in research_areas for word in item.split())
+                    ).found_set(text)
                     for area in research_areas:
                         # Look for mentions of research areas with quantitative findings
-                        if any(word.lower() in text.lower() for word in area.split()):
+                        if any(word.lower() in mentioned for word in area.split()):
                             area_data = self._extract_area_consensus(text, area, paper_name)
                             if area_data:
                                 consensus_data.append(area_data)
@@ -250,7 +285,7 @@ class AcademicPapersLoader(BaseDataLoader):
         ]
 
         for pattern in estimate_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 try:
                     estimate = float(matches[0])
@@ -311,18 +346,13 @@ class AcademicPapersLoader(BaseDataLoader):
                     "model",
                 ]
 
-                method_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    method_pages.extend(pages)
-
-                method_pages = sorted(set(method_pages))[:8]
+                method_pages = self.pages_with_keywords(keywords, extractor)[:8]
 
                 if not method_pages:
                     continue
 
                 for page in method_pages[:4]:
-                    text = extractor.extract_text_from_page(page)
+                    text = self.page_text(page, extractor)
 
                     # Identify methodology used
                     methodology = self._infer_methodology(text)
@@ -409,7 +439,7 @@ class AcademicPapersLoader(BaseDataLoader):
         ]
 
         for pattern in impact_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = self.findall(pattern, text, re.IGNORECASE)
             if matches:
                 try:
                     result["impact_estimate"] = float(matches[0])
@@ -454,22 +484,20 @@ class AcademicPapersLoader(BaseDataLoader):
                     "change",
                 ]
 
-                impact_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    impact_pages.extend(pages)
-
-                impact_pages = sorted(set(impact_pages))[:8]
+                impact_pages = self.pages_with_keywords(keywords, extractor)[:8]
 
                 if not impact_pages:
                     continue
 
                 for page in impact_pages[:4]:
-                    text = extractor.extract_text_from_page(page)
+                    text = self.page_text(page, extractor)
 
+                    mentioned = get_scanner(
+                        tuple(word.lower() for item in impact_types for word in item.split())
+                    ).found_set(text)
                     for impact_type in impact_types:
                         # Look for specific impact types with quantitative data
-                        if any(word.lower() in text.lower() for word in impact_type.split()):
+                        if any(word.lower() in mentioned for word in impact_type.split()):
                             impact_info = self._extract_specific_impact(
                                 text, impact_type, paper_name
                             )
@@ -478,7 +506,7 @@ class AcademicPapersLoader(BaseDataLoader):
 
                 # Also look for impact tables
                 for page in impact_pages[:3]:
-                    tables = extractor.extract_tables(page_range=(page, page))
+                    tables = self.page_tables(page, extractor)
                     for table in tables:
                         if table.empty:
                             continue
@@ -528,7 +556,7 @@ class AcademicPapersLoader(BaseDataLoader):
         ]
 
         for pattern in impact_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 try:
                     estimate = float(matches[0])
@@ -562,68 +590,32 @@ class AcademicPapersLoader(BaseDataLoader):
 
     def _process_impact_table(self, table: pd.DataFrame, paper_name: str) -> List[Dict]:
         """Process table containing impact estimates."""
-        results = []
-
-        # Look for coefficient/estimate columns
-        estimate_cols = []
-        for col in table.columns:
-            col_lower = str(col).lower()
-            if any(
-                term in col_lower for term in ["coeff", "estimate", "effect", "impact", "result"]
-            ):
-                estimate_cols.append(col)
-
+        table = normalize_table(table)
+        estimate_cols = [
+            col
+            for col in table.columns
+            if header_matches(col, ["coeff", "estimate", "effect", "impact", "result"])
+        ]
         if not estimate_cols:
-            return results
-
-        # Look for variable/factor column
-        var_col = None
-        for col in table.columns:
-            if col not in estimate_cols:
-                # Check if this column contains variable names
-                sample_vals = table[col].astype(str).str.lower()
-                if any(
-                    val
-                    for val in sample_vals
-                    if any(term in val for term in ["ai", "technology", "automation", "digital"])
-                ):
-                    var_col = col
-                    break
-
-        if not var_col:
-            # Use first non-estimate column
-            var_col = (
-                [col for col in table.columns if col not in estimate_cols][0]
-                if len(table.columns) > len(estimate_cols)
-                else None
-            )
-
-        if var_col:
-            for _, row in table.iterrows():
-                variable = str(row[var_col]).strip()
-                if not variable or variable.lower() == "nan":
-                    continue
-
-                for est_col in estimate_cols:
-                    try:
-                        value_str = str(row[est_col])
-                        # Extract numeric value
-                        numeric_match = re.search(r"([+-]?\d+(?:\.\d+)?)", value_str)
-                        if numeric_match:
-                            estimate = float(numeric_match.group(1))
-
-                            results.append(
-                                {
-                                    "impact_type": variable,
-                                    "estimate": estimate,
-                                    "paper_source": paper_name,
-                                    "methodology": "Table-based",
-                                }
-                            )
-                    except ValueError:
-                        continue
+            return []
 
-        return results
+        # Variable names mention AI or technology; otherwise use the first other column
+        var_col = find_label_column(
+            table, ["ai", "technology", "automation", "digital"], exclude=estimate_cols
+        )
+        if var_col is None:
+            other_cols = [col for col in table.columns if col not in estimate_cols]
+            if not other_cols:
+                return []
+            var_col = other_cols[0]
+
+        estimates = melt_values(
+            table, var_col, estimate_cols, label_name="impact_type", parse="signed"
+        )
+        df = estimates[["impact_type", "value"]].rename(columns={"value": "estimate"})
+        df["paper_source"] = paper_name
+        df["methodology"] = "Table-based"
+        return df.to_dict("records")
 
     def _extract_research_agenda(self) -> Optional[pd.DataFrame]:
         """Extract future research priorities and gaps."""
@@ -645,12 +637,7 @@ class AcademicPapersLoader(BaseDataLoader):
                     "recommendations",
                 ]
 
-                agenda_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    agenda_pages.extend(pages)
-
-                agenda_pages = sorted(set(agenda_pages))[:8]
+                agenda_pages = self.pages_with_keywords(keywords, extractor)[:8]
 
                 if not agenda_pages:
                     continue
@@ -670,10 +657,13 @@ class AcademicPapersLoader(BaseDataLoader):
                 ]
 
                 for page in agenda_pages[:4]:
-                    text = extractor.extract_text_from_page(page)
+                    text = self.page_text(page, extractor)
 
+                    mentioned = get_scanner(
+                        tuple(word.lower() for item in priorities for word in item.split())
+                    ).found_set(text)
                     for priority in priorities:
-                        if any(word.lower() in text.lower() for word in priority.split()):
+                        if any(word.lower() in mentioned for word in priority.split()):
                             priority_data = self._extract_priority_data(text, priority, paper_name)
                             if priority_data:
                                 agenda_data.append(priority_data)
@@ -789,12 +779,7 @@ class AcademicPapersLoader(BaseDataLoader):
                 # Look for references/bibliography sections
                 keywords = ["references", "bibliography", "cited", "literature"]
 
-                ref_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    ref_pages.extend(pages)
-
-                ref_pages = sorted(set(ref_pages))
+                ref_pages = self.pages_with_keywords(keywords, extractor)
 
                 # Count references and analyze patterns
                 total_refs = 0
@@ -802,12 +787,12 @@ class AcademicPapersLoader(BaseDataLoader):
                 recent_refs = 0
 
                 for page in ref_pages[-3:]:  # Last 3 pages (likely references)
-                    text = extractor.extract_text_from_page(page)
+                    text = self.page_text(page, extractor)
 
                     # Count total references (rough estimate)
                     ref_patterns = [r"\(\d{4}\)", r"\[\d+\]", r"^\d+\."]
                     for pattern in ref_patterns:
-                        matches = re.findall(pattern, text, re.MULTILINE)
+                        matches = self.findall(pattern, text, re.MULTILINE)
                         total_refs += len(matches)
 
                     # Count AI-related references
@@ -819,25 +804,25 @@ class AcademicPapersLoader(BaseDataLoader):
                         "ML",
                     ]
                     for term in ai_terms:
-                        ai_refs += len(re.findall(term, text, re.IGNORECASE))
+                        ai_refs += len(self.findall(term, text, re.IGNORECASE))
 
                     # Count recent references (2020+)
                     recent_years = [str(year) for year in range(2020, 2026)]
                     for year in recent_years:
-                        recent_refs += len(re.findall(year, text))
+                        recent_refs += len(self.findall(year, text))
 
                 if total_refs > 0:
                     # Analyze abstract/introduction for influence indicators
                     intro_keywords = ["abstract", "introduction", "summary"]
                     intro_pages = []
                     for keyword in intro_keywords:
-                        pages = extractor.find_pages_with_keyword(keyword)
+                        pages = self.pages_with_keywords([keyword], extractor)
                         intro_pages.extend(pages)
 
                     influence_score = 5.0  # Base score
 
                     if intro_pages:
-                        intro_text = extractor.extract_text_from_page(intro_pages[0])
+                        intro_text = self.page_text(intro_pages[0], extractor)
 
                         # Check for influence indicators
                         if any(
@@ -912,11 +897,11 @@ class AcademicPapersLoader(BaseDataLoader):
                     )
                 ):
                     try:
-                        text = extractor.extract_text_from_page(page)
+                        text = self.page_text(page, extractor)
 
                         for region, keywords in regions.items():
                             for keyword in keywords:
-                                mentions = len(re.findall(keyword, text, re.IGNORECASE))
+                                mentions = len(self.findall(keyword, text, re.IGNORECASE))
                                 region_mentions[region] += mentions
 
                                 # Check for data-focused mentions
@@ -1095,12 +1080,7 @@ class IMFLoader(BaseDataLoader):
                 "baseline",
             ]
 
-            macro_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                macro_pages.extend(pages)
-
-            macro_pages = sorted(set(macro_pages))[:15]
+            macro_pages = self.pages_with_keywords(keywords)[:15]
 
             if not macro_pages:
                 return None
@@ -1120,10 +1100,11 @@ class IMFLoader(BaseDataLoader):
             ]
 
             for page in macro_pages[:8]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(tuple(scenarios)).found_set(text)
                 for scenario in scenarios:
-                    if scenario.lower() in text.lower():
+                    if scenario in mentioned:
                         # Extract economic metrics for this scenario
                         scenario_data = self._extract_scenario_metrics(text, scenario)
                         if scenario_data:
@@ -1131,7 +1112,7 @@ class IMFLoader(BaseDataLoader):
 
             # Look for macroeconomic tables
             for page in macro_pages[:5]:
-                tables = self.extractor.extract_tables(page_range=(page, page))
+                tables = self.page_tables(page)
                 for table in tables:
                     if table.empty:
                         continue
@@ -1174,7 +1155,7 @@ class IMFLoader(BaseDataLoader):
         ]
 
         for pattern in gdp_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 result["global_gdp_impact_2030"] = float(matches[0])
                 break
@@ -1187,7 +1168,7 @@ class IMFLoader(BaseDataLoader):
         ]
 
         for pattern in inflation_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 result["inflation_impact"] = float(matches[0])
                 break
@@ -1200,7 +1181,7 @@ class IMFLoader(BaseDataLoader):
         ]
 
         for pattern in unemployment_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 result["unemployment_change"] = float(matches[0])
                 break
@@ -1231,7 +1212,7 @@ class IMFLoader(BaseDataLoader):
         ]
 
         for pattern in inequality_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 result["inequality_gini_change"] = float(matches[0])
                 break
@@ -1240,63 +1221,13 @@ class IMFLoader(BaseDataLoader):
 
     def _process_macro_table(self, table: pd.DataFrame) -> List[Dict]:
         """Process table containing macroeconomic data."""
-        results = []
-
-        # Identify scenario column
-        scenario_col = None
-        for col in table.columns:
-            sample_vals = table[col].astype(str).str.lower()
-            if any(
-                val
-                for val in sample_vals
-                if any(scenario in val for scenario in ["baseline", "optimistic", "pessimistic"])
-            ):
-                scenario_col = col
-                break
-
-        if not scenario_col:
-            return results
-
-        # Extract metrics for each scenario
-        for _, row in table.iterrows():
-            scenario = str(row[scenario_col]).strip()
-            if not scenario or scenario.lower() == "nan":
-                continue
-
-            result = {"scenario": scenario}
+        table = normalize_table(table)
+        scenario_col = find_label_column(table, ["baseline", "optimistic", "pessimistic"])
+        if scenario_col is None:
+            return []
 
-            for col in table.columns:
-                if col == scenario_col:
-                    continue
-
-                col_lower = str(col).lower()
-                value_str = str(row[col])
-
-                try:
-                    # Extract numeric value
-                    numeric_match = re.search(r"([+-]?\d+(?:\.\d+)?)", value_str)
-                    if numeric_match:
-                        value = float(numeric_match.group(1))
-
-                        if "gdp" in col_lower:
-                            result["global_gdp_impact_2030"] = value
-                        elif "inflation" in col_lower:
-                            result["inflation_impact"] = value
-                        elif "unemployment" in col_lower:
-                            result["unemployment_change"] = value
-                        elif "developed" in col_lower:
-                            result["developed_markets_impact"] = value
-                        elif "emerging" in col_lower:
-                            result["emerging_markets_impact"] = value
-                        elif "inequality" in col_lower or "gini" in col_lower:
-                            result["inequality_gini_change"] = value
-                except ValueError:
-                    continue
-
-            if len(result) > 1:
-                results.append(result)
-
-        return results
+        df = pivot_columns(table, scenario_col, "scenario", MACRO_COLUMNS, parse="signed")
+        return df.to_dict("records")
 
     def _extract_fiscal_implications(self) -> Optional[pd.DataFrame]:
         """Extract fiscal policy implications."""
@@ -1317,12 +1248,7 @@ class IMFLoader(BaseDataLoader):
                 "universal basic income",
             ]
 
-            fiscal_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                fiscal_pages.extend(pages)
-
-            fiscal_pages = sorted(set(fiscal_pages))[:10]
+            fiscal_pages = self.pages_with_keywords(keywords)[:10]
 
             if not fiscal_pages:
                 return None
@@ -1343,10 +1269,13 @@ class IMFLoader(BaseDataLoader):
             ]
 
             for page in fiscal_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(
+                    tuple(word.lower() for item in impact_areas for word in item.split())
+                ).found_set(text)
                 for area in impact_areas:
-                    if any(word.lower() in text.lower() for word in area.split()):
+                    if any(word.lower() in mentioned for word in area.split()):
                         # Extract fiscal metrics for this area
                         area_data = self._extract_fiscal_area_data(text, area)
                         if area_data:
@@ -1354,7 +1283,7 @@ class IMFLoader(BaseDataLoader):
 
             # Look for fiscal impact tables
             for page in fiscal_pages[:5]:
-                tables = self.extractor.extract_tables(page_range=(page, page))
+                tables = self.page_tables(page)
                 for table in tables:
                     if table.empty:
                         continue
@@ -1405,7 +1334,7 @@ class IMFLoader(BaseDataLoader):
         ]
 
         for pattern in revenue_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 result["revenue_impact_percent"] = float(matches[0])
                 break
@@ -1418,7 +1347,7 @@ class IMFLoader(BaseDataLoader):
         ]
 
         for pattern in spending_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 result["spending_change_percent"] = float(matches[0])
                 break
@@ -1431,7 +1360,7 @@ class IMFLoader(BaseDataLoader):
         ]
 
         for pattern in timeline_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 if len(matches[0]) == 4:  # Year format
                     current_year = 2024
@@ -1464,59 +1393,20 @@ class IMFLoader(BaseDataLoader):
 
     def _process_fiscal_table(self, table: pd.DataFrame) -> List[Dict]:
         """Process table containing fiscal data."""
-        results = []
-
-        # Identify area/category column
-        area_col = None
-        for col in table.columns:
-            sample_vals = table[col].astype(str).str.lower()
-            if any(
-                val
-                for val in sample_vals
-                if any(term in val for term in ["tax", "spending", "budget", "revenue"])
-            ):
-                area_col = col
-                break
-
-        if not area_col:
-            return results
-
-        # Extract data for each area
-        for _, row in table.iterrows():
-            area = str(row[area_col]).strip()
-            if not area or area.lower() == "nan":
-                continue
-
-            result = {"impact_area": area}
-
-            for col in table.columns:
-                if col == area_col:
-                    continue
-
-                col_lower = str(col).lower()
-                value_str = str(row[col])
-
-                try:
-                    # Extract numeric value
-                    numeric_match = re.search(r"([+-]?\d+(?:\.\d+)?)", value_str)
-                    if numeric_match:
-                        value = float(numeric_match.group(1))
-
-                        if "revenue" in col_lower:
-                            result["revenue_impact_percent"] = value
-                        elif "spending" in col_lower or "expenditure" in col_lower:
-                            result["spending_change_percent"] = value
-                        elif "timeline" in col_lower or "years" in col_lower:
-                            result["timeline_years"] = int(value)
-                        elif "readiness" in col_lower or "score" in col_lower:
-                            result["policy_readiness_score"] = value
-                except ValueError:
-                    continue
-
-            if len(result) > 1:
-                results.append(result)
-
-        return results
+        table = normalize_table(table)
+        area_col = find_label_column(table, ["tax", "spending", "budget", "revenue"])
+        if area_col is None:
+            return []
+
+        df = pivot_columns(
+            table,
+            area_col,
+            "impact_area",
+            FISCAL_COLUMNS,
+            parse="signed",
+            integers=["timeline_years"],
+        )
+        return df.to_dict("records")
 
     def _extract_monetary_policy(self) -> Optional[pd.DataFrame]:
         """Extract monetary policy considerations."""
@@ -1534,12 +1424,7 @@ class IMFLoader(BaseDataLoader):
                 "digital currency",
             ]
 
-            monetary_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                monetary_pages.extend(pages)
-
-            monetary_pages = sorted(set(monetary_pages))[:10]
+            monetary_pages = self.pages_with_keywords(keywords)[:10]
 
             if not monetary_pages:
                 return None
@@ -1559,10 +1444,13 @@ class IMFLoader(BaseDataLoader):
             ]
 
             for page in monetary_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(
+                    tuple(word.lower() for item in concerns for word in item.split())
+                ).found_set(text)
                 for concern in concerns:
-                    if any(word.lower() in text.lower() for word in concern.split()):
+                    if any(word.lower() in mentioned for word in concern.split()):
                         # Extract concern-specific data
                         concern_data = self._extract_monetary_concern_data(text, concern)
                         if concern_data:
@@ -1655,12 +1543,7 @@ class IMFLoader(BaseDataLoader):
                 "regulatory",
             ]
 
-            stability_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                stability_pages.extend(pages)
-
-            stability_pages = sorted(set(stability_pages))[:10]
+            stability_pages = self.pages_with_keywords(keywords)[:10]
 
             if not stability_pages:
                 return None
@@ -1681,10 +1564,13 @@ class IMFLoader(BaseDataLoader):
             ]
 
             for page in stability_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(
+                    tuple(word.lower() for item in risk_categories for word in item.split())
+                ).found_set(text)
                 for category in risk_categories:
-                    if any(word.lower() in text.lower() for word in category.split()):
+                    if any(word.lower() in mentioned for word in category.split()):
                         # Extract risk-specific data
                         risk_data = self._extract_financial_risk_data(text, category)
                         if risk_data:
@@ -1729,7 +1615,7 @@ class IMFLoader(BaseDataLoader):
         ]
 
         for pattern in severity_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 result["severity_score"] = float(matches[0])
                 break
@@ -1756,7 +1642,7 @@ class IMFLoader(BaseDataLoader):
         ]
 
         for pattern in likelihood_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 if "%" in pattern:
                     result["likelihood_score"] = float(matches[0]) / 10  # Convert % to 0-10 scale
@@ -1816,12 +1702,7 @@ class IMFLoader(BaseDataLoader):
                 "digital divide",
             ]
 
-            em_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                em_pages.extend(pages)
-
-            em_pages = sorted(set(em_pages))[:10]
+            em_pages = self.pages_with_keywords(keywords)[:10]
 
             if not em_pages:
                 return None
@@ -1848,10 +1729,11 @@ class IMFLoader(BaseDataLoader):
             ]
 
             for page in em_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(tuple(countries)).found_set(text)
                 for country in countries:
-                    if country.lower() in text.lower():
+                    if country in mentioned:
                         # Extract country-specific data
                         country_data = self._extract_country_readiness_data(text, country)
                         if country_data:
@@ -1859,7 +1741,7 @@ class IMFLoader(BaseDataLoader):
 
             # Look for emerging markets tables
             for page in em_pages[:5]:
-                tables = self.extractor.extract_tables(page_range=(page, page))
+                tables = self.page_tables(page)
                 for table in tables:
                     if table.empty:
                         continue
@@ -1902,7 +1784,7 @@ class IMFLoader(BaseDataLoader):
         ]
 
         for pattern in readiness_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 result["ai_readiness_score"] = float(matches[0])
                 break
@@ -1927,7 +1809,7 @@ class IMFLoader(BaseDataLoader):
         ]
 
         for pattern in infra_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 result["infrastructure_gap"] = float(matches[0])
                 break
@@ -1940,7 +1822,7 @@ class IMFLoader(BaseDataLoader):
         ]
 
         for pattern in skills_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 result["skills_gap"] = float(matches[0])
                 break
@@ -1983,61 +1865,13 @@ class IMFLoader(BaseDataLoader):
 
     def _process_em_table(self, table: pd.DataFrame) -> List[Dict]:
         """Process table containing emerging markets data."""
-        results = []
-
-        # Identify country column
-        country_col = None
-        for col in table.columns:
-            sample_vals = table[col].astype(str).str.lower()
-            if any(
-                val
-                for val in sample_vals
-                if any(country in val for country in ["india", "brazil", "mexico", "indonesia"])
-            ):
-                country_col = col
-                break
-
-        if not country_col:
-            return results
-
-        # Extract data for each country
-        for _, row in table.iterrows():
-            country = str(row[country_col]).strip()
-            if not country or country.lower() == "nan":
-                continue
-
-            result = {"country": country}
+        table = normalize_table(table)
+        country_col = find_label_column(table, ["india", "brazil", "mexico", "indonesia"])
+        if country_col is None:
+            return []
 
-            for col in table.columns:
-                if col == country_col:
-                    continue
-
-                col_lower = str(col).lower()
-                value_str = str(row[col])
-
-                try:
-                    # Extract numeric value
-                    numeric_match = re.search(r"(\d+(?:\.\d+)?)", value_str)
-                    if numeric_match:
-                        value = float(numeric_match.group(1))
-
-                        if "readiness" in col_lower:
-                            result["ai_readiness_score"] = value
-                        elif "infrastructure" in col_lower:
-                            result["infrastructure_gap"] = value
-                        elif "skills" in col_lower:
-                            result["skills_gap"] = value
-                        elif "policy" in col_lower:
-                            result["policy_framework_score"] = value
-                        elif "growth" in col_lower or "potential" in col_lower:
-                            result["growth_potential"] = value
-                except ValueError:
-                    continue
-
-            if len(result) > 1:
-                results.append(result)
-
-        return results
+        df = pivot_columns(table, country_col, "country", EMERGING_MARKET_COLUMNS, parse="loose")
+        return df.to_dict("records")
 
     def _extract_trade_implications(self) -> Optional[pd.DataFrame]:
         """Extract global trade implications of AI."""
@@ -2056,12 +1890,7 @@ class IMFLoader(BaseDataLoader):
                 "trade policy",
             ]
 
-            trade_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                trade_pages.extend(pages)
-
-            trade_pages = sorted(set(trade_pages))[:10]
+            trade_pages = self.pages_with_keywords(keywords)[:10]
 
             if not trade_pages:
                 return None
@@ -2079,10 +1908,13 @@ class IMFLoader(BaseDataLoader):
             ]
 
             for page in trade_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(
+                    tuple(word.lower() for item in trade_aspects for word in item.split())
+                ).found_set(text)
                 for aspect in trade_aspects:
-                    if any(word.lower() in text.lower() for word in aspect.split()):
+                    if any(word.lower() in mentioned for word in aspect.split()):
                         # Extract trade-specific data
                         aspect_data = self._extract_trade_aspect_data(text, aspect)
                         if aspect_data:
@@ -2127,7 +1959,7 @@ class IMFLoader(BaseDataLoader):
         ]
 
         for pattern in impact_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 result["impact_magnitude_percent"] = float(matches[0])
                 break
@@ -2152,7 +1984,7 @@ class IMFLoader(BaseDataLoader):
         ]
 
         for pattern in timeline_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 if len(matches[0]) == 4:  # Year format
                     result["implementation_timeline"] = f"By {matches[0]}"
@@ -10,16 +10,108 @@ import pandas as pd
 
 from config.settings import settings
 
+from ..extractors.patterns import PERCENT_BY_YEAR
 from ..extractors.pdf_extractor import PDFExtractor
+from ..extractors.table_normalization import ColumnSpec, TableSchema
 from ..models.adoption import AdoptionMetrics, GeographicAdoption, SectorAdoption
+from ..models.schemas import PERCENT_RULE, ColumnRule, DatasetSchema
 from .base import BaseDataLoader, DataSource
 
 logger = logging.getLogger(__name__)
 
+DATASET_SCHEMAS = {
+    "adoption_trends": DatasetSchema(
+        "adoption_trends",
+        model=AdoptionMetrics,
+        # Trend tables reach back before the model's 2017 floor
+        rules={"year": ColumnRule("int", required=True, low=2010, high=2030)},
+    ),
+    "sector_adoption": DatasetSchema("sector_adoption", model=SectorAdoption),
+    "geographic_adoption": DatasetSchema("geographic_adoption", model=GeographicAdoption),
+    "firm_size_adoption": DatasetSchema(
+        "firm_size_adoption", rules={"adoption_rate": PERCENT_RULE}
+    ),
+    "ai_maturity": DatasetSchema("ai_maturity", rules={"percentage_of_firms": PERCENT_RULE}),
+    "investment_trends": DatasetSchema(
+        "investment_trends",
+        rules={"year": ColumnRule("int", low=2010, high=2030)},
+    ),
+}
+
+PERCENT_BOUNDS = (0, 100)
+
+ADOPTION_SCHEMA = TableSchema(
+    name="adoption_trends",
+    columns=(
+        ColumnSpec("year", kind="year", header_terms=("year",), bounds=(2010, 2030)),
+        ColumnSpec(
+            "overall_adoption",
+            header_terms=("adoption", "rate", "deployment", "%"),
+            exclude_terms=("genai", "generative"),
+            bounds=PERCENT_BOUNDS,
+        ),
+        ColumnSpec("genai_adoption", header_terms=("genai", "generative"), required=False),
+    ),
+    sort_by="year",
+)
+
+SECTOR_SCHEMA = TableSchema(
+    name="sector_adoption",
+    columns=(
+        ColumnSpec(
+            "sector",
+            kind="label",
+            value_terms=("technology", "financial", "healthcare"),
+            title_case=True,
+        ),
+        ColumnSpec("adoption_rate", bounds=PERCENT_BOUNDS),
+        ColumnSpec("genai_adoption", required=False),
+    ),
+    constants={"year": 2025},
+)
+
+GEOGRAPHIC_SCHEMA = TableSchema(
+    name="geographic_adoption",
+    columns=(
+        ColumnSpec(
+            "location", kind="label", value_terms=("state", "country", "city", "united", "china")
+        ),
+        ColumnSpec("adoption_rate", bounds=PERCENT_BOUNDS),
+    ),
+    constants={"year": 2025},
+)
+
+FIRM_SIZE_SCHEMA = TableSchema(
+    name="firm_size_adoption",
+    columns=(
+        ColumnSpec(
+            "firm_size",
+            kind="label",
+            value_terms=("<", ">", "-", "employee", "small", "medium", "large"),
+        ),
+        ColumnSpec("adoption_rate", bounds=PERCENT_BOUNDS),
+    ),
+)
+
+MATURITY_SCHEMA = TableSchema(
+    name="ai_maturity",
+    columns=(
+        ColumnSpec(
+            "maturity_level",
+            kind="label",
+            value_terms=("explor", "experiment", "pilot", "scal", "transform"),
+            title_case=True,
+        ),
+        ColumnSpec("percentage_of_firms", bounds=PERCENT_BOUNDS),
+    ),
+)
+
 
 class AIIndexLoader(BaseDataLoader):
     """Loader for Stanford HAI AI Index Report data with real PDF extraction."""
 
+    schemas = DATASET_SCHEMAS
+
     def __init__(self, file_path: Optional[Path] = None):
         if file_path is None:
             file_path = (
@@ -50,14 +142,20 @@ class AIIndexLoader(BaseDataLoader):
         if not self.extractor:
             logger.warning("PDF extractor not available, returning empty datasets")
             return self._get_empty_datasets()
+        extractors = {
+            "adoption_trends": self._extract_adoption_trends,
+            "sector_adoption": self._extract_sector_adoption,
+            "geographic_adoption": self._extract_geographic_adoption,
+            "firm_size_adoption": self._extract_firm_size_adoption,
+            "ai_maturity": self._extract_ai_maturity,
+            "investment_trends": self._extract_investment_trends,
+        }
+        empty = self._get_empty_datasets()
         datasets = {}
         try:
-            datasets["adoption_trends"] = self._extract_adoption_trends() or pd.DataFrame()
-            datasets["sector_adoption"] = self._extract_sector_adoption() or pd.DataFrame()
-            datasets["geographic_adoption"] = self._extract_geographic_adoption() or pd.DataFrame()
-            datasets["firm_size_adoption"] = self._extract_firm_size_adoption() or pd.DataFrame()
-            datasets["ai_maturity"] = self._extract_ai_maturity() or pd.DataFrame()
-            datasets["investment_trends"] = self._extract_investment_trends() or pd.DataFrame()
+            for name, extract in extractors.items():
+                df = extract()
+                datasets[name] = df if df is not None else empty[name]
         except Exception as e:
             logger.error(f"Error during PDF extraction: {e}")
             return self._get_empty_datasets()
@@ -72,10 +170,7 @@ class AIIndexLoader(BaseDataLoader):
         logger.info("Extracting adoption trends data...")
         try:
             keywords = ["adoption rate", "deployment", "implementation", "year-over-year", "growth"]
-            adoption_pages = []
-            for keyword in keywords:
-                adoption_pages.extend(self.extractor.find_pages_with_keyword(keyword))
-            adoption_pages = sorted(set(adoption_pages))[:10]
+            adoption_pages = self.extractor.find_pages_with_keywords(keywords)[:10]
             if not adoption_pages:
                 logger.warning("No adoption trend pages found")
                 return None
@@ -113,26 +208,7 @@ class AIIndexLoader(BaseDataLoader):
         adoption_data = []
         for page in pages[:5]:
             text = self.extractor.extract_text_from_page(page)
-            patterns = [
-                r"(\d{4}):\s*(\d+(?:\.\d+)?)\s*%",
-                r"(\d+(?:\.\d+)?)\s*%\s*in\s*(\d{4})",
-                r"(\d{4})\s*\((\d+(?:\.\d+)?)\s*%\)",
-                r"(\d{4})\s*-\s*(\d+(?:\.\d+)?)\s*%",
-            ]
-            for pattern in patterns:
-                matches = re.findall(pattern, text)
-                for match in matches:
-                    try:
-                        if pattern.startswith(r"(\d+(?:\.\d+)?)\s*%"):
-                            percentage, year = match
-                        else:
-                            year, percentage = match
-                        year = int(year)
-                        percentage = float(percentage)
-                        if 2010 <= year <= 2030 and 0 <= percentage <= 100:
-                            adoption_data.append({"year": year, "adoption_rate": percentage})
-                    except ValueError:
-                        continue
+            adoption_data.extend(PERCENT_BY_YEAR.extract(text))
         seen = set()
         unique_data = []
         for item in sorted(adoption_data, key=lambda x: x["year"]):
@@ -143,52 +219,14 @@ class AIIndexLoader(BaseDataLoader):
         return unique_data
 
     def _clean_adoption_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        df.columns = [col.lower().strip() for col in df.columns]
-        year_col = None
-        for col in df.columns:
-            if "year" in col or bool(re.search(r"20\d{2}", str(df[col].iloc[0]))):
-                year_col = col
-                break
-        rate_col = None
-        for col in df.columns:
-            if any(keyword in col for keyword in ["adoption", "rate", "deployment", "%"]):
-                rate_col = col
-                break
-        if year_col and rate_col:
-            clean_df = pd.DataFrame(
-                {
-                    "year": pd.to_numeric(df[year_col], errors="coerce"),
-                    "overall_adoption": pd.to_numeric(
-                        df[rate_col].astype(str).str.replace("%", ""), errors="coerce"
-                    ),
-                }
-            )
-            clean_df = clean_df.dropna()
-            clean_df = clean_df[
-                (clean_df["year"] >= 2010)
-                & (clean_df["year"] <= 2030)
-                & (clean_df["overall_adoption"] >= 0)
-                & (clean_df["overall_adoption"] <= 100)
-            ]
-            clean_df = clean_df.sort_values("year").reset_index(drop=True)
-            if "genai" in str(df).lower() or "generative" in str(df).lower():
-                for col in df.columns:
-                    if "genai" in col.lower() or "generative" in col.lower():
-                        clean_df["genai_adoption"] = pd.to_numeric(
-                            df[col].astype(str).str.replace("%", ""), errors="coerce"
-                        )
-                        break
-            return clean_df
-        return df
+        clean_df = ADOPTION_SCHEMA.apply(df)
+        return df if clean_df is None else clean_df
 
     def _extract_sector_adoption(self) -> Optional[pd.DataFrame]:
         logger.info("Extracting sector adoption data...")
         try:
             keywords = ["industry", "sector", "vertical", "by industry", "industry adoption"]
-            sector_pages = []
-            for keyword in keywords:
-                sector_pages.extend(self.extractor.find_pages_with_keyword(keyword))
-            sector_pages = sorted(set(sector_pages))[:10]
+            sector_pages = self.extractor.find_pages_with_keywords(keywords)[:10]
             if not sector_pages:
                 return None
             sector_df = None
@@ -215,61 +253,14 @@ class AIIndexLoader(BaseDataLoader):
         return None
 
     def _clean_sector_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        sector_col = None
-        for col in df.columns:
-            sample_values = df[col].astype(str).str.lower()
-            if any(
-                "technology" in val or "financial" in val or "healthcare" in val
-                for val in sample_values
-            ):
-                sector_col = col
-                break
-        if not sector_col:
-            return df
-        rate_cols = []
-        for col in df.columns:
-            if col == sector_col:
-                continue
-            try:
-                numeric_vals = pd.to_numeric(
-                    df[col].astype(str).str.replace("%", "").str.replace(",", ""), errors="coerce"
-                )
-                if numeric_vals.notna().sum() > len(df) * 0.5:
-                    rate_cols.append(col)
-            except:
-                continue
-        if sector_col and rate_cols:
-            clean_df = pd.DataFrame(
-                {
-                    "sector": df[sector_col],
-                    "adoption_rate": pd.to_numeric(
-                        df[rate_cols[0]].astype(str).str.replace("%", "").str.replace(",", ""),
-                        errors="coerce",
-                    ),
-                }
-            )
-            if len(rate_cols) > 1:
-                clean_df["genai_adoption"] = pd.to_numeric(
-                    df[rate_cols[1]].astype(str).str.replace("%", "").str.replace(",", ""),
-                    errors="coerce",
-                )
-            clean_df["sector"] = clean_df["sector"].str.strip().str.title()
-            clean_df = clean_df.dropna(subset=["sector", "adoption_rate"])
-            clean_df = clean_df[
-                (clean_df["adoption_rate"] >= 0) & (clean_df["adoption_rate"] <= 100)
-            ]
-            clean_df["year"] = 2025
-            return clean_df.reset_index(drop=True)
-        return df
+        clean_df = SECTOR_SCHEMA.apply(df)
+        return df if clean_df is None else clean_df
 
     def _extract_geographic_adoption(self) -> Optional[pd.DataFrame]:
         logger.info("Extracting geographic adoption data...")
         try:
             keywords = ["geographic", "regional", "country", "state", "city", "location"]
-            geo_pages = []
-            for keyword in keywords:
-                geo_pages.extend(self.extractor.find_pages_with_keyword(keyword))
-            geo_pages = sorted(set(geo_pages))[:10]
+            geo_pages = self.extractor.find_pages_with_keywords(keywords)[:10]
             if not geo_pages:
                 return None
             for page in geo_pages:
@@ -290,48 +281,8 @@ class AIIndexLoader(BaseDataLoader):
             logger.error(f"Error extracting geographic adoption: {e}")
         return None
 
-    def _clean_geographic_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        location_col = None
-        for col in df.columns:
-            sample_values = df[col].astype(str).str.lower()
-            if any(
-                loc in " ".join(sample_values)
-                for loc in ["state", "country", "city", "united", "china"]
-            ):
-                location_col = col
-                break
-        if not location_col:
-            return None
-        rate_col = None
-        for col in df.columns:
-            if col == location_col:
-                continue
-            try:
-                numeric_vals = pd.to_numeric(
-                    df[col].astype(str).str.replace("%", "").str.replace(",", ""), errors="coerce"
-                )
-                if numeric_vals.notna().sum() > len(df) * 0.5:
-                    rate_col = col
-                    break
-            except:
-                continue
-        if location_col and rate_col:
-            clean_df = pd.DataFrame(
-                {
-                    "location": df[location_col].str.strip(),
-                    "adoption_rate": pd.to_numeric(
-                        df[rate_col].astype(str).str.replace("%", "").str.replace(",", ""),
-                        errors="coerce",
-                    ),
-                    "year": 2025,
-                }
-            )
-            clean_df = clean_df.dropna()
-            clean_df = clean_df[
-                (clean_df["adoption_rate"] >= 0) & (clean_df["adoption_rate"] <= 100)
-            ]
-            return clean_df.reset_index(drop=True)
-        return None
+    def _clean_geographic_dataframe(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        return GEOGRAPHIC_SCHEMA.apply(df)
 
     def _extract_firm_size_adoption(self) -> Optional[pd.DataFrame]:
         logger.info("Extracting firm size adoption data...")
@@ -339,10 +290,7 @@ class AIIndexLoader(BaseDataLoader):
             keywords = [
                 "firm size", "company size", "employee", "small business", "enterprise", "SMB"
             ]
-            size_pages = []
-            for keyword in keywords:
-                size_pages.extend(self.extractor.find_pages_with_keyword(keyword))
-            size_pages = sorted(set(size_pages))[:10]
+            size_pages = self.extractor.find_pages_with_keywords(keywords)[:10]
             if not size_pages:
                 return None
             for page in size_pages:
@@ -363,50 +311,8 @@ class AIIndexLoader(BaseDataLoader):
             logger.error(f"Error extracting firm size adoption: {e}")
         return None
 
-    def _clean_firm_size_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        size_col = None
-        for col in df.columns:
-            col_values = df[col].astype(str)
-            if any(
-                val
-                for val in col_values
-                if any(
-                    size in val for size in ["<", ">", "-", "employee", "small", "medium", "large"]
-                )
-            ):
-                size_col = col
-                break
-        if not size_col:
-            return None
-        rate_col = None
-        for col in df.columns:
-            if col == size_col:
-                continue
-            try:
-                numeric_vals = pd.to_numeric(
-                    df[col].astype(str).str.replace("%", "").str.replace(",", ""), errors="coerce"
-                )
-                if numeric_vals.notna().sum() > len(df) * 0.5:
-                    rate_col = col
-                    break
-            except:
-                continue
-        if size_col and rate_col:
-            clean_df = pd.DataFrame(
-                {
-                    "firm_size": df[size_col].str.strip(),
-                    "adoption_rate": pd.to_numeric(
-                        df[rate_col].astype(str).str.replace("%", "").str.replace(",", ""),
-                        errors="coerce",
-                    ),
-                }
-            )
-            clean_df = clean_df.dropna()
-            clean_df = clean_df[
-                (clean_df["adoption_rate"] >= 0) & (clean_df["adoption_rate"] <= 100)
-            ]
-            return clean_df.reset_index(drop=True)
-        return None
+    def _clean_firm_size_dataframe(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        return FIRM_SIZE_SCHEMA.apply(df)
 
     def _extract_ai_maturity(self) -> Optional[pd.DataFrame]:
         logger.info("Extracting AI maturity data...")
@@ -414,10 +320,7 @@ class AIIndexLoader(BaseDataLoader):
             keywords = [
                 "maturity", "stage", "phase", "journey", "adoption stage", "implementation phase"
             ]
-            maturity_pages = []
-            for keyword in keywords:
-                maturity_pages.extend(self.extractor.find_pages_with_keyword(keyword))
-            maturity_pages = sorted(set(maturity_pages))[:10]
+            maturity_pages = self.extractor.find_pages_with_keywords(keywords)[:10]
             if not maturity_pages:
                 return None
             for page in maturity_pages:
@@ -438,59 +341,14 @@ class AIIndexLoader(BaseDataLoader):
             logger.error(f"Error extracting AI maturity: {e}")
         return None
 
-    def _clean_maturity_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        maturity_col = None
-        for col in df.columns:
-            col_values = df[col].astype(str).str.lower()
-            if any(
-                val
-                for val in col_values
-                if any(
-                    stage in val for stage in ["explor", "experiment", "pilot", "scal", "transform"]
-                )
-            ):
-                maturity_col = col
-                break
-        if not maturity_col:
-            return None
-        pct_col = None
-        for col in df.columns:
-            if col == maturity_col:
-                continue
-            try:
-                numeric_vals = pd.to_numeric(
-                    df[col].astype(str).str.replace("%", "").str.replace(",", ""), errors="coerce"
-                )
-                if numeric_vals.notna().sum() > len(df) * 0.5:
-                    pct_col = col
-                    break
-            except:
-                continue
-        if maturity_col and pct_col:
-            clean_df = pd.DataFrame(
-                {
-                    "maturity_level": df[maturity_col].str.strip().str.title(),
-                    "percentage_of_firms": pd.to_numeric(
-                        df[pct_col].astype(str).str.replace("%", "").str.replace(",", ""),
-                        errors="coerce",
-                    ),
-                }
-            )
-            clean_df = clean_df.dropna()
-            clean_df = clean_df[
-                (clean_df["percentage_of_firms"] >= 0) & (clean_df["percentage_of_firms"] <= 100)
-            ]
-            return clean_df.reset_index(drop=True)
-        return None
+    def _clean_maturity_dataframe(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        return MATURITY_SCHEMA.apply(df)
 
     def _extract_investment_trends(self) -> Optional[pd.DataFrame]:
         logger.info("Extracting investment trends data...")
         try:
             keywords = ["investment", "funding", "venture capital", "billion", "million", "capital"]
-            investment_pages = []
-            for keyword in keywords:
-                investment_pages.extend(self.extractor.find_pages_with_keyword(keyword))
-            investment_pages = sorted(set(investment_pages))[:10]
+            investment_pages = self.extractor.find_pages_with_keywords(keywords)[:10]
             if not investment_pages:
                 return None
             investment_data = []
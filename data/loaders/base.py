@@ -1,13 +1,21 @@
 """Base data loader interface for all data sources."""
 
+import weakref
 from abc import ABC, abstractmethod
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
 
 import pandas as pd
 from pydantic import BaseModel, Field
 
+from config.settings import settings
+from performance.telemetry import register_cache_layer
+
+from ..extractors.patterns import compile_pattern
+from ..models.schemas import DatasetSchema
+
 
 class DataSource(BaseModel):
     """Metadata for a data source."""
@@ -20,13 +28,68 @@ class DataSource(BaseModel):
     citation: str = Field(..., description="Proper citation for the source")
 
 
+class LoadRunMemo:
+    """Intermediate extraction results shared by the methods of one load run.
+
+    Loaders run many ``_extract_*`` methods over the same documents, and
+    those methods ask for the same keyword page sets, page texts, tables and
+    regex matches. Each result is computed once per run and served from
+    here afterwards, so a load costs in proportion to the unique pages it
+    touches. Entries are grouped by kind for statistics.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Any] = {}
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, kind: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Get a memoized result, computing it on first use.
+
+        Args:
+            kind: Result kind, e.g. "keyword_pages" or "page_text"
+            key: Key identifying the result within its kind
+            compute: Produces the result on a miss
+        """
+        entry_key = (kind, key)
+        if entry_key in self._entries:
+            self.hits[kind] += 1
+            return self._entries[entry_key]
+        self.misses[kind] += 1
+        value = self._entries[entry_key] = compute()
+        return value
+
+    def clear(self) -> None:
+        """Drop every memoized result; hit and miss counts are kept."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Get hits and misses per result kind."""
+        return {
+            kind: {"hits": self.hits[kind], "misses": self.misses[kind]}
+            for kind in sorted(set(self.hits) | set(self.misses))
+        }
+
+
 class BaseDataLoader(ABC):
     """Abstract base class for all data loaders."""
 
+    # Live loaders, for process-wide memo statistics
+    _instances: "weakref.WeakSet[BaseDataLoader]" = weakref.WeakSet()
+
+    # Declared dtypes and checks per dataset name; datasets without an entry
+    # still get the default compaction (see data/models/schemas.py)
+    schemas: Dict[str, DatasetSchema] = {}
+
     def __init__(self, source: DataSource):
         """Initialize loader with data source metadata."""
         self.source = source
         self._cache: Dict[str, pd.DataFrame] = {}
+        self.memo = LoadRunMemo()
+        BaseDataLoader._instances.add(self)
 
     @abstractmethod
     def load(self) -> Dict[str, pd.DataFrame]:
@@ -49,6 +112,126 @@ class BaseDataLoader(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """Release the documents opened while loading.
+
+        Loaders that extract from PDFs keep one open document per extractor
+        for the whole load run; closing it frees the file handle and the
+        parsed page cache.
+        """
+        extractors = [getattr(self, "extractor", None)]
+        # Multi-document loaders keep extractors or (extractor, name) pairs
+        for entry in getattr(self, "extractors", []):
+            extractors.append(entry[0] if isinstance(entry, tuple) else entry)
+        for extractor in extractors:
+            if extractor is not None and hasattr(extractor, "close"):
+                extractor.close()
+        self.memo.clear()
+
+    def load_and_close(self) -> Dict[str, pd.DataFrame]:
+        """Run a complete load, then release the opened documents.
+
+        Intermediate results are memoized for the duration of the run only
+        (see ``LoadRunMemo``), and the datasets are typed by their schemas
+        (see ``apply_schemas``).
+
+        Returns:
+            Dictionary mapping dataset names to DataFrames
+        """
+        self.memo.clear()
+        try:
+            datasets = self.load()
+        finally:
+            self.close()
+        return self.apply_schemas(datasets)
+
+    def apply_schemas(self, datasets: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """Validate datasets in bulk and store them with compact dtypes.
+
+        Disabled by ``settings.ENFORCE_DATASET_SCHEMAS``.
+        """
+        if not settings.ENFORCE_DATASET_SCHEMAS:
+            return datasets
+        typed = {}
+        for name, df in datasets.items():
+            if isinstance(df, pd.DataFrame):
+                schema = self.schemas.get(name) or DatasetSchema(name)
+                df = schema.apply(df, float_dtype=settings.DATASET_FLOAT_DTYPE)
+            typed[name] = df
+        return typed
+
+    def _memo_key(self, extractor: Any) -> str:
+        return str(extractor.file_path)
+
+    def pages_with_keywords(self, keywords: Sequence[str], extractor: Any = None) -> List[int]:
+        """Find pages containing any of the keywords, once per keyword set and run.
+
+        Args:
+            keywords: Keywords to search for (case-insensitive)
+            extractor: PDF extractor to search, defaults to ``self.extractor``
+
+        Returns:
+            Sorted page numbers (0-indexed); a copy the caller may modify
+        """
+        extractor = extractor or self.extractor
+        key = (self._memo_key(extractor), frozenset(keyword.lower() for keyword in keywords))
+        pages = self.memo.get_or_compute(
+            "keyword_pages", key, lambda: extractor.find_pages_with_keywords(list(keywords))
+        )
+        return list(pages)
+
+    def page_text(self, page: int, extractor: Any = None) -> str:
+        """Get the text of a page (0-indexed), once per run."""
+        extractor = extractor or self.extractor
+        return self.memo.get_or_compute(
+            "page_text",
+            (self._memo_key(extractor), page),
+            lambda: extractor.extract_text_from_page(page),
+        )
+
+    def page_tables(self, page: int, extractor: Any = None) -> List[pd.DataFrame]:
+        """Get the tables on a page (0-indexed), once per run."""
+        extractor = extractor or self.extractor
+        return self.memo.get_or_compute(
+            "page_tables",
+            (self._memo_key(extractor), page),
+            lambda: extractor.extract_tables(page_range=(page, page)),
+        )
+
+    def findall(self, pattern: str, text: str, flags: int = 0) -> List[Any]:
+        """Run ``re.findall`` once per pattern, flags and text within a run."""
+        return self.memo.get_or_compute(
+            "pattern_matches",
+            (pattern, flags, text),
+            lambda: compile_pattern(pattern, flags).findall(text),
+        )
+
+    @classmethod
+    def get_memo_stats(cls) -> Dict[str, Any]:
+        """Get load-run memo statistics across all live loaders."""
+        memos = [loader.memo for loader in list(BaseDataLoader._instances)]
+        hits = sum(sum(memo.hits.values()) for memo in memos)
+        misses = sum(sum(memo.misses.values()) for memo in memos)
+        by_kind: Dict[str, Dict[str, int]] = {}
+        for memo in memos:
+            for kind, counts in memo.stats().items():
+                totals = by_kind.setdefault(kind, {"hits": 0, "misses": 0})
+                totals["hits"] += counts["hits"]
+                totals["misses"] += counts["misses"]
+        return {
+            "hits": hits,
+            "misses": misses,
+            "size": sum(len(memo) for memo in memos),
+            "kinds": by_kind,
+            "loaders": len(memos),
+        }
+
+    @classmethod
+    def clear_all_memos(cls) -> None:
+        """Clear the memo of every live loader."""
+        for loader in list(BaseDataLoader._instances):
+            loader.memo.clear()
+
     def get_dataset(self, name: str) -> Optional[pd.DataFrame]:
         """Get a specific dataset by name.
 
@@ -59,7 +242,7 @@ class BaseDataLoader(ABC):
             DataFrame if found, None otherwise
         """
         if not self._cache:
-            self._cache = self.load()
+            self._cache = self.load_and_close()
         return self._cache.get(name)
 
     def list_datasets(self) -> List[str]:
@@ -69,9 +252,19 @@ class BaseDataLoader(ABC):
             List of dataset names
         """
         if not self._cache:
-            self._cache = self.load()
+            self._cache = self.load_and_close()
         return list(self._cache.keys())
 
+    def source_files(self) -> List[Path]:
+        """List the local files this loader extracts data from.
+
+        Returns:
+            List of file paths (may include files that do not exist)
+        """
+        if self.source.file_path and not self.source.file_path.is_dir():
+            return [self.source.file_path]
+        return []
+
     def get_metadata(self) -> Dict[str, Any]:
         """Get metadata about the data source.
 
@@ -79,3 +272,7 @@ class BaseDataLoader(ABC):
             Dictionary with source metadata
         """
         return self.source.model_dump()
+
+
+# Report load-run memo reuse in the performance telemetry
+register_cache_layer("loader_memo", BaseDataLoader.get_memo_stats, BaseDataLoader.clear_all_memos)
@@ -7,6 +7,7 @@ from typing import Dict, List, Optional
 
 import pandas as pd
 
+from ..extractors.entity_scanner import get_scanner
 from ..extractors.pdf_extractor import PDFExtractor
 from ..models.economics import EconomicImpact
 from ..models.workforce import ProductivityMetrics
@@ -84,12 +85,7 @@ class RichmondFedLoader(BaseDataLoader):
             # Keywords for productivity sections
             keywords = ["productivity", "growth", "paradox", "slowdown", "puzzle", "output"]
 
-            productivity_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                productivity_pages.extend(pages)
-
-            productivity_pages = sorted(set(productivity_pages))[:10]
+            productivity_pages = self.pages_with_keywords(keywords)[:10]
 
             if not productivity_pages:
                 return None
@@ -98,7 +94,7 @@ class RichmondFedLoader(BaseDataLoader):
 
             # Extract productivity metrics
             for page in productivity_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
                 # Patterns for productivity data
                 patterns = [
@@ -109,7 +105,7 @@ class RichmondFedLoader(BaseDataLoader):
                 ]
 
                 for pattern in patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
+                    matches = self.findall(pattern, text, re.IGNORECASE)
                     for match in matches:
                         value = float(match[0] if isinstance(match, str) else match[0])
 
@@ -127,7 +123,7 @@ class RichmondFedLoader(BaseDataLoader):
 
             # Look for productivity tables
             for page in productivity_pages[:5]:
-                tables = self.extractor.extract_tables(page_range=(page, page))
+                tables = self.page_tables(page)
                 for table in tables:
                     if table.empty:
                         continue
@@ -161,7 +157,7 @@ class RichmondFedLoader(BaseDataLoader):
         ]
 
         for year_pattern in year_patterns:
-            matches = re.findall(year_pattern, text[:200])  # Check nearby text
+            matches = self.findall(year_pattern, text[:200])  # Check nearby text
             if matches:
                 if isinstance(matches[0], tuple):
                     return f"{matches[0][0]}-{matches[0][1]}"
@@ -250,12 +246,7 @@ class RichmondFedLoader(BaseDataLoader):
                 "automation",
             ]
 
-            tech_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                tech_pages.extend(pages)
-
-            tech_pages = sorted(set(tech_pages))[:10]
+            tech_pages = self.pages_with_keywords(keywords)[:10]
 
             if not tech_pages:
                 return None
@@ -275,9 +266,13 @@ class RichmondFedLoader(BaseDataLoader):
             ]
 
             for page in tech_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(tuple(technologies)).found_set(text)
                 for tech in technologies:
+                    if tech not in mentioned:
+                        continue
+
                     # Patterns for adoption rates
                     patterns = [
                         rf"{tech}.*?adoption.*?(\d+(?:\.\d+)?)\s*%",
@@ -286,7 +281,7 @@ class RichmondFedLoader(BaseDataLoader):
                     ]
 
                     for pattern in patterns:
-                        matches = re.findall(pattern, text, re.IGNORECASE)
+                        matches = self.findall(pattern, text, re.IGNORECASE)
                         if matches:
                             try:
                                 rate = float(matches[0])
@@ -319,7 +314,7 @@ class RichmondFedLoader(BaseDataLoader):
     def _extract_year_from_context(self, text: str) -> int:
         """Extract year from text context."""
         # Look for recent years
-        year_matches = re.findall(r"20[1-2]\\d", text)
+        year_matches = self.findall(r"20[1-2]\\d", text)
         if year_matches:
             # Return most recent year found
             return max(int(year) for year in year_matches)
@@ -352,12 +347,7 @@ class RichmondFedLoader(BaseDataLoader):
                 "occupations",
             ]
 
-            workforce_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                workforce_pages.extend(pages)
-
-            workforce_pages = sorted(set(workforce_pages))[:10]
+            workforce_pages = self.pages_with_keywords(keywords)[:10]
 
             if not workforce_pages:
                 return None
@@ -366,7 +356,7 @@ class RichmondFedLoader(BaseDataLoader):
 
             # Extract workforce metrics
             for page in workforce_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
                 # Patterns for workforce impact
                 patterns = [
@@ -377,7 +367,7 @@ class RichmondFedLoader(BaseDataLoader):
                 ]
 
                 for pattern in patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
+                    matches = self.findall(pattern, text, re.IGNORECASE)
                     for match in matches:
                         value = float(match[0] if isinstance(match, str) else match[0])
 
@@ -443,12 +433,7 @@ class RichmondFedLoader(BaseDataLoader):
             # Keywords for skills sections
             keywords = ["skills", "training", "education", "competencies", "capabilities", "talent"]
 
-            skill_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                skill_pages.extend(pages)
-
-            skill_pages = sorted(set(skill_pages))[:10]
+            skill_pages = self.pages_with_keywords(keywords)[:10]
 
             if not skill_pages:
                 return None
@@ -471,9 +456,13 @@ class RichmondFedLoader(BaseDataLoader):
             ]
 
             for page in skill_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(tuple(skill_categories)).found_set(text)
                 for skill in skill_categories:
+                    if skill not in mentioned:
+                        continue
+
                     # Look for skill mentions with percentages or importance
                     patterns = [
                         rf"{skill}.*?(\d+(?:\.\d+)?)\s*%\s*(?:of\s+)?(?:workers|employees|firms)\s*(?:need|require|lack)",
@@ -482,7 +471,7 @@ class RichmondFedLoader(BaseDataLoader):
                     ]
 
                     for pattern in patterns:
-                        matches = re.findall(pattern, text, re.IGNORECASE)
+                        matches = self.findall(pattern, text, re.IGNORECASE)
                         if matches:
                             try:
                                 value = float(matches[0])
@@ -544,12 +533,7 @@ class RichmondFedLoader(BaseDataLoader):
             # Keywords for regional data
             keywords = ["regional", "geographic", "state", "metropolitan", "urban", "rural"]
 
-            regional_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                regional_pages.extend(pages)
-
-            regional_pages = sorted(set(regional_pages))[:10]
+            regional_pages = self.pages_with_keywords(keywords)[:10]
 
             if not regional_pages:
                 return None
@@ -571,7 +555,7 @@ class RichmondFedLoader(BaseDataLoader):
             ]
 
             for page in regional_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
                 # Extract numeric data by region
                 numeric_data = self.extractor.extract_numeric_data(
@@ -633,12 +617,7 @@ class RichmondFedLoader(BaseDataLoader):
                 "support",
             ]
 
-            policy_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                policy_pages.extend(pages)
-
-            policy_pages = sorted(set(policy_pages))[:10]
+            policy_pages = self.pages_with_keywords(keywords)[:10]
 
             if not policy_pages:
                 return None
@@ -658,10 +637,11 @@ class RichmondFedLoader(BaseDataLoader):
             ]
 
             for page in policy_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(tuple(policy_areas)).found_set(text)
                 for policy in policy_areas:
-                    if policy.lower() in text.lower():
+                    if policy in mentioned:
                         # Extract any associated metrics
                         patterns = [
                             r"(\d+(?:\.\d+)?)\s*%\s*(?:increase|improvement|reduction)",
@@ -673,7 +653,7 @@ class RichmondFedLoader(BaseDataLoader):
                         impact_unit = None
 
                         for pattern in patterns:
-                            matches = re.findall(
+                            matches = self.findall(
                                 pattern,
                                 text[
                                     max(
@@ -788,7 +768,7 @@ class StLouisFedLoader(BaseDataLoader):
             citation="Federal Reserve Bank of St. Louis. 'Rapid Adoption of Generative AI' and 'Impact of Generative AI on Work Productivity.r' On the Economy Blog, 2024-2025.",
         )
         super().__init__(source)
-        self.file_paths = file_paths
+        self.file_paths = file_paths or []
         self.extractors = []
         for file_path in self.file_paths:
             if file_path and file_path.exists():
@@ -801,6 +781,10 @@ class StLouisFedLoader(BaseDataLoader):
             else:
                 logger.warning(f"PDF file not found: {file_path}")
 
+    def source_files(self) -> List[Path]:
+        """List all St. Louis Fed report files."""
+        return [path for path in self.file_paths or [] if path]
+
     def load(self) -> Dict[str, pd.DataFrame]:
         logger.info(f"Loading data from {self.source.name}")
         if not self.extractors:
@@ -854,19 +838,14 @@ class StLouisFedLoader(BaseDataLoader):
                     "deployment",
                 ]
 
-                adoption_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    adoption_pages.extend(pages)
-
-                adoption_pages = sorted(set(adoption_pages))[:10]
+                adoption_pages = self.pages_with_keywords(keywords, extractor)[:10]
 
                 if not adoption_pages:
                     continue
 
                 # Extract adoption metrics
                 for page in adoption_pages[:5]:
-                    text = extractor.extract_text_from_page(page)
+                    text = self.page_text(page, extractor)
 
                     # Patterns for adoption data
                     patterns = [
@@ -877,7 +856,7 @@ class StLouisFedLoader(BaseDataLoader):
                     ]
 
                     for pattern in patterns:
-                        matches = re.findall(pattern, text, re.IGNORECASE)
+                        matches = self.findall(pattern, text, re.IGNORECASE)
                         for match in matches:
                             value = float(match[0] if isinstance(match, str) else match[0])
 
@@ -937,19 +916,14 @@ class StLouisFedLoader(BaseDataLoader):
                 # Keywords for productivity sections
                 keywords = ["productivity", "efficiency", "output", "performance", "time savings"]
 
-                productivity_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    productivity_pages.extend(pages)
-
-                productivity_pages = sorted(set(productivity_pages))[:10]
+                productivity_pages = self.pages_with_keywords(keywords, extractor)[:10]
 
                 if not productivity_pages:
                     continue
 
                 # Extract productivity metrics
                 for page in productivity_pages[:5]:
-                    text = extractor.extract_text_from_page(page)
+                    text = self.page_text(page, extractor)
 
                     # Extract numeric productivity data
                     numeric_data = extractor.extract_numeric_data(
@@ -1024,19 +998,14 @@ class StLouisFedLoader(BaseDataLoader):
                 # Keywords for task automation
                 keywords = ["task", "automate", "automation", "activities", "work activities"]
 
-                task_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    task_pages.extend(pages)
-
-                task_pages = sorted(set(task_pages))[:10]
+                task_pages = self.pages_with_keywords(keywords, extractor)[:10]
 
                 if not task_pages:
                     continue
 
                 # Extract task automation data
                 for page in task_pages[:5]:
-                    text = extractor.extract_text_from_page(page)
+                    text = self.page_text(page, extractor)
 
                     # Patterns for task automation
                     patterns = [
@@ -1046,7 +1015,7 @@ class StLouisFedLoader(BaseDataLoader):
                     ]
 
                     for pattern in patterns:
-                        matches = re.findall(pattern, text, re.IGNORECASE)
+                        matches = self.findall(pattern, text, re.IGNORECASE)
                         for match in matches:
                             value = float(match[0] if isinstance(match, str) else match[0])
 
@@ -1130,12 +1099,7 @@ class StLouisFedLoader(BaseDataLoader):
                 # Keywords for worker categories
                 keywords = ["worker", "employee", "skill level", "occupation", "job category"]
 
-                worker_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    worker_pages.extend(pages)
-
-                worker_pages = sorted(set(worker_pages))[:10]
+                worker_pages = self.pages_with_keywords(keywords, extractor)[:10]
 
                 if not worker_pages:
                     continue
@@ -1154,9 +1118,13 @@ class StLouisFedLoader(BaseDataLoader):
                 ]
 
                 for page in worker_pages[:5]:
-                    text = extractor.extract_text_from_page(page)
+                    text = self.page_text(page, extractor)
 
+                    mentioned = get_scanner(tuple(categories)).found_set(text)
                     for category in categories:
+                        if category not in mentioned:
+                            continue
+
                         # Look for impact metrics for each category
                         patterns = [
                             rf"{category}.*?(\d+(?:\.\d+)?)\s*%\s*(?:productivity|efficiency|impact)",
@@ -1165,7 +1133,7 @@ class StLouisFedLoader(BaseDataLoader):
                         ]
 
                         for pattern in patterns:
-                            matches = re.findall(pattern, text, re.IGNORECASE)
+                            matches = self.findall(pattern, text, re.IGNORECASE)
                             if matches:
                                 try:
                                     impact_value = float(matches[0])
@@ -1242,12 +1210,7 @@ class StLouisFedLoader(BaseDataLoader):
                 # Keywords for timeline/phases
                 keywords = ["timeline", "phase", "stage", "implementation", "roadmap", "milestone"]
 
-                timeline_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    timeline_pages.extend(pages)
-
-                timeline_pages = sorted(set(timeline_pages))[:10]
+                timeline_pages = self.pages_with_keywords(keywords, extractor)[:10]
 
                 if not timeline_pages:
                     continue
@@ -1256,10 +1219,11 @@ class StLouisFedLoader(BaseDataLoader):
                 phases = ["Pilot", "Early Adoption", "Scaling", "Full Deployment", "Optimization"]
 
                 for page in timeline_pages[:5]:
-                    text = extractor.extract_text_from_page(page)
+                    text = self.page_text(page, extractor)
 
+                    mentioned = get_scanner(tuple(phases)).found_set(text)
                     for phase in phases:
-                        if phase.lower() in text.lower():
+                        if phase in mentioned:
                             # Extract timing and metrics
                             patterns = [
                                 rf"{phase}.*?(\d+(?:\.\d+)?)\s*(?:months|quarters|years)",
@@ -1271,7 +1235,7 @@ class StLouisFedLoader(BaseDataLoader):
                             target_date = None
 
                             for pattern in patterns:
-                                matches = re.findall(pattern, text, re.IGNORECASE)
+                                matches = self.findall(pattern, text, re.IGNORECASE)
                                 if matches:
                                     if (
                                         "months" in pattern
@@ -1341,19 +1305,14 @@ class StLouisFedLoader(BaseDataLoader):
                 # Keywords for economic implications
                 keywords = ["economic", "GDP", "growth", "impact", "trillion", "billion"]
 
-                economic_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    economic_pages.extend(pages)
-
-                economic_pages = sorted(set(economic_pages))[:10]
+                economic_pages = self.pages_with_keywords(keywords, extractor)[:10]
 
                 if not economic_pages:
                     continue
 
                 # Extract economic metrics
                 for page in economic_pages[:5]:
-                    text = extractor.extract_text_from_page(page)
+                    text = self.page_text(page, extractor)
 
                     # Patterns for economic data
                     patterns = [
@@ -1364,7 +1323,7 @@ class StLouisFedLoader(BaseDataLoader):
                     ]
 
                     for pattern in patterns:
-                        matches = re.findall(pattern, text, re.IGNORECASE)
+                        matches = self.findall(pattern, text, re.IGNORECASE)
                         for match in matches:
                             economic_data.append(self._parse_economic_match(match, pattern))
 
@@ -7,17 +7,89 @@ from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from ..extractors.entity_scanner import get_scanner
+from ..extractors.patterns import NUMBER, PERCENT, NumericPattern, PatternSet, scale_factor
 from ..extractors.pdf_extractor import PDFExtractor
+from ..extractors.table_normalization import (
+    find_label_column,
+    is_percent,
+    map_unique,
+    melt_values,
+    normalize_table,
+    to_numeric,
+    value_columns,
+)
 from ..models.economics import EconomicImpact
-from ..models.workforce import ProductivityMetrics
+from ..models.schemas import ColumnRule, DatasetSchema
+from ..models.workforce import ProductivityMetrics, WorkforceImpact
 from .base import BaseDataLoader, DataSource
 
 logger = logging.getLogger(__name__)
 
+DATASET_SCHEMAS = {
+    "gdp_impact": DatasetSchema("gdp_impact", model=EconomicImpact),
+    "productivity_gains": DatasetSchema(
+        "productivity_gains", rules={"productivity_gain": ColumnRule("float", low=-100, high=500)}
+    ),
+    "automation_exposure": DatasetSchema(
+        "automation_exposure",
+        model=WorkforceImpact,
+        fields={"occupation": "job_category", "automation_exposure": "automation_risk_percent"},
+        rules={"risk_level": ColumnRule("str", choices=("Low", "Medium", "High"))},
+    ),
+}
+
+
+def _gdp_growth(groups: Tuple[str, ...]) -> Dict:
+    return {
+        "metric": "GDP growth rate",
+        "value": float(groups[0]),
+        "unit": "percentage",
+        "region": "Global",
+    }
+
+
+# GDP impact figures, e.g. "7% increase in GDP", "$7 trillion in GDP impact"
+GDP_PATTERNS = PatternSet(
+    "goldman_sachs.gdp",
+    [
+        NumericPattern(
+            "percent_gdp_increase",
+            PERCENT + r"\s*(?:increase|boost|growth|rise)\s*in\s*(?:global\s+)?GDP",
+            _gdp_growth,
+        ),
+        NumericPattern(
+            "gdp_increase_by",
+            r"GDP\s*(?:could|may|will)?\s*(?:increase|grow|rise)\s*(?:by\s+)?" + PERCENT,
+            _gdp_growth,
+        ),
+        NumericPattern(
+            "currency_gdp_impact",
+            r"\$"
+            + NUMBER
+            + r"\s*(trillion|billion)\s*(?:in\s+)?(?:GDP|economic)\s*(?:impact|growth)",
+            lambda g: {
+                "metric": "GDP impact (trillions USD)",
+                "value": float(g[0]) * scale_factor(g[1], base="trillion"),
+                "unit": "trillions_usd",
+                "region": "Global",
+            },
+        ),
+        NumericPattern(
+            "add_percent_to_gdp",
+            r"add\s*" + PERCENT + r"\s*to\s*(?:global\s+)?(?:GDP|output)",
+            _gdp_growth,
+        ),
+        NumericPattern("percent_of_gdp", PERCENT + r"\s*of\s*(?:global\s+)?GDP", _gdp_growth),
+    ],
+)
+
 
 class GoldmanSachsLoader(BaseDataLoader):
     """Loader for Goldman Sachs AI economic impact report with real PDF extraction."""
 
+    schemas = DATASET_SCHEMAS
+
     def __init__(self, file_path: Optional[Path] = None):
         """Initialize with Goldman Sachs report file path."""
         if file_path is None:
@@ -115,12 +187,7 @@ class GoldmanSachsLoader(BaseDataLoader):
             keywords = ["GDP", "growth", "economic impact", "7%", "trillion", "global output"]
 
             # Find relevant pages
-            gdp_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                gdp_pages.extend(pages)
-
-            gdp_pages = sorted(set(gdp_pages))[:10]
+            gdp_pages = self.pages_with_keywords(keywords)[:10]
 
             if not gdp_pages:
                 return None
@@ -129,26 +196,15 @@ class GoldmanSachsLoader(BaseDataLoader):
 
             # Extract GDP impact data
             for page in gdp_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
-
-                # Patterns for GDP impact
-                # Examples: "7% increase in GDP", "$7 trillion", "boost GDP by 7%"
-                patterns = [
-                    r"(\d+(?:\.\d+)?)\s*%\s*(?:increase|boost|growth|rise)\s*in\s*(?:global\s+)?GDP",
-                    r"GDP\s*(?:could|may|will)?\s*(?:increase|grow|rise)\s*(?:by\s+)?(\d+(?:\.\d+)?)\s*%",
-                    r"\$(\d+(?:\.\d+)?)\s*(trillion|billion)\s*(?:in\s+)?(?:GDP|economic)\s*(?:impact|growth)",
-                    r"add\s*(\d+(?:\.\d+)?)\s*%\s*to\s*(?:global\s+)?(?:GDP|output)",
-                    r"(\d+(?:\.\d+)?)\s*%\s*of\s*(?:global\s+)?GDP",
-                ]
-
-                for pattern in patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
-                    for match in matches:
-                        gdp_data.append(self._parse_gdp_match(match, pattern))
+                text = self.page_text(page)
+                for match in GDP_PATTERNS.finditer(text):
+                    if match.data is not None:
+                        match.data["timeframe"] = self._extract_timeframe_context(match.text)
+                        gdp_data.append(match.data)
 
             # Extract from tables
             for page in gdp_pages[:5]:
-                tables = self.extractor.extract_tables(page_range=(page, page))
+                tables = self.page_tables(page)
                 for table in tables:
                     if table.empty:
                         continue
@@ -175,39 +231,6 @@ class GoldmanSachsLoader(BaseDataLoader):
 
         return None
 
-    def _parse_gdp_match(self, match: tuple, pattern: str) -> Dict:
-        """Parse regex match for GDP data."""
-        result = {"metric": "", "value": 0, "unit": "", "region": "Global"}
-
-        try:
-            if "trillion" in pattern or "billion" in pattern:
-                # Dollar amount pattern
-                if len(match) >= 2:
-                    value = float(match[0])
-                    unit = match[1].lower()
-
-                    # Convert to consistent units (trillions)
-                    if unit == "billion":
-                        value = value / 1000
-
-                    result["metric"] = "GDP impact (trillions USD)"
-                    result["value"] = value
-                    result["unit"] = "trillions_usd"
-            else:
-                # Percentage pattern
-                result["metric"] = "GDP growth rate"
-                result["value"] = float(match[0] if isinstance(match, str) else match[0])
-                result["unit"] = "percentage"
-
-            # Try to extract region from context
-            # This would need more sophisticated context analysis
-            result["timeframe"] = self._extract_timeframe_context(pattern)
-
-        except (ValueError, IndexError):
-            pass
-
-        return result
-
     def _extract_timeframe_context(self, text: str) -> str:
         """Extract timeframe from context."""
         # Simple heuristic - would need improvement
@@ -222,58 +245,32 @@ class GoldmanSachsLoader(BaseDataLoader):
 
     def _process_gdp_table(self, table: pd.DataFrame) -> List[Dict]:
         """Process table containing GDP data."""
-        results = []
-
-        # Look for region/country column
-        region_col = None
-        for col in table.columns:
-            sample_vals = table[col].astype(str).str.lower()
-            if any(
-                val
-                for val in sample_vals
-                if any(region in val for region in ["us", "china", "europe", "global", "world"])
-            ):
-                region_col = col
-                break
-
-        # Find value columns
-        value_cols = []
-        for col in table.columns:
-            if col == region_col:
-                continue
-
-            # Check for numeric values
-            col_vals = table[col].astype(str)
-            if (
-                col_vals.str.contains("%").sum() > 0
-                or col_vals.str.match(r"^\d+(?:\.\d+)?$").sum() > len(table) * 0.3
-            ):
-                value_cols.append(col)
-
-        # Extract data
-        for _, row in table.iterrows():
-            region = str(row[region_col]) if region_col else "Global"
-
-            for val_col in value_cols:
-                try:
-                    value_str = str(row[val_col])
-
-                    if "%" in value_str:
-                        value = float(value_str.replace("%", "").strip())
-                        metric = f"GDP growth - {val_col}"
-                        unit = "percentage"
-                    else:
-                        value = float(value_str.replace(",", "").strip())
-                        metric = f"GDP impact - {val_col}"
-                        unit = "absolute"
-
-                    results.append(
-                        {"metric": metric, "value": value, "unit": unit, "region": region}
-                    )
-                except ValueError:
-                    continue
+        table = normalize_table(table)
+        region_col = find_label_column(table, ["us", "china", "europe", "global", "world"])
+        if region_col is None:
+            region_col = "__region__"
+            table = table.assign(**{region_col: "Global"})
+
+        # Columns with any percentage, or mostly plain numbers
+        value_cols = [
+            col
+            for col in table.columns
+            if col != region_col
+            and (
+                is_percent(table[col]).any()
+                or to_numeric(table[col]).notna().sum() > len(table) * 0.3
+            )
+        ]
+        values = melt_values(table, region_col, value_cols, label_name="region")
+        if values.empty:
+            return []
 
-        return results
+        growth = values["is_percent"]
+        values["metric"] = ("GDP growth - " + values["column"]).where(
+            growth, "GDP impact - " + values["column"]
+        )
+        values["unit"] = growth.map({True: "percentage", False: "absolute"})
+        return values[["metric", "value", "unit", "region"]].to_dict("records")
 
     def _extract_labor_market_impact(self) -> Optional[pd.DataFrame]:
         """Extract labor market disruption data."""
@@ -291,12 +288,7 @@ class GoldmanSachsLoader(BaseDataLoader):
                 "workforce",
             ]
 
-            labor_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                labor_pages.extend(pages)
-
-            labor_pages = sorted(set(labor_pages))[:10]
+            labor_pages = self.pages_with_keywords(keywords)[:10]
 
             if not labor_pages:
                 return None
@@ -305,7 +297,7 @@ class GoldmanSachsLoader(BaseDataLoader):
 
             # Extract labor impact metrics
             for page in labor_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
                 # Patterns for labor impact
                 patterns = [
@@ -316,7 +308,7 @@ class GoldmanSachsLoader(BaseDataLoader):
                 ]
 
                 for pattern in patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
+                    matches = self.findall(pattern, text, re.IGNORECASE)
                     for match in matches:
                         value = float(match[0] if isinstance(match, str) else match[0])
 
@@ -377,19 +369,14 @@ class GoldmanSachsLoader(BaseDataLoader):
             # Keywords for productivity sections
             keywords = ["productivity", "efficiency", "output", "performance", "gains"]
 
-            productivity_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                productivity_pages.extend(pages)
-
-            productivity_pages = sorted(set(productivity_pages))[:10]
+            productivity_pages = self.pages_with_keywords(keywords)[:10]
 
             if not productivity_pages:
                 return None
 
             # Look for productivity tables
             for page in productivity_pages:
-                tables = self.extractor.extract_tables(page_range=(page, page))
+                tables = self.page_tables(page)
 
                 for table in tables:
                     if table.empty:
@@ -420,75 +407,43 @@ class GoldmanSachsLoader(BaseDataLoader):
 
     def _process_productivity_table(self, table: pd.DataFrame) -> Optional[pd.DataFrame]:
         """Process table containing productivity data."""
-        # Identify sector column
-        sector_col = None
-        for col in table.columns:
-            sample_vals = table[col].astype(str).str.lower()
-            if any(
-                val
-                for val in sample_vals
-                if any(
-                    sector in val for sector in ["manufacturing", "finance", "retail", "healthcare"]
-                )
-            ):
-                sector_col = col
-                break
-
-        if not sector_col:
+        table = normalize_table(table)
+        sector_col = find_label_column(
+            table, ["manufacturing", "finance", "retail", "healthcare"]
+        )
+        if sector_col is None:
             return None
 
-        # Find productivity gain columns
-        gain_cols = []
-        for col in table.columns:
-            if col == sector_col:
-                continue
-
-            col_vals = table[col].astype(str)
-            if col_vals.str.contains("%").sum() > len(table) * 0.3:
-                gain_cols.append(col)
-
-        if sector_col and gain_cols:
-            # Create clean dataframe
-            result_data = []
-
-            for _, row in table.iterrows():
-                sector = str(row[sector_col]).strip()
-
-                for gain_col in gain_cols:
-                    try:
-                        value_str = str(row[gain_col])
-                        value = float(value_str.replace("%", "").strip())
-
-                        # Determine timeframe from column name
-                        col_lower = gain_col.lower()
-                        if "2030" in col_lower:
-                            timeframe = "2030"
-                        elif "2025" in col_lower:
-                            timeframe = "2025"
-                        elif "annual" in col_lower:
-                            timeframe = "annual"
-                        else:
-                            timeframe = "projected"
-
-                        result_data.append(
-                            {
-                                "sector": sector,
-                                "productivity_gain": value,
-                                "timeframe": timeframe,
-                                "unit": "percentage",
-                            }
-                        )
-                    except ValueError:
-                        continue
-
-            if result_data:
-                df = pd.DataFrame(result_data)
-                # Keep highest gain per sector if multiple timeframes
-                df = df.sort_values("productivity_gain", ascending=False)
-                df = df.drop_duplicates(subset=["sector"], keep="first")
-                return df
+        gain_cols = value_columns(table, exclude=[sector_col], min_fraction=0.3, percent_only=True)
+        gains = melt_values(table, sector_col, gain_cols, label_name="sector")
+        if gains.empty:
+            return None
 
-        return None
+        df = pd.DataFrame(
+            {
+                "sector": gains["sector"],
+                "productivity_gain": gains["value"],
+                # Determine timeframe from column name
+                "timeframe": map_unique(gains["column"], self._productivity_timeframe),
+                "unit": "percentage",
+            }
+        )
+        # Keep highest gain per sector if multiple timeframes
+        df = df.sort_values("productivity_gain", ascending=False)
+        df = df.drop_duplicates(subset=["sector"], keep="first")
+        return df
+
+    def _productivity_timeframe(self, column: str) -> str:
+        """Name the timeframe of a productivity table column."""
+        col_lower = column.lower()
+        if "2030" in col_lower:
+            return "2030"
+        elif "2025" in col_lower:
+            return "2025"
+        elif "annual" in col_lower:
+            return "annual"
+        else:
+            return "projected"
 
     def _extract_productivity_from_text(self, pages: List[int]) -> List[Dict]:
         """Extract productivity data from text."""
@@ -505,9 +460,13 @@ class GoldmanSachsLoader(BaseDataLoader):
         ]
 
         for page in pages[:5]:
-            text = self.extractor.extract_text_from_page(page)
+            text = self.page_text(page)
 
+            mentioned = get_scanner(tuple(sectors)).found_set(text)
             for sector in sectors:
+                if sector not in mentioned:
+                    continue
+
                 # Look for sector mentions with productivity gains
                 patterns = [
                     rf"{sector}.*?(\d+(?:\.\d+)?)\s*%\s*productivity",
@@ -516,7 +475,7 @@ class GoldmanSachsLoader(BaseDataLoader):
                 ]
 
                 for pattern in patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
+                    matches = self.findall(pattern, text, re.IGNORECASE)
                     if matches:
                         try:
                             value = float(matches[0])
@@ -552,12 +511,7 @@ class GoldmanSachsLoader(BaseDataLoader):
             # Keywords for automation sections
             keywords = ["automation", "occupation", "exposure", "risk", "displacement"]
 
-            automation_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                automation_pages.extend(pages)
-
-            automation_pages = sorted(set(automation_pages))[:10]
+            automation_pages = self.pages_with_keywords(keywords)[:10]
 
             if not automation_pages:
                 return None
@@ -583,9 +537,13 @@ class GoldmanSachsLoader(BaseDataLoader):
 
             # Extract automation exposure data
             for page in automation_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(tuple(occupations)).found_set(text)
                 for occupation in occupations:
+                    if occupation not in mentioned:
+                        continue
+
                     # Look for occupation mentions with exposure percentages
                     patterns = [
                         rf"{occupation}.*?(\d+(?:\.\d+)?)\s*%\s*(?:exposure|risk|automation)",
@@ -594,7 +552,7 @@ class GoldmanSachsLoader(BaseDataLoader):
                     ]
 
                     for pattern in patterns:
-                        matches = re.findall(pattern, text, re.IGNORECASE)
+                        matches = self.findall(pattern, text, re.IGNORECASE)
                         if matches:
                             try:
                                 exposure = float(matches[0])
@@ -647,12 +605,7 @@ class GoldmanSachsLoader(BaseDataLoader):
                 "conservative",
             ]
 
-            scenario_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                scenario_pages.extend(pages)
-
-            scenario_pages = sorted(set(scenario_pages))[:10]
+            scenario_pages = self.pages_with_keywords(keywords)[:10]
 
             if not scenario_pages:
                 return None
@@ -669,9 +622,13 @@ class GoldmanSachsLoader(BaseDataLoader):
             ]
 
             for page in scenario_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(tuple(scenarios)).found_set(text)
                 for scenario in scenarios:
+                    if scenario not in mentioned:
+                        continue
+
                     # Look for scenario mentions with growth rates
                     patterns = [
                         rf"{scenario}.*?(\d+(?:\.\d+)?)\s*%\s*(?:GDP\s+)?growth",
@@ -680,7 +637,7 @@ class GoldmanSachsLoader(BaseDataLoader):
                     ]
 
                     for pattern in patterns:
-                        matches = re.findall(pattern, text, re.IGNORECASE)
+                        matches = self.findall(pattern, text, re.IGNORECASE)
                         if matches:
                             try:
                                 growth_rate = float(matches[0])
@@ -731,12 +688,7 @@ class GoldmanSachsLoader(BaseDataLoader):
             # Keywords for investment sections
             keywords = ["investment", "capital", "funding", "opportunity", "returns", "ROI"]
 
-            investment_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                investment_pages.extend(pages)
-
-            investment_pages = sorted(set(investment_pages))[:10]
+            investment_pages = self.pages_with_keywords(keywords)[:10]
 
             if not investment_pages:
                 return None
@@ -756,7 +708,7 @@ class GoldmanSachsLoader(BaseDataLoader):
             ]
 
             for page in investment_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
                 # Extract investment amounts and returns
                 patterns = [
@@ -766,7 +718,7 @@ class GoldmanSachsLoader(BaseDataLoader):
                 ]
 
                 for pattern in patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
+                    matches = self.findall(pattern, text, re.IGNORECASE)
                     for match in matches:
                         investment_data.append(self._parse_investment_match(match, pattern))
 
@@ -7,16 +7,81 @@ from typing import Dict, List, Optional
 
 import pandas as pd
 
+from ..extractors.entity_scanner import get_scanner
+from ..extractors.patterns import NUMBER, PERCENT, NumericPattern, PatternSet, scale_factor
 from ..extractors.pdf_extractor import PDFExtractor
+from ..extractors.table_normalization import (
+    as_text,
+    find_label_column,
+    map_unique,
+    melt_values,
+    normalize_table,
+    to_numeric,
+    value_columns,
+)
 from ..models.economics import EconomicImpact, ROIMetrics
+from ..models.schemas import PERCENT_RULE, ColumnRule, DatasetSchema
 from .base import BaseDataLoader, DataSource
 
 logger = logging.getLogger(__name__)
 
+DATASET_SCHEMAS = {
+    "financial_impact": DatasetSchema("financial_impact", model=EconomicImpact),
+    "use_case_adoption": DatasetSchema(
+        "use_case_adoption",
+        rules={
+            "adoption_rate": PERCENT_RULE,
+            "genai_adoption": PERCENT_RULE,
+            "pilot_rate": PERCENT_RULE,
+            "production_rate": PERCENT_RULE,
+            "year": ColumnRule("int", low=2017, high=2030),
+        },
+    ),
+    "implementation_barriers": DatasetSchema(
+        "implementation_barriers", rules={"percentage": PERCENT_RULE}
+    ),
+    "productivity_gains": DatasetSchema("productivity_gains", model=EconomicImpact),
+    "risk_governance": DatasetSchema("risk_governance", rules={"adoption_rate": PERCENT_RULE}),
+}
+
+# Financial impact figures, e.g. "20% cost reduction", "$2.5 million savings"
+FINANCIAL_PATTERNS = PatternSet(
+    "mckinsey.financial",
+    [
+        NumericPattern(
+            "percent_metric",
+            PERCENT
+            + r"\s*(cost reduction|revenue increase|productivity gain|EBITDA improvement)",
+            lambda g: {"metric": g[1], "value": float(g[0]), "unit": "percentage"},
+        ),
+        NumericPattern(
+            "metric_of_percent",
+            r"(cost reduction|revenue increase|productivity gain|savings)\s*of\s*" + PERCENT,
+            lambda g: {"metric": g[0], "value": float(g[1]), "unit": "percentage"},
+        ),
+        NumericPattern(
+            "currency_impact",
+            r"\$" + NUMBER + r"\s*(million|billion)\s*(savings|value|impact)",
+            lambda g: {
+                "metric": f"{g[2]} (millions)",
+                "value": float(g[0]) * scale_factor(g[1]),
+                "unit": "millions_usd",
+            },
+        ),
+        NumericPattern(
+            "percent_change_in",
+            PERCENT + r"\s*(improvement|increase|decrease|reduction)\s*in\s*(\w+)",
+            lambda g: {"metric": f"{g[1]} in {g[2]}", "value": float(g[0]), "unit": "percentage"},
+        ),
+    ],
+)
+
 
 class McKinseyLoader(BaseDataLoader):
     """Loader for McKinsey State of AI report data with real PDF extraction."""
 
+    schemas = DATASET_SCHEMAS
+
     def __init__(self, file_path: Optional[Path] = None):
         """Initialize with McKinsey report file path."""
         if file_path is None:
@@ -121,12 +186,7 @@ class McKinseyLoader(BaseDataLoader):
             ]
 
             # Find relevant pages
-            financial_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                financial_pages.extend(pages)
-
-            financial_pages = sorted(set(financial_pages))[:15]
+            financial_pages = self.pages_with_keywords(keywords)[:15]
 
             if not financial_pages:
                 return None
@@ -136,7 +196,7 @@ class McKinseyLoader(BaseDataLoader):
 
             # First try tables
             for page in financial_pages[:10]:
-                tables = self.extractor.extract_tables(page_range=(page, page))
+                tables = self.page_tables(page)
 
                 for table in tables:
                     if table.empty:
@@ -153,23 +213,12 @@ class McKinseyLoader(BaseDataLoader):
                         if processed_data:
                             financial_data.extend(processed_data)
 
-            # Also extract from text using patterns
+            # Also extract from text using the precompiled financial patterns
             for page in financial_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
-
-                # Patterns for financial metrics
-                # Examples: "20% cost reduction", "15% revenue increase", "$2.5 million savings"
-                patterns = [
-                    r"(\d+(?:\.\d+)?)\s*%\s*(cost reduction|revenue increase|productivity gain|EBITDA improvement)",
-                    r"(cost reduction|revenue increase|productivity gain|savings)\s*of\s*(\d+(?:\.\d+)?)\s*%",
-                    r"\$(\d+(?:\.\d+)?)\s*(million|billion)\s*(savings|value|impact)",
-                    r"(\d+(?:\.\d+)?)\s*%\s*(improvement|increase|decrease|reduction)\s*in\s*(\w+)",
-                ]
-
-                for pattern in patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
-                    for match in matches:
-                        financial_data.append(self._parse_financial_match(match, pattern))
+                text = self.page_text(page)
+                for record in FINANCIAL_PATTERNS.extract(text):
+                    record["category"] = self._categorize_financial_metric(record["metric"])
+                    financial_data.append(record)
 
             if financial_data:
                 # Convert to DataFrame and clean
@@ -187,98 +236,21 @@ class McKinseyLoader(BaseDataLoader):
 
     def _process_financial_table(self, table: pd.DataFrame) -> List[Dict]:
         """Process a table containing financial metrics."""
-        results = []
-
-        # Identify metric name column
-        metric_col = None
-        for col in table.columns:
-            sample_vals = table[col].astype(str).str.lower()
-            if any(
-                val
-                for val in sample_vals
-                if any(
-                    term in val
-                    for term in ["cost", "revenue", "productivity", "savings", "function"]
-                )
-            ):
-                metric_col = col
-                break
-
-        if not metric_col:
-            return results
-
-        # Find value columns
-        value_cols = []
-        for col in table.columns:
-            if col == metric_col:
-                continue
-
-            # Check if column contains percentages or numbers
-            col_str = table[col].astype(str)
-            if col_str.str.contains("%").sum() > len(table) * 0.3:
-                value_cols.append(col)
-            elif col_str.str.match(r"^\d+(?:\.\d+)?$").sum() > len(table) * 0.3:
-                value_cols.append(col)
-
-        # Extract data
-        for _, row in table.iterrows():
-            metric_name = str(row[metric_col])
-
-            for val_col in value_cols:
-                try:
-                    value_str = str(row[val_col])
-                    if "%" in value_str:
-                        value = float(value_str.replace("%", "").strip())
-                        unit = "percentage"
-                    else:
-                        value = float(value_str.replace(",", "").strip())
-                        unit = "absolute"
-
-                    results.append(
-                        {
-                            "metric": metric_name,
-                            "value": value,
-                            "unit": unit,
-                            "category": self._categorize_financial_metric(metric_name),
-                        }
-                    )
-                except ValueError:
-                    continue
-
-        return results
-
-    def _parse_financial_match(self, match: tuple, pattern: str) -> Dict:
-        """Parse a regex match for financial data."""
-        result = {"metric": "", "value": 0, "unit": "", "category": ""}
-
-        try:
-            if "%" in pattern and "cost reduction" in pattern:
-                # Pattern like "20% cost reduction"
-                if len(match) >= 2:
-                    result["value"] = float(match[0])
-                    result["metric"] = match[1]
-                    result["unit"] = "percentage"
-            elif "$" in pattern:
-                # Pattern like "$2.5 million savings"
-                if len(match) >= 3:
-                    value = float(match[0])
-                    multiplier = 1 if match[1].lower() == "million" else 1000
-                    result["value"] = value * multiplier
-                    result["metric"] = f"{match[2]} (millions)"
-                    result["unit"] = "millions_usd"
-            else:
-                # Generic percentage pattern
-                if len(match) >= 3:
-                    result["value"] = float(match[0])
-                    result["metric"] = f"{match[1]} in {match[2]}"
-                    result["unit"] = "percentage"
+        table = normalize_table(table)
+        metric_col = find_label_column(
+            table, ["cost", "revenue", "productivity", "savings", "function"]
+        )
+        if metric_col is None:
+            return []
 
-            result["category"] = self._categorize_financial_metric(result["metric"])
+        value_cols = value_columns(table, exclude=[metric_col], min_fraction=0.3)
+        values = melt_values(table, metric_col, value_cols, label_name="metric")
+        if values.empty:
+            return []
 
-        except (ValueError, IndexError):
-            pass
-
-        return result
+        values["unit"] = values["is_percent"].map({True: "percentage", False: "absolute"})
+        values["category"] = map_unique(values["metric"], self._categorize_financial_metric)
+        return values[["metric", "value", "unit", "category"]].to_dict("records")
 
     def _categorize_financial_metric(self, metric: str) -> str:
         """Categorize financial metric."""
@@ -316,19 +288,14 @@ class McKinseyLoader(BaseDataLoader):
             ]
 
             # Find relevant pages
-            use_case_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                use_case_pages.extend(pages)
-
-            use_case_pages = sorted(set(use_case_pages))[:10]
+            use_case_pages = self.pages_with_keywords(keywords)[:10]
 
             if not use_case_pages:
                 return None
 
             # Look for use case tables
             for page in use_case_pages:
-                tables = self.extractor.extract_tables(page_range=(page, page))
+                tables = self.page_tables(page)
 
                 for table in tables:
                     if table.empty or len(table) < 3:
@@ -367,65 +334,39 @@ class McKinseyLoader(BaseDataLoader):
 
     def _process_use_case_table(self, table: pd.DataFrame) -> Optional[pd.DataFrame]:
         """Process table containing use case data."""
-        # Identify function column
-        function_col = None
-        for col in table.columns:
-            sample_vals = table[col].astype(str).str.lower()
-            if any(
-                "marketing" in val or "sales" in val or "supply" in val or "finance" in val
-                for val in sample_vals
-            ):
-                function_col = col
-                break
-
-        if not function_col:
+        table = normalize_table(table)
+        function_col = find_label_column(table, ["marketing", "sales", "supply", "finance"])
+        if function_col is None:
             return None
 
-        # Find adoption rate columns
-        rate_cols = []
-        for col in table.columns:
-            if col == function_col:
-                continue
-
-            # Check for percentage values
-            col_vals = table[col].astype(str)
-            if col_vals.str.contains("%").sum() > len(table) * 0.3:
-                rate_cols.append(col)
-
-        if function_col and rate_cols:
-            # Create clean dataframe
-            result_data = []
-
-            for _, row in table.iterrows():
-                function = str(row[function_col]).strip()
-
-                for rate_col in rate_cols:
-                    try:
-                        rate_str = str(row[rate_col])
-                        rate = float(rate_str.replace("%", "").strip())
-
-                        # Determine metric type from column name
-                        col_lower = rate_col.lower()
-                        if "genai" in col_lower or "generative" in col_lower:
-                            metric_type = "genai_adoption"
-                        elif "pilot" in col_lower:
-                            metric_type = "pilot_rate"
-                        elif "production" in col_lower:
-                            metric_type = "production_rate"
-                        else:
-                            metric_type = "adoption_rate"
-
-                        result_data.append({"function": function, metric_type: rate, "year": 2024})
-                    except ValueError:
-                        continue
-
-            if result_data:
-                # Consolidate by function
-                df = pd.DataFrame(result_data)
-                df = df.groupby("function").first().reset_index()
-                return df
+        rate_cols = value_columns(
+            table, exclude=[function_col], min_fraction=0.3, percent_only=True
+        )
+        rates = melt_values(table, function_col, rate_cols, label_name="function")
+        if rates.empty:
+            return None
 
-        return None
+        # Determine metric type from column name
+        rates["metric"] = map_unique(rates["column"], self._use_case_metric_type)
+        df = rates.pivot_table(
+            index="function", columns="metric", values="value", aggfunc="first"
+        )
+        df.columns.name = None
+        df = df.reset_index()
+        df["year"] = 2024
+        return df
+
+    def _use_case_metric_type(self, column: str) -> str:
+        """Name the adoption metric held in a use case table column."""
+        col_lower = column.lower()
+        if "genai" in col_lower or "generative" in col_lower:
+            return "genai_adoption"
+        elif "pilot" in col_lower:
+            return "pilot_rate"
+        elif "production" in col_lower:
+            return "production_rate"
+        else:
+            return "adoption_rate"
 
     def _extract_use_cases_from_text(self, pages: List[int]) -> List[Dict]:
         """Extract use case data from text."""
@@ -442,9 +383,13 @@ class McKinseyLoader(BaseDataLoader):
         ]
 
         for page in pages[:5]:
-            text = self.extractor.extract_text_from_page(page)
+            text = self.page_text(page)
 
+            mentioned = get_scanner(tuple(functions)).found_set(text)
             for function in functions:
+                if function not in mentioned:
+                    continue
+
                 # Look for function mentions with percentages
                 patterns = [
                     rf"{function}.*?(\d+(?:\.\d+)?)\s*%",
@@ -453,7 +398,7 @@ class McKinseyLoader(BaseDataLoader):
                 ]
 
                 for pattern in patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
+                    matches = self.findall(pattern, text, re.IGNORECASE)
                     if matches:
                         try:
                             rate = float(matches[0])
@@ -494,12 +439,7 @@ class McKinseyLoader(BaseDataLoader):
             ]
 
             # Find relevant pages
-            barrier_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                barrier_pages.extend(pages)
-
-            barrier_pages = sorted(set(barrier_pages))[:10]
+            barrier_pages = self.pages_with_keywords(keywords)[:10]
 
             if not barrier_pages:
                 return None
@@ -508,7 +448,7 @@ class McKinseyLoader(BaseDataLoader):
 
             # Extract from tables first
             for page in barrier_pages[:5]:
-                tables = self.extractor.extract_tables(page_range=(page, page))
+                tables = self.page_tables(page)
 
                 for table in tables:
                     if table.empty:
@@ -532,10 +472,10 @@ class McKinseyLoader(BaseDataLoader):
             ]
 
             for page in barrier_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
                 for pattern in barrier_patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
+                    matches = self.findall(pattern, text, re.IGNORECASE)
                     for match in matches:
                         barriers_data.append(self._parse_barrier_match(match, pattern))
 
@@ -557,50 +497,28 @@ class McKinseyLoader(BaseDataLoader):
 
     def _process_barrier_table(self, table: pd.DataFrame) -> List[Dict]:
         """Process table containing barrier data."""
-        results = []
-
-        # Find barrier description column
+        table = normalize_table(table)
+        # Barrier descriptions are in the first text-heavy column
         barrier_col = None
         for col in table.columns:
-            # Look for text-heavy columns
-            non_numeric = table[col].astype(str).str.match(r"^\d+(?:\.\d+)?%?$").sum()
-            if non_numeric < len(table) * 0.5:
+            if to_numeric(table[col]).notna().sum() < len(table) * 0.5:
                 barrier_col = col
                 break
+        if barrier_col is None:
+            return []
 
-        if not barrier_col:
-            return results
-
-        # Find percentage column
-        pct_col = None
-        for col in table.columns:
-            if col == barrier_col:
-                continue
-
-            col_vals = table[col].astype(str)
-            if col_vals.str.contains("%").sum() > len(table) * 0.3:
-                pct_col = col
-                break
-
-        if barrier_col and pct_col:
-            for _, row in table.iterrows():
-                try:
-                    barrier = str(row[barrier_col]).strip()
-                    pct_str = str(row[pct_col])
-                    percentage = float(pct_str.replace("%", "").strip())
-
-                    if 0 < percentage <= 100:
-                        results.append(
-                            {
-                                "barrier": barrier,
-                                "percentage": percentage,
-                                "category": self._categorize_barrier(barrier),
-                            }
-                        )
-                except ValueError:
-                    continue
+        pct_cols = value_columns(
+            table, exclude=[barrier_col], min_fraction=0.3, percent_only=True
+        )
+        if not pct_cols:
+            return []
 
-        return results
+        df = pd.DataFrame(
+            {"barrier": as_text(table[barrier_col]), "percentage": to_numeric(table[pct_cols[0]])}
+        ).dropna()
+        df = df[(df["percentage"] > 0) & (df["percentage"] <= 100)]
+        df["category"] = map_unique(df["barrier"], self._categorize_barrier)
+        return df.to_dict("records")
 
     def _parse_barrier_match(self, match: tuple, pattern: str) -> Dict:
         """Parse regex match for barrier data."""
@@ -652,12 +570,7 @@ class McKinseyLoader(BaseDataLoader):
             # Keywords for talent sections
             keywords = ["talent", "skills", "hiring", "workforce", "training", "expertise", "roles"]
 
-            talent_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                talent_pages.extend(pages)
-
-            talent_pages = sorted(set(talent_pages))[:10]
+            talent_pages = self.pages_with_keywords(keywords)[:10]
 
             if not talent_pages:
                 return None
@@ -666,7 +579,7 @@ class McKinseyLoader(BaseDataLoader):
 
             # Extract talent metrics
             for page in talent_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
                 # Patterns for talent metrics
                 patterns = [
@@ -677,7 +590,7 @@ class McKinseyLoader(BaseDataLoader):
                 ]
 
                 for pattern in patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
+                    matches = self.findall(pattern, text, re.IGNORECASE)
                     for match in matches:
                         value = float(match if isinstance(match, str) else match[0])
 
@@ -720,12 +633,7 @@ class McKinseyLoader(BaseDataLoader):
                 "time savings",
             ]
 
-            productivity_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                productivity_pages.extend(pages)
-
-            productivity_pages = sorted(set(productivity_pages))[:10]
+            productivity_pages = self.pages_with_keywords(keywords)[:10]
 
             if not productivity_pages:
                 return None
@@ -734,7 +642,7 @@ class McKinseyLoader(BaseDataLoader):
 
             # Extract productivity metrics
             for page in productivity_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
                 # Extract numeric productivity data
                 numeric_data = self.extractor.extract_numeric_data(
@@ -817,12 +725,7 @@ class McKinseyLoader(BaseDataLoader):
                 "accountability",
             ]
 
-            risk_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                risk_pages.extend(pages)
-
-            risk_pages = sorted(set(risk_pages))[:10]
+            risk_pages = self.pages_with_keywords(keywords)[:10]
 
             if not risk_pages:
                 return None
@@ -843,9 +746,13 @@ class McKinseyLoader(BaseDataLoader):
 
             # Extract adoption rates for each aspect
             for page in risk_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(tuple(aspects)).found_set(text)
                 for aspect in aspects:
+                    if aspect not in mentioned:
+                        continue
+
                     # Look for mentions with percentages
                     patterns = [
                         rf"{aspect}.*?(\d+(?:\.\d+)?)\s*%",
@@ -854,7 +761,7 @@ class McKinseyLoader(BaseDataLoader):
                     ]
 
                     for pattern in patterns:
-                        matches = re.findall(pattern, text, re.IGNORECASE)
+                        matches = self.findall(pattern, text, re.IGNORECASE)
                         if matches:
                             try:
                                 rate = float(matches[0])
@@ -3,20 +3,111 @@
 import logging
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from ..extractors.entity_scanner import get_scanner
+from ..extractors.patterns import (
+    NUMBER,
+    PERCENT,
+    QUARTER,
+    YEAR_2020S,
+    NumericPattern,
+    PatternSet,
+)
 from ..extractors.pdf_extractor import PDFExtractor
+from ..extractors.table_normalization import (
+    as_text,
+    extract_number,
+    find_label_column,
+    header_matches,
+    normalize_table,
+    pivot_columns,
+)
 from ..models.economics import TokenEconomics
+from ..models.schemas import DatasetSchema
 from .base import BaseDataLoader, DataSource
 
 logger = logging.getLogger(__name__)
 
+DATASET_SCHEMAS = {
+    "token_pricing_evolution": DatasetSchema(
+        "token_pricing_evolution", model=TokenEconomics, categories=("date",)
+    ),
+}
+
+# Efficiency metrics by table header keywords
+EFFICIENCY_COLUMNS = [
+    ("parameters", ["param", "size"]),
+    ("tokens_per_second", ["token", "throughput", "speed"]),
+    ("quality_score", ["quality", "accuracy", "score"]),
+    ("efficiency_ratio", ["efficiency", "ratio"]),
+    ("latency_ms", ["latency", "response"]),
+]
+
+# Compute requirement metrics by table header keywords
+COMPUTE_COLUMNS = [
+    ("avg_tokens_per_request", ["token"]),
+    ("gpu_hours_required", ["gpu"]),
+    ("cost_per_million_requests", ["cost"]),
+    ("latency_ms", ["latency"]),
+]
+
+
+def _pricing_record(metric: str, value: float, unit: str) -> Dict:
+    return {"metric": metric, "value": value, "unit": unit, "model": "", "date": ""}
+
+
+def _price_reduction(groups: Tuple[str, ...]) -> Dict:
+    from_price, to_price = float(groups[0]), float(groups[1])
+    reduction = ((from_price - to_price) / from_price) * 100
+    return _pricing_record("price_reduction_percentage", reduction, "percentage")
+
+
+# Token pricing figures, e.g. "280x reduction", "$0.06 per thousand tokens"
+PRICING_PATTERNS = PatternSet(
+    "nvidia.pricing",
+    [
+        NumericPattern(
+            "cost_reduction_factor",
+            NUMBER + r"\s*x\s*(?:cost\s*)?reduction",
+            lambda g: _pricing_record("cost_reduction_factor", float(g[0]), "multiplier"),
+        ),
+        NumericPattern(
+            "usd_per_1k_tokens",
+            r"\$" + NUMBER + r"\s*per\s*(?:thousand|1k|1,000)\s*tokens",
+            lambda g: _pricing_record("price_per_1k_tokens", float(g[0]), "usd"),
+        ),
+        NumericPattern(
+            "cents_per_1k_tokens",
+            NUMBER + r"\s*(?:cents?|¢)\s*per\s*(?:thousand|1k|1,000)\s*tokens",
+            lambda g: _pricing_record("price_per_1k_tokens", float(g[0]) / 100, "usd"),
+        ),
+        NumericPattern(
+            "token_price_drop_percent",
+            r"token\s*(?:price|cost)\s*(?:dropped|reduced|decreased)\s*(?:by\s*)?" + PERCENT,
+            lambda g: _pricing_record("price_reduction_percentage", float(g[0]), "percentage"),
+        ),
+        NumericPattern(
+            "price_from_to",
+            r"from\s*\$" + NUMBER + r"\s*to\s*\$" + NUMBER + r"\s*per\s*(?:thousand|1k)",
+            _price_reduction,
+        ),
+        NumericPattern(
+            "tokens_per_dollar",
+            NUMBER + r"\s*tokens?\s*per\s*dollar",
+            lambda g: _pricing_record("tokens_per_dollar", float(g[0]), "tokens"),
+        ),
+    ],
+)
+
 
 class NVIDIATokenLoader(BaseDataLoader):
     """Loader for NVIDIA token economics and AI infrastructure data with real PDF extraction."""
 
+    schemas = DATASET_SCHEMAS
+
     def __init__(self, file_path: Optional[Path] = None):
         """Initialize with NVIDIA report file path."""
         if file_path is None:
@@ -121,12 +212,7 @@ class NVIDIATokenLoader(BaseDataLoader):
                 "price evolution",
             ]
 
-            pricing_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                pricing_pages.extend(pages)
-
-            pricing_pages = sorted(set(pricing_pages))[:10]
+            pricing_pages = self.pages_with_keywords(keywords)[:10]
 
             if not pricing_pages:
                 return None
@@ -135,26 +221,24 @@ class NVIDIATokenLoader(BaseDataLoader):
 
             # Extract pricing metrics
             for page in pricing_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
-
-                # Patterns for token pricing and cost reduction
-                patterns = [
-                    r"(\d+(?:\.\d+)?)\s*x\s*(?:cost\s*)?reduction",  # 280x reduction
-                    r"\$(\d+(?:\.\d+)?)\s*per\s*(?:thousand|1k|1,000)\s*tokens",
-                    r"(\d+(?:\.\d+)?)\s*(?:cents?|¢)\s*per\s*(?:thousand|1k|1,000)\s*tokens",
-                    r"token\s*(?:price|cost)\s*(?:dropped|reduced|decreased)\s*(?:by\s*)?(\d+(?:\.\d+)?)\s*%",
-                    r"from\s*\$(\d+(?:\.\d+)?)\s*to\s*\$(\d+(?:\.\d+)?)\s*per\s*(?:thousand|1k)",
-                    r"(\d+(?:\.\d+)?)\s*tokens?\s*per\s*dollar",
-                ]
-
-                for pattern in patterns:
-                    matches = re.findall(pattern, text, re.IGNORECASE)
-                    for match in matches:
-                        pricing_data.append(self._parse_pricing_match(match, pattern, text))
+                text = self.page_text(page)
+
+                records = PRICING_PATTERNS.extract(text)
+                if not records:
+                    continue
+
+                # Model and date come from the page, so resolve them once per page
+                model = self._extract_model_from_context(text)
+                date = self._extract_date_from_context(text)
+                for record in records:
+                    if record["metric"] == "price_per_1k_tokens":
+                        record["model"] = model
+                    record["date"] = date
+                    pricing_data.append(record)
 
             # Look for pricing tables
             for page in pricing_pages[:5]:
-                tables = self.extractor.extract_tables(page_range=(page, page))
+                tables = self.page_tables(page)
                 for table in tables:
                     if table.empty:
                         continue
@@ -178,59 +262,13 @@ class NVIDIATokenLoader(BaseDataLoader):
 
         return None
 
-    def _parse_pricing_match(self, match: tuple, pattern: str, context: str) -> Dict:
-        """Parse pricing data match."""
-        result = {"metric": "", "value": 0, "unit": "", "model": "", "date": ""}
-
-        try:
-            if "x" in pattern and "reduction" in pattern:
-                # Cost reduction factor (e.g., 280x)
-                result["metric"] = "cost_reduction_factor"
-                result["value"] = float(match[0] if isinstance(match, str) else match[0])
-                result["unit"] = "multiplier"
-
-            elif "per" in pattern and ("thousand" in pattern or "1k" in pattern):
-                # Price per thousand tokens
-                if "cents" in pattern or "¢" in pattern:
-                    value = float(match[0] if isinstance(match, str) else match[0]) / 100
-                else:
-                    value = float(match[0] if isinstance(match, str) else match[0])
-
-                result["metric"] = "price_per_1k_tokens"
-                result["value"] = value
-                result["unit"] = "usd"
-                result["model"] = self._extract_model_from_context(context)
-
-            elif "from" in pattern and "to" in pattern:
-                # Price change from-to
-                from_price = float(match[0])
-                to_price = float(match[1])
-                reduction = ((from_price - to_price) / from_price) * 100
-
-                result["metric"] = "price_reduction_percentage"
-                result["value"] = reduction
-                result["unit"] = "percentage"
-
-            elif "tokens" in pattern and "per" in pattern and "dollar" in pattern:
-                # Tokens per dollar
-                result["metric"] = "tokens_per_dollar"
-                result["value"] = float(match[0] if isinstance(match, str) else match[0])
-                result["unit"] = "tokens"
-
-            # Extract date if available
-            result["date"] = self._extract_date_from_context(context)
-
-        except (ValueError, IndexError):
-            pass
-
-        return result
-
     def _extract_model_from_context(self, text: str) -> str:
         """Extract model name from context."""
         models = ["GPT-4", "GPT-3.5", "GPT-3", "Claude", "Gemini", "LLaMA", "Mistral"]
 
+        mentioned = get_scanner(tuple(models)).found_set(text)
         for model in models:
-            if model.lower() in text.lower():
+            if model in mentioned:
                 return model
 
         return "General"
@@ -238,12 +276,12 @@ class NVIDIATokenLoader(BaseDataLoader):
     def _extract_date_from_context(self, text: str) -> str:
         """Extract date from context."""
         # Look for year or quarter mentions
-        year_match = re.search(r"20[2-3]\\d", text)
+        year_match = YEAR_2020S.search(text)
         if year_match:
             year = year_match.group()
 
             # Check for quarter
-            quarter_match = re.search(r"Q[1-4]", text)
+            quarter_match = QUARTER.search(text)
             if quarter_match:
                 return f"{quarter_match.group()} {year}"
             else:
@@ -253,61 +291,47 @@ class NVIDIATokenLoader(BaseDataLoader):
 
     def _process_pricing_table(self, table: pd.DataFrame) -> List[Dict]:
         """Process table containing pricing data."""
-        results = []
-
-        # Look for date/time column
-        date_col = None
-        for col in table.columns:
-            col_str = str(col).lower()
-            if any(term in col_str for term in ["date", "year", "quarter", "month", "time"]):
-                date_col = col
-                break
-
-        # Look for model column
-        model_col = None
-        for col in table.columns:
-            col_str = str(col).lower()
-            if any(term in col_str for term in ["model", "service", "api", "provider"]):
-                model_col = col
-                break
-
-        # Find price columns
-        price_cols = []
-        for col in table.columns:
-            col_str = str(col).lower()
-            if any(term in col_str for term in ["price", "cost", "token", "rate"]):
-                price_cols.append(col)
-
-        if price_cols:
-            for _, row in table.iterrows():
-                date = str(row[date_col]) if date_col else "Recent"
-                model = str(row[model_col]) if model_col else "General"
-
-                for price_col in price_cols:
-                    try:
-                        value_str = str(row[price_col])
-                        # Extract numeric value
-                        numeric_match = re.search(r"(\d+(?:\.\d+)?)", value_str)
-                        if numeric_match:
-                            value = float(numeric_match.group(1))
-
-                            # Check if cents
-                            if "¢" in value_str or "cent" in value_str.lower():
-                                value = value / 100
-
-                            results.append(
-                                {
-                                    "metric": "price_per_1k_tokens",
-                                    "value": value,
-                                    "unit": "usd",
-                                    "model": model,
-                                    "date": date,
-                                }
-                            )
-                    except ValueError:
-                        continue
-
-        return results
+        table = normalize_table(table)
+        price_cols = [
+            col for col in table.columns if header_matches(col, ["price", "cost", "token", "rate"])
+        ]
+        if not price_cols:
+            return []
+
+        # Date/time and model columns label each row where present
+        date_col = next(
+            (
+                col
+                for col in table.columns
+                if header_matches(col, ["date", "year", "quarter", "month", "time"])
+            ),
+            None,
+        )
+        model_col = next(
+            (
+                col
+                for col in table.columns
+                if header_matches(col, ["model", "service", "api", "provider"])
+            ),
+            None,
+        )
+        labels = pd.DataFrame(index=table.index)
+        labels["model"] = as_text(table[model_col]) if model_col is not None else None
+        labels["date"] = as_text(table[date_col]) if date_col is not None else None
+        labels = labels.fillna({"model": "General", "date": "Recent"})
+
+        prices = []
+        for price_col in price_cols:
+            cells = as_text(table[price_col])
+            value = extract_number(cells)
+            # Check if cents
+            cents = cells.str.contains("¢|cent", case=False, regex=True).fillna(False)
+            prices.append(labels.assign(value=value.where(~cents.astype(bool), value / 100)))
+
+        df = pd.concat(prices, ignore_index=True).dropna(subset=["value"])
+        df["metric"] = "price_per_1k_tokens"
+        df["unit"] = "usd"
+        return df[["metric", "value", "unit", "model", "date"]].to_dict("records")
 
     def _extract_model_efficiency(self) -> Optional[pd.DataFrame]:
         """Extract model efficiency and performance data."""
@@ -326,12 +350,7 @@ class NVIDIATokenLoader(BaseDataLoader):
                 "benchmark",
             ]
 
-            efficiency_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                efficiency_pages.extend(pages)
-
-            efficiency_pages = sorted(set(efficiency_pages))[:10]
+            efficiency_pages = self.pages_with_keywords(keywords)[:10]
 
             if not efficiency_pages:
                 return None
@@ -353,10 +372,11 @@ class NVIDIATokenLoader(BaseDataLoader):
             ]
 
             for page in efficiency_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(tuple(models)).found_set(text)
                 for model in models:
-                    if model.lower() in text.lower():
+                    if model in mentioned:
                         # Extract metrics for this model
                         metrics = self._extract_model_metrics(text, model)
                         if metrics:
@@ -364,7 +384,7 @@ class NVIDIATokenLoader(BaseDataLoader):
 
             # Look for efficiency tables
             for page in efficiency_pages[:5]:
-                tables = self.extractor.extract_tables(page_range=(page, page))
+                tables = self.page_tables(page)
                 for table in tables:
                     if table.empty:
                         continue
@@ -410,7 +430,7 @@ class NVIDIATokenLoader(BaseDataLoader):
 
         found_metrics = False
         for metric, pattern in patterns.items():
-            matches = re.findall(pattern, context, re.IGNORECASE)
+            matches = self.findall(pattern, context, re.IGNORECASE)
             if matches:
                 value = float(matches[0])
                 if metric == "parameters":
@@ -422,51 +442,13 @@ class NVIDIATokenLoader(BaseDataLoader):
 
     def _process_efficiency_table(self, table: pd.DataFrame) -> List[Dict]:
         """Process table containing efficiency data."""
-        results = []
-
-        # Identify model column
-        model_col = None
-        for col in table.columns:
-            sample_vals = table[col].astype(str).str.lower()
-            if any("gpt" in val or "claude" in val or "gemini" in val for val in sample_vals):
-                model_col = col
-                break
-
-        if not model_col:
-            return results
-
-        # Map column names to metrics
-        metric_mappings = {
-            "parameters": ["param", "size"],
-            "tokens_per_second": ["token", "throughput", "speed"],
-            "quality_score": ["quality", "accuracy", "score"],
-            "efficiency_ratio": ["efficiency", "ratio"],
-            "latency_ms": ["latency", "response"],
-        }
-
-        # Extract data
-        for _, row in table.iterrows():
-            model_name = str(row[model_col])
-            result = {"model_name": model_name}
-
-            for col in table.columns:
-                if col == model_col:
-                    continue
+        table = normalize_table(table)
+        model_col = find_label_column(table, ["gpt", "claude", "gemini"])
+        if model_col is None:
+            return []
 
-                col_lower = str(col).lower()
-                for metric, keywords in metric_mappings.items():
-                    if any(keyword in col_lower for keyword in keywords):
-                        try:
-                            value_str = str(row[col])
-                            value = float(re.search(r"(\d+(?:\.\d+)?)", value_str).group(1))
-                            result[metric] = value
-                        except:
-                            continue
-
-            if len(result) > 1:  # Has more than just model name
-                results.append(result)
-
-        return results
+        df = pivot_columns(table, model_col, "model_name", EFFICIENCY_COLUMNS, parse="loose")
+        return df.to_dict("records")
 
     def _extract_infrastructure_costs(self) -> Optional[pd.DataFrame]:
         """Extract infrastructure and compute cost data."""
@@ -486,12 +468,7 @@ class NVIDIATokenLoader(BaseDataLoader):
                 "energy",
             ]
 
-            cost_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                cost_pages.extend(pages)
-
-            cost_pages = sorted(set(cost_pages))[:10]
+            cost_pages = self.pages_with_keywords(keywords)[:10]
 
             if not cost_pages:
                 return None
@@ -500,7 +477,7 @@ class NVIDIATokenLoader(BaseDataLoader):
 
             # Extract cost metrics
             for page in cost_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
                 # Extract numeric cost data
                 numeric_data = self.extractor.extract_numeric_data(
@@ -544,7 +521,7 @@ class NVIDIATokenLoader(BaseDataLoader):
 
     def _extract_year_from_cost_context(self, text: str) -> int:
         """Extract year from cost context."""
-        year_matches = re.findall(r"20[2-3]\\d", text)
+        year_matches = YEAR_2020S.findall(text)
         if year_matches:
             return max(int(year) for year in year_matches)
         return 2024
@@ -584,12 +561,7 @@ class NVIDIATokenLoader(BaseDataLoader):
                 "fine-tuning",
             ]
 
-            optimization_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                optimization_pages.extend(pages)
-
-            optimization_pages = sorted(set(optimization_pages))[:10]
+            optimization_pages = self.pages_with_keywords(keywords)[:10]
 
             if not optimization_pages:
                 return None
@@ -612,10 +584,11 @@ class NVIDIATokenLoader(BaseDataLoader):
             ]
 
             for page in optimization_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(tuple(techniques)).found_set(text)
                 for technique in techniques:
-                    if technique.lower() in text.lower():
+                    if technique in mentioned:
                         # Extract metrics for this technique
                         patterns = [
                             rf"{technique}.*?(\d+(?:\.\d+)?)\s*%\s*(?:token\s*)?reduction",
@@ -625,7 +598,7 @@ class NVIDIATokenLoader(BaseDataLoader):
                         ]
 
                         for pattern in patterns:
-                            matches = re.findall(pattern, text, re.IGNORECASE)
+                            matches = self.findall(pattern, text, re.IGNORECASE)
                             if matches:
                                 value = float(matches[0])
                                 optimization_data.append(
@@ -682,19 +655,14 @@ class NVIDIATokenLoader(BaseDataLoader):
                 "latency",
             ]
 
-            compute_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                compute_pages.extend(pages)
-
-            compute_pages = sorted(set(compute_pages))[:10]
+            compute_pages = self.pages_with_keywords(keywords)[:10]
 
             if not compute_pages:
                 return None
 
             # Look for compute requirement tables
             for page in compute_pages[:5]:
-                tables = self.extractor.extract_tables(page_range=(page, page))
+                tables = self.page_tables(page)
 
                 for table in tables:
                     if table.empty:
@@ -726,57 +694,13 @@ class NVIDIATokenLoader(BaseDataLoader):
         """
         Process table containing compute requirements.
         """
-        # Identify use case column
-        use_case_col = None
-        for col in table.columns:
-            sample_vals = table[col].astype(str).str.lower()
-            if any(
-                val
-                for val in sample_vals
-                if any(use in val for use in ["chat", "code", "content", "translation"])
-            ):
-                use_case_col = col
-                break
-
-        if not use_case_col:
+        table = normalize_table(table)
+        use_case_col = find_label_column(table, ["chat", "code", "content", "translation"])
+        if use_case_col is None:
             return None
 
-        # Extract metrics
-        result_data = []
-        for _, row in table.iterrows():
-            use_case = str(row[use_case_col])
-            metrics = {"use_case": use_case}
-
-            for col in table.columns:
-                if col == use_case_col:
-                    continue
-
-                col_lower = str(col).lower()
-                value_str = str(row[col])
-
-                try:
-                    # Extract numeric value
-                    numeric_match = re.search(
-                        r"(\d+(?:,\d+)*(?:\.\d+)?)", value_str
-                    )
-                    if numeric_match:
-                        value = float(numeric_match.group(1).replace(",", ""))
-
-                        if "token" in col_lower:
-                            metrics["avg_tokens_per_request"] = value
-                        elif "gpu" in col_lower:
-                            metrics["gpu_hours_required"] = value
-                        elif "cost" in col_lower:
-                            metrics["cost_per_million_requests"] = value
-                        elif "latency" in col_lower:
-                            metrics["latency_ms"] = value
-                except:
-                    continue
-
-            if len(metrics) > 1:
-                result_data.append(metrics)
-
-        return pd.DataFrame(result_data) if result_data else None
+        df = pivot_columns(table, use_case_col, "use_case", COMPUTE_COLUMNS, parse="loose")
+        return df if not df.empty else None
 
     def _extract_compute_from_text(self, pages: List[int]) -> List[Dict]:
         """Extract compute requirements from text."""
@@ -792,10 +716,11 @@ class NVIDIATokenLoader(BaseDataLoader):
         ]
 
         for page in pages[:5]:
-            text = self.extractor.extract_text_from_page(page)
+            text = self.page_text(page)
 
+            mentioned = get_scanner(tuple(use_cases)).found_set(text)
             for use_case in use_cases:
-                if use_case.lower() in text.lower():
+                if use_case in mentioned:
                     # Extract metrics for this use case
                     metrics = {"use_case": use_case}
 
@@ -840,12 +765,7 @@ class NVIDIATokenLoader(BaseDataLoader):
                 "compliance",
             ]
 
-            barrier_pages = []
-            for keyword in keywords:
-                pages = self.extractor.find_pages_with_keyword(keyword)
-                barrier_pages.extend(pages)
-
-            barrier_pages = sorted(set(barrier_pages))[:10]
+            barrier_pages = self.pages_with_keywords(keywords)[:10]
 
             if not barrier_pages:
                 return None
@@ -866,10 +786,11 @@ class NVIDIATokenLoader(BaseDataLoader):
             ]
 
             for page in barrier_pages[:5]:
-                text = self.extractor.extract_text_from_page(page)
+                text = self.page_text(page)
 
+                mentioned = get_scanner(tuple(barriers)).found_set(text)
                 for barrier in barriers:
-                    if barrier.lower() in text.lower():
+                    if barrier in mentioned:
                         # Extract cost data for this barrier
                         patterns = [
                             rf"{barrier}.*?\\$(\d+(?:,\d+)*(?:\.\d+)?)\s*(thousand|million|K|M)?",
@@ -878,7 +799,7 @@ class NVIDIATokenLoader(BaseDataLoader):
                         ]
 
                         for pattern in patterns:
-                            matches = re.findall(pattern, text, re.IGNORECASE)
+                            matches = self.findall(pattern, text, re.IGNORECASE)
                             if matches:
                                 barrier_data.append(self._parse_barrier_match(matches[0], barrier))
                                 break
@@ -9,16 +9,67 @@ import pandas as pd
 
 from config.settings import settings
 
+from ..extractors.entity_scanner import get_scanner
 from ..extractors.pdf_extractor import PDFExtractor
+from ..extractors.table_normalization import (
+    as_text,
+    find_label_column,
+    normalize_table,
+    pivot_columns,
+    to_numeric,
+)
 from ..models.governance import GovernanceMetrics, PolicyFramework
+from ..models.schemas import PERCENT_RULE, ColumnRule, DatasetSchema
 from .base import BaseDataLoader, DataSource
 
 logger = logging.getLogger(__name__)
 
+DATASET_SCHEMAS = {
+    "national_ai_strategies": DatasetSchema(
+        "national_ai_strategies",
+        model=PolicyFramework,
+        fields={"country": "country_or_region", "strategy_launch_year": "implementation_year"},
+    ),
+    "public_investment": DatasetSchema(
+        "public_investment",
+        rules={
+            "year": ColumnRule("int", required=True, low=2015, high=2030),
+            "us_share_percent": PERCENT_RULE,
+            "china_share_percent": PERCENT_RULE,
+            "eu_share_percent": PERCENT_RULE,
+            "focus_on_safety_percent": PERCENT_RULE,
+        },
+    ),
+}
+
+# Table metrics by header keywords; the first matching metric wins
+STRATEGY_COLUMNS = [
+    ("strategy_launch_year", ["year"]),
+    ("public_funding_billions", ["fund", "invest"]),
+    ("strategy_maturity_score", ["score", "maturity"]),
+]
+
+COOPERATION_COLUMNS = [
+    ("member_countries", ["member", "countr"]),
+    ("budget_millions", ["budget", "fund"]),
+    ("effectiveness_score", ["score", "effectiveness"]),
+    ("focus_area", ["focus", "area"]),
+]
+
+INVESTMENT_COLUMNS = [
+    ("global_public_investment_billions", ["global", "total"]),
+    ("us_share_percent", ["us", "united states"]),
+    ("china_share_percent", ["china"]),
+    ("eu_share_percent", ["eu", "europe"]),
+    ("focus_on_safety_percent", ["safety", "security"]),
+]
+
 
 class OECDLoader(BaseDataLoader):
     """Loader for OECD AI Policy Observatory data with real PDF extraction."""
 
+    schemas = DATASET_SCHEMAS
+
     def __init__(self, policy_file: Optional[Path] = None, adoption_file: Optional[Path] = None):
         """Initialize with OECD report file paths."""
         if policy_file is None:
@@ -58,6 +109,10 @@ class OECDLoader(BaseDataLoader):
             except Exception as e:
                 logger.error(f"Failed to initialize PDF extractor for adoption file: {e}")
 
+    def source_files(self) -> List[Path]:
+        """List the policy and adoption report files."""
+        return [path for path in (self.source.file_path, self.adoption_file) if path]
+
     def load(self) -> Dict[str, pd.DataFrame]:
         """Load all datasets from OECD reports using actual PDF extraction."""
         logger.info(f"Loading data from {self.source.name}")
@@ -139,12 +194,7 @@ class OECDLoader(BaseDataLoader):
                     "plan",
                 ]
 
-                strategy_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    strategy_pages.extend(pages)
-
-                strategy_pages = sorted(set(strategy_pages))[:15]
+                strategy_pages = extractor.find_pages_with_keywords(keywords)[:15]
 
                 if not strategy_pages:
                     continue
@@ -176,8 +226,9 @@ class OECDLoader(BaseDataLoader):
                 for page in strategy_pages[:10]:
                     text = extractor.extract_text_from_page(page)
 
+                    mentioned = get_scanner(tuple(countries)).found_set(text)
                     for country in countries:
-                        if country.lower() in text.lower():
+                        if country in mentioned:
                             # Extract strategy information
                             strategy_info = self._extract_country_strategy(text, country)
                             if strategy_info:
@@ -280,51 +331,20 @@ class OECDLoader(BaseDataLoader):
 
     def _process_strategy_table(self, table: pd.DataFrame) -> List[Dict]:
         """Process table containing strategy information."""
-        results = []
-
-        # Identify country column
-        country_col = None
-        for col in table.columns:
-            sample_vals = table[col].astype(str).str.lower()
-            if any("united" in val or "china" in val or "germany" in val for val in sample_vals):
-                country_col = col
-                break
-
-        if not country_col:
-            return results
-
-        # Extract data for each country
-        for _, row in table.iterrows():
-            country = str(row[country_col]).strip()
-            if not country or country.lower() == "nan":
-                continue
-
-            result = {"country": country}
-
-            for col in table.columns:
-                if col == country_col:
-                    continue
-
-                col_lower = str(col).lower()
-                value_str = str(row[col])
-
-                try:
-                    if "year" in col_lower:
-                        result["strategy_launch_year"] = int(float(value_str))
-                    elif "fund" in col_lower or "invest" in col_lower:
-                        # Extract numeric value
-                        numeric_match = re.search(r"(\d+(?:\.\d+)?)", value_str)
-                        if numeric_match:
-                            result["public_funding_billions"] = float(numeric_match.group(1))
-                    elif "score" in col_lower or "maturity" in col_lower:
-                        result["strategy_maturity_score"] = float(value_str)
-                except ValueError:
-                    continue
-
-            if len(result) > 1:
-                results.append(result)
-
-        return results
+        table = normalize_table(table)
+        country_col = find_label_column(table, ["united", "china", "germany"])
+        if country_col is None:
+            return []
+
+        df = pivot_columns(
+            table,
+            country_col,
+            "country",
+            STRATEGY_COLUMNS,
+            parse={"public_funding_billions": "loose"},
+            integers=["strategy_launch_year"],
+        )
+        return df.to_dict("records")
 
     def _extract_policy_instruments(self) -> Optional[pd.DataFrame]:
         """Extract AI policy instruments data."""
@@ -346,12 +366,7 @@ class OECDLoader(BaseDataLoader):
                     "regulatory",
                 ]
 
-                policy_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    policy_pages.extend(pages)
-
-                policy_pages = sorted(set(policy_pages))[:10]
+                policy_pages = extractor.find_pages_with_keywords(keywords)[:10]
 
                 if not policy_pages:
                     continue
@@ -376,8 +391,9 @@ class OECDLoader(BaseDataLoader):
                 for page in policy_pages[:5]:
                     text = extractor.extract_text_from_page(page)
 
+                    mentioned = get_scanner(tuple(instruments)).found_set(text)
                     for instrument in instruments:
-                        if instrument.lower() in text.lower():
+                        if instrument in mentioned:
                             # Extract instrument metrics
                             metrics = self._extract_instrument_metrics(text, instrument)
                             if metrics:
@@ -470,12 +486,7 @@ class OECDLoader(BaseDataLoader):
                     "human",
                 ]
 
-                principles_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    principles_pages.extend(pages)
-
-                principles_pages = sorted(set(principles_pages))[:10]
+                principles_pages = extractor.find_pages_with_keywords(keywords)[:10]
 
                 if not principles_pages:
                     continue
@@ -592,12 +603,7 @@ class OECDLoader(BaseDataLoader):
                     "law",
                 ]
 
-                regulatory_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    regulatory_pages.extend(pages)
-
-                regulatory_pages = sorted(set(regulatory_pages))[:10]
+                regulatory_pages = extractor.find_pages_with_keywords(keywords)[:10]
 
                 if not regulatory_pages:
                     continue
@@ -719,12 +725,7 @@ class OECDLoader(BaseDataLoader):
                     "initiative",
                 ]
 
-                cooperation_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    cooperation_pages.extend(pages)
-
-                cooperation_pages = sorted(set(cooperation_pages))[:10]
+                cooperation_pages = extractor.find_pages_with_keywords(keywords)[:10]
 
                 if not cooperation_pages:
                     continue
@@ -758,8 +759,9 @@ class OECDLoader(BaseDataLoader):
                             cooperation_data.extend(processed)
 
                     # Also extract from text
+                    mentioned = get_scanner(tuple(initiatives)).found_set(text)
                     for initiative in initiatives:
-                        if initiative.lower() in text.lower():
+                        if initiative in mentioned:
                             info = self._extract_initiative_info(text, initiative)
                             if info:
                                 cooperation_data.append(info)
@@ -837,50 +839,20 @@ class OECDLoader(BaseDataLoader):
 
     def _process_cooperation_table(self, table: pd.DataFrame) -> List[Dict]:
         """Process table containing cooperation initiative data."""
-        results = []
-
-        # Identify initiative column
-        init_col = None
-        for col in table.columns:
-            sample_vals = table[col].astype(str).str.lower()
-            if any("gpai" in val or "oecd" in val or "unesco" in val for val in sample_vals):
-                init_col = col
-                break
-
-        if not init_col:
-            return results
-
-        # Extract data
-        for _, row in table.iterrows():
-            initiative = str(row[init_col]).strip()
-            if not initiative or initiative.lower() == "nan":
-                continue
-
-            result = {"initiative": initiative}
-
-            for col in table.columns:
-                if col == init_col:
-                    continue
-
-                col_lower = str(col).lower()
-                value_str = str(row[col])
-
-                try:
-                    if "member" in col_lower or "countr" in col_lower:
-                        result["member_countries"] = int(float(value_str))
-                    elif "budget" in col_lower or "fund" in col_lower:
-                        result["budget_millions"] = float(value_str)
-                    elif "score" in col_lower or "effectiveness" in col_lower:
-                        result["effectiveness_score"] = float(value_str)
-                    elif "focus" in col_lower or "area" in col_lower:
-                        result["focus_area"] = value_str
-                except ValueError:
-                    continue
-
-            if len(result) > 1:
-                results.append(result)
-
-        return results
+        table = normalize_table(table)
+        init_col = find_label_column(table, ["gpai", "oecd", "unesco"])
+        if init_col is None:
+            return []
+
+        df = pivot_columns(
+            table,
+            init_col,
+            "initiative",
+            COOPERATION_COLUMNS,
+            parse={"focus_area": "text"},
+            integers=["member_countries"],
+        )
+        return df.to_dict("records")
 
     def _extract_skills_initiatives(self) -> Optional[pd.DataFrame]:
         """Extract AI skills and education initiatives."""
@@ -902,12 +874,7 @@ class OECDLoader(BaseDataLoader):
                     "curriculum",
                 ]
 
-                skills_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    skills_pages.extend(pages)
-
-                skills_pages = sorted(set(skills_pages))[:10]
+                skills_pages = extractor.find_pages_with_keywords(keywords)[:10]
 
                 if not skills_pages:
                     continue
@@ -934,8 +901,9 @@ class OECDLoader(BaseDataLoader):
                 for page in skills_pages[:5]:
                     text = extractor.extract_text_from_page(page)
 
+                    mentioned = get_scanner(tuple(countries)).found_set(text)
                     for country in countries:
-                        if country.lower() in text.lower():
+                        if country in mentioned:
                             # Extract skills initiative data
                             skills_info = self._extract_country_skills(text, country)
                             if skills_info:
@@ -1038,12 +1006,7 @@ class OECDLoader(BaseDataLoader):
                     "public",
                 ]
 
-                investment_pages = []
-                for keyword in keywords:
-                    pages = extractor.find_pages_with_keyword(keyword)
-                    investment_pages.extend(pages)
-
-                investment_pages = sorted(set(investment_pages))[:10]
+                investment_pages = extractor.find_pages_with_keywords(keywords)[:10]
 
                 if not investment_pages:
                     continue
@@ -1118,56 +1081,21 @@ class OECDLoader(BaseDataLoader):
 
     def _process_investment_table(self, table: pd.DataFrame) -> List[Dict]:
         """Process table containing investment data."""
-        results = []
-
+        table = normalize_table(table)
         # Identify year column
         year_col = None
         for col in table.columns:
-            sample_vals = table[col].astype(str)
-            if sample_vals.str.contains(r"20[1-3]\\d").sum() > 0:
+            if as_text(table[col]).str.contains(r"20[1-3]\d", regex=True).any():
                 year_col = col
                 break
 
-        if not year_col:
-            return results
-
-        # Extract investment data
-        for _, row in table.iterrows():
-            try:
-                year = int(float(str(row[year_col])))
-                if year < 2015 or year > 2030:
-                    continue
-
-                result = {"year": year}
-
-                for col in table.columns:
-                    if col == year_col:
-                        continue
-
-                    col_lower = str(col).lower()
-                    value_str = str(row[col])
-
-                    try:
-                        if "global" in col_lower or "total" in col_lower:
-                            result["global_public_investment_billions"] = float(value_str)
-                        elif "us" in col_lower or "united states" in col_lower:
-                            result["us_share_percent"] = float(value_str)
-                        elif "china" in col_lower:
-                            result["china_share_percent"] = float(value_str)
-                        elif "eu" in col_lower or "europe" in col_lower:
-                            result["eu_share_percent"] = float(value_str)
-                        elif "safety" in col_lower or "security" in col_lower:
-                            result["focus_on_safety_percent"] = float(value_str)
-                    except ValueError:
-                        continue
-
-                if len(result) > 1:
-                    results.append(result)
-
-            except ValueError:
-                continue
+        if year_col is None:
+            return []
 
-        return results
+        df = pivot_columns(table, year_col, "year", INVESTMENT_COLUMNS)
+        df = df.assign(year=to_numeric(df["year"]))
+        df = df[df["year"].between(2015, 2030)].astype({"year": int})
+        return df.to_dict("records")
 
     def _extract_regional_shares(self, text: str, year: int) -> Optional[Dict]:
         """Extract regional investment shares for a given year."""
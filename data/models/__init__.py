@@ -3,6 +3,7 @@
 from .adoption import AdoptionMetrics, GeographicAdoption, SectorAdoption
 from .economics import EconomicImpact, ROIMetrics, TokenEconomics
 from .governance import GovernanceMetrics, PolicyFramework
+from .schemas import ColumnRule, DatasetSchema
 from .workforce import ProductivityMetrics, SkillGaps, WorkforceImpact
 
 __all__ = [
@@ -17,4 +18,6 @@ __all__ = [
     "ProductivityMetrics",
     "GovernanceMetrics",
     "PolicyFramework",
+    "ColumnRule",
+    "DatasetSchema",
 ]
@@ -0,0 +1,240 @@
+"""Typed, compact dataset schemas.
+
+Loader datasets carry label columns (country, sector, metric, source,
+category, risk_level, ...) as strings repeated on every row, and numbers as
+float64/int64. Each worker process holds them and every view render
+serializes them. A ``DatasetSchema`` declares the dtypes of one dataset so
+they can be enforced once, at load time:
+
+- label columns become pandas categories, with a fixed category list where
+  the model restricts values (``pattern="^(Low|Medium|High)$"``);
+- integers are downcast to the narrowest type, floats to
+  ``settings.DATASET_FLOAT_DTYPE``.
+
+Bounds, allowed values and required fields are read from the pydantic models
+in this package, so they are declared once. Validation runs column-wise over
+the whole frame instead of instantiating a model per row.
+"""
+
+import logging
+import re
+import typing
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Mapping, Optional, Tuple, Type
+
+import pandas as pd
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Label columns that repeat heavily across the loaders' datasets
+CATEGORY_COLUMNS = frozenset(
+    {
+        "adoption_stage",
+        "category",
+        "country",
+        "firm_size",
+        "function",
+        "impact_type",
+        "industry",
+        "location",
+        "maturity_level",
+        "methodology",
+        "metric",
+        "model",
+        "paper_source",
+        "period",
+        "policy_type",
+        "region",
+        "risk_level",
+        "scenario",
+        "sector",
+        "source",
+        "technology",
+        "time_period",
+        "timeframe",
+        "unit",
+    }
+)
+
+# A pydantic pattern listing the allowed values: ^(Low|Medium|High)$
+_CHOICES_PATTERN = re.compile(r"^\^\(([^()]*)\)\$$")
+
+_KINDS = {int: "int", float: "float", str: "str", bool: "bool"}
+
+
+@dataclass(frozen=True)
+class ColumnRule:
+    """Target dtype and checks of one dataset column."""
+
+    kind: str  # "int", "float", "str" or "bool"
+    required: bool = False
+    low: Optional[float] = None
+    high: Optional[float] = None
+    choices: Optional[Tuple[str, ...]] = None
+
+
+# A share in percent, the most common numeric column
+PERCENT_RULE = ColumnRule("float", low=0, high=100)
+
+
+def _annotation_kind(annotation) -> Optional[str]:
+    """Get the column kind of a model field annotation, unwrapping Optional."""
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else None
+    return _KINDS.get(annotation)
+
+
+def rules_from_model(
+    model: Type[BaseModel], fields: Optional[Mapping[str, str]] = None
+) -> Dict[str, ColumnRule]:
+    """Derive column rules from a pydantic model's fields.
+
+    Args:
+        model: Model whose fields describe the dataset rows
+        fields: Dataset column to model field, for columns named differently
+
+    Returns:
+        Mapping of dataset column to rule; list-valued fields are skipped
+    """
+    columns = {field_name: column for column, field_name in (fields or {}).items()}
+    rules = {}
+    for name, info in model.model_fields.items():
+        kind = _annotation_kind(info.annotation)
+        if kind is None:
+            continue
+        low = high = choices = None
+        for constraint in info.metadata:
+            low = getattr(constraint, "ge", low)
+            high = getattr(constraint, "le", high)
+            pattern = getattr(constraint, "pattern", None)
+            match = _CHOICES_PATTERN.match(pattern) if pattern else None
+            if match:
+                choices = tuple(match.group(1).split("|"))
+        rules[columns.get(name, name)] = ColumnRule(kind, info.is_required(), low, high, choices)
+    return rules
+
+
+def _narrow_integers(numbers: pd.Series) -> pd.Series:
+    if numbers.isna().any():
+        numbers = numbers.astype("Int64")
+    return pd.to_numeric(numbers, downcast="integer")
+
+
+@dataclass(frozen=True)
+class DatasetSchema:
+    """Declared dtypes and checks of one loader dataset.
+
+    Columns without a rule keep their values: floats are narrowed, integers
+    downcast, and known label columns (``CATEGORY_COLUMNS`` plus
+    ``categories``) become categories.
+    """
+
+    name: str
+    model: Optional[Type[BaseModel]] = None
+    fields: Mapping[str, str] = field(default_factory=dict)
+    rules: Mapping[str, ColumnRule] = field(default_factory=dict)
+    categories: Tuple[str, ...] = ()
+
+    @cached_property
+    def column_rules(self) -> Dict[str, ColumnRule]:
+        """Rules from the model, overridden by the explicitly declared ones."""
+        rules = rules_from_model(self.model, self.fields) if self.model else {}
+        rules.update(self.rules)
+        return rules
+
+    def check(self, df: pd.DataFrame) -> Tuple[pd.Series, Dict[str, int]]:
+        """Validate every row at once.
+
+        Only columns present in ``df`` are checked: datasets often carry a
+        subset of their model's fields.
+
+        Returns:
+            Mask of invalid rows, and the number of violations per column
+        """
+        invalid = pd.Series(False, index=df.index)
+        violations = {}
+        for column, rule in self.column_rules.items():
+            if column not in df.columns:
+                continue
+            values = df[column]
+            bad = values.isna() if rule.required else pd.Series(False, index=df.index)
+            if rule.kind in ("int", "float"):
+                numbers = pd.to_numeric(values, errors="coerce")
+                bad |= values.notna() & numbers.isna()
+                if rule.low is not None:
+                    bad |= numbers < rule.low
+                if rule.high is not None:
+                    bad |= numbers > rule.high
+            if rule.choices:
+                bad |= values.notna() & ~values.isin(rule.choices)
+            count = int(bad.sum())
+            if count:
+                violations[column] = count
+                invalid |= bad
+        return invalid, violations
+
+    def enforce(self, df: pd.DataFrame, float_dtype: str = "float32") -> pd.DataFrame:
+        """Cast columns to their declared compact dtypes.
+
+        Values that cannot be represented (text in a numeric column, a value
+        outside a fixed category list) become missing; ``check`` reports them.
+        """
+        out = df.copy()
+        rules = self.column_rules
+        for column in out.columns:
+            series = out[column]
+            rule = rules.get(column)
+            if isinstance(series.dtype, pd.CategoricalDtype) and not (rule and rule.choices):
+                continue
+            kind = rule.kind if rule else None
+
+            if kind in ("int", "float") or (kind is None and pd.api.types.is_float_dtype(series)):
+                numbers = pd.to_numeric(series, errors="coerce")
+                whole = numbers.dropna()
+                if kind == "int" and (whole == whole.round()).all():
+                    out[column] = _narrow_integers(numbers)
+                else:
+                    out[column] = numbers.astype(float_dtype)
+            elif kind is None and pd.api.types.is_integer_dtype(series):
+                out[column] = _narrow_integers(series)
+            elif rule is not None and rule.choices:
+                out[column] = series.astype(pd.CategoricalDtype(list(rule.choices)))
+            elif column in CATEGORY_COLUMNS or column in self.categories:
+                if not pd.api.types.is_bool_dtype(series):
+                    out[column] = series.astype("category")
+        return out
+
+    def apply(
+        self, df: pd.DataFrame, float_dtype: str = "float32", drop_invalid: bool = False
+    ) -> pd.DataFrame:
+        """Validate a dataset in bulk, then enforce its dtypes.
+
+        Args:
+            df: Dataset as returned by a loader
+            float_dtype: Dtype of float columns
+            drop_invalid: Drop rows failing a check instead of only logging them
+
+        Returns:
+            The typed dataset
+        """
+        invalid, violations = self.check(df)
+        if violations:
+            logger.warning(
+                f"Dataset '{self.name}': {int(invalid.sum())} of {len(df)} rows "
+                f"fail schema checks {violations}"
+            )
+            if drop_invalid:
+                df = df[~invalid]
+        return self.enforce(df, float_dtype)
+
+
+def memory_usage(datasets: Mapping[str, pd.DataFrame]) -> Dict[str, int]:
+    """Get the in-memory size in bytes of each dataset, including strings."""
+    return {
+        name: int(df.memory_usage(index=True, deep=True).sum())
+        for name, df in datasets.items()
+        if df is not None
+    }
@@ -0,0 +1,368 @@
+"""Precomputed dataset snapshot bundles for fast application startup.
+
+A snapshot bundle is produced by running every data loader once and writing
+each resulting dataset to an uncompressed Arrow IPC file, together with a
+manifest that records the hash of every source PDF and the row count of every
+dataset. At startup the data manager opens the newest bundle and serves
+datasets from it, falling back to live PDF extraction only for sources whose
+files changed since the build.
+
+Dataset files are memory-mapped read-only, so the column buffers live in the
+OS page cache and are shared by every Dash/uvicorn worker on the host instead
+of being copied into each process. Conversion to pandas or NumPy is zero-copy
+for numeric columns without nulls; the resulting arrays are read-only.
+
+Bundles are versioned: each build is written to its own directory under the
+snapshot root and a ``LATEST`` pointer file is swapped atomically once the
+bundle is complete, so readers never observe a half-written bundle.
+
+Build a bundle from the command line with::
+
+    python -m data.snapshot build
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.settings import settings
+
+from .loaders.base import BaseDataLoader, DataSource
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 2
+MANIFEST_NAME = "manifest.json"
+LATEST_POINTER = "LATEST"
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    """Compute the SHA-256 digest of a file, reading it in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_fingerprint(path: Path) -> Dict[str, Any]:
+    """Describe a source file by size, modification time and content hash."""
+    stat = path.stat()
+    return {
+        "path": str(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": hash_file(path),
+    }
+
+
+def fingerprint_matches(fingerprint: Dict[str, Any]) -> bool:
+    """Check whether a source file still matches its recorded fingerprint.
+
+    Size and modification time are compared first so that unchanged files are
+    verified with a single ``stat`` call; the content hash is only recomputed
+    when the modification time moved but the size did not. Missing files are
+    treated as unchanged because live extraction could not read them either.
+    """
+    path = Path(fingerprint["path"])
+    if not path.exists():
+        logger.debug(f"Snapshot source file no longer present, keeping snapshot: {path}")
+        return True
+
+    stat = path.stat()
+    if stat.st_size != fingerprint["size"]:
+        return False
+    if stat.st_mtime_ns == fingerprint["mtime_ns"]:
+        return True
+    return hash_file(path) == fingerprint["sha256"]
+
+
+def _write_dataframe(df: pd.DataFrame, path: Path) -> None:
+    """Write a DataFrame to an Arrow IPC file, stringifying mixed-type object columns."""
+    df = df.copy()
+    df.columns = [str(col) for col in df.columns]
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        # Tables scraped from PDFs often mix numbers and text in one column
+        for col in df.columns:
+            if df[col].dtype == object:
+                df[col] = df[col].map(lambda v: v if v is None else str(v))
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+    # A single record batch keeps every column in one contiguous chunk, which
+    # is what allows zero-copy conversion on read
+    table = table.combine_chunks()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+class SnapshotBundle:
+    """Read-only view of a snapshot bundle on disk."""
+
+    def __init__(self, path: Path, manifest: Dict[str, Any]):
+        """Initialize from a bundle directory and its parsed manifest."""
+        self.path = Path(path)
+        self.manifest = manifest
+        self._current: Dict[str, bool] = {}
+        self._tables: Dict[Tuple[str, str], "pa.Table"] = {}
+
+    @classmethod
+    def open(cls, root: Optional[Path] = None) -> Optional["SnapshotBundle"]:
+        """Open the latest bundle under ``root``.
+
+        Returns:
+            The bundle, or None if no usable bundle exists
+        """
+        if not PYARROW_AVAILABLE:
+            logger.debug("pyarrow not installed, snapshot bundles disabled")
+            return None
+
+        root = Path(root or settings.SNAPSHOT_DIR)
+        pointer = root / LATEST_POINTER
+        if not pointer.exists():
+            return None
+
+        bundle_path = root / pointer.read_text().strip()
+        try:
+            with open(bundle_path / MANIFEST_NAME, "r") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read snapshot manifest in {bundle_path}: {e}")
+            return None
+
+        if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            logger.warning(
+                f"Ignoring snapshot {bundle_path.name}: format version "
+                f"{manifest.get('format_version')} != {SNAPSHOT_FORMAT_VERSION}"
+            )
+            return None
+
+        logger.info(f"Opened snapshot bundle {manifest.get('snapshot_id')}")
+        return cls(bundle_path, manifest)
+
+    @property
+    def snapshot_id(self) -> str:
+        """Identifier of the bundle build."""
+        return self.manifest.get("snapshot_id", self.path.name)
+
+    def list_sources(self) -> List[str]:
+        """List the sources captured in this bundle."""
+        return list(self.manifest.get("sources", {}).keys())
+
+    def has_source(self, source_name: str) -> bool:
+        """Check whether a source was captured in this bundle."""
+        return source_name in self.manifest.get("sources", {})
+
+    def is_source_current(self, source_name: str) -> bool:
+        """Check whether a source's files are unchanged since the bundle was built."""
+        if not self.has_source(source_name):
+            return False
+        if source_name not in self._current:
+            files = self.manifest["sources"][source_name].get("files", [])
+            self._current[source_name] = all(fingerprint_matches(fp) for fp in files)
+            if not self._current[source_name]:
+                logger.info(f"Source '{source_name}' changed since snapshot, using live extraction")
+        return self._current[source_name]
+
+    def source_entry(self, source_name: str) -> Dict[str, Any]:
+        """Get the manifest entry for a source."""
+        return self.manifest["sources"][source_name]
+
+    def list_datasets(self, source_name: str) -> List[str]:
+        """List dataset names captured for a source."""
+        return list(self.source_entry(source_name).get("datasets", {}).keys())
+
+    def read_table(self, source_name: str, dataset_name: str) -> "pa.Table":
+        """Get one dataset as an Arrow table backed by its memory-mapped file.
+
+        The mapping is opened once per bundle and reused by every later call.
+        """
+        key = (source_name, dataset_name)
+        table = self._tables.get(key)
+        if table is None:
+            entry = self.source_entry(source_name)["datasets"][dataset_name]
+            source = pa.memory_map(str(self.path / entry["file"]), "r")
+            table = pa.ipc.open_file(source).read_all()
+            self._tables[key] = table
+        return table
+
+    def read_dataset(self, source_name: str, dataset_name: str) -> pd.DataFrame:
+        """Get one dataset as a DataFrame sharing the memory-mapped buffers.
+
+        ``split_blocks`` stops pandas from consolidating columns into a new
+        2D block, which would copy every numeric column into process memory.
+        """
+        return self.read_table(source_name, dataset_name).to_pandas(split_blocks=True)
+
+    def read_array(self, source_name: str, dataset_name: str, column: str) -> np.ndarray:
+        """Get one dataset column as a NumPy array, zero-copy where the type allows."""
+        chunked = self.read_table(source_name, dataset_name).column(column)
+        if chunked.num_chunks == 1:
+            return chunked.chunk(0).to_numpy(zero_copy_only=False)
+        return chunked.to_numpy()
+
+
+class SnapshotLoader(BaseDataLoader):
+    """Data loader that serves one source's datasets from a snapshot bundle."""
+
+    def __init__(self, bundle: SnapshotBundle, source_name: str):
+        """Initialize loader for ``source_name`` within ``bundle``."""
+        entry = bundle.source_entry(source_name)
+        super().__init__(DataSource(**entry["source"]))
+        self.bundle = bundle
+        self.source_name = source_name
+
+    def load(self) -> Dict[str, pd.DataFrame]:
+        """Load every dataset for this source from the bundle."""
+        for name in self.list_datasets():
+            self.get_dataset(name)
+        return dict(self._cache)
+
+    def get_dataset(self, name: str) -> Optional[pd.DataFrame]:
+        """Get a dataset, reading it from the bundle on first access."""
+        if name not in self._cache:
+            if name not in self.bundle.list_datasets(self.source_name):
+                return None
+            self._cache[name] = self.bundle.read_dataset(self.source_name, name)
+        return self._cache[name]
+
+    def get_table(self, name: str) -> Optional["pa.Table"]:
+        """Get a dataset as a memory-mapped Arrow table."""
+        if name not in self.bundle.list_datasets(self.source_name):
+            return None
+        return self.bundle.read_table(self.source_name, name)
+
+    def get_array(self, name: str, column: str) -> Optional[np.ndarray]:
+        """Get one dataset column as a read-only NumPy view of the mapped file."""
+        if name not in self.bundle.list_datasets(self.source_name):
+            return None
+        return self.bundle.read_array(self.source_name, name, column)
+
+    def list_datasets(self) -> List[str]:
+        """List datasets from the manifest without reading any data."""
+        return self.bundle.list_datasets(self.source_name)
+
+    def validate(self, data: Dict[str, pd.DataFrame]) -> bool:
+        """Check row counts against the manifest."""
+        expected = self.bundle.source_entry(self.source_name)["datasets"]
+        for name, df in data.items():
+            rows = expected.get(name, {}).get("rows")
+            if rows is not None and len(df) != rows:
+                raise ValueError(
+                    f"Snapshot dataset '{name}' has {len(df)} rows, manifest records {rows}"
+                )
+        return True
+
+
+def build_snapshot(
+    loaders: Dict[str, BaseDataLoader], output_root: Optional[Path] = None
+) -> Path:
+    """Run every loader once and write a new snapshot bundle.
+
+    Sources whose loader fails are left out of the bundle, so the data manager
+    keeps using live extraction for them.
+
+    Args:
+        loaders: Mapping of source name to loader instance
+        output_root: Snapshot root directory (defaults to settings.SNAPSHOT_DIR)
+
+    Returns:
+        Path of the new bundle directory
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required to build snapshots. Run: pip install pyarrow")
+
+    output_root = Path(output_root or settings.SNAPSHOT_DIR)
+    snapshot_id = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+    bundle_dir = output_root / snapshot_id
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest: Dict[str, Any] = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "snapshot_id": snapshot_id,
+        "created_at": datetime.now().isoformat(),
+        "sources": {},
+    }
+
+    for source_name, loader in loaders.items():
+        logger.info(f"Snapshotting source '{source_name}'")
+        try:
+            datasets = loader.load_and_close()
+        except Exception as e:
+            logger.error(f"Skipping source '{source_name}' in snapshot: {e}")
+            continue
+
+        dataset_entries = {}
+        for dataset_name, df in datasets.items():
+            if df is None:
+                continue
+            relative_path = f"{source_name}/{dataset_name}.arrow"
+            _write_dataframe(df, bundle_dir / relative_path)
+            dataset_entries[dataset_name] = {
+                "file": relative_path,
+                "rows": len(df),
+                "columns": [str(col) for col in df.columns],
+            }
+
+        manifest["sources"][source_name] = {
+            "loader": type(loader).__name__,
+            "source": json.loads(loader.source.model_dump_json()),
+            "files": [file_fingerprint(p) for p in loader.source_files() if p.is_file()],
+            "datasets": dataset_entries,
+        }
+
+    with open(bundle_dir / MANIFEST_NAME, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    # Publish the bundle only once it is complete
+    pointer_tmp = output_root / f"{LATEST_POINTER}.tmp"
+    pointer_tmp.write_text(snapshot_id)
+    os.replace(pointer_tmp, output_root / LATEST_POINTER)
+
+    logger.info(
+        f"Wrote snapshot {snapshot_id} with {len(manifest['sources'])} sources to {bundle_dir}"
+    )
+    return bundle_dir
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point for building snapshot bundles."""
+    parser = argparse.ArgumentParser(description="Manage precomputed dataset snapshots")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="Run all loaders and write a new bundle")
+    build.add_argument("--output", type=Path, default=None, help="Snapshot root directory")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=settings.LOG_LEVEL, format=settings.LOG_FORMAT)
+
+    if args.command == "build":
+        from .data_manager_dash import DataManagerDash
+
+        manager = DataManagerDash(use_snapshot=False)
+        bundle_dir = build_snapshot(manager.loaders, args.output)
+        print(f"Snapshot written to {bundle_dir}")
+
+
+if __name__ == "__main__":
+    main()
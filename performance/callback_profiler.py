@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+"""Instrumentation layer for Dash callbacks.
+
+Wraps every callback registered on a Dash app, including those registered
+with the global ``dash.callback`` decorator by view modules, and records how
+long each one takes in ``performance.monitor`` under ``callback.<name>``.
+
+Detailed profiling is opt-in (``settings.CALLBACK_PROFILING``) and splits
+each call into phases recorded under ``callback_phase.<name>.<phase>``:
+
+- ``deserialize``: parsing the JSON request body
+- ``user``: the callback function itself (data access, layout building)
+- ``figure``: converting Plotly figures returned as outputs to dicts
+- ``serialize``: Dash response preparation and JSON encoding
+
+Request and response payload sizes are tracked per callback, and the
+slowest N callbacks are captured with a sampling profiler whose folded
+stacks can be loaded into flame graph tools.
+"""
+
+import inspect
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from dash import _callback
+from dash.exceptions import PreventUpdate
+
+from .monitor import get_metrics
+from .telemetry import CALLBACK_PREFIX
+
+logger = logging.getLogger(__name__)
+
+PHASE_PREFIX = "callback_phase."
+PHASES = ("deserialize", "user", "figure", "serialize")
+
+DISPATCH_PATH = "_dash-update-component"
+
+# How often the set of slowest callbacks to profile is recomputed
+_TARGET_REFRESH_SECONDS = 10.0
+
+try:
+    from plotly.basedatatypes import BaseFigure
+
+    PLOTLY_AVAILABLE = True
+except ImportError:
+    BaseFigure = None
+    PLOTLY_AVAILABLE = False
+
+
+@dataclass
+class PayloadStats:
+    """Request and response sizes of one callback."""
+
+    calls: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    max_response_bytes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict with per-call averages."""
+        calls = max(self.calls, 1)
+        return {
+            "calls": self.calls,
+            "avg_request_bytes": self.request_bytes / calls,
+            "avg_response_bytes": self.response_bytes / calls,
+            "max_response_bytes": self.max_response_bytes,
+        }
+
+
+class StackSampler:
+    """Sampling profiler for selected threads.
+
+    A single daemon thread periodically samples the stacks of the threads
+    being profiled and counts folded stacks. It sleeps while nothing is
+    being profiled.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """Initialize the sampler.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self._targets: Dict[int, Counter] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def start(self, thread_id: int) -> None:
+        """Start sampling a thread."""
+        with self._lock:
+            self._targets[thread_id] = Counter()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="callback-profiler", daemon=True
+                )
+                self._thread.start()
+        self._wakeup.set()
+
+    def stop(self, thread_id: int) -> Counter:
+        """Stop sampling a thread and return its folded stack counts."""
+        with self._lock:
+            return self._targets.pop(thread_id, Counter())
+
+    def _run(self) -> None:
+        while True:
+            if not self._targets:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            frames = sys._current_frames()
+            with self._lock:
+                for thread_id, counter in self._targets.items():
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        counter[_fold_stack(frame)] += 1
+            del frames
+            time.sleep(self.interval)
+
+
+def _fold_stack(frame) -> str:
+    """Fold a stack into the ``outer;...;inner`` flame graph format."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class CallbackInstrumentation:
+    """Wraps the callbacks of a Dash app with timing and profiling."""
+
+    def __init__(
+        self,
+        app,
+        detailed: bool = False,
+        profile_top_n: int = 0,
+        profile_dir: Optional[Path] = None,
+        sample_interval: float = 0.005,
+    ):
+        """Initialize the instrumentation.
+
+        Args:
+            app: Dash application
+            detailed: Record phase timings and payload sizes
+            profile_top_n: Profile the N slowest callbacks (detailed mode only)
+            profile_dir: Directory for folded stack files of captured profiles
+            sample_interval: Seconds between profiler samples
+        """
+        self.app = app
+        self.detailed = detailed
+        self.profile_top_n = profile_top_n if detailed else 0
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+
+        self._names: Dict[str, str] = {}
+        self._payloads: Dict[str, PayloadStats] = {}
+        self._profiles: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sampler = StackSampler(sample_interval) if self.profile_top_n else None
+        self._profile_targets: frozenset = frozenset()
+        self._targets_refreshed = 0.0
+
+    def install(self) -> None:
+        """Wrap registered callbacks and hook into request handling."""
+        self.wrap_callbacks()
+        self.app.server.before_request(self._before_request)
+
+    def wrap_callbacks(self) -> int:
+        """Wrap callbacks that are not instrumented yet.
+
+        Returns:
+            Number of newly wrapped callbacks
+        """
+        wrapped = 0
+        for callback_map in (self.app.callback_map, _callback.GLOBAL_CALLBACK_MAP):
+            for callback_id, entry in list(callback_map.items()):
+                if self._wrap_entry(callback_id, entry):
+                    wrapped += 1
+        if wrapped:
+            logger.debug(f"Instrumented {wrapped} Dash callbacks")
+        return wrapped
+
+    def _wrap_entry(self, callback_id: str, entry: Dict[str, Any]) -> bool:
+        """Replace a callback map entry with a timed wrapper."""
+        dispatch_func = entry.get("callback")
+        if dispatch_func is None or getattr(dispatch_func, "_instrumented", False):
+            return False
+        if entry.get("background") or inspect.iscoroutinefunction(dispatch_func):
+            return False
+
+        user_func = getattr(dispatch_func, "__wrapped__", dispatch_func)
+        name = getattr(user_func, "__name__", callback_id)
+        self._names[callback_id] = name
+        operation = f"{CALLBACK_PREFIX}{name}"
+
+        if self.detailed:
+            self._replace_user_func(dispatch_func, user_func, self._wrap_user_func(name, user_func))
+
+        metrics = get_metrics()
+        detailed = self.detailed
+
+        def instrumented(*args, **kwargs):
+            start_time = time.perf_counter_ns()
+            if detailed:
+                self._local.user_ns = 0
+            try:
+                response = dispatch_func(*args, **kwargs)
+            except PreventUpdate:
+                raise
+            except Exception as e:
+                metrics.record_error(operation, str(e))
+                raise
+            finally:
+                duration_ns = time.perf_counter_ns() - start_time
+                metrics.record_ns(operation, duration_ns)
+
+            if detailed:
+                self._record_dispatch(name, duration_ns, response)
+            return response
+
+        instrumented._instrumented = True
+        instrumented.__wrapped__ = user_func
+        entry["callback"] = instrumented
+        return True
+
+    def _wrap_user_func(self, name: str, user_func):
+        """Time the user function and figure conversion of one callback."""
+        metrics = get_metrics()
+        user_operation = f"{PHASE_PREFIX}{name}.user"
+        figure_operation = f"{PHASE_PREFIX}{name}.figure"
+
+        def timed_user_func(*args, **kwargs):
+            profiling = self._sampler is not None and name in self._get_profile_targets()
+            if profiling:
+                self._sampler.start(threading.get_ident())
+
+            start_time = time.perf_counter_ns()
+            try:
+                output_value = user_func(*args, **kwargs)
+            finally:
+                user_ns = time.perf_counter_ns() - start_time
+                if profiling:
+                    self._store_profile(name, self._sampler.stop(threading.get_ident()), user_ns)
+            metrics.record_ns(user_operation, user_ns)
+
+            figure_start = time.perf_counter_ns()
+            output_value = _build_figures(output_value)
+            figure_ns = time.perf_counter_ns() - figure_start
+            metrics.record_ns(figure_operation, figure_ns)
+
+            self._local.user_ns = user_ns + figure_ns
+            return output_value
+
+        return timed_user_func
+
+    @staticmethod
+    def _replace_user_func(dispatch_func, user_func, replacement) -> bool:
+        """Point Dash's dispatch wrapper at the timed user function.
+
+        Dash calls the user function through a closure variable of its
+        internal wrapper, so the closure cell is swapped in place.
+        """
+        code = getattr(dispatch_func, "__code__", None)
+        closure = getattr(dispatch_func, "__closure__", None)
+        if code is None or not closure or "func" not in code.co_freevars:
+            logger.debug(f"Cannot time phases of {user_func}; recording totals only")
+            return False
+
+        cell = closure[code.co_freevars.index("func")]
+        if cell.cell_contents is not user_func:
+            return False
+        cell.cell_contents = replacement
+        return True
+
+    def _record_dispatch(self, name: str, duration_ns: int, response: Any) -> None:
+        """Record the serialization phase and payload sizes of one call."""
+        user_ns = getattr(self._local, "user_ns", 0)
+        get_metrics().record_ns(f"{PHASE_PREFIX}{name}.serialize", max(duration_ns - user_ns, 0))
+
+        response_bytes = len(response) if isinstance(response, (str, bytes)) else 0
+        request_bytes = getattr(self._local, "request_bytes", 0)
+        self._local.request_bytes = 0
+        with self._lock:
+            stats = self._payloads.setdefault(name, PayloadStats())
+            stats.calls += 1
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            stats.max_response_bytes = max(stats.max_response_bytes, response_bytes)
+
+    def _before_request(self) -> None:
+        """Wrap late registrations and time request body parsing."""
+        from flask import request
+
+        if not request.path.endswith(DISPATCH_PATH):
+            return
+
+        self.wrap_callbacks()
+        if not self.detailed:
+            return
+
+        start_time = time.perf_counter_ns()
+        # Flask caches the parsed body, so Dash does not parse it again
+        body = request.get_json(silent=True) or {}
+        duration_ns = time.perf_counter_ns() - start_time
+
+        self._local.request_bytes = request.content_length or 0
+        name = self._names.get(body.get("output", ""))
+        if name:
+            get_metrics().record_ns(f"{PHASE_PREFIX}{name}.deserialize", duration_ns)
+
+    def _get_profile_targets(self) -> frozenset:
+        """Get the names of the slowest callbacks by p95 latency."""
+        now = time.monotonic()
+        if now - self._targets_refreshed < _TARGET_REFRESH_SECONDS:
+            return self._profile_targets
+
+        metrics = get_metrics()
+        p95 = {}
+        for name in set(self._names.values()):
+            stats = metrics.get_stats(f"{CALLBACK_PREFIX}{name}")
+            if stats.get("count"):
+                p95[name] = stats["p95"]
+
+        slowest = sorted(p95, key=p95.get, reverse=True)[: self.profile_top_n]
+        self._profile_targets = frozenset(slowest)
+        self._targets_refreshed = now
+        return self._profile_targets
+
+    def _store_profile(self, name: str, stacks: Counter, duration_ns: int) -> None:
+        """Keep the latest profile of a callback and write it to disk."""
+        if not stacks:
+            return
+
+        profile = {
+            "captured_at": time.time(),
+            "duration_ms": duration_ns / 1e6,
+            "samples": sum(stacks.values()),
+            "stacks": dict(stacks.most_common()),
+        }
+        with self._lock:
+            self._profiles[name] = profile
+
+        if self.profile_dir is not None:
+            try:
+                self.profile_dir.mkdir(parents=True, exist_ok=True)
+                lines = [f"{stack} {count}" for stack, count in stacks.most_common()]
+                (self.profile_dir / f"{name}.folded").write_text("\n".join(lines) + "\n")
+            except OSError as e:
+                logger.warning(f"Could not write profile for callback '{name}': {e}")
+
+    def get_payload_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get payload size statistics per callback."""
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in self._payloads.items()}
+
+    def get_profiles(self) -> Dict[str, Dict[str, Any]]:
+        """Get the latest sampling profile captured per callback."""
+        with self._lock:
+            return dict(self._profiles)
+
+
+def _build_figures(output_value: Any) -> Any:
+    """Convert Plotly figures returned as callback outputs to plain dicts.
+
+    Dash would do the same conversion while encoding the response; doing it
+    here lets figure building be timed separately from JSON encoding.
+    """
+    if not PLOTLY_AVAILABLE:
+        return output_value
+    if isinstance(output_value, BaseFigure):
+        return output_value.to_plotly_json()
+    if isinstance(output_value, (list, tuple)):
+        if any(isinstance(value, BaseFigure) for value in output_value):
+            return [
+                value.to_plotly_json() if isinstance(value, BaseFigure) else value
+                for value in output_value
+            ]
+    return output_value
+
+
+_instrumentation: Optional[CallbackInstrumentation] = None
+
+
+def instrument_callbacks(app, **kwargs) -> CallbackInstrumentation:
+    """Instrument every callback of a Dash app.
+
+    Call after the callbacks have been registered; callbacks registered
+    later are picked up on the next callback request.
+
+    Args:
+        app: Dash application
+        **kwargs: Options passed to ``CallbackInstrumentation``
+
+    Returns:
+        The installed instrumentation
+    """
+    global _instrumentation
+    _instrumentation = CallbackInstrumentation(app, **kwargs)
+    _instrumentation.install()
+    return _instrumentation
+
+
+def get_instrumentation() -> Optional[CallbackInstrumentation]:
+    """Get the installed callback instrumentation, if any."""
+    return _instrumentation
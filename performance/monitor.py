@@ -3,15 +3,164 @@
 import functools
 import json
 import logging
+import math
 import statistics
 import threading
 import time
-from collections import defaultdict, deque
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Histogram resolution: 2**SUB_BUCKET_BITS buckets per power of two (~3% error)
+SUB_BUCKET_BITS = 5
+# Durations are tracked up to 2**MAX_VALUE_BITS ns (~73 minutes)
+MAX_VALUE_BITS = 42
+
+# Bucket upper bounds in seconds for the Prometheus text export
+PROMETHEUS_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_NUM_LOCK_STRIPES = 16
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with fixed memory.
+
+    Durations in nanoseconds are counted in buckets whose width grows with
+    the value, so recording is O(1) and percentiles are O(buckets) no matter
+    how many measurements were taken. The histogram itself is not locked.
+    """
+
+    _sub_buckets = 1 << SUB_BUCKET_BITS
+    _max_value = (1 << MAX_VALUE_BITS) - 1
+    num_buckets = (MAX_VALUE_BITS - SUB_BUCKET_BITS + 1) << SUB_BUCKET_BITS
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts = [0] * self.num_buckets
+        self.count = 0
+        self.sum_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    @classmethod
+    def bucket_index(cls, value_ns: int) -> int:
+        """Get the bucket index for a duration in nanoseconds."""
+        value_ns = min(max(value_ns, 0), cls._max_value)
+        shift = max(value_ns.bit_length() - SUB_BUCKET_BITS - 1, 0)
+        return (shift << SUB_BUCKET_BITS) + (value_ns >> shift)
+
+    @classmethod
+    def bucket_range(cls, index: int) -> Tuple[int, int]:
+        """Get the ``(lower, upper)`` nanosecond bounds of a bucket (upper exclusive)."""
+        if index < 2 * cls._sub_buckets:
+            return index, index + 1
+        shift = (index >> SUB_BUCKET_BITS) - 1
+        lower = (index - (shift << SUB_BUCKET_BITS)) << shift
+        return lower, lower + (1 << shift)
+
+    def record_ns(self, value_ns: int) -> None:
+        """Record a duration in nanoseconds."""
+        self.counts[self.bucket_index(value_ns)] += 1
+        if self.count == 0 or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        self.count += 1
+        self.sum_ns += value_ns
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the measurements of another histogram to this one."""
+        if other.count == 0:
+            return
+        for i, count in enumerate(other.counts):
+            if count:
+                self.counts[i] += count
+        self.min_ns = other.min_ns if self.count == 0 else min(self.min_ns, other.min_ns)
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.sum_ns += other.sum_ns
+
+    def copy(self) -> "LatencyHistogram":
+        """Create an independent copy of this histogram."""
+        clone = LatencyHistogram()
+        clone.counts = list(self.counts)
+        clone.count = self.count
+        clone.sum_ns = self.sum_ns
+        clone.min_ns = self.min_ns
+        clone.max_ns = self.max_ns
+        return clone
+
+    def percentiles(self, percentiles: List[float]) -> List[int]:
+        """Get several percentiles in one pass over the buckets.
+
+        Each percentile is reported as the upper bound of the bucket holding
+        it, clamped to the exact minimum and maximum.
+
+        Args:
+            percentiles: Ascending percentiles between 0 and 100
+
+        Returns:
+            Nanosecond values in the same order
+        """
+        if self.count == 0:
+            return [0] * len(percentiles)
+
+        ranks = [max(1, math.ceil(self.count * p / 100)) for p in percentiles]
+        results = []
+        running = 0
+        rank_iter = iter(ranks)
+        rank = next(rank_iter)
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            running += count
+            while rank is not None and running >= rank:
+                upper = self.bucket_range(index)[1] - 1
+                results.append(min(max(upper, self.min_ns), self.max_ns))
+                rank = next(rank_iter, None)
+            if rank is None:
+                break
+        while len(results) < len(percentiles):
+            results.append(self.max_ns)
+        return results
+
+    def bucket_counts(self, bounds_ns: List[int]) -> List[int]:
+        """Re-bucket the measurements into coarser buckets.
+
+        Args:
+            bounds_ns: Ascending bucket upper bounds in nanoseconds
+
+        Returns:
+            One count per bound plus a final overflow bucket
+        """
+        counts = [0] * (len(bounds_ns) + 1)
+        position = 0
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            lower = self.bucket_range(index)[0]
+            while position < len(bounds_ns) and lower > bounds_ns[position]:
+                position += 1
+            counts[position] += count
+        return counts
+
+
+class _OperationState:
+    """Histograms, error count and recent slow samples of one operation."""
+
+    __slots__ = ("lock", "histogram", "sizes", "errors", "slow_samples")
+
+    def __init__(self, lock: threading.Lock, slow_window: int):
+        self.lock = lock
+        self.histogram = LatencyHistogram()
+        # Payload sizes in bytes; the histogram buckets any non-negative integer
+        self.sizes = LatencyHistogram()
+        self.errors = 0
+        self.slow_samples = deque(maxlen=slow_window)
+
 
 class PerformanceMetrics:
     """Collect and analyze performance metrics."""
@@ -20,11 +169,13 @@ class PerformanceMetrics:
         """Initialize metrics collector.
 
         Args:
-            window_size: Number of recent measurements to keep
+            window_size: Number of recent slow measurements to keep per operation
         """
         self.window_size = window_size
-        self._metrics = defaultdict(lambda: deque(maxlen=window_size))
-        self._errors = defaultdict(int)
+        self._operations: Dict[str, _OperationState] = {}
+        # Each operation is guarded by one of a few striped locks so that
+        # concurrent requests recording different operations rarely contend
+        self._stripes = [threading.Lock() for _ in range(_NUM_LOCK_STRIPES)]
         self._lock = threading.RLock()
         self._thresholds = {
             "data_load": 1.0,
@@ -36,6 +187,18 @@ class PerformanceMetrics:
             "api_call": 1.0,
         }
 
+    def _get_state(self, operation: str) -> _OperationState:
+        """Get or create the state of an operation."""
+        state = self._operations.get(operation)
+        if state is None:
+            with self._lock:
+                state = self._operations.get(operation)
+                if state is None:
+                    stripe = self._stripes[hash(operation) % len(self._stripes)]
+                    state = _OperationState(stripe, self.window_size)
+                    self._operations[operation] = state
+        return state
+
     def record(self, operation: str, duration: float, metadata: Optional[Dict] = None) -> None:
         """Record a performance measurement.
 
@@ -44,89 +207,148 @@ class PerformanceMetrics:
             duration: Duration in seconds
             metadata: Additional metadata
         """
-        with self._lock:
-            measurement = {
-                "duration": duration,
-                "timestamp": time.time(),
-                "metadata": metadata or {},
-            }
-            self._metrics[operation].append(measurement)
+        self.record_ns(operation, int(duration * 1e9), metadata)
 
-            # Check threshold
-            threshold = self._thresholds.get(operation, 1.0)
-            if duration > threshold:
-                logger.warning(
-                    f"Slow operation detected: {operation} took {duration:.3f}s "
-                    f"(threshold: {threshold}s)"
+    def record_ns(self, operation: str, duration_ns: int, metadata: Optional[Dict] = None) -> None:
+        """Record a performance measurement taken with ``time.perf_counter_ns``.
+
+        Args:
+            operation: Name of the operation
+            duration_ns: Duration in nanoseconds
+            metadata: Additional metadata, kept only for slow measurements
+        """
+        state = self._get_state(operation)
+        threshold = self._thresholds.get(operation, 1.0)
+        duration = duration_ns / 1e9
+        is_slow = duration > threshold
+
+        with state.lock:
+            state.histogram.record_ns(duration_ns)
+            if is_slow:
+                state.slow_samples.append(
+                    {"duration": duration, "timestamp": time.time(), "metadata": metadata or {}}
                 )
 
+        if is_slow:
+            logger.warning(
+                f"Slow operation detected: {operation} took {duration:.3f}s "
+                f"(threshold: {threshold}s)"
+            )
+
+    def record_size(self, operation: str, size_bytes: int) -> None:
+        """Record the payload size of an operation, such as an encoded response.
+
+        Args:
+            operation: Name of the operation
+            size_bytes: Size in bytes
+        """
+        state = self._get_state(operation)
+        with state.lock:
+            state.sizes.record_ns(size_bytes)
+
     def record_error(self, operation: str, error: str) -> None:
         """Record an error for an operation."""
-        with self._lock:
-            self._errors[operation] += 1
-            logger.error(f"Error in {operation}: {error}")
+        state = self._get_state(operation)
+        with state.lock:
+            state.errors += 1
+        logger.error(f"Error in {operation}: {error}")
+
+    def get_histogram_snapshot(self, operation: str) -> Optional[LatencyHistogram]:
+        """Get a copy of the latency histogram of an operation."""
+        state = self._operations.get(operation)
+        if state is None:
+            return None
+        with state.lock:
+            return state.histogram.copy()
 
     def get_stats(self, operation: str) -> Dict[str, Any]:
         """Get statistics for an operation.
 
+        Percentiles are accurate to the histogram resolution; count, min,
+        max and mean are exact.
+
         Returns:
-            Dict with min, max, mean, median, p95, p99
+            Dict with min, max, mean, median, p95, p99, plus mean_bytes,
+            p95_bytes and max_bytes if sizes were recorded
         """
-        with self._lock:
-            measurements = self._metrics.get(operation, [])
-            if not measurements:
-                return {}
+        state = self._operations.get(operation)
+        if state is None:
+            return {}
+
+        with state.lock:
+            histogram = state.histogram.copy()
+            sizes = state.sizes.copy() if state.sizes.count else None
+            errors = state.errors
+
+        if histogram.count == 0 and errors == 0 and sizes is None:
+            return {}
+
+        median, p95, p99 = histogram.percentiles([50, 95, 99])
+        stats = {
+            "count": histogram.count,
+            "min": histogram.min_ns / 1e9,
+            "max": histogram.max_ns / 1e9,
+            "mean": histogram.sum_ns / histogram.count / 1e9 if histogram.count else 0.0,
+            "median": median / 1e9,
+            "p95": p95 / 1e9,
+            "p99": p99 / 1e9,
+            "errors": errors,
+            "threshold": self._thresholds.get(operation, 1.0),
+        }
+        if sizes is not None:
+            stats["mean_bytes"] = sizes.sum_ns / sizes.count
+            stats["p95_bytes"] = sizes.percentiles([95])[0]
+            stats["max_bytes"] = sizes.max_ns
+        return stats
 
-            durations = [m["duration"] for m in measurements]
+    def get_histogram(self, operation: str, bounds: List[float]) -> List[int]:
+        """Count measurements of an operation per latency bucket.
 
-            return {
-                "count": len(durations),
-                "min": min(durations),
-                "max": max(durations),
-                "mean": statistics.mean(durations),
-                "median": statistics.median(durations),
-                "p95": self._percentile(durations, 95),
-                "p99": self._percentile(durations, 99),
-                "errors": self._errors.get(operation, 0),
-                "threshold": self._thresholds.get(operation, 1.0),
-            }
+        Args:
+            operation: Name of the operation
+            bounds: Ascending bucket upper bounds in seconds
+
+        Returns:
+            One count per bound plus a final overflow bucket
+        """
+        histogram = self.get_histogram_snapshot(operation)
+        if histogram is None:
+            return [0] * (len(bounds) + 1)
+        return histogram.bucket_counts([int(b * 1e9) for b in bounds])
+
+    def list_operations(self) -> List[str]:
+        """List operations that have recorded measurements."""
+        with self._lock:
+            return list(self._operations.keys())
 
     def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get statistics for all operations."""
-        with self._lock:
-            return {op: self.get_stats(op) for op in self._metrics.keys()}
+        return {op: self.get_stats(op) for op in self.list_operations()}
 
     def get_slow_operations(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get slowest recent operations."""
         with self._lock:
-            all_ops = []
-
-            for operation, measurements in self._metrics.items():
-                threshold = self._thresholds.get(operation, 1.0)
-                for m in measurements:
-                    if m["duration"] > threshold:
-                        all_ops.append(
-                            {
-                                "operation": operation,
-                                "duration": m["duration"],
-                                "timestamp": m["timestamp"],
-                                "threshold": threshold,
-                                "excess": m["duration"] - threshold,
-                            }
-                        )
-
-            # Sort by excess time over threshold
-            all_ops.sort(key=lambda x: x["excess"], reverse=True)
-            return all_ops[:limit]
-
-    def _percentile(self, data: List[float], percentile: float) -> float:
-        """Calculate percentile of data."""
-        if not data:
-            return 0
-
-        sorted_data = sorted(data)
-        index = int(len(sorted_data) * percentile / 100)
-        return sorted_data[min(index, len(sorted_data) - 1)]
+            states = list(self._operations.items())
+
+        all_ops = []
+        for operation, state in states:
+            threshold = self._thresholds.get(operation, 1.0)
+            with state.lock:
+                samples = list(state.slow_samples)
+            for m in samples:
+                all_ops.append(
+                    {
+                        "operation": operation,
+                        "duration": m["duration"],
+                        "timestamp": m["timestamp"],
+                        "threshold": threshold,
+                        "excess": m["duration"] - threshold,
+                    }
+                )
+
+        # Sort by excess time over threshold
+        all_ops.sort(key=lambda x: x["excess"], reverse=True)
+        return all_ops[:limit]
 
     def set_threshold(self, operation: str, threshold: float) -> None:
         """Set performance threshold for an operation."""
@@ -134,14 +356,65 @@ class PerformanceMetrics:
 
     def export_metrics(self) -> str:
         """Export metrics as JSON."""
-        with self._lock:
-            data = {
-                "timestamp": datetime.now().isoformat(),
-                "stats": self.get_all_stats(),
-                "slow_operations": self.get_slow_operations(),
-                "thresholds": self._thresholds,
-            }
-            return json.dumps(data, indent=2)
+        data = {
+            "timestamp": datetime.now().isoformat(),
+            "stats": self.get_all_stats(),
+            "slow_operations": self.get_slow_operations(),
+            "thresholds": self._thresholds,
+        }
+        return json.dumps(data, indent=2)
+
+    def export_prometheus(self, namespace: str = "ai_dashboard") -> str:
+        """Export metrics in the Prometheus text exposition format.
+
+        Args:
+            namespace: Prefix for the metric names
+
+        Returns:
+            Text with one duration histogram and error counter per operation
+        """
+        duration_name = f"{namespace}_operation_duration_seconds"
+        errors_name = f"{namespace}_operation_errors_total"
+        bounds_ns = [int(b * 1e9) for b in PROMETHEUS_BUCKETS]
+
+        duration_lines = [
+            f"# HELP {duration_name} Duration of monitored operations.",
+            f"# TYPE {duration_name} histogram",
+        ]
+        error_lines = [
+            f"# HELP {errors_name} Errors raised by monitored operations.",
+            f"# TYPE {errors_name} counter",
+        ]
+
+        for operation in sorted(self.list_operations()):
+            state = self._operations[operation]
+            with state.lock:
+                histogram = state.histogram.copy()
+                errors = state.errors
+
+            label = _escape_label_value(operation)
+            cumulative = 0
+            counts = histogram.bucket_counts(bounds_ns)
+            for bound, count in zip(PROMETHEUS_BUCKETS, counts):
+                cumulative += count
+                duration_lines.append(
+                    f'{duration_name}_bucket{{operation="{label}",le="{bound}"}} {cumulative}'
+                )
+            duration_lines.append(
+                f'{duration_name}_bucket{{operation="{label}",le="+Inf"}} {histogram.count}'
+            )
+            duration_lines.append(
+                f'{duration_name}_sum{{operation="{label}"}} {histogram.sum_ns / 1e9}'
+            )
+            duration_lines.append(f'{duration_name}_count{{operation="{label}"}} {histogram.count}')
+            error_lines.append(f'{errors_name}{{operation="{label}"}} {errors}')
+
+        return "\n".join(duration_lines + error_lines) + "\n"
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
 
 
 # Global metrics instance
@@ -171,19 +444,22 @@ def track_performance(
 
     def decorator(func):
         op_name = operation or f"{func.__module__}.{func.__name__}"
+        configured_metrics = None
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            nonlocal configured_metrics
+            start_time = time.perf_counter_ns()
             metrics = get_metrics()
 
-            # Set custom threshold if provided
-            if threshold is not None:
+            # Set custom threshold once per metrics instance
+            if threshold is not None and metrics is not configured_metrics:
                 metrics.set_threshold(op_name, threshold)
+                configured_metrics = metrics
 
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration_ns = time.perf_counter_ns() - start_time
 
                 # Generate metadata if function provided
                 metadata = None
@@ -194,18 +470,18 @@ def track_performance(
                         pass
 
                 # Record success
-                metrics.record(op_name, duration, metadata)
+                metrics.record_ns(op_name, duration_ns, metadata)
 
                 return result
 
             except Exception as e:
-                duration = time.time() - start_time
+                duration_ns = time.perf_counter_ns() - start_time
 
                 # Record error
                 metrics.record_error(op_name, str(e))
 
                 # Still record duration for failed operations
-                metrics.record(op_name, duration, {"error": True})
+                metrics.record_ns(op_name, duration_ns, {"error": True})
 
                 raise
 
@@ -230,12 +506,12 @@ class PerformanceContext:
 
     def __enter__(self):
         """Enter context and start timing."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit context and record metrics."""
-        duration = time.time() - self.start_time
+        duration_ns = time.perf_counter_ns() - self.start_time
         metrics = get_metrics()
 
         if exc_type:
@@ -243,7 +519,7 @@ class PerformanceContext:
             metrics.record_error(self.operation, str(exc_val))
             self.metadata["error"] = True
 
-        metrics.record(self.operation, duration, self.metadata)
+        metrics.record_ns(self.operation, duration_ns, self.metadata)
 
 
 class ResourceMonitor:
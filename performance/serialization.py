@@ -0,0 +1,144 @@
+"""Fast JSON encoding shared by the API and the Dash app.
+
+API responses and Dash callback outputs carry NumPy scalars and arrays,
+pandas objects, Plotly figures and large nested dicts such as Monte Carlo
+histograms and ``data-store`` records. ``dumps`` encodes them with orjson,
+which serializes NumPy arrays natively and is several times faster than the
+standard library. Without orjson the standard library is used with the same
+conversions, so both produce equivalent JSON.
+
+Objects neither encoder handles natively go through ``_default``; plain
+dicts, lists and numbers never do, so the common case stays in C.
+
+Encodes that name a channel (``api``, ``dash``) record their time and size
+in ``performance.monitor`` as ``serialize.<channel>``, which the telemetry
+reports next to callback and endpoint latency.
+"""
+
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import logging
+import time
+import uuid
+from pathlib import PurePath
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from .monitor import get_metrics
+from .telemetry import SERIALIZE_PREFIX
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+DASH_CHANNEL = "dash"
+
+
+def _default(obj: Any) -> Any:
+    """Convert an object the encoder does not support to JSON-compatible data."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        # orjson only falls back here for non-contiguous or object arrays
+        return obj.tolist()
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict(orient="records")
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return obj.tolist()
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (uuid.UUID, PurePath, datetime.timedelta)):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+
+    # Plotly figures and Dash components
+    to_plotly_json = getattr(obj, "to_plotly_json", None)
+    if callable(to_plotly_json):
+        return to_plotly_json()
+    # Pydantic models
+    model_dump = getattr(obj, "model_dump", None)
+    if callable(model_dump):
+        return model_dump()
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, channel: Optional[str] = None) -> bytes:
+    """Encode an object as compact UTF-8 JSON.
+
+    NaN and infinite floats are encoded as ``null`` by orjson; the standard
+    library fallback keeps its usual ``NaN`` output.
+
+    Args:
+        obj: Object to encode
+        channel: Record the encode time and size under ``serialize.<channel>``
+
+    Returns:
+        Encoded JSON
+
+    Raises:
+        TypeError: If the object contains values that cannot be encoded
+    """
+    start_time = time.perf_counter_ns()
+    if ORJSON_AVAILABLE:
+        content = orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+    else:
+        content = json.dumps(
+            obj, default=_default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    if channel is not None:
+        metrics = get_metrics()
+        operation = f"{SERIALIZE_PREFIX}{channel}"
+        metrics.record_ns(operation, time.perf_counter_ns() - start_time)
+        metrics.record_size(operation, len(content))
+    return content
+
+
+def dash_to_json(value: Any) -> str:
+    """Encode a Dash callback response with ``dumps``."""
+    return dumps(value, DASH_CHANNEL).decode("utf-8")
+
+
+def install_dash_encoder() -> bool:
+    """Encode Dash callback responses with the shared encoder.
+
+    Dash imports its ``to_json`` helper by name into the callback module, so
+    that reference is replaced. Layout and config encoding keep Plotly's
+    encoder, whose HTML-safe escaping they rely on.
+
+    Returns:
+        Whether the encoder was installed
+    """
+    try:
+        from dash import _callback
+    except ImportError:
+        return False
+
+    if not hasattr(_callback, "to_json"):
+        logger.debug("Dash callback module has no to_json; keeping Dash's encoder")
+        return False
+
+    _callback.to_json = dash_to_json
+    return True
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""Unified runtime telemetry for the performance sidebar and API.
+
+Combines latency statistics recorded in ``performance.monitor`` with hit rates
+from every registered cache layer and the memory of the current worker into a
+single snapshot. Cache layers register themselves at import time, so the
+telemetry module never has to import the data or calculation packages.
+
+Snapshots are memoized for a short time so that several browser tabs polling
+the sidebar every few seconds share one collection pass.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from .monitor import get_metrics
+
+logger = logging.getLogger(__name__)
+
+# Operation name prefixes used when recording Dash callbacks and API requests
+CALLBACK_PREFIX = "callback."
+ENDPOINT_PREFIX = "api."
+# Prefix of JSON encoding times and sizes (see performance/serialization.py)
+SERIALIZE_PREFIX = "serialize."
+
+# Upper bounds of the latency histogram buckets in milliseconds
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+_SNAPSHOT_TTL = 1.0
+
+
+@dataclass
+class CacheLayer:
+    """A cache whose statistics are reported and which can be flushed."""
+
+    name: str
+    stats_func: Callable[[], Dict[str, Any]]
+    clear_func: Optional[Callable[[], None]] = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get normalized statistics for this layer."""
+        stats = dict(self.stats_func())
+        hits = stats.get("hits", 0)
+        misses = stats.get("misses", 0)
+        total = hits + misses
+        stats.setdefault("hit_rate", (hits / total * 100) if total > 0 else 0)
+        stats.setdefault("size", 0)
+        return stats
+
+
+_cache_layers: Dict[str, CacheLayer] = {}
+_layers_lock = threading.Lock()
+
+_snapshot: Optional[Dict[str, Any]] = None
+_snapshot_time = 0.0
+_snapshot_lock = threading.Lock()
+
+try:
+    import psutil
+
+    _process = psutil.Process()
+except ImportError:
+    psutil = None
+    _process = None
+
+
+def register_cache_layer(
+    name: str,
+    stats_func: Callable[[], Dict[str, Any]],
+    clear_func: Optional[Callable[[], None]] = None,
+) -> None:
+    """Register a cache layer for telemetry and flushing.
+
+    Args:
+        name: Layer name shown in the sidebar (e.g. "dataset", "pdf")
+        stats_func: Returns a dict with at least ``hits``, ``misses`` and ``size``
+        clear_func: Flushes the layer; omit for read-only layers
+    """
+    with _layers_lock:
+        _cache_layers[name] = CacheLayer(name, stats_func, clear_func)
+
+
+def get_cache_layer_stats() -> Dict[str, Dict[str, Any]]:
+    """Get statistics for every registered cache layer."""
+    with _layers_lock:
+        layers = list(_cache_layers.values())
+
+    stats = {}
+    for layer in layers:
+        try:
+            stats[layer.name] = layer.get_stats()
+        except Exception as e:
+            logger.warning(f"Could not collect stats for cache layer '{layer.name}': {e}")
+    return stats
+
+
+def clear_caches() -> Dict[str, bool]:
+    """Flush every registered cache layer.
+
+    Returns:
+        Mapping of layer name to whether it was cleared
+    """
+    global _snapshot
+
+    with _layers_lock:
+        layers = list(_cache_layers.values())
+
+    results = {}
+    for layer in layers:
+        if layer.clear_func is None:
+            results[layer.name] = False
+            continue
+        try:
+            layer.clear_func()
+            results[layer.name] = True
+        except Exception as e:
+            logger.error(f"Failed to clear cache layer '{layer.name}': {e}")
+            results[layer.name] = False
+
+    with _snapshot_lock:
+        _snapshot = None
+
+    logger.info(f"Cleared cache layers: {[name for name, ok in results.items() if ok]}")
+    return results
+
+
+def get_worker_memory() -> Dict[str, Any]:
+    """Get memory usage of the current worker process."""
+    if _process is None:
+        return {"pid": os.getpid(), "rss_mb": 0.0, "percent": 0.0}
+
+    memory_info = _process.memory_info()
+    return {
+        "pid": os.getpid(),
+        "rss_mb": memory_info.rss / 1024 / 1024,
+        "percent": _process.memory_percent(),
+    }
+
+
+def get_latency_summary(prefix: str) -> Dict[str, Dict[str, Any]]:
+    """Get latency statistics and histograms for operations with a name prefix.
+
+    Durations are reported in milliseconds and payload sizes, where
+    recorded, in bytes. Operation names are returned without the prefix.
+    """
+    metrics = get_metrics()
+    bounds = [b / 1000 for b in LATENCY_BUCKETS_MS]
+
+    summary = {}
+    for operation in metrics.list_operations():
+        if not operation.startswith(prefix):
+            continue
+        stats = metrics.get_stats(operation)
+        if not stats:
+            continue
+        summary[operation[len(prefix) :]] = {
+            "count": stats["count"],
+            "errors": stats["errors"],
+            "mean_ms": stats["mean"] * 1000,
+            "p50_ms": stats["median"] * 1000,
+            "p95_ms": stats["p95"] * 1000,
+            "max_ms": stats["max"] * 1000,
+            "histogram": metrics.get_histogram(operation, bounds),
+        }
+        if "mean_bytes" in stats:
+            summary[operation[len(prefix) :]].update(
+                mean_bytes=stats["mean_bytes"],
+                p95_bytes=stats["p95_bytes"],
+                max_bytes=stats["max_bytes"],
+            )
+    return summary
+
+
+def collect_telemetry(max_age: float = _SNAPSHOT_TTL) -> Dict[str, Any]:
+    """Collect a telemetry snapshot.
+
+    Args:
+        max_age: Reuse a snapshot collected less than this many seconds ago
+
+    Returns:
+        Dict with callback and endpoint latencies, JSON encoding times and
+        sizes, cache layers and worker memory
+    """
+    global _snapshot, _snapshot_time
+
+    with _snapshot_lock:
+        now = time.monotonic()
+        if _snapshot is not None and now - _snapshot_time < max_age:
+            return _snapshot
+
+        _snapshot = {
+            "timestamp": time.time(),
+            "latency_buckets_ms": LATENCY_BUCKETS_MS,
+            "callbacks": get_latency_summary(CALLBACK_PREFIX),
+            "endpoints": get_latency_summary(ENDPOINT_PREFIX),
+            "serialization": get_latency_summary(SERIALIZE_PREFIX),
+            "caches": get_cache_layer_stats(),
+            "worker": get_worker_memory(),
+        }
+        _snapshot_time = now
+        return _snapshot
+
+
+def summarize_latency(operations: Dict[str, Dict[str, Any]]) -> Dict[str, float]:
+    """Aggregate per-operation latency into overall figures in milliseconds."""
+    count = sum(op["count"] for op in operations.values())
+    if not count:
+        return {"count": 0, "avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+
+    max_ms = max(op["max_ms"] for op in operations.values())
+
+    # Approximate the overall p95 by the upper bound of the bucket holding it
+    histogram = merge_histograms(operations)
+    target = 0.95 * sum(histogram)
+    running = 0
+    p95_ms = max_ms
+    for bound, bucket_count in zip(LATENCY_BUCKETS_MS, histogram):
+        running += bucket_count
+        if running >= target:
+            p95_ms = min(float(bound), max_ms)
+            break
+
+    return {
+        "count": count,
+        "avg_ms": sum(op["mean_ms"] * op["count"] for op in operations.values()) / count,
+        "p95_ms": p95_ms,
+        "max_ms": max_ms,
+    }
+
+
+def merge_histograms(operations: Dict[str, Dict[str, Any]]) -> List[int]:
+    """Sum the latency histograms of several operations."""
+    merged = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    for op in operations.values():
+        for i, count in enumerate(op["histogram"]):
+            merged[i] += count
+    return merged
@@ -0,0 +1,90 @@
+"""Minimal PDF documents written without a PDF library, for extractor tests."""
+
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_text_pdf(
+    path: Path, pages: Sequence[str], drawings: Optional[Sequence[str]] = None
+) -> Path:
+    """Write a PDF with Helvetica text on each page.
+
+    Args:
+        path: Output file
+        pages: Text of each page; newlines start new lines
+        drawings: Optional raw content-stream operators per page, e.g. ruling
+            lines, appended after the text
+
+    Returns:
+        The output path
+    """
+    objects: List[Optional[str]] = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for index, text in enumerate(pages):
+        lines = " T* ".join(f"({_escape(line)}) Tj" for line in text.split("\n"))
+        stream = f"BT /F1 12 Tf 14 TL 72 720 Td {lines} ET"
+        if drawings and drawings[index]:
+            stream += "\n" + drawings[index]
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        content_id = len(objects)
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>"
+
+    body = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += f"{number} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref = len(body)
+    body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    body += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    body += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n".encode()
+    body += f"startxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(body)
+    return path
+
+
+def grid_drawing(rows: int = 4, columns: int = 3, top: int = 650, cell: int = 60) -> str:
+    """Content-stream operators drawing a ruled table grid."""
+    width = columns * cell
+    height = rows * cell
+    lines = [f"72 {top - r * cell} m {72 + width} {top - r * cell} l S" for r in range(rows + 1)]
+    lines += [
+        f"{72 + c * cell} {top} m {72 + c * cell} {top - height} l S" for c in range(columns + 1)
+    ]
+    return "\n".join(lines)
+
+
+def table_drawing(
+    cells: Sequence[Sequence[str]], top: int = 400, cell_width: int = 120, row_height: int = 20
+) -> str:
+    """Content-stream operators drawing a ruled table with text in its cells."""
+    columns = max(len(row) for row in cells)
+    width = columns * cell_width
+    height = len(cells) * row_height
+    lines = [
+        f"72 {top - r * row_height} m {72 + width} {top - r * row_height} l S"
+        for r in range(len(cells) + 1)
+    ]
+    lines += [
+        f"{72 + c * cell_width} {top} m {72 + c * cell_width} {top - height} l S"
+        for c in range(columns + 1)
+    ]
+    for r, row in enumerate(cells):
+        baseline = top - (r + 1) * row_height + 6
+        for c, value in enumerate(row):
+            x = 72 + c * cell_width + 4
+            lines.append(f"BT /F1 9 Tf {x} {baseline} Td ({_escape(str(value))}) Tj ET")
+    return "\n".join(lines)
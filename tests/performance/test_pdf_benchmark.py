@@ -0,0 +1,68 @@
+"""Tests for the PDF pipeline benchmark harness and synthetic corpus."""
+
+import json
+
+import pytest
+
+pytest.importorskip("pdfplumber")
+
+from tests.performance.pdf_benchmark import (
+    LOADER_FACTORIES,
+    PHASES,
+    compare_results,
+    main,
+    run_benchmark,
+)
+from tests.performance.synthetic_pdfs import TABLE_EVERY, build_corpus
+
+
+@pytest.mark.performance
+class TestSyntheticCorpus:
+    """Test generation of synthetic report PDFs."""
+
+    def test_reports_have_pages_tables_and_numbers(self, tmp_path):
+        from data.extractors.pdf_extractor import PDFExtractor
+
+        path = build_corpus(tmp_path, [6])[6]
+
+        with PDFExtractor(path) as extractor:
+            assert extractor.session.page_count == 6
+            assert "%" in extractor.extract_text_from_page(1)
+            assert extractor.session.likely_table_pages(range(6)) == list(range(0, 6, TABLE_EVERY))
+
+    def test_reports_are_reused_and_deterministic(self, tmp_path):
+        first = build_corpus(tmp_path / "a", [4], seed=1)[4]
+        second = build_corpus(tmp_path / "b", [4], seed=1)[4]
+        mtime = first.stat().st_mtime_ns
+
+        assert build_corpus(tmp_path / "a", [4], seed=1)[4].stat().st_mtime_ns == mtime
+        assert first.read_bytes() == second.read_bytes()
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestBenchmarkHarness:
+    """Test a small benchmark run end to end."""
+
+    def test_records_every_phase_and_loader(self, tmp_path):
+        output = tmp_path / "results.json"
+
+        assert main(["--pages", "3", "--corpus-dir", str(tmp_path), "--output", str(output)]) == 0
+
+        document = json.loads(output.read_text())["documents"]["3"]
+        assert set(document["phases"]["seconds"]) == set(PHASES)
+        assert document["phases"]["counts"]["pages"] == 3
+        assert set(document["loaders"]) == set(LOADER_FACTORIES)
+        assert all(loader["seconds"] >= 0 for loader in document["loaders"].values())
+
+    def test_baseline_comparison(self, tmp_path):
+        results = run_benchmark([2], tmp_path, loaders=["mckinsey"])
+        slower = json.loads(json.dumps(results))
+        slower["documents"]["2"]["loaders"]["mckinsey"]["seconds"] += 1.0
+        slower["documents"]["2"]["phases"]["seconds"]["open"] *= 1.1
+
+        assert compare_results(results, results) == []
+        assert compare_results(results, slower) == [
+            f"2/loader/mckinsey: {results['documents']['2']['loaders']['mckinsey']['seconds']:.3f}s"
+            f" -> {slower['documents']['2']['loaders']['mckinsey']['seconds']:.3f}s"
+        ]
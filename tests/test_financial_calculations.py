@@ -17,7 +17,10 @@ from business.financial_calculations import (
     calculate_payback_period,
     calculate_risk_adjusted_return,
     calculate_ai_productivity_roi,
-    calculate_break_even_analysis
+    calculate_break_even_analysis,
+    calculate_npv_batch,
+    calculate_irr_batch,
+    pad_cash_flows
 )
 
 
@@ -252,5 +255,43 @@ class TestFinancialCalculations(unittest.TestCase):
         self.assertGreater(npv, 50000)  # Greater than undiscounted sum - investment
 
 
+
+class TestBatchFinancialCalculations(unittest.TestCase):
+    """Test the vectorized NPV and IRR kernels against the scalar functions."""
+    
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.cash_flows = [
+            list(rng.uniform(-50000, 300000, rng.integers(1, 9))) for _ in range(300)
+        ]
+        self.investments = rng.uniform(100000, 1000000, 300)
+        self.rates = rng.uniform(0, 0.3, 300)
+        
+    def test_pad_cash_flows(self):
+        """Test that ragged series are padded with trailing zeros."""
+        matrix = pad_cash_flows([[1, 2, 3], [4]])
+        np.testing.assert_array_equal(matrix, [[1, 2, 3], [4, 0, 0]])
+        
+    def test_npv_batch_matches_scalar(self):
+        """Test batch NPVs against calculate_npv."""
+        npv = calculate_npv_batch(pad_cash_flows(self.cash_flows), self.rates, self.investments)
+        expected = [
+            calculate_npv(flows, rate, investment)
+            for flows, rate, investment in zip(self.cash_flows, self.rates, self.investments)
+        ]
+        self.assertEqual([round(value, 2) for value in npv.tolist()], expected)
+        
+    def test_irr_batch_matches_scalar(self):
+        """Test batch IRRs, including rows without a root, against calculate_irr."""
+        irr = calculate_irr_batch(pad_cash_flows(self.cash_flows), self.investments)
+        expected = [
+            calculate_irr(flows, investment)
+            for flows, investment in zip(self.cash_flows, self.investments)
+        ]
+        actual = [None if np.isnan(value) else round(value, 4) for value in irr.tolist()]
+        self.assertEqual(actual, expected)
+        self.assertIn(None, actual)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
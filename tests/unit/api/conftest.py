@@ -0,0 +1,24 @@
+"""Shared fixtures for the API tests."""
+
+import pytest
+
+from api import auth
+from api.auth import TOKEN_CACHE_SIZE, TokenCache, UserDatabase, UserRole
+
+
+@pytest.fixture
+def token_cache_size():
+    """Capacity of the ``users`` token cache; override to test eviction."""
+    return TOKEN_CACHE_SIZE
+
+
+@pytest.fixture
+def users(tmp_path, monkeypatch, token_cache_size):
+    """Isolated user database and token cache wired like the module globals."""
+    db = UserDatabase(str(tmp_path / "users.db"))
+    db.create_user({"username": "ana", "role": UserRole.ANALYST, "is_active": True})
+    cache = TokenCache(max_entries=token_cache_size)
+    db.add_listener(cache.invalidate_user)
+    monkeypatch.setattr(auth, "user_db", db)
+    monkeypatch.setattr(auth, "token_cache", cache)
+    return db, cache
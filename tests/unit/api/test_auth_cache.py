@@ -0,0 +1,116 @@
+"""Tests for the token validation cache and permission bitmasks."""
+
+import time
+from datetime import timedelta
+
+import pytest
+
+from api import auth
+from api.auth import (
+    AuthManager,
+    TokenCache,
+    TokenData,
+    UserDatabase,
+    UserRole,
+    check_permission,
+    create_access_token,
+    role_has_permission,
+)
+
+
+@pytest.fixture
+def token_cache_size():
+    """Keep the ``users`` token cache small enough to evict."""
+    return 2
+
+
+class TestPermissionMasks:
+    """Test role permissions against the precomputed bitmasks."""
+
+    def test_exact_and_wildcard_permissions(self):
+        assert role_has_permission(UserRole.ANALYST, "write:reports")
+        assert not role_has_permission(UserRole.VIEWER, "write:reports")
+        assert role_has_permission(UserRole.ADMIN, "read:calculations")
+        assert not role_has_permission(UserRole.ADMIN, "export:anything")
+        assert not role_has_permission("unknown", "read:reports")
+
+    def test_check_permission_reads_the_current_role(self, users):
+        db, _ = users
+
+        assert not check_permission("ana", "admin:users")
+        db.update_user("ana", {"role": UserRole.ADMIN})
+        assert check_permission("ana", "admin:users")
+        assert not check_permission("nobody", "read:reports")
+
+
+class TestTokenCache:
+    """Test caching, expiry and invalidation of verified tokens."""
+
+    def test_second_validation_is_a_hit(self, users):
+        _, cache = users
+        token = create_access_token({"sub": "ana", "scopes": ["read:reports"]})
+
+        first = AuthManager.validate_token(token)
+        second = AuthManager.validate_token(token)
+
+        assert first.role == UserRole.ANALYST
+        assert second is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_user_changes_invalidate_tokens(self, users):
+        db, cache = users
+        token = create_access_token({"sub": "ana"})
+        AuthManager.validate_token(token)
+
+        db.update_user("ana", {"last_login": "2025-01-01T00:00:00"})
+        assert cache.stats()["size"] == 1
+
+        db.update_user("ana", {"role": UserRole.VIEWER})
+        assert cache.stats()["size"] == 0
+        assert AuthManager.validate_token(token).role == UserRole.VIEWER
+
+        db.delete_user("ana")
+        assert AuthManager.validate_token(token) is None
+
+    def test_expired_entries_and_lru_bound(self):
+        cache = TokenCache(max_entries=2)
+        data = TokenData(username="ana")
+
+        cache.put(b"expired", data, time.time() - 1)
+        assert cache.get(b"expired") is None
+
+        for key in (b"a", b"b", b"c"):
+            cache.put(key, data, None)
+        assert cache.get(b"a") is None
+        assert cache.get(b"c") is data
+        assert cache.stats()["evictions"] == 1
+
+    def test_entries_without_expiry_are_capped_by_the_ttl(self, monkeypatch):
+        cache = TokenCache(ttl=30)
+        data = TokenData(username="ana")
+        cache.put(b"api-key", data, None)
+        cache.put(b"access", data, time.time() + 3600)
+
+        now = time.time()
+        monkeypatch.setattr(auth.time, "time", lambda: now + 31)
+        assert cache.get(b"api-key") is None
+        assert cache.get(b"access") is None
+
+    def test_changes_from_another_process_apply_after_the_ttl(self, users, tmp_path, monkeypatch):
+        token = create_access_token({"sub": "ana"})
+        assert AuthManager.validate_token(token).role == UserRole.ANALYST
+
+        # A second handle on the same file, like the one another worker process holds
+        UserDatabase(str(tmp_path / "users.db")).update_user("ana", {"is_active": False})
+        assert AuthManager.validate_token(token) is not None
+
+        now = time.time()
+        monkeypatch.setattr(auth.time, "time", lambda: now + auth.TOKEN_CACHE_TTL + 1)
+        assert AuthManager.validate_token(token) is None
+
+    def test_invalid_token_is_not_cached(self, users):
+        _, cache = users
+        token = create_access_token({"sub": "ana"}, expires_delta=timedelta(seconds=-1))
+
+        assert AuthManager.validate_token(token) is None
+        assert cache.stats()["size"] == 0
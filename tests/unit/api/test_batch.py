@@ -0,0 +1,118 @@
+"""Tests for batch NPV, IRR and industry ROI evaluation."""
+
+import json
+
+import pytest
+
+from api.batch import (
+    BatchValidationError,
+    complete_batch,
+    evaluate_financial_batch,
+    evaluate_industry_batch,
+    iter_ndjson,
+    plan_financial_batch,
+)
+from business.financial_calculations import calculate_irr, calculate_npv
+from utils.cache_manager import batch_cache, calculation_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    batch_cache.clear()
+    yield
+    batch_cache.clear()
+
+
+CASH_FLOWS = [[100000, 120000, 140000], [50000, 60000], [100000, 120000, 140000], [1000]]
+INVESTMENTS = [300000, 90000, 300000, 500000]
+
+
+class TestFinancialBatch:
+    """Test results, deduplication and validation of financial batches."""
+
+    def test_columns_match_the_single_calculations(self):
+        result = evaluate_financial_batch(CASH_FLOWS, INVESTMENTS, discount_rate=0.1)
+
+        columns = result["columns"]
+        assert columns["npv"] == [
+            calculate_npv(flows, 0.1, investment)
+            for flows, investment in zip(CASH_FLOWS, INVESTMENTS)
+        ]
+        assert columns["irr"] == [
+            calculate_irr(flows, investment) for flows, investment in zip(CASH_FLOWS, INVESTMENTS)
+        ]
+        assert columns["irr"][3] is None
+        assert columns["profitable"] == [npv > 0 for npv in columns["npv"]]
+
+    def test_identical_rows_are_evaluated_once_and_cached(self):
+        first = evaluate_financial_batch(CASH_FLOWS, INVESTMENTS, metrics=["npv"])
+        second = evaluate_financial_batch(CASH_FLOWS, INVESTMENTS, metrics=["npv"])
+
+        assert (first["count"], first["unique"], first["cache_hits"]) == (4, 3, 0)
+        assert second["cache_hits"] == 3
+        assert second["columns"] == first["columns"]
+        assert "irr" not in first["columns"]
+
+    def test_only_cache_misses_are_computed(self):
+        calculation_cache.set("single", 1.0)
+        evaluate_financial_batch(CASH_FLOWS[:2], INVESTMENTS[:2], metrics=["npv"])
+
+        plan = plan_financial_batch(CASH_FLOWS, INVESTMENTS, metrics=["npv"])
+        func, (matrix, rates, investments, metrics) = plan.task
+        result = complete_batch(plan, func(matrix, rates, investments, metrics))
+
+        assert investments.tolist() == [500000]
+        assert (result["unique"], result["cache_hits"]) == (3, 2)
+        assert result["columns"]["npv"][3] == calculate_npv(CASH_FLOWS[3], 0.1, INVESTMENTS[3])
+        # The single-calculation cache is left alone
+        assert calculation_cache.get_stats()["size"] == 1
+        calculation_cache.clear()
+
+    def test_invalid_rows_are_reported_together(self):
+        with pytest.raises(BatchValidationError) as error:
+            evaluate_financial_batch(CASH_FLOWS, INVESTMENTS, discount_rate=[0.1, 2, 0.1, -1])
+
+        assert error.value.rows == [1, 3]
+
+    def test_misaligned_columns(self):
+        with pytest.raises(BatchValidationError):
+            evaluate_financial_batch(CASH_FLOWS, INVESTMENTS[:2])
+        with pytest.raises(BatchValidationError):
+            evaluate_financial_batch(CASH_FLOWS, INVESTMENTS, metrics=["npv", "mirr"])
+
+
+class TestIndustryBatch:
+    """Test industry batches and NDJSON encoding."""
+
+    ITEM = {
+        "industry": "retail",
+        "investment": 250000.0,
+        "years": 5,
+        "annual_revenue": 5000000.0,
+        "personalization_uplift": 0.15,
+        "inventory_optimization": 0.2,
+        "customer_service_automation": 0.5,
+        "supply_chain_efficiency": 0.25,
+    }
+
+    def test_duplicates_share_one_evaluation(self):
+        result = evaluate_industry_batch([self.ITEM, dict(self.ITEM)], include_details=True)
+
+        assert result["unique"] == 1
+        assert result["columns"]["industry"] == ["retail", "retail"]
+        assert result["columns"]["npv"][0] == result["columns"]["details"][0]["financial_metrics"]["npv"]
+
+    def test_unknown_industry(self):
+        with pytest.raises(BatchValidationError) as error:
+            evaluate_industry_batch([self.ITEM, {**self.ITEM, "industry": "mining"}])
+
+        assert error.value.rows == [1]
+
+    def test_ndjson_rows(self):
+        columns = evaluate_industry_batch([self.ITEM] * 3)["columns"]
+
+        chunks = list(iter_ndjson(columns, chunk_rows=2))
+        rows = [json.loads(line) for line in b"".join(chunks).splitlines()]
+
+        assert len(chunks) == 2
+        assert rows[2]["risk_level"] == columns["risk_level"][2]
@@ -0,0 +1,88 @@
+"""Tests for the API execution model: worker pools, route limits and loop lag."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from api import execution
+from api.execution import LoopLagMonitor, RouteLimiter, run_cpu, run_io
+from performance.monitor import get_metrics
+from utils.audit_logger import audit_logger
+
+
+def audited_square(value: int):
+    """Worker task that logs an audit entry, as the API calls do."""
+    audit_logger.log_error("Probe", f"square {value}", user="worker")
+    return value * value, os.getpid()
+
+
+def failing_task():
+    raise ValueError("bad input")
+
+
+class TestPools:
+    """Test where offloaded calls run."""
+
+    def test_io_calls_run_on_the_thread_pool(self):
+        name = asyncio.run(run_io("audit", lambda: threading.current_thread().name))
+
+        assert name.startswith("api-io")
+
+    def test_cpu_calls_run_in_a_worker_process(self):
+        async def main():
+            return await run_cpu("scenario", audited_square, 7)
+
+        (result, pid) = asyncio.run(main())
+
+        assert result == 49
+        assert pid != os.getpid()
+        # The worker's audit entry is logged by this process
+        messages = [e.details.get("error_message") for e in audit_logger.memory_buffer]
+        assert "square 7" in messages
+
+    def test_worker_exceptions_are_raised_in_the_caller(self):
+        with pytest.raises(ValueError, match="bad input"):
+            asyncio.run(run_cpu("scenario", failing_task))
+
+
+class TestRouteLimiter:
+    """Test concurrency bounds and rejection."""
+
+    def test_waits_beyond_the_timeout_are_rejected(self, monkeypatch):
+        monkeypatch.setattr(execution, "ROUTE_QUEUE_TIMEOUT", 0.05)
+
+        async def main():
+            limiter = RouteLimiter("probe", 1)
+            async with limiter:
+                with pytest.raises(HTTPException) as rejected:
+                    async with limiter:
+                        pass
+            return limiter, rejected.value
+
+        limiter, error = asyncio.run(main())
+
+        assert error.status_code == 503
+        assert limiter.stats() == {"limit": 1, "active": 0, "waiting": 0, "rejected": 1}
+
+
+class TestLoopLagMonitor:
+    """Test that a blocked loop shows up as lag."""
+
+    def test_blocking_call_is_recorded(self):
+        async def main():
+            monitor = LoopLagMonitor(interval=0.01)
+            monitor.start()
+            await asyncio.sleep(0.02)
+            time.sleep(0.1)  # blocks the loop
+            await asyncio.sleep(0.02)
+            await monitor.stop()
+            return monitor
+
+        monitor = asyncio.run(main())
+
+        assert monitor.max_lag_ns >= 50_000_000
+        assert get_metrics().get_stats("event_loop.lag")["count"] >= 1
@@ -0,0 +1,60 @@
+"""Tests for off-loop password hashing and the API key fast path."""
+
+import asyncio
+import threading
+
+from api.auth import (
+    AuthManager,
+    api_key_digest,
+    generate_api_key,
+    get_password_hash,
+    run_in_password_pool,
+    scopes_have_permission,
+    verify_password,
+)
+from performance.monitor import get_metrics
+
+
+class TestPasswordPool:
+    """Test that bcrypt work runs on the bounded pool and is timed."""
+
+    def test_runs_off_the_event_loop_thread(self):
+        async def main():
+            return await run_in_password_pool(lambda: threading.current_thread().name)
+
+        assert asyncio.run(main()).startswith("password")
+
+    def test_hash_and_verify_are_timed(self):
+        before = get_metrics().get_stats("auth.password_verify").get("count", 0)
+
+        hashed = asyncio.run(run_in_password_pool(get_password_hash, "s3cret!"))
+
+        assert verify_password("s3cret!", hashed)
+        assert get_metrics().get_stats("auth.password_verify")["count"] == before + 1
+        assert get_metrics().get_stats("auth.password_hash")["count"] >= 1
+        assert get_metrics().get_stats("auth.password_queue_wait")["count"] >= 1
+
+
+class TestAPIKeys:
+    """Test API key validation by digest and scope limits."""
+
+    def test_registered_key_carries_its_permissions(self, users):
+        db, _ = users
+        key = generate_api_key("ana", "ci", ["read:calculations"])
+
+        token_data = AuthManager.validate_token(key)
+
+        assert db.get_user("ana")["api_keys"][0]["key_digest"] == api_key_digest(key)
+        assert token_data.token_type == "api_key"
+        assert token_data.scopes == ["read:calculations"]
+        assert scopes_have_permission(token_data.scopes, "read:calculations")
+        assert not scopes_have_permission(token_data.scopes, "write:reports")
+
+    def test_revoked_key_is_rejected(self, users):
+        db, _ = users
+        key = generate_api_key("ana", "ci", ["read:calculations"])
+        assert AuthManager.validate_token(key) is not None
+
+        db.update_user("ana", {"api_keys": []})
+
+        assert AuthManager.validate_token(key) is None
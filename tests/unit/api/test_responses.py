@@ -0,0 +1,124 @@
+"""Tests for orjson responses and response compression."""
+
+import json
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from api import responses
+from api.export_endpoints import create_streaming_download_response
+from api.responses import (
+    CompressionMiddleware,
+    FastJSONResponse,
+    FastJSONRoute,
+    select_encoding
+)
+from performance.monitor import get_metrics
+
+
+class Summary(BaseModel):
+    mean: float
+
+
+def create_app() -> FastAPI:
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.router.route_class = FastJSONRoute
+    app.add_middleware(CompressionMiddleware, minimum_size=1000)
+
+    @app.get("/histogram")
+    async def histogram(bins: int = 10):
+        return {"counts": np.arange(bins), "mean": np.float32(2.5), "runs": np.int64(bins)}
+
+    @app.post("/created", status_code=201)
+    def created():
+        return {"id": np.int64(7)}
+
+    @app.get("/summary", response_model=Summary)
+    async def summary():
+        return {"mean": 1.5, "internal": "dropped by the response model"}
+
+    @app.get("/rows")
+    async def rows():
+        chunks = (b'{"row": %d}\n' % row for row in range(500))
+        return StreamingResponse(chunks, media_type="application/x-ndjson")
+
+    @app.get("/download")
+    async def download():
+        chunks = (b'{"row": %d}\n' % row for row in range(500))
+        return create_streaming_download_response(chunks, "rows.ndjson", "application/x-ndjson")
+
+    return app
+
+
+@pytest.fixture
+def client():
+    return TestClient(create_app())
+
+
+class TestFastJSONRoute:
+    """Test that returned payloads are rendered with the shared encoder."""
+
+    def test_numpy_payload(self, client):
+        response = client.get("/histogram?bins=3", headers={"Accept-Encoding": "identity"})
+
+        assert response.json() == {"counts": [0, 1, 2], "mean": 2.5, "runs": 3}
+
+    def test_status_code_and_sync_endpoints(self, client):
+        response = client.post("/created")
+
+        assert response.status_code == 201
+        assert response.json() == {"id": 7}
+
+    def test_response_models_keep_fastapi_encoding(self, client):
+        assert client.get("/summary").json() == {"mean": 1.5}
+
+
+class TestCompression:
+    """Test gzip and brotli compression above the size threshold."""
+
+    def test_small_responses_are_not_compressed(self, client):
+        response = client.get("/histogram?bins=3", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_large_responses_are_gzipped(self, client):
+        response = client.get("/histogram?bins=2000", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert int(response.headers["content-length"]) < 2000 * 4
+        assert len(response.json()["counts"]) == 2000
+
+    def test_streams_are_compressed_in_chunks(self, client):
+        response = client.get("/rows", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert json.loads(response.text.splitlines()[-1]) == {"row": 499}
+
+    def test_downloads_are_compressed_by_the_middleware(self, client):
+        before = get_metrics().get_stats("serialize.api.gzip").get("count", 0)
+
+        response = client.get("/download", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-disposition"] == "attachment; filename=rows.ndjson"
+        assert len(response.text.splitlines()) == 500
+        assert get_metrics().get_stats("serialize.api.gzip")["count"] == before + 1
+
+    def test_brotli_is_preferred(self, client):
+        pytest.importorskip("brotli")
+
+        response = client.get("/histogram?bins=2000", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.headers["content-encoding"] == "br"
+        assert len(response.json()["counts"]) == 2000
+
+    def test_select_encoding(self, monkeypatch):
+        monkeypatch.setattr(responses, "BROTLI_AVAILABLE", False)
+
+        assert select_encoding("gzip, deflate, br") == "gzip"
+        assert select_encoding("gzip;q=0, br") is None
+        assert select_encoding("identity") is None
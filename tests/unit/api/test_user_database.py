@@ -0,0 +1,105 @@
+"""Tests for the SQLite user database."""
+
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+from api.auth import UserDatabase, UserRole
+
+
+def user(username: str, **fields):
+    return {
+        "username": username,
+        "email": f"{username}@example.com",
+        "role": UserRole.VIEWER,
+        "is_active": True,
+        "last_login": None,
+        **fields,
+    }
+
+
+class TestUserDatabase:
+    """Test row-level storage, batched logins and the JSON import."""
+
+    def test_crud_and_email_index(self, tmp_path):
+        db = UserDatabase(str(tmp_path / "users.db"))
+        db.create_user(user("ana", full_name="Ana"))
+
+        with pytest.raises(ValueError):
+            db.create_user(user("ana"))
+        assert db.update_user("ana", {"role": UserRole.ANALYST})["full_name"] == "Ana"
+        assert db.get_user_by_email("ana@example.com")["role"] == UserRole.ANALYST
+        assert UserDatabase(str(tmp_path / "users.db")).get_user("ana")["role"] == "analyst"
+        assert db.delete_user("ana") and not db.delete_user("ana")
+        assert [u["username"] for u in db.list_users()] == ["admin"]
+
+    def test_concurrent_updates_are_not_lost(self, tmp_path):
+        db = UserDatabase(str(tmp_path / "users.db"))
+        db.create_user(user("ana", counter=0))
+
+        def increment():
+            for _ in range(20):
+                with db._write() as conn:
+                    row = conn.execute(
+                        "SELECT data FROM users WHERE username = 'ana'"
+                    ).fetchone()
+                    data = json.loads(row[0])
+                    data["counter"] += 1
+                    conn.execute(
+                        "UPDATE users SET data = ? WHERE username = 'ana'", (json.dumps(data),)
+                    )
+
+        threads = [threading.Thread(target=increment) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert db.get_user("ana")["counter"] == 80
+
+    def test_logins_are_batched(self, tmp_path):
+        db = UserDatabase(str(tmp_path / "users.db"), login_flush_interval=3600)
+        db.create_user(user("ana"))
+        login = datetime(2025, 1, 2, 3, 4, 5)
+
+        db.record_login("ana", login)
+
+        assert db.get_user("ana")["last_login"] == login.isoformat()
+        assert UserDatabase(str(tmp_path / "users.db")).get_user("ana")["last_login"] is None
+        db.flush_logins()
+        assert UserDatabase(str(tmp_path / "users.db")).get_user("ana")["last_login"] == (
+            login.isoformat()
+        )
+
+    def test_imports_legacy_json_once(self, tmp_path):
+        (tmp_path / "users.json").write_text(json.dumps({"bob": user("bob")}))
+
+        db = UserDatabase(str(tmp_path / "users.db"))
+
+        assert db.get_user("bob")["email"] == "bob@example.com"
+        assert db.get_user("admin") is None
+        assert not (tmp_path / "users.json").exists()
+
+    def test_workers_starting_together_import_once(self, tmp_path):
+        (tmp_path / "users.json").write_text(json.dumps({"bob": user("bob")}))
+        barrier = threading.Barrier(4)
+        errors = []
+
+        def start_worker():
+            barrier.wait()
+            try:
+                UserDatabase(str(tmp_path / "users.db"))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=start_worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert UserDatabase(str(tmp_path / "users.db")).get_user("bob") is not None
+        assert (tmp_path / "users.json.imported").exists()
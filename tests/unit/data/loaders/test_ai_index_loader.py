@@ -277,3 +277,28 @@ class TestAIIndexLoader:
         assert metrics.overall_adoption_rate == 87.3
         assert metrics.growth_rate_yoy == 15.2
         assert "Marketing" in metrics.adoption_by_function
+
+
+class TestAIIndexLoad:
+    """Test that extracted tables reach the loaded datasets."""
+
+    def test_load_returns_cleaned_frames(self, tmp_path):
+        loader = AIIndexLoader(file_path=tmp_path / "missing.pdf")
+        extractor = Mock()
+        extractor.find_pages_with_keywords.side_effect = (
+            lambda keywords: [3] if "adoption rate" in keywords else []
+        )
+        table = pd.DataFrame(
+            {"Year": ["2022", "2023", "2024"], "Adoption Rate (%)": ["55%", "72%", "78%"]}
+        )
+        extractor.extract_tables.return_value = [table]
+        loader.extractor = extractor
+
+        result = loader.load()
+
+        trends = result["adoption_trends"]
+        assert trends["year"].tolist() == [2022, 2023, 2024]
+        assert trends["overall_adoption"].tolist() == [55.0, 72.0, 78.0]
+        # Datasets without a matching table are empty but keep their columns
+        assert result["sector_adoption"].empty
+        assert "sector" in result["sector_adoption"].columns
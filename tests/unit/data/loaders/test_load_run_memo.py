@@ -0,0 +1,127 @@
+"""Tests for the load-run memo shared by a loader's extraction methods."""
+
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+import pytest
+
+from data.loaders.base import BaseDataLoader, DataSource, LoadRunMemo
+
+
+class CountingExtractor:
+    """Extractor double counting how often each operation runs."""
+
+    def __init__(self, file_path: Path, pages: List[str]):
+        self.file_path = file_path
+        self.pages = pages
+        self.calls: Dict[str, int] = {"keywords": 0, "text": 0, "tables": 0}
+        self.closed = False
+
+    def find_pages_with_keywords(self, keywords: List[str]) -> List[int]:
+        self.calls["keywords"] += 1
+        return [
+            i
+            for i, text in enumerate(self.pages)
+            if any(keyword.lower() in text.lower() for keyword in keywords)
+        ]
+
+    def extract_text_from_page(self, page: int) -> str:
+        self.calls["text"] += 1
+        return self.pages[page]
+
+    def extract_tables(self, page_range=None) -> List[pd.DataFrame]:
+        self.calls["tables"] += 1
+        return [pd.DataFrame({"page": [page_range[0]]})]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class RepeatingLoader(BaseDataLoader):
+    """Loader whose extraction methods revisit the same pages."""
+
+    def __init__(self, tmp_path: Path):
+        super().__init__(
+            DataSource(name="Repeating", version="2025", file_path=tmp_path, citation="Test")
+        )
+        self.extractor = CountingExtractor(
+            tmp_path / "report.pdf", ["GDP grew 7%", "Intro", "GDP and labor 2.5%"]
+        )
+
+    def load(self) -> Dict[str, pd.DataFrame]:
+        rows = []
+        for _ in range(3):
+            for page in self.pages_with_keywords(["GDP", "labor"])[:10]:
+                text = self.page_text(page)
+                rows += [{"page": page, "value": v} for v in self.findall(r"(\d+(?:\.\d+)?)%", text)]
+                self.page_tables(page)
+        return {"values": pd.DataFrame(rows)}
+
+    def validate(self, data: Dict[str, pd.DataFrame]) -> bool:
+        return True
+
+
+class TestLoadRunMemo:
+    """Test memoization of intermediate extraction results."""
+
+    def test_each_result_is_computed_once_per_run(self, tmp_path):
+        loader = RepeatingLoader(tmp_path)
+
+        data = loader.load_and_close()
+
+        assert len(data["values"]) == 6
+        assert loader.extractor.calls == {"keywords": 1, "text": 2, "tables": 2}
+        stats = loader.memo.stats()
+        assert stats["keyword_pages"] == {"hits": 2, "misses": 1}
+        assert stats["pattern_matches"] == {"hits": 4, "misses": 2}
+
+    def test_memo_is_scoped_to_one_run(self, tmp_path):
+        loader = RepeatingLoader(tmp_path)
+
+        loader.load_and_close()
+        assert loader.extractor.closed
+        assert len(loader.memo) == 0
+
+        loader.load_and_close()
+        assert loader.extractor.calls["keywords"] == 2
+
+    def test_keyword_sets_ignore_order_and_case(self, tmp_path):
+        loader = RepeatingLoader(tmp_path)
+
+        first = loader.pages_with_keywords(["GDP", "labor"])
+        first.append(99)
+
+        assert loader.pages_with_keywords(["LABOR", "gdp"]) == [0, 2]
+        assert loader.extractor.calls["keywords"] == 1
+
+    def test_process_wide_stats(self, tmp_path):
+        loader = RepeatingLoader(tmp_path)
+        loader.page_text(0)
+        loader.page_text(0)
+
+        stats = BaseDataLoader.get_memo_stats()
+        assert stats["hits"] >= 1
+        assert stats["kinds"]["page_text"]["misses"] >= 1
+
+        BaseDataLoader.clear_all_memos()
+        assert len(loader.memo) == 0
+
+
+def test_memo_counts_by_kind():
+    memo = LoadRunMemo()
+
+    assert memo.get_or_compute("a", 1, lambda: "x") == "x"
+    assert memo.get_or_compute("a", 1, pytest.fail) == "x"
+    assert memo.stats() == {"a": {"hits": 1, "misses": 1}}
+
+
+def test_close_handles_both_extractor_list_shapes(tmp_path):
+    loader = RepeatingLoader(tmp_path)
+    bare = CountingExtractor(tmp_path / "a.pdf", [])
+    named = CountingExtractor(tmp_path / "b.pdf", [])
+    loader.extractors = [bare, (named, "b.pdf")]
+
+    loader.close()
+
+    assert bare.closed and named.closed and loader.extractor.closed
@@ -0,0 +1,127 @@
+"""Tests for typed dataset schemas and their enforcement at load time."""
+
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+
+from config.settings import settings
+from data.loaders.base import BaseDataLoader, DataSource
+from data.models import SectorAdoption, WorkforceImpact
+from data.models.schemas import ColumnRule, DatasetSchema, memory_usage, rules_from_model
+
+
+def sectors(rows: int = 6) -> pd.DataFrame:
+    names = ["Technology", "Finance", "Retail"]
+    return pd.DataFrame(
+        {
+            "sector": [names[i % 3] for i in range(rows)],
+            "year": [2024] * rows,
+            "adoption_rate": [40.5 + i for i in range(rows)],
+            "source": ["AI Index"] * rows,
+        }
+    )
+
+
+class StaticLoader(BaseDataLoader):
+    """Loader returning fixed datasets."""
+
+    schemas = {"sector_adoption": DatasetSchema("sector_adoption", model=SectorAdoption)}
+
+    def __init__(self, tmp_path: Path, datasets: Dict[str, pd.DataFrame]):
+        super().__init__(
+            DataSource(name="Static", version="2025", file_path=tmp_path, citation="Test")
+        )
+        self.datasets = datasets
+
+    def load(self) -> Dict[str, pd.DataFrame]:
+        return dict(self.datasets)
+
+    def validate(self, data: Dict[str, pd.DataFrame]) -> bool:
+        return True
+
+
+class TestModelRules:
+    """Test rules derived from the pydantic models."""
+
+    def test_bounds_and_requirements(self):
+        rules = rules_from_model(SectorAdoption)
+
+        assert rules["year"] == ColumnRule("int", True, 2017, 2030)
+        assert rules["genai_adoption"] == ColumnRule("float", False, 0, 100)
+        assert "use_cases" not in rules
+
+    def test_patterns_become_choices_under_renamed_columns(self):
+        rules = rules_from_model(WorkforceImpact, {"risk": "reskilling_required"})
+
+        assert rules["risk"].choices == ("Low", "Medium", "High", "Critical")
+
+
+class TestDatasetSchema:
+    """Test bulk validation and dtype enforcement."""
+
+    schema = DatasetSchema("sector_adoption", model=SectorAdoption)
+
+    def test_vectorized_check_counts_violations(self):
+        df = sectors(4)
+        df.loc[1, "adoption_rate"] = 140.0
+        df.loc[2, "year"] = None
+        df.loc[3, "sector"] = None
+
+        invalid, violations = self.schema.check(df)
+
+        assert invalid.tolist() == [False, True, True, True]
+        assert violations == {"sector": 1, "year": 1, "adoption_rate": 1}
+
+    def test_compact_dtypes(self):
+        df = self.schema.apply(sectors())
+
+        assert isinstance(df["sector"].dtype, pd.CategoricalDtype)
+        assert isinstance(df["source"].dtype, pd.CategoricalDtype)
+        assert str(df["year"].dtype) == "int16"
+        assert str(df["adoption_rate"].dtype) == "float32"
+        assert memory_usage({"df": df})["df"] < memory_usage({"df": sectors()})["df"]
+
+    def test_invalid_rows_are_kept_unless_dropped(self):
+        df = sectors(3)
+        df.loc[0, "adoption_rate"] = -5.0
+
+        assert len(self.schema.apply(df)) == 3
+        assert len(self.schema.apply(df, drop_invalid=True)) == 2
+
+    def test_fixed_choices(self):
+        rule = ColumnRule("str", choices=("Low", "High"))
+        schema = DatasetSchema("risk", rules={"risk_level": rule})
+
+        df = schema.apply(pd.DataFrame({"risk_level": ["High", "Low", "Extreme"]}))
+
+        assert list(df["risk_level"].cat.categories) == ["Low", "High"]
+        assert df["risk_level"].isna().tolist() == [False, False, True]
+
+    def test_nullable_integers(self):
+        schema = DatasetSchema("years", rules={"year": ColumnRule("int")})
+
+        df = schema.apply(pd.DataFrame({"year": [2020.0, None]}))
+
+        assert str(df["year"].dtype) == "Int16"
+
+
+class TestLoadTimeEnforcement:
+    """Test that loaders type their datasets in load_and_close."""
+
+    def test_declared_and_default_schemas(self, tmp_path):
+        other = pd.DataFrame({"metric": ["GDP", "GDP"], "value": [1.5, 2.5]})
+        loader = StaticLoader(tmp_path, {"sector_adoption": sectors(), "other": other})
+
+        data = loader.load_and_close()
+
+        assert str(data["sector_adoption"]["year"].dtype) == "int16"
+        assert isinstance(data["other"]["metric"].dtype, pd.CategoricalDtype)
+        assert str(data["other"]["value"].dtype) == "float32"
+
+    def test_enforcement_can_be_disabled(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "ENFORCE_DATASET_SCHEMAS", False)
+
+        data = StaticLoader(tmp_path, {"sector_adoption": sectors()}).load_and_close()
+
+        assert str(data["sector_adoption"]["year"].dtype) == "int64"
@@ -0,0 +1,115 @@
+"""Tests for open-once PDF document sessions."""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pdfplumber")
+pytest.importorskip("PyPDF2")
+
+from data.extractors import document_session
+from data.extractors.document_session import LRUByteCache, PDFDocumentSession, estimate_size
+from data.extractors.parallel_pages import plan_shards
+from data.extractors.pdf_extractor import PDFExtractor
+from tests.fixtures.pdf_documents import write_text_pdf
+
+
+@pytest.fixture
+def report_pdf(tmp_path):
+    return write_text_pdf(
+        tmp_path / "report.pdf",
+        ["AI adoption reached 55% in 2024", "Token prices fell", "GDP could rise by 7%"],
+    )
+
+
+class TestLRUByteCache:
+    """Test byte-bounded LRU eviction."""
+
+    def test_evicts_least_recently_used(self):
+        value_size = estimate_size("x" * 100)
+        cache = LRUByteCache(max_bytes=value_size * 2)
+
+        cache.put("a", "a" * 100)
+        cache.put("b", "b" * 100)
+        cache.get("a")
+        cache.put("c", "c" * 100)
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.current_bytes <= cache.max_bytes
+        assert cache.stats()["evictions"] == 1
+
+    def test_oversized_values_are_not_cached(self):
+        cache = LRUByteCache(max_bytes=10)
+
+        cache.put("big", pd.DataFrame({"x": range(100)}))
+
+        assert len(cache) == 0
+        assert cache.current_bytes == 0
+
+
+class TestPDFDocumentSession:
+    """Test that a session opens the document once and caches pages."""
+
+    def test_reads_every_page_from_one_open(self, report_pdf):
+        with PDFDocumentSession(report_pdf) as session:
+            texts = session.page_texts()
+            assert session.page_text(2) == "GDP could rise by 7%"
+            assert session.page_text(10) == ""
+            stats = session.stats()
+
+        assert texts[0] == "AI adoption reached 55% in 2024"
+        assert stats["opens"] == 1
+        assert stats["hits"] == 1
+        assert not session.is_open
+
+    def test_reopens_lazily_after_close(self, report_pdf):
+        session = PDFDocumentSession(report_pdf)
+        session.page_text(0)
+        session.close()
+
+        assert session.page_text(1) == "Token prices fell"
+        assert session.opens == 2
+        session.close()
+
+
+class TestPDFExtractorSession:
+    """Test PDFExtractor page reads through its session."""
+
+    def test_page_reads_share_the_session(self, report_pdf):
+        with PDFExtractor(report_pdf) as extractor:
+            assert extractor.find_pages_with_keywords(["gdp", "token"]) == [1, 2]
+            assert extractor.extract_text_from_page(0).startswith("AI adoption")
+            assert extractor.extract_text_range(1, 2) == (
+                "Token prices fell\n\nGDP could rise by 7%"
+            )
+            assert extractor.extract_metadata()["pages"] == 3
+            assert extractor.session.opens == 2  # pdfplumber for pages, PyPDF2 for metadata
+
+        assert not extractor.session.is_open
+
+
+class TestParallelPages:
+    """Test process-pool page extraction."""
+
+    def test_plan_shards_covers_range_in_order(self):
+        shards = plan_shards(3, 20, workers=2)
+
+        assert shards[0][0] == 3 and shards[-1][1] == 20
+        assert all(a[1] == b[0] for a, b in zip(shards, shards[1:]))
+        assert len(shards) == 4
+        assert plan_shards(5, 5, workers=4) == []
+
+    def test_streams_pages_in_order_into_the_cache(self, tmp_path, monkeypatch):
+        texts = [f"Page number {i} text" for i in range(8)]
+        path = write_text_pdf(tmp_path / "long.pdf", texts)
+        monkeypatch.setattr(document_session, "PARALLEL_MIN_PAGES", 2)
+
+        with PDFDocumentSession(path) as session:
+            streamed = list(session.iter_pages(max_workers=2, include_tables=True))
+
+            assert streamed == list(enumerate(texts))
+            assert all(("text", i) in session.cache for i in range(8))
+            assert all(("tables", i) in session.cache for i in range(8))
+            # The parent only opened the document to count pages
+            assert session.opens == 1
+            assert session.page_texts() == texts
@@ -0,0 +1,69 @@
+"""Tests for the multi-pattern entity scanner."""
+
+import pytest
+
+from data.extractors.entity_scanner import EntityHit, EntityScanner, get_scanner
+
+
+class TestEntityScanner:
+    """Test EntityScanner matching semantics."""
+
+    def test_matches_naive_substring_check(self):
+        entities = ["AI", "Machine Learning", "IoT", "Analytics", "Cloud Computing"]
+        text = "Firms adopting machine learning and cloud computing saw gains; iot lagged."
+        scanner = EntityScanner(entities)
+
+        expected = {entity for entity in entities if entity.lower() in text.lower()}
+        assert scanner.found_set(text) == expected
+
+    def test_overlapping_and_prefix_entities(self):
+        scanner = EntityScanner(["data", "data analysis", "analysis", "sis"])
+        hits = scanner.scan("Data Analysis")
+
+        assert {hit.entity for hit in hits} == {"data", "data analysis", "analysis", "sis"}
+        assert EntityHit("data analysis", 0, 13) in hits
+        assert EntityHit("data", 0, 4) in hits
+        assert [hit.start for hit in hits] == sorted(hit.start for hit in hits)
+
+    def test_find_entities_keeps_vocabulary_order(self):
+        scanner = EntityScanner(["Germany", "France", "Japan"])
+        text = "Japan leads, followed by France and Germany."
+
+        assert scanner.find_entities(text) == ["Germany", "France", "Japan"]
+        assert scanner.first_offsets(text) == {"Japan": 0, "France": 25, "Germany": 36}
+
+    def test_whole_words(self):
+        scanner = EntityScanner(["AI", "AI adoption"], whole_words=True)
+
+        assert scanner.found_set("Retail and aid programs") == set()
+        assert scanner.found_set("AI adoption grew") == {"AI", "AI adoption"}
+        assert scanner.found_set("AI adoptions grew") == {"AI"}
+
+    def test_lowered_text_and_metacharacters(self):
+        scanner = EntityScanner(["AI/ML Skills", "R&D (total)"])
+
+        assert scanner.found_set("ai/ml skills and r&d (total)", lowered=True) == {
+            "AI/ML Skills",
+            "R&D (total)",
+        }
+
+    def test_text_whose_lowercase_is_longer(self):
+        scanner = EntityScanner(["Istanbul", "Turkey"])
+        text = "İSTANBUL, TURKEY"
+
+        expected = {entity for entity in ["Istanbul", "Turkey"] if entity.lower() in text.lower()}
+        assert scanner.found_set(text) == expected
+        assert scanner.scan(text) == [EntityHit("Turkey", 10, 16)]
+        assert scanner.find_entities("İzmir and Istanbul") == ["Istanbul"]
+
+    @pytest.mark.parametrize("entities", [[], [""]])
+    def test_empty_vocabulary(self, entities):
+        scanner = EntityScanner(entities)
+
+        assert len(scanner) == 0
+        assert not scanner.contains_any("anything at all")
+        assert scanner.scan("") == []
+
+    def test_get_scanner_reuses_compilation(self):
+        assert get_scanner(("a", "b")) is get_scanner(("a", "b"))
+        assert get_scanner(("a", "b")) is not get_scanner(("a", "b"), whole_words=True)
@@ -0,0 +1,88 @@
+"""Tests for the precompiled numeric pattern library."""
+
+import pytest
+
+from data.extractors.patterns import (
+    CURRENCY_AMOUNT,
+    PERCENT_BY_YEAR,
+    PERCENT_RANGE,
+    NUMBER,
+    NumericPattern,
+    PatternSet,
+    get_pattern_stats,
+    reset_pattern_stats,
+)
+
+
+class TestPatternSet:
+    """Test single-pass scanning over combined patterns."""
+
+    def setup_method(self):
+        reset_pattern_stats()
+
+    def test_percent_by_year_shapes(self):
+        text = "Adoption: 2019: 20%, then 35.5% in 2021, 2022 (50%) and 2023 - 55%."
+
+        records = PERCENT_BY_YEAR.extract(text)
+
+        assert records == [
+            {"year": 2019, "adoption_rate": 20.0},
+            {"year": 2021, "adoption_rate": 35.5},
+            {"year": 2022, "adoption_rate": 50.0},
+            {"year": 2023, "adoption_rate": 55.0},
+        ]
+
+    def test_rejected_matches_are_counted_but_not_returned(self):
+        records = PERCENT_BY_YEAR.extract("1990: 20% and 2020: 150%")
+
+        assert records == []
+        stats = get_pattern_stats()["percent_by_year"]
+        assert stats["hits"] == {"year_colon_percent": 2}
+        assert stats["rejected"] == {"year_colon_percent": 2}
+        assert stats["scans"] == 1
+
+    def test_groups_are_routed_to_the_matching_pattern(self):
+        pattern_set = PatternSet(
+            "test.routing",
+            [
+                NumericPattern("pair", NUMBER + r"\s*/\s*" + NUMBER, lambda g: {"pair": g}),
+                NumericPattern("single", NUMBER + "x", lambda g: {"single": g}),
+            ],
+        )
+
+        matches = list(pattern_set.finditer("ratio 3 / 4 and 280x"))
+
+        assert [(m.pattern, m.groups) for m in matches] == [
+            ("pair", ("3", "4")),
+            ("single", ("280",)),
+        ]
+        assert matches[1].text == "280x"
+        assert pattern_set.stats()["hits"] == {"pair": 1, "single": 1}
+
+    def test_flags_are_scoped_per_pattern(self):
+        pattern_set = PatternSet(
+            "test.flags",
+            [
+                NumericPattern("exact", r"GDP " + NUMBER, lambda g: {"exact": g[0]}, flags=0),
+                NumericPattern("any_case", r"growth " + NUMBER, lambda g: {"any": g[0]}),
+            ],
+        )
+
+        assert pattern_set.extract("gdp 1, GDP 2, GROWTH 3") == [{"exact": "2"}, {"any": "3"}]
+
+    def test_generic_amounts_and_ranges(self):
+        assert CURRENCY_AMOUNT.parse(("2.5", "Billion")) == {
+            "value": 2500.0,
+            "unit": "millions_usd",
+        }
+        assert CURRENCY_AMOUNT.parse(("n/a", "billion")) is None
+        assert PERCENT_RANGE.compiled.search("between 20% to 30% of tasks").groups() == (
+            "20",
+            "30",
+        )
+
+    def test_duplicate_pattern_names_rejected(self):
+        pattern = NumericPattern("same", NUMBER, lambda g: {})
+
+        with pytest.raises(ValueError):
+            PatternSet("test.duplicates", [pattern, pattern])
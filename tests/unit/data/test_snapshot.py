@@ -0,0 +1,123 @@
+"""Unit tests for precomputed dataset snapshot bundles."""
+
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from data.loaders.base import BaseDataLoader, DataSource
+from data.snapshot import SnapshotBundle, SnapshotLoader, build_snapshot
+
+
+class StaticLoader(BaseDataLoader):
+    """Loader returning fixed datasets for a single source file."""
+
+    def __init__(self, file_path: Path, datasets: Dict[str, pd.DataFrame]):
+        super().__init__(
+            DataSource(name="Static", version="2025", file_path=file_path, citation="Test")
+        )
+        self.datasets = datasets
+        self.load_calls = 0
+
+    def load(self) -> Dict[str, pd.DataFrame]:
+        self.load_calls += 1
+        return self.datasets
+
+    def validate(self, data: Dict[str, pd.DataFrame]) -> bool:
+        return True
+
+
+@pytest.fixture
+def source_pdf(tmp_path):
+    """Create a fake source document."""
+    path = tmp_path / "report.pdf"
+    path.write_bytes(b"%PDF-1.4 original")
+    return path
+
+
+@pytest.fixture
+def datasets():
+    """Create datasets including a mixed-type column scraped from a table."""
+    return {
+        "adoption_trends": pd.DataFrame({"year": [2023, 2024], "overall_adoption": [55.0, 78.0]}),
+        "raw_table": pd.DataFrame({"Metric": ["Sector", 12], "Value": ["a", "b"]}),
+    }
+
+
+class TestSnapshotBundle:
+    """Test suite for snapshot build and load."""
+
+    def test_round_trip(self, tmp_path, source_pdf, datasets):
+        """Datasets written to a bundle are served back unchanged."""
+        root = tmp_path / "snapshots"
+        static = StaticLoader(source_pdf, datasets)
+        build_snapshot({"static": static}, root)
+
+        bundle = SnapshotBundle.open(root)
+        assert bundle is not None
+        assert bundle.list_sources() == ["static"]
+        assert bundle.is_source_current("static")
+
+        loader = SnapshotLoader(bundle, "static")
+        assert loader.list_datasets() == ["adoption_trends", "raw_table"]
+        # Bundles hold the datasets as typed by their schemas at load time
+        pd.testing.assert_frame_equal(
+            loader.get_dataset("adoption_trends"),
+            static.apply_schemas(datasets)["adoption_trends"],
+        )
+        assert loader.get_dataset("raw_table")["Metric"].tolist() == ["Sector", "12"]
+        assert loader.get_dataset("missing") is None
+        assert loader.validate(loader.load())
+
+    def test_numeric_columns_are_zero_copy(self, tmp_path, source_pdf, datasets):
+        """Numeric columns are served as read-only views of the mapped file."""
+        root = tmp_path / "snapshots"
+        build_snapshot({"static": StaticLoader(source_pdf, datasets)}, root)
+        loader = SnapshotLoader(SnapshotBundle.open(root), "static")
+
+        array = loader.get_array("adoption_trends", "overall_adoption")
+        assert array.tolist() == [55.0, 78.0]
+        assert not array.flags.writeable
+
+        frame = loader.get_dataset("adoption_trends")
+        assert not frame["overall_adoption"].to_numpy().flags.writeable
+        assert loader.get_table("adoption_trends").num_rows == 2
+        assert loader.get_array("missing", "year") is None
+
+    def test_changed_source_is_not_current(self, tmp_path, source_pdf, datasets):
+        """A source whose file content changed falls back to live extraction."""
+        root = tmp_path / "snapshots"
+        build_snapshot({"static": StaticLoader(source_pdf, datasets)}, root)
+
+        source_pdf.write_bytes(b"%PDF-1.4 revised edition")
+
+        bundle = SnapshotBundle.open(root)
+        assert not bundle.is_source_current("static")
+        assert not bundle.is_source_current("unknown")
+
+    def test_failed_loader_is_skipped(self, tmp_path, source_pdf, datasets):
+        """Sources whose loader raises are left out of the bundle."""
+
+        class FailingLoader(StaticLoader):
+            def load(self):
+                raise RuntimeError("No PDF extractors available")
+
+        root = tmp_path / "snapshots"
+        build_snapshot(
+            {
+                "static": StaticLoader(source_pdf, datasets),
+                "broken": FailingLoader(source_pdf, {}),
+            },
+            root,
+        )
+
+        bundle = SnapshotBundle.open(root)
+        assert bundle.has_source("static")
+        assert not bundle.has_source("broken")
+
+    def test_open_without_bundle(self, tmp_path):
+        """Opening an empty snapshot root yields no bundle."""
+        assert SnapshotBundle.open(tmp_path) is None
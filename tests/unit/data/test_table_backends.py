@@ -0,0 +1,115 @@
+"""Tests for the table-extraction backends and engine."""
+
+import pandas as pd
+import pytest
+
+from data.extractors.table_backends import (
+    PdfplumberBackend,
+    TableBackend,
+    TableExtractionEngine,
+    get_backend_stats,
+    reset_backend_stats,
+)
+
+
+class FailingBackend(TableBackend):
+    name = "failing"
+
+    def extract(self, file_path, pages, session=None):
+        raise RuntimeError("engine crashed")
+
+
+class RecordingBackend(TableBackend):
+    name = "recording"
+
+    def __init__(self, available: bool = True):
+        self._available = available
+        self.calls = []
+
+    @property
+    def available(self) -> bool:
+        return self._available
+
+    def extract(self, file_path, pages, session=None):
+        self.calls.append(list(pages))
+        return {page: [pd.DataFrame({"page": [page]})] for page in pages}
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    reset_backend_stats()
+    yield
+    reset_backend_stats()
+
+
+class TestTableExtractionEngine:
+    """Test backend fallback, batching and timing statistics."""
+
+    def test_batches_pages_into_one_call(self, tmp_path):
+        backend = RecordingBackend()
+        engine = TableExtractionEngine([backend])
+
+        result = engine.extract(tmp_path / "report.pdf", [4, 1, 7])
+
+        assert backend.calls == [[4, 1, 7]]
+        assert result.backend == "recording"
+        assert [df["page"][0] for df in result.flatten()] == [1, 4, 7]
+
+    def test_falls_back_after_failure(self, tmp_path):
+        skipped = RecordingBackend(available=False)
+        backend = RecordingBackend()
+        engine = TableExtractionEngine([skipped, FailingBackend(), backend])
+
+        result = engine.extract(tmp_path / "report.pdf", [0, 1])
+
+        assert skipped.calls == []
+        assert result.backend == "recording"
+        assert [(t.backend, t.failed) for t in result.timings] == [
+            ("failing", True),
+            ("recording", False),
+        ]
+
+        stats = get_backend_stats()["report.pdf"]
+        assert stats["failing"]["failures"] == 1
+        assert stats["recording"]["pages"] == 2
+        assert stats["recording"]["tables"] == 2
+
+    def test_all_backends_failing_returns_no_tables(self, tmp_path):
+        result = TableExtractionEngine([FailingBackend()]).extract(tmp_path / "r.pdf", [0])
+
+        assert result.backend is None
+        assert result.flatten() == []
+
+    def test_unrecorded_timings_are_returned(self, tmp_path):
+        result = TableExtractionEngine([RecordingBackend()]).extract(
+            tmp_path / "r.pdf", [0], record=False
+        )
+
+        assert len(result.timings) == 1
+        assert get_backend_stats() == {}
+
+    def test_backends_must_implement_extract(self):
+        with pytest.raises(TypeError):
+            TableBackend()
+
+
+class TestPdfplumberBackend:
+    """Test the pdfplumber backend against a generated document."""
+
+    def test_reads_tables_through_session(self, tmp_path):
+        pytest.importorskip("pdfplumber")
+        from data.extractors.document_session import PDFDocumentSession
+        from tests.fixtures.pdf_documents import grid_drawing, write_text_pdf
+
+        path = write_text_pdf(
+            tmp_path / "grid.pdf",
+            ["Narrative", "Results table"],
+            drawings=[None, grid_drawing()],
+        )
+
+        with PDFDocumentSession(path) as session:
+            tables = PdfplumberBackend(header=None).extract(path, [0, 1], session)
+            assert ("tables", 1) in session.cache
+
+        assert tables[0] == []
+        assert len(tables[1]) == 1
@@ -0,0 +1,69 @@
+"""Tests for the table-detection pre-pass."""
+
+import pytest
+
+from data.extractors.table_detection import (
+    TABLE_SCORE_THRESHOLD,
+    alignment_score,
+    ruling_score,
+)
+
+
+def word(x0: float, top: float, width: float = 30.0):
+    return {"x0": x0, "x1": x0 + width, "top": top}
+
+
+class TestScoring:
+    """Test page scores computed from layout objects."""
+
+    def test_column_aligned_words_score_high(self):
+        words = [word(x, 100 + row * 14) for row in range(8) for x in (72, 200, 320, 440)]
+
+        assert alignment_score(words) == 1.0
+
+    def test_prose_scores_low(self):
+        # Words separated by ordinary spaces form one cell per line
+        words = [word(72 + i * 33, 100 + row * 14) for row in range(20) for i in range(12)]
+
+        assert alignment_score(words) == 0.0
+        assert alignment_score([]) == 0.0
+
+    def test_ruling_lines(self):
+        assert ruling_score(5, 4) == 1.0
+        assert ruling_score(0, 0) == 0.0
+        # Horizontal rules alone (booktabs style) reach the threshold
+        assert ruling_score(4, 0) >= TABLE_SCORE_THRESHOLD
+
+
+class TestTablePrePass:
+    """Test that table extraction only runs on likely table pages."""
+
+    @pytest.fixture
+    def mixed_pdf(self, tmp_path):
+        pytest.importorskip("pdfplumber")
+        from tests.fixtures.pdf_documents import grid_drawing, write_text_pdf
+
+        return write_text_pdf(
+            tmp_path / "mixed.pdf",
+            ["Narrative text only", "Results table", "More narrative"],
+            drawings=[None, grid_drawing(), None],
+        )
+
+    def test_scores_are_cached_with_page_text(self, mixed_pdf):
+        from data.extractors.document_session import PDFDocumentSession
+
+        with PDFDocumentSession(mixed_pdf) as session:
+            session.page_texts()
+            assert ("table_score", 1) in session.cache
+            assert session.likely_table_pages(range(3)) == [1]
+
+    def test_extract_tables_skips_pages_without_tables(self, mixed_pdf):
+        from data.extractors.pdf_extractor import PDFExtractor
+
+        with PDFExtractor(mixed_pdf) as extractor:
+            skipped_before = PDFExtractor._table_pages_skipped
+            assert extractor.extract_tables(page_range=(0, 0)) == []
+            assert extractor.extract_tables(page_range=(2, 2)) == []
+            assert PDFExtractor._table_pages_skipped - skipped_before == 2
+            assert extractor._candidate_table_pages((0, 2), detect_tables=True) == [1]
+            assert extractor._candidate_table_pages((0, 2), detect_tables=False) == [0, 1, 2]
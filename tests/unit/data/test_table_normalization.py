@@ -0,0 +1,146 @@
+"""Tests for vectorized table normalization."""
+
+import pandas as pd
+
+from data.extractors.table_normalization import (
+    ColumnSpec,
+    TableSchema,
+    detect_header,
+    extract_number,
+    map_columns,
+    melt_values,
+    pivot_columns,
+    to_numeric,
+    value_columns,
+)
+from data.models.schemas import DatasetSchema
+
+
+class TestNumberParsing:
+    """Test column-wise parsing of formatted cells."""
+
+    def test_formatted_cells(self):
+        cells = pd.Series(["12.5%", "$1,200", "(3.4)", "−5", "2-5%", "10 to 20", None, 7])
+
+        assert to_numeric(cells).tolist()[:6] == [12.5, 1200.0, -3.4, -5.0, 3.5, 15.0]
+        assert to_numeric(cells).iloc[6:].isna().tolist() == [True, False]
+
+    def test_text_is_not_a_number(self):
+        assert to_numeric(pd.Series(["Q1 2024", "n/a", "GPT-4"])).isna().all()
+
+    def test_scale_words(self):
+        cells = pd.Series(["$500 million", "1.2bn", "3 trillion", "4"])
+
+        assert to_numeric(cells, scale_to="billion").tolist() == [0.5, 1.2, 3000.0, 4.0]
+
+    def test_first_number_anywhere(self):
+        cells = pd.Series(["~1,760B params", "+3.5x", "-0.12***", "none"])
+
+        assert extract_number(cells).tolist()[:3] == [1760.0, 3.5, 0.12]
+        assert extract_number(cells, signed=True).tolist()[:3] == [1760.0, 3.5, -0.12]
+
+
+class TestReshaping:
+    """Test column discovery and reshaping into records."""
+
+    table = pd.DataFrame(
+        {
+            "Function": ["Marketing", "Supply chain", "Finance"],
+            "Adoption %": ["42%", "30%", "n/a"],
+            "GenAI adoption %": ["20%", "15%", "10%"],
+            "Notes": ["pilot", "scaled", "early"],
+        }
+    )
+
+    def test_value_columns(self):
+        assert value_columns(self.table, exclude=["Function"]) == [
+            "Adoption %",
+            "GenAI adoption %",
+        ]
+
+    def test_melt_drops_unparsed_cells(self):
+        long = melt_values(self.table, "Function", ["Adoption %"], label_name="function")
+
+        assert long["function"].tolist() == ["Marketing", "Supply chain"]
+        assert long["is_percent"].all()
+
+    def test_first_mapping_wins_per_column(self):
+        mapping = [("genai", ["genai"]), ("adoption", ["adoption"])]
+
+        assert map_columns(self.table, mapping) == {
+            "Adoption %": "adoption",
+            "GenAI adoption %": "genai",
+        }
+
+    def test_pivot_keeps_rows_with_a_metric(self):
+        table = pd.DataFrame(
+            {
+                "Country": ["India", "Brazil", None],
+                "Launch year": ["2019", "n/a", "2020"],
+                "Focus": ["Skills", None, "Data"],
+            }
+        )
+
+        df = pivot_columns(
+            table,
+            "Country",
+            "country",
+            [("year", ["year"]), ("focus", ["focus"])],
+            parse={"focus": "text"},
+            integers=["year"],
+        )
+
+        assert df["country"].tolist() == ["India"]
+        assert df.loc[0, "year"] == 2019 and df.loc[0, "focus"] == "Skills"
+
+
+class TestSchema:
+    """Test header detection, declared schemas and downcasting."""
+
+    def test_promotes_header_row(self):
+        raw = pd.DataFrame([["Sector", "Adoption"], ["Retail", "40%"]])
+
+        table = detect_header(raw)
+
+        assert list(table.columns) == ["Sector", "Adoption"]
+        assert table.iloc[0].tolist() == ["Retail", "40%"]
+        assert detect_header(table) is table
+
+    def test_schema_applies_bounds_and_constants(self):
+        schema = TableSchema(
+            name="sector_adoption",
+            columns=(
+                ColumnSpec("sector", kind="label", value_terms=("retail",), title_case=True),
+                ColumnSpec("adoption_rate", bounds=(0, 100)),
+            ),
+            constants={"year": 2025},
+        )
+        table = pd.DataFrame(
+            {"Name": ["retail", "energy", "health", "retail"], "Rate": ["40%", "120", "7", "41"]}
+        )
+
+        df = schema.apply(table)
+
+        assert df["sector"].tolist() == ["Retail", "Health", "Retail"]
+        assert df["adoption_rate"].tolist() == [40.0, 7.0, 41.0]
+        assert df["year"].tolist() == [2025, 2025, 2025]
+        assert schema.apply(table[["Rate"]]) is None
+
+    def test_schema_leaves_dtypes_to_dataset_schemas(self):
+        schema = TableSchema(
+            name="sector_adoption",
+            columns=(
+                ColumnSpec("sector", kind="label", value_terms=("retail",)),
+                ColumnSpec("adoption_rate"),
+            ),
+            constants={"year": 2025},
+        )
+        table = pd.DataFrame({"Name": ["retail", "retail", "energy"], "Rate": ["40%", "41", "7"]})
+
+        df = schema.apply(table)
+        typed = DatasetSchema("sector_adoption").apply(df)
+
+        assert str(df["adoption_rate"].dtype) == "float64"
+        assert str(typed["adoption_rate"].dtype) == "float32"
+        assert str(typed["year"].dtype) == "int16"
+        assert isinstance(typed["sector"].dtype, pd.CategoricalDtype)
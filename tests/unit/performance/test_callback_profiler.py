@@ -0,0 +1,95 @@
+"""Unit tests for Dash callback instrumentation."""
+
+import json
+import time
+
+import pytest
+
+dash = pytest.importorskip("dash")
+go = pytest.importorskip("plotly.graph_objects")
+
+from dash import Input, Output, dcc, html
+
+from performance import callback_profiler
+from performance.monitor import PerformanceMetrics
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """Provide an isolated metrics collector."""
+    instance = PerformanceMetrics()
+    monkeypatch.setattr(callback_profiler, "get_metrics", lambda: instance)
+    return instance
+
+
+@pytest.fixture
+def app():
+    """Create a Dash app with one figure callback."""
+    app = dash.Dash(__name__)
+    app.layout = html.Div([dcc.Input(id="year"), dcc.Graph(id="chart")])
+
+    @app.callback(Output("chart", "figure"), Input("year", "value"))
+    def update_chart(year):
+        time.sleep(0.02)
+        return go.Figure(go.Bar(x=["a", "b"], y=[1, 2]), layout={"title": str(year)})
+
+    return app
+
+
+def dispatch(app, year):
+    """Send one callback request through the Flask test client."""
+    body = {
+        "output": "chart.figure",
+        "outputs": {"id": "chart", "property": "figure"},
+        "inputs": [{"id": "year", "property": "value", "value": year}],
+        "changedPropIds": ["year.value"],
+    }
+    return app.server.test_client().post("/_dash-update-component", json=body)
+
+
+class TestCallbackInstrumentation:
+    """Test suite for callback instrumentation."""
+
+    def test_total_timing_by_default(self, app, metrics):
+        """Without detailed mode only the total duration is recorded."""
+        callback_profiler.CallbackInstrumentation(app).install()
+
+        response = dispatch(app, 2024)
+        assert response.status_code == 200
+        assert metrics.get_stats("callback.update_chart")["count"] == 1
+        assert not any(op.startswith("callback_phase.") for op in metrics.list_operations())
+
+    def test_detailed_phases_and_payloads(self, app, metrics):
+        """Detailed mode records every phase and the payload sizes."""
+        instrumentation = callback_profiler.CallbackInstrumentation(app, detailed=True)
+        instrumentation.install()
+
+        response = dispatch(app, 2024)
+        assert response.status_code == 200
+        figure = json.loads(response.data)["response"]["chart"]["figure"]
+        assert figure["layout"]["title"]["text"] == "2024"
+
+        for phase in callback_profiler.PHASES:
+            assert metrics.get_stats(f"callback_phase.update_chart.{phase}")["count"] == 1
+        assert metrics.get_stats("callback_phase.update_chart.user")["min"] >= 0.02
+
+        payload = instrumentation.get_payload_stats()["update_chart"]
+        assert payload["calls"] == 1
+        assert payload["avg_request_bytes"] > 0
+        assert payload["max_response_bytes"] == len(response.data)
+
+    def test_slowest_callback_is_profiled(self, app, metrics, tmp_path):
+        """The slowest callback is captured by the sampling profiler."""
+        instrumentation = callback_profiler.CallbackInstrumentation(
+            app, detailed=True, profile_top_n=1, profile_dir=tmp_path, sample_interval=0.001
+        )
+        instrumentation.install()
+
+        dispatch(app, 2023)
+        instrumentation._targets_refreshed = 0.0
+        dispatch(app, 2024)
+
+        profile = instrumentation.get_profiles()["update_chart"]
+        assert profile["samples"] > 0
+        assert any("update_chart" in stack for stack in profile["stacks"])
+        assert (tmp_path / "update_chart.folded").exists()
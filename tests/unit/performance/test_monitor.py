@@ -0,0 +1,110 @@
+"""Unit tests for histogram-based performance metrics."""
+
+import threading
+
+import pytest
+
+from performance.monitor import LatencyHistogram, PerformanceMetrics
+
+
+class TestLatencyHistogram:
+    """Test suite for the log-bucketed histogram."""
+
+    def test_buckets_are_contiguous(self):
+        """Every nanosecond value maps to exactly one bucket."""
+        upper = 0
+        for index in range(LatencyHistogram.num_buckets):
+            lower, next_upper = LatencyHistogram.bucket_range(index)
+            assert lower == upper
+            assert LatencyHistogram.bucket_index(lower) == index
+            assert LatencyHistogram.bucket_index(next_upper - 1) == index
+            upper = next_upper
+
+    def test_percentiles_within_resolution(self):
+        """Percentiles stay within the relative bucket error."""
+        histogram = LatencyHistogram()
+        for value in range(1, 10001):
+            histogram.record_ns(value * 1000)
+
+        median, p99 = histogram.percentiles([50, 99])
+        assert median == pytest.approx(5_000_000, rel=0.04)
+        assert p99 == pytest.approx(9_900_000, rel=0.04)
+        assert histogram.percentiles([100]) == [10_000_000]
+
+    def test_merge(self):
+        """Merged histograms combine counts and extremes."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record_ns(100)
+        second.record_ns(5000)
+        first.merge(second)
+
+        assert first.count == 2
+        assert (first.min_ns, first.max_ns) == (100, 5000)
+        assert first.bucket_counts([1000]) == [1, 1]
+
+
+class TestPerformanceMetrics:
+    """Test suite for PerformanceMetrics."""
+
+    def test_concurrent_recording(self):
+        """Measurements from many threads are all counted."""
+        metrics = PerformanceMetrics()
+
+        def worker():
+            for _ in range(1000):
+                metrics.record_ns("shared", 2_000_000)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert metrics.get_stats("shared")["count"] == 8000
+
+    def test_slow_samples_are_bounded(self):
+        """Only slow measurements are kept, up to the window size."""
+        metrics = PerformanceMetrics(window_size=3)
+        metrics.set_threshold("load", 0.1)
+        metrics.record("load", 0.05)
+        for duration in (0.2, 0.3, 0.4, 0.5):
+            metrics.record("load", duration, {"source": "pdf"})
+
+        slow = metrics.get_slow_operations()
+        assert [op["duration"] for op in slow] == [0.5, 0.4, 0.3]
+        assert metrics.get_stats("load")["count"] == 5
+
+    def test_error_only_operation(self):
+        """Errors are reported even without recorded durations."""
+        metrics = PerformanceMetrics()
+        metrics.record_error("failing", "boom")
+        assert metrics.get_stats("failing")["errors"] == 1
+        assert metrics.get_stats("unknown") == {}
+
+    def test_payload_sizes(self):
+        """Sizes are reported in bytes next to the durations."""
+        metrics = PerformanceMetrics()
+        for size in (100, 300):
+            metrics.record_ns("serialize.api", 1000)
+            metrics.record_size("serialize.api", size)
+
+        stats = metrics.get_stats("serialize.api")
+        assert stats["count"] == 2
+        assert stats["mean_bytes"] == 200
+        assert stats["max_bytes"] == 300
+        metrics.record("data_load", 0.1)
+        assert "mean_bytes" not in metrics.get_stats("data_load")
+
+    def test_prometheus_export(self):
+        """Export produces cumulative buckets with escaped labels."""
+        metrics = PerformanceMetrics()
+        metrics.record("api.GET /api/health", 0.01)
+        metrics.record("api.GET /api/health", 0.2)
+        metrics.record_error('say "hi"', "boom")
+
+        text = metrics.export_prometheus()
+        name = "ai_dashboard_operation_duration_seconds"
+        assert f'{name}_bucket{{operation="api.GET /api/health",le="0.01"}} 1' in text
+        assert f'{name}_bucket{{operation="api.GET /api/health",le="+Inf"}} 2' in text
+        assert f'{name}_count{{operation="api.GET /api/health"}} 2' in text
+        assert 'ai_dashboard_operation_errors_total{operation="say \\"hi\\""} 1' in text
@@ -0,0 +1,107 @@
+"""Unit tests for the shared JSON encoder."""
+
+import datetime
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from performance import serialization, telemetry
+from performance.monitor import PerformanceMetrics
+from performance.serialization import dumps
+
+PAYLOAD = {
+    "histogram_data": {"counts": np.arange(4), "edges": np.linspace(0, 1, 5)},
+    "mean": np.float32(0.5),
+    "runs": np.int64(1000),
+    "strided": np.arange(6).reshape(2, 3)[:, 1],
+    "series": pd.Series([1.5, 2.5]),
+    "frame": pd.DataFrame({"year": [2024], "rate": [0.1]}),
+    "date": pd.Timestamp("2024-01-01"),
+    "missing": pd.NaT,
+    2025: {"sectors": {"retail"}},
+}
+
+EXPECTED = {
+    "histogram_data": {"counts": [0, 1, 2, 3], "edges": [0.0, 0.25, 0.5, 0.75, 1.0]},
+    "mean": 0.5,
+    "runs": 1000,
+    "strided": [1, 4],
+    "series": [1.5, 2.5],
+    "frame": [{"year": 2024, "rate": 0.1}],
+    "date": "2024-01-01T00:00:00",
+    "missing": None,
+    "2025": {"sectors": ["retail"]},
+}
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """Provide an isolated metrics collector."""
+    instance = PerformanceMetrics()
+    monkeypatch.setattr(serialization, "get_metrics", lambda: instance)
+    monkeypatch.setattr(telemetry, "get_metrics", lambda: instance)
+    monkeypatch.setattr(telemetry, "_snapshot", None)
+    return instance
+
+
+class TestDumps:
+    """Test suite for NumPy- and pandas-aware encoding."""
+
+    @pytest.mark.skipif(not serialization.ORJSON_AVAILABLE, reason="orjson not installed")
+    def test_orjson_encoding(self):
+        """NumPy and pandas values are converted to plain JSON."""
+        assert json.loads(dumps(PAYLOAD)) == EXPECTED
+
+    def test_standard_library_fallback(self, monkeypatch):
+        """Without orjson the same payload encodes to the same JSON."""
+        monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", False)
+        assert json.loads(dumps(PAYLOAD)) == EXPECTED
+
+    def test_unsupported_objects(self):
+        """Objects without a JSON form raise TypeError like json.dumps."""
+        with pytest.raises(TypeError):
+            dumps({"lock": object()})
+
+    def test_channel_records_time_and_size(self, metrics):
+        """Encodes naming a channel show up in the telemetry."""
+        content = dumps({"at": datetime.date(2024, 1, 1)}, channel="api")
+
+        stats = metrics.get_stats("serialize.api")
+        assert stats["count"] == 1
+        assert stats["max_bytes"] == len(content)
+        snapshot = telemetry.collect_telemetry(max_age=0)
+        assert snapshot["serialization"]["api"]["mean_bytes"] == len(content)
+
+
+class TestDashEncoder:
+    """Test suite for Dash callback response encoding."""
+
+    def test_matches_dash_encoding(self, metrics):
+        """Figures, components and store records encode as Dash would."""
+        go = pytest.importorskip("plotly.graph_objects")
+        dash_utils = pytest.importorskip("dash._utils")
+        from dash import html
+
+        response = {
+            "multi": True,
+            "response": {
+                "chart": {"figure": go.Figure(go.Bar(x=["a", "b"], y=np.array([1.5, 2.0])))},
+                "data-store": {"data": PAYLOAD["frame"].to_dict("records")},
+                "summary": {"children": html.P("Adoption rose")},
+            },
+        }
+
+        encoded = serialization.dash_to_json(response)
+
+        assert json.loads(encoded) == json.loads(dash_utils.to_json(response))
+        assert metrics.get_stats("serialize.dash")["count"] == 1
+
+    def test_install_replaces_callback_encoder(self, monkeypatch):
+        """Installing swaps the encoder used for callback responses."""
+        callback_module = pytest.importorskip("dash._callback")
+        monkeypatch.setattr(callback_module, "to_json", callback_module.to_json)
+
+        assert serialization.install_dash_encoder()
+        assert callback_module.to_json is serialization.dash_to_json
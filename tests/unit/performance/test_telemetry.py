@@ -0,0 +1,62 @@
+"""Unit tests for runtime telemetry collection."""
+
+import pytest
+
+from performance import telemetry
+from performance.monitor import PerformanceMetrics
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """Provide an isolated metrics collector."""
+    instance = PerformanceMetrics()
+    monkeypatch.setattr(telemetry, "get_metrics", lambda: instance)
+    monkeypatch.setattr(telemetry, "_cache_layers", {})
+    monkeypatch.setattr(telemetry, "_snapshot", None)
+    return instance
+
+
+class TestTelemetry:
+    """Test suite for telemetry snapshots."""
+
+    def test_latency_grouped_by_prefix(self, metrics):
+        """Callback and endpoint timings are reported separately in milliseconds."""
+        metrics.record("callback.render_main_view", 0.02)
+        metrics.record("callback.render_main_view", 0.3)
+        metrics.record("api.GET /api/health", 0.004)
+        metrics.record("data_load", 0.5)
+
+        snapshot = telemetry.collect_telemetry(max_age=0)
+
+        view = snapshot["callbacks"]["render_main_view"]
+        assert view["count"] == 2
+        assert view["max_ms"] == pytest.approx(300)
+        assert sum(view["histogram"]) == 2
+        assert list(snapshot["endpoints"]) == ["GET /api/health"]
+        assert snapshot["worker"]["rss_mb"] >= 0
+
+    def test_summarize_latency(self, metrics):
+        """Overall p95 is bounded by the slowest recorded call."""
+        for _ in range(19):
+            metrics.record("callback.fast", 0.003)
+        metrics.record("callback.slow", 0.2)
+
+        summary = telemetry.summarize_latency(telemetry.get_latency_summary("callback."))
+        assert summary["count"] == 20
+        assert summary["p95_ms"] == 5
+        assert summary["max_ms"] == pytest.approx(200)
+
+    def test_cache_layers_report_and_clear(self, metrics):
+        """Registered layers report hit rates and are flushed together."""
+        cleared = []
+        telemetry.register_cache_layer(
+            "dataset", lambda: {"hits": 3, "misses": 1, "size": 4}, lambda: cleared.append(True)
+        )
+        telemetry.register_cache_layer("readonly", lambda: {"hits": 0, "misses": 0})
+
+        stats = telemetry.get_cache_layer_stats()
+        assert stats["dataset"]["hit_rate"] == 75
+        assert stats["readonly"]["size"] == 0
+
+        assert telemetry.clear_caches() == {"dataset": True, "readonly": False}
+        assert cleared == [True]
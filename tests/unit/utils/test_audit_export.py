@@ -0,0 +1,80 @@
+"""Tests for streaming audit log exports."""
+
+import csv
+import io
+import json
+
+import pyarrow.parquet as pq
+import pytest
+
+from utils.audit_export import encode_chunks
+from utils.audit_logger import AuditEntry, AuditEventType, AuditLogger
+
+
+def chunks(count: int = 5, size: int = 2):
+    rows = [
+        {
+            "id": str(i),
+            "timestamp": f"2025-01-01T00:00:0{i}",
+            "event_type": "api_call",
+            "action": f"action_{i}",
+            "user": "alice",
+            "severity": "info",
+            "correlation_id": str(i),
+            "details": {"status_code": 200, "path": "/api/x"},
+        }
+        for i in range(count)
+    ]
+    for start in range(0, count, size):
+        yield rows[start:start + size]
+
+
+class TestEncoders:
+    """Test that each format decodes to the full export."""
+
+    def test_json_array(self):
+        data = b"".join(encode_chunks(chunks(), "json"))
+
+        assert [row["action"] for row in json.loads(data)] == [f"action_{i}" for i in range(5)]
+        assert json.loads(b"".join(encode_chunks(iter([]), "json"))) == []
+
+    def test_ndjson_one_chunk_per_input_chunk(self):
+        parts = list(encode_chunks(chunks(), "ndjson"))
+
+        assert len(parts) == 3
+        assert len(b"".join(parts).splitlines()) == 5
+
+    def test_csv_details_as_json(self):
+        text = b"".join(encode_chunks(chunks(), "csv")).decode()
+
+        rows = list(csv.DictReader(io.StringIO(text)))
+        assert len(rows) == 5
+        assert json.loads(rows[0]["details"]) == {"status_code": 200, "path": "/api/x"}
+
+    def test_parquet_row_groups(self):
+        data = b"".join(encode_chunks(chunks(), "parquet"))
+
+        parquet = pq.ParquetFile(io.BytesIO(data))
+        assert parquet.metadata.num_row_groups == 3
+        assert parquet.read().column("action").to_pylist()[-1] == "action_4"
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            encode_chunks(chunks(), "xml")
+
+
+class TestLoggerExport:
+    """Test exports read from the audit store."""
+
+    def test_export_everything_in_order(self, tmp_path):
+        audit = AuditLogger(log_dir=str(tmp_path), max_memory_entries=3)
+        for i in range(12):
+            audit.log(AuditEntry(AuditEventType.CALCULATION, f"action_{i}", user="bob"))
+
+        path = audit.export_logs(str(tmp_path / "export.json"))
+        streamed = b"".join(audit.iter_export("ndjson", chunk_size=5))
+
+        actions = [row["action"] for row in json.loads(open(path).read())]
+        assert actions == [f"action_{i}" for i in range(12)]
+        assert len(streamed.splitlines()) == 12
+        audit.close()
@@ -0,0 +1,74 @@
+"""Tests for write-time audit rollups."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from utils.audit_logger import AuditEntry, AuditEventType, AuditLogger
+from utils.audit_rollups import AuditRollups
+
+NOW = datetime(2025, 3, 1, 12, 0)
+
+
+def api_call(endpoint: str, duration_ms: float, minutes_ago: float) -> AuditEntry:
+    entry = AuditEntry(
+        event_type=AuditEventType.API_CALL,
+        action=f"GET {endpoint}",
+        user="alice",
+        details={"endpoint": endpoint, "duration_ms": duration_ms},
+    )
+    entry.timestamp = NOW - timedelta(minutes=minutes_ago)
+    return entry
+
+
+class TestAuditRollups:
+    """Test bucketing, windows, percentiles and retention."""
+
+    def test_endpoint_percentiles_over_a_window(self):
+        rollups = AuditRollups()
+        rollups.add(api_call("/api/npv", float(ms), ms % 60) for ms in range(1, 101))
+        rollups.add([api_call("/api/irr", 5.0, 30), api_call("/api/npv", 999.0, 60 * 30)])
+
+        stats = rollups.summary("endpoint", timedelta(hours=24), now=NOW)
+
+        assert stats["/api/npv"]["count"] == 100
+        assert stats["/api/npv"]["p95_duration_ms"] == pytest.approx(95, rel=0.05)
+        assert stats["/api/npv"]["max_duration_ms"] == 100
+        assert stats["/api/irr"]["count"] == 1
+
+    def test_short_windows_use_minute_buckets(self):
+        rollups = AuditRollups()
+        rollups.add([api_call("/api/npv", 10.0, 2), api_call("/api/npv", 10.0, 50)])
+
+        stats = rollups.summary("endpoint", timedelta(minutes=10), now=NOW)
+
+        assert stats["/api/npv"]["count"] == 1
+
+    def test_old_buckets_are_pruned(self):
+        rollups = AuditRollups(minute_retention=5, hour_retention=2)
+        rollups.add(api_call("/api/npv", 1.0, 60 * hours) for hours in range(5))
+
+        assert len(rollups.timeseries("endpoint", "/api/npv", "hour")) == 2
+        assert rollups.summary("user", timedelta(days=7), now=NOW)["alice"]["count"] == 2
+
+    def test_unknown_dimension(self):
+        with pytest.raises(ValueError):
+            AuditRollups().summary("country")
+
+
+class TestCalculationRollups:
+    """Test the calculation rollup fed by the audit logger."""
+
+    def test_cache_hits_and_durations_per_type(self, tmp_path):
+        audit = AuditLogger(log_dir=str(tmp_path))
+        for i in range(4):
+            audit.log_calculation("npv", {}, 1.0, "bob", duration_ms=10.0, cache_hit=i % 2 == 0)
+        audit.flush()
+
+        stats = audit.rollup("calculation")["npv"]
+
+        assert stats["count"] == 4
+        assert stats["cache_hit_rate"] == 0.5
+        assert stats["avg_duration_ms"] == pytest.approx(10.0, rel=0.05)
+        assert audit.get_stats()["by_user"]["bob"]["count"] == 4
+        audit.close()
@@ -0,0 +1,64 @@
+"""Tests for the indexed audit store."""
+
+from datetime import datetime, timedelta
+
+from utils.audit_logger import AuditEntry, AuditEventType, AuditLogger, AuditSeverity
+from utils.audit_store import AuditStore
+
+
+def entries(count: int, start: datetime = datetime(2025, 1, 1)):
+    for i in range(count):
+        entry = AuditEntry(
+            event_type=AuditEventType.CALCULATION if i % 2 else AuditEventType.API_CALL,
+            action=f"action_{i}",
+            user=f"user_{i % 3}",
+            details={"duration_ms": i},
+            severity=AuditSeverity.ERROR if i % 5 == 0 else AuditSeverity.INFO,
+        )
+        entry.timestamp = start + timedelta(minutes=i)
+        yield entry
+
+
+class TestAuditStore:
+    """Test indexed queries and chunked iteration."""
+
+    def test_filters_and_newest_first(self, tmp_path):
+        store = AuditStore(tmp_path / "audit.db")
+        store.add(entry.to_dict() for entry in entries(30))
+
+        rows = store.query(user="user_1", event_type="calculation", limit=3)
+
+        assert [row["action"] for row in rows] == ["action_25", "action_19", "action_13"]
+        assert rows[0]["details"] == {"duration_ms": 25}
+        assert store.count(severity=AuditSeverity.ERROR) == 6
+        assert store.count(
+            start_time=datetime(2025, 1, 1, 0, 10), end_time=datetime(2025, 1, 1, 0, 19)
+        ) == 10
+
+    def test_iter_rows_pages_through_everything_in_order(self, tmp_path):
+        store = AuditStore(tmp_path / "audit.db")
+        store.add(entry.to_dict() for entry in entries(25))
+
+        chunks = list(store.iter_rows(chunk_size=10, user="user_0"))
+
+        assert [len(chunk) for chunk in chunks] == [9]
+        actions = [row["action"] for chunk in store.iter_rows(chunk_size=7) for row in chunk]
+        assert actions == [f"action_{i}" for i in range(25)]
+
+
+class TestAuditLoggerSearch:
+    """Test that search sees both stored and still-queued entries."""
+
+    def test_search_beyond_the_memory_buffer(self, tmp_path):
+        audit = AuditLogger(log_dir=str(tmp_path), max_memory_entries=5)
+        for entry in entries(20):
+            audit.log(entry)
+        audit.flush()
+
+        found = audit.search(user="user_2", limit=100)
+
+        assert len(found) == 6
+        assert found[0].action == "action_17" and found[-1].action == "action_2"
+        assert isinstance(found[0].timestamp, datetime)
+        assert audit.count(event_type=AuditEventType.CALCULATION) == 10
+        audit.close()
@@ -0,0 +1,126 @@
+"""Tests for the background audit log writer."""
+
+import json
+import threading
+
+from utils.audit_logger import AuditEntry, AuditEventType, AuditLogger, AuditSeverity
+from utils.audit_writer import AuditWriter, OverflowPolicy
+
+
+def entry(action: str = "GET /api/test", user: str = "alice") -> AuditEntry:
+    return AuditEntry(event_type=AuditEventType.API_CALL, action=action, user=user)
+
+
+def read_lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestAuditWriter:
+    """Test batching, rotation and overflow handling."""
+
+    def test_batches_reach_the_file_after_flush(self, tmp_path):
+        batches = []
+        writer = AuditWriter(
+            tmp_path, serialize=AuditEntry.to_json, batch_size=4, on_batch=batches.append
+        )
+
+        for i in range(10):
+            assert writer.submit(entry(f"action_{i}"))
+        assert writer.flush()
+
+        lines = read_lines(writer.current_file)
+        assert [line["action"] for line in lines] == [f"action_{i}" for i in range(10)]
+        assert sum(len(batch) for batch in batches) == 10
+        assert all(len(batch) <= 4 for batch in batches)
+        assert writer.get_stats()["written"] == 10
+        assert writer.get_stats()["fsyncs"] >= 1
+        writer.close()
+
+    def test_rotates_on_byte_count(self, tmp_path):
+        writer = AuditWriter(tmp_path, serialize=AuditEntry.to_json, rotation_bytes=500)
+
+        for _ in range(3):
+            for _ in range(3):
+                writer.submit(entry())
+            writer.flush()
+        writer.close()
+
+        assert writer.get_stats()["rotations"] >= 1
+        logs = list(tmp_path.glob("audit_*.log"))
+        assert len(logs) == writer.get_stats()["rotations"] + 1
+        assert sum(len(read_lines(path)) for path in logs) == 9
+
+    def test_drop_newest_when_full(self, tmp_path):
+        gate = threading.Event()
+        writer = AuditWriter(
+            tmp_path,
+            serialize=AuditEntry.to_json,
+            queue_size=3,
+            batch_size=1,
+            on_batch=lambda batch: gate.wait(5),
+        )
+
+        results = [writer.submit(entry(f"action_{i}")) for i in range(10)]
+        gate.set()
+        writer.flush()
+        writer.close()
+
+        assert not all(results)
+        assert writer.get_stats()["dropped"] == results.count(False)
+        assert len(read_lines(writer.current_file)) == results.count(True)
+
+    def test_drop_oldest_keeps_latest_entries(self, tmp_path):
+        gate = threading.Event()
+        writer = AuditWriter(
+            tmp_path,
+            serialize=AuditEntry.to_json,
+            queue_size=3,
+            batch_size=1,
+            overflow_policy=OverflowPolicy.DROP_OLDEST,
+            on_batch=lambda batch: gate.wait(5),
+        )
+
+        assert all(writer.submit(entry(f"action_{i}")) for i in range(10))
+        gate.set()
+        writer.flush()
+        writer.close()
+
+        actions = [line["action"] for line in read_lines(writer.current_file)]
+        assert actions[-3:] == ["action_7", "action_8", "action_9"]
+        assert writer.get_stats()["dropped"] == 10 - len(actions)
+
+    def test_block_waits_for_space(self, tmp_path):
+        writer = AuditWriter(
+            tmp_path,
+            serialize=AuditEntry.to_json,
+            queue_size=2,
+            batch_size=2,
+            overflow_policy="block",
+        )
+
+        assert all(writer.submit(entry()) for _ in range(20))
+        writer.flush()
+        writer.close()
+
+        assert len(read_lines(writer.current_file)) == 20
+        assert writer.get_stats()["dropped"] == 0
+
+
+class TestAuditLogger:
+    """Test the logger on top of the background writer."""
+
+    def test_stats_are_updated_by_the_writer(self, tmp_path):
+        audit = AuditLogger(log_dir=str(tmp_path), writer_options={"batch_size": 2})
+
+        audit.log(entry(user="alice"))
+        audit.log(entry(user="bob"))
+        audit.log_error("ValueError", "bad input", user="bob")
+        assert audit.flush()
+
+        stats = audit.get_stats()
+        assert stats["summary"]["total_entries"] == 3
+        assert stats["summary"]["entries_by_user"] == {"alice": 1, "bob": 2}
+        assert stats["summary"]["entries_by_severity"] == {"info": 2, "error": 1}
+        assert stats["writer"]["written"] == 3
+        assert len(audit.search(severity=AuditSeverity.ERROR)) == 1
+        audit.close()
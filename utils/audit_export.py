@@ -0,0 +1,137 @@
+"""Streaming encoders for audit log exports.
+
+Exports can span millions of entries, so nothing here builds the whole file:
+each encoder takes an iterator of row chunks (``AuditStore.iter_rows``) and
+yields encoded bytes one chunk at a time. Memory use depends on the chunk
+size, not the export size.
+"""
+
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+EXPORT_FIELDS = [
+    "id",
+    "timestamp",
+    "event_type",
+    "action",
+    "user",
+    "severity",
+    "correlation_id",
+    "details",
+]
+
+MEDIA_TYPES = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+Chunks = Iterable[List[Dict[str, Any]]]
+
+
+def _json_chunks(chunks: Chunks) -> Iterator[bytes]:
+    """A JSON array, written element by element."""
+    yield b"["
+    separator = b"\n"
+    for rows in chunks:
+        if rows:
+            body = ",\n".join(json.dumps(row, default=str) for row in rows)
+            yield separator + body.encode("utf-8")
+            separator = b",\n"
+    yield b"\n]\n"
+
+
+def _ndjson_chunks(chunks: Chunks) -> Iterator[bytes]:
+    for rows in chunks:
+        if rows:
+            yield "".join(json.dumps(row, default=str) + "\n" for row in rows).encode("utf-8")
+
+
+def _flat(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {**row, "details": json.dumps(row.get("details") or {}, default=str)}
+
+
+def _csv_chunks(chunks: Chunks) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    for rows in chunks:
+        writer.writerows(_flat(row) for row in rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file collecting what ParquetWriter writes between yields."""
+
+    def __init__(self):
+        self.parts: List[bytes] = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.parts.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def take(self) -> bytes:
+        data = b"".join(self.parts)
+        self.parts.clear()
+        return data
+
+
+def _parquet_chunks(chunks: Chunks) -> Iterator[bytes]:
+    """One row group per chunk, flushed as soon as it is encoded."""
+    schema = pa.schema([(name, pa.string()) for name in EXPORT_FIELDS])
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for rows in chunks:
+            if rows:
+                flat = [_flat(row) for row in rows]
+                columns = {name: [row.get(name) for row in flat] for name in EXPORT_FIELDS}
+                writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+                yield sink.take()
+    yield sink.take()
+
+
+_ENCODERS = {
+    "json": _json_chunks,
+    "ndjson": _ndjson_chunks,
+    "csv": _csv_chunks,
+    "parquet": _parquet_chunks,
+}
+
+
+def encode_chunks(chunks: Chunks, format: str = "ndjson") -> Iterator[bytes]:
+    """Encode row chunks into a byte stream.
+
+    Args:
+        chunks: Lists of entries as dictionaries
+        format: json, ndjson, csv or parquet
+
+    Raises:
+        ValueError: If the format is not supported
+        ImportError: For parquet without pyarrow
+    """
+    if format not in _ENCODERS:
+        raise ValueError(f"Unsupported export format: {format}")
+    if format == "parquet" and not PYARROW_AVAILABLE:
+        raise ImportError("Parquet export requires pyarrow")
+    return _ENCODERS[format](chunks)
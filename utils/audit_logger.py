@@ -5,16 +5,22 @@ API calls, and user actions for compliance and debugging.
 """
 
 import json
-import logging
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List
 from enum import Enum
 import threading
 from collections import deque
 import uuid
 import hashlib
 
+from config.settings import settings
+from .audit_export import encode_chunks
+from .audit_rollups import AuditRollups
+from .audit_store import AuditStore
+from .audit_writer import AuditWriter
+
 
 class AuditEventType(Enum):
     """Types of audit events."""
@@ -75,18 +81,51 @@ class AuditEntry:
     def to_json(self) -> str:
         """Convert to JSON string."""
         return json.dumps(self.to_dict(), default=str)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AuditEntry":
+        """Rebuild an entry from its dictionary form."""
+        entry = cls(
+            event_type=AuditEventType(data["event_type"]),
+            action=data["action"],
+            user=data.get("user"),
+            details=data.get("details"),
+            severity=AuditSeverity(data["severity"]),
+            correlation_id=data.get("correlation_id")
+        )
+        entry.id = data["id"]
+        entry.timestamp = datetime.fromisoformat(data["timestamp"])
+        return entry
 
 
 class AuditLogger:
-    """Main audit logging class."""
+    """Main audit logging class.
+
+    ``log`` only appends the entry to the in-memory buffer and the writer's
+    queue; serialization, file I/O, rotation and statistics run on the
+    writer thread (see ``utils.audit_writer``). The writer also fills the
+    indexed ``AuditStore`` that ``search`` and ``count`` query, and the
+    time-bucketed ``AuditRollups`` behind ``get_stats`` and ``rollup``.
+    """
     
     def __init__(
         self,
         log_dir: str = "audit_logs",
         max_memory_entries: int = 1000,
-        rotation_size_mb: int = 100
+        rotation_size_mb: int = 100,
+        writer_options: Optional[Dict[str, Any]] = None,
+        store_path: Optional[str] = None
     ):
-        """Initialize audit logger."""
+        """Initialize audit logger.
+
+        Args:
+            log_dir: Directory of the audit log files
+            max_memory_entries: Number of recent entries kept for search
+            rotation_size_mb: Rotate a log file once it reaches this size
+            writer_options: ``AuditWriter`` arguments overriding the settings
+            store_path: Database of the audit store, ``audit.db`` in
+                ``log_dir`` by default; unused if the store is disabled
+        """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
         
@@ -96,84 +135,108 @@ class AuditLogger:
         # In-memory buffer for recent entries
         self.memory_buffer = deque(maxlen=max_memory_entries)
         self.buffer_lock = threading.Lock()
+        self._capture = threading.local()
         
-        # Setup file logging
-        self.current_log_file = self._get_current_log_file()
-        self.file_logger = self._setup_file_logger()
-        
-        # Statistics
+        # Statistics, updated by the writer thread: lifetime totals by type
+        # and severity, windowed breakdowns from the rollups
         self.stats = {
             "total_entries": 0,
             "entries_by_type": {},
-            "entries_by_severity": {},
-            "entries_by_user": {}
+            "entries_by_severity": {}
         }
+        self.stats_lock = threading.Lock()
+        self.rollups = AuditRollups(
+            minute_retention=settings.AUDIT_ROLLUP_MINUTES,
+            hour_retention=settings.AUDIT_ROLLUP_HOURS
+        )
+        
+        # Indexed copy of the log for search
+        self.store = None
+        if settings.AUDIT_STORE_ENABLED:
+            self.store = AuditStore(Path(store_path) if store_path else self.log_dir / "audit.db")
+        
+        options = {
+            "queue_size": settings.AUDIT_QUEUE_SIZE,
+            "batch_size": settings.AUDIT_BATCH_SIZE,
+            "flush_interval": settings.AUDIT_FLUSH_INTERVAL,
+            "fsync_interval": settings.AUDIT_FSYNC_INTERVAL,
+            "overflow_policy": settings.AUDIT_OVERFLOW_POLICY,
+            **(writer_options or {})
+        }
+        self.writer = AuditWriter(
+            self.log_dir,
+            serialize=AuditEntry.to_json,
+            rotation_bytes=int(rotation_size_mb * 1024 * 1024),
+            on_batch=self._on_batch,
+            **options
+        )
         
-    def _get_current_log_file(self) -> Path:
+    @property
+    def current_log_file(self) -> Path:
         """Get current log file path."""
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        return self.log_dir / f"audit_{date_str}.log"
+        return self.writer.current_file
     
-    def _setup_file_logger(self) -> logging.Logger:
-        """Setup file logger."""
-        logger = logging.getLogger("audit_file_logger")
-        logger.setLevel(logging.INFO)
-        
-        # Remove existing handlers
-        logger.handlers = []
-        
-        # Add file handler
-        handler = logging.FileHandler(self.current_log_file, mode='a')
-        handler.setFormatter(logging.Formatter('%(message)s'))
-        logger.addHandler(handler)
-        
-        return logger
+    def _on_batch(self, entries: List[AuditEntry]):
+        """Record a batch the writer has written to the log file."""
+        self._update_stats(entries)
+        self.rollups.add(entries)
+        if self.store is not None:
+            self.store.add(entry.to_dict() for entry in entries)
     
-    def _rotate_log_if_needed(self):
-        """Check and rotate log file if it exceeds size limit."""
-        if self.current_log_file.exists():
-            size_mb = self.current_log_file.stat().st_size / (1024 * 1024)
-            if size_mb >= self.rotation_size_mb:
-                # Rotate file
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                new_name = self.current_log_file.stem + f"_{timestamp}.log"
-                self.current_log_file.rename(self.log_dir / new_name)
-                
-                # Setup new logger
-                self.current_log_file = self._get_current_log_file()
-                self.file_logger = self._setup_file_logger()
+    def _update_stats(self, entries: List[AuditEntry]):
+        """Update statistics with a written batch."""
+        with self.stats_lock:
+            self.stats["total_entries"] += len(entries)
+            by_type = self.stats["entries_by_type"]
+            by_severity = self.stats["entries_by_severity"]
+            for entry in entries:
+                event_type = entry.event_type.value
+                by_type[event_type] = by_type.get(event_type, 0) + 1
+                severity = entry.severity.value
+                by_severity[severity] = by_severity.get(severity, 0) + 1
     
-    def _update_stats(self, entry: AuditEntry):
-        """Update statistics."""
-        self.stats["total_entries"] += 1
-        
-        # By type
-        event_type = entry.event_type.value
-        self.stats["entries_by_type"][event_type] = \
-            self.stats["entries_by_type"].get(event_type, 0) + 1
-        
-        # By severity
-        severity = entry.severity.value
-        self.stats["entries_by_severity"][severity] = \
-            self.stats["entries_by_severity"].get(severity, 0) + 1
+    def log(self, entry: AuditEntry) -> bool:
+        """Log an audit entry.
+
+        Returns:
+            False if the writer's queue was full and the entry was dropped
+            from the log file
+        """
+        captured = getattr(self._capture, "entries", None)
+        if captured is not None:
+            captured.append(entry)
+            return True
         
-        # By user
-        user = entry.user
-        self.stats["entries_by_user"][user] = \
-            self.stats["entries_by_user"].get(user, 0) + 1
-    
-    def log(self, entry: AuditEntry):
-        """Log an audit entry."""
         # Add to memory buffer
         with self.buffer_lock:
             self.memory_buffer.append(entry)
         
-        # Write to file
-        self._rotate_log_if_needed()
-        self.file_logger.info(entry.to_json())
-        
-        # Update stats
-        self._update_stats(entry)
+        # Write to file in the background
+        return self.writer.submit(entry)
+    
+    @contextmanager
+    def capture(self) -> Iterator[List[AuditEntry]]:
+        """Collect the entries this thread logs instead of writing them.
+        
+        Worker processes use this to hand their entries back to the
+        process that owns the log files, which then logs them.
+        """
+        previous = getattr(self._capture, "entries", None)
+        self._capture.entries = entries = []
+        try:
+            yield entries
+        finally:
+            self._capture.entries = previous
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every logged entry is written and synced to disk."""
+        return self.writer.flush(timeout)
+    
+    def close(self):
+        """Write out pending entries and stop the writer."""
+        self.writer.close()
+        if self.store is not None:
+            self.store.close()
     
     def log_calculation(
         self,
@@ -384,7 +447,11 @@ class AuditLogger:
         severity: Optional[AuditSeverity] = None,
         limit: int = 100
     ) -> List[AuditEntry]:
-        """Search audit logs."""
+        """Search audit logs, newest entries first.
+
+        Entries still queued for the writer are found in the memory buffer,
+        older ones in the audit store.
+        """
         results = []
         
         # Search in memory buffer first
@@ -403,48 +470,134 @@ class AuditLogger:
                     
                 results.append(entry)
                 if len(results) >= limit:
-                    return results
+                    break
         
-        # If need more, search in files
-        # (Implementation would read from log files)
+        if self.store is None:
+            return results
         
-        return results
+        # Then in the store, which also holds most of the buffered entries
+        seen = {entry.id for entry in results}
+        rows = self.store.query(
+            limit=limit,
+            event_type=event_type,
+            user=user,
+            severity=severity,
+            start_time=start_time,
+            end_time=end_time
+        )
+        results.extend(AuditEntry.from_dict(row) for row in rows if row["id"] not in seen)
+        results.sort(key=lambda entry: entry.timestamp, reverse=True)
+        return results[:limit]
+    
+    def count(
+        self,
+        event_type: Optional[AuditEventType] = None,
+        user: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        severity: Optional[AuditSeverity] = None
+    ) -> int:
+        """Count entries matching the filters without loading them."""
+        filters = {
+            "event_type": event_type,
+            "user": user,
+            "start_time": start_time,
+            "end_time": end_time,
+            "severity": severity
+        }
+        if self.store is None:
+            return len(self.search(limit=self.max_memory_entries, **filters))
+        self.flush()
+        return self.store.count(**filters)
+    
+    def rollup(self, dimension: str, window: timedelta = timedelta(hours=24)) -> Dict[str, Dict]:
+        """Get counts, cache hits and ``duration_ms`` percentiles per value.
+
+        Args:
+            dimension: event_type, endpoint, user, severity or calculation
+            window: Trailing time window, rounded to whole minutes or hours
+        """
+        return self.rollups.summary(dimension, window)
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get audit statistics."""
+    def get_stats(self, window: timedelta = timedelta(hours=24)) -> Dict[str, Any]:
+        """Get audit statistics.
+
+        Lifetime totals are under ``summary``; ``window`` breakdowns by
+        event type, endpoint, user and severity come from the rollups.
+        """
+        with self.stats_lock:
+            summary = {
+                key: dict(value) if isinstance(value, dict) else value
+                for key, value in self.stats.items()
+            }
+        by_user = self.rollup("user", window)
+        summary["entries_by_user"] = {user: row["count"] for user, row in by_user.items()}
         return {
-            "summary": self.stats,
+            "summary": summary,
+            "window_hours": window.total_seconds() / 3600,
+            "by_event_type": self.rollup("event_type", window),
+            "by_endpoint": self.rollup("endpoint", window),
+            "by_severity": self.rollup("severity", window),
+            "by_user": by_user,
             "recent_entries": len(self.memory_buffer),
-            "log_files": len(list(self.log_dir.glob("*.log")))
+            "log_files": len(list(self.log_dir.glob("*.log"))),
+            "writer": self.writer.get_stats()
         }
     
+    def iter_rows(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 1000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield matching entries as dictionaries, oldest first, in chunks.
+
+        Args:
+            filters: ``search`` keyword arguments other than ``limit``
+            chunk_size: Entries per chunk
+        """
+        filters = {key: value for key, value in (filters or {}).items() if key != "limit"}
+        if self.store is not None:
+            self.flush()
+            yield from self.store.iter_rows(chunk_size=chunk_size, **filters)
+            return
+        
+        entries = self.search(limit=self.max_memory_entries, **filters)
+        rows = [entry.to_dict() for entry in reversed(entries)]
+        for start in range(0, len(rows), chunk_size):
+            yield rows[start:start + chunk_size]
+    
+    def iter_export(
+        self,
+        format: str = "ndjson",
+        filters: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 1000
+    ) -> Iterator[bytes]:
+        """Stream an export of the matching entries as encoded bytes.
+
+        Args:
+            format: json, ndjson, csv or parquet
+            filters: ``search`` keyword arguments other than ``limit``
+            chunk_size: Entries read from the store per chunk
+
+        Raises:
+            ValueError: If the format is not supported
+            ImportError: For parquet without pyarrow
+        """
+        return encode_chunks(self.iter_rows(filters, chunk_size), format)
+    
     def export_logs(
         self,
         output_file: str,
         format: str = "json",
         filters: Optional[Dict[str, Any]] = None
     ) -> str:
-        """Export audit logs to file."""
-        entries = self.search(**filters) if filters else list(self.memory_buffer)
-        
+        """Export audit logs to file, writing one chunk at a time."""
         output_path = Path(output_file)
+        chunks = self.iter_export(format, filters)
         
-        if format == "json":
-            with open(output_path, 'w') as f:
-                json.dump(
-                    [entry.to_dict() for entry in entries],
-                    f,
-                    indent=2,
-                    default=str
-                )
-        elif format == "csv":
-            import csv
-            with open(output_path, 'w', newline='') as f:
-                if entries:
-                    writer = csv.DictWriter(f, fieldnames=entries[0].to_dict().keys())
-                    writer.writeheader()
-                    for entry in entries:
-                        writer.writerow(entry.to_dict())
+        with open(output_path, 'wb') as f:
+            for data in chunks:
+                f.write(data)
         
         return str(output_path)
 
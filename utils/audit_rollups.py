@@ -0,0 +1,236 @@
+"""Incremental rollups of audit entries.
+
+Audit statistics used to be recomputed from raw entries on every request.
+``AuditRollups`` instead updates per-minute and per-hour buckets as the audit
+writer records each batch, keyed by dimension (event type, endpoint, user,
+severity, calculation type) and value. Each bucket holds a count, cache hits
+and a sparse latency sketch of ``duration_ms``, so a question like "p95
+latency per endpoint over the last 24 hours" merges at most 24 hourly buckets
+per endpoint, whatever the traffic.
+
+Minute buckets are kept for ``minute_retention`` minutes and hour buckets
+for ``hour_retention`` hours; older buckets are pruned as new ones open.
+Rollups live in the process that writes the entries and start empty.
+"""
+
+import threading
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from performance.monitor import LatencyHistogram
+
+DIMENSIONS = ("event_type", "endpoint", "user", "severity", "calculation")
+
+RESOLUTIONS = {"minute": 60, "hour": 3600}
+
+_PERCENTILES = [50, 95, 99]
+
+
+class LatencySketch:
+    """Sparse ``LatencyHistogram``: only buckets that were hit are stored."""
+
+    __slots__ = ("counts", "count", "sum_ns", "min_ns", "max_ns")
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.sum_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record_ms(self, duration_ms: float) -> None:
+        value_ns = int(duration_ms * 1_000_000)
+        index = LatencyHistogram.bucket_index(value_ns)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        if self.count == 0 or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        self.count += 1
+        self.sum_ns += value_ns
+
+    def merge_into(self, histogram: LatencyHistogram) -> None:
+        """Add these measurements to a dense histogram."""
+        if self.count == 0:
+            return
+        for index, count in self.counts.items():
+            histogram.counts[index] += count
+        histogram.min_ns = self.min_ns if histogram.count == 0 else min(
+            histogram.min_ns, self.min_ns
+        )
+        histogram.max_ns = max(histogram.max_ns, self.max_ns)
+        histogram.count += self.count
+        histogram.sum_ns += self.sum_ns
+
+
+class RollupCell:
+    """Aggregates of one dimension value over one time bucket."""
+
+    __slots__ = ("count", "cache_hits", "latency")
+
+    def __init__(self):
+        self.count = 0
+        self.cache_hits = 0
+        self.latency = LatencySketch()
+
+
+def _epoch(timestamp: datetime) -> int:
+    """Seconds since the epoch of a naive UTC (or aware) timestamp."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp())
+
+
+def _dimension_values(entry: Any) -> Iterable[Tuple[str, str]]:
+    yield "event_type", entry.event_type.value
+    yield "severity", entry.severity.value
+    yield "user", entry.user
+    details = entry.details
+    if details.get("endpoint"):
+        yield "endpoint", details["endpoint"]
+    if details.get("calculation_type"):
+        yield "calculation", details["calculation_type"]
+
+
+class AuditRollups:
+    """Time-bucketed aggregates of audit entries, maintained at write time."""
+
+    def __init__(self, minute_retention: int = 120, hour_retention: int = 168):
+        """Initialize empty rollups.
+
+        Args:
+            minute_retention: Number of minute buckets kept
+            hour_retention: Number of hour buckets kept
+        """
+        self.retention = {"minute": minute_retention, "hour": hour_retention}
+        # resolution -> bucket start (epoch seconds) -> dimension -> value -> cell
+        self._buckets: Dict[str, Dict[int, Dict[str, Dict[str, RollupCell]]]] = {
+            resolution: {} for resolution in RESOLUTIONS
+        }
+        self._order: Dict[str, Deque[int]] = {resolution: deque() for resolution in RESOLUTIONS}
+        self._lock = threading.Lock()
+
+    def _bucket(self, resolution: str, start: int) -> Dict[str, Dict[str, RollupCell]]:
+        buckets = self._buckets[resolution]
+        cells = buckets.get(start)
+        if cells is None:
+            cells = buckets[start] = {dimension: {} for dimension in DIMENSIONS}
+            order = self._order[resolution]
+            order.append(start)
+            if len(order) > 1 and order[-2] > start:
+                # Entries from an earlier bucket arrived late
+                order = self._order[resolution] = deque(sorted(order))
+            while len(order) > self.retention[resolution]:
+                del buckets[order.popleft()]
+        return cells
+
+    def add(self, entries: Iterable[Any]) -> None:
+        """Fold a batch of ``AuditEntry`` objects into the rollups."""
+        with self._lock:
+            for entry in entries:
+                epoch = _epoch(entry.timestamp)
+                duration_ms = entry.details.get("duration_ms")
+                cache_hit = bool(entry.details.get("cache_hit"))
+                for resolution, seconds in RESOLUTIONS.items():
+                    cells = self._bucket(resolution, epoch - epoch % seconds)
+                    for dimension, value in _dimension_values(entry):
+                        cell = cells[dimension].get(value)
+                        if cell is None:
+                            cell = cells[dimension][value] = RollupCell()
+                        cell.count += 1
+                        cell.cache_hits += cache_hit
+                        if isinstance(duration_ms, (int, float)):
+                            cell.latency.record_ms(duration_ms)
+
+    def _resolution_for(self, window: timedelta) -> str:
+        minutes = window.total_seconds() / RESOLUTIONS["minute"]
+        return "minute" if minutes <= self.retention["minute"] else "hour"
+
+    def summary(
+        self,
+        dimension: str,
+        window: timedelta = timedelta(hours=24),
+        now: Optional[datetime] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Aggregate a dimension over a trailing time window.
+
+        The window is rounded out to whole buckets: minutes for windows
+        within the minute retention, hours otherwise.
+
+        Args:
+            dimension: One of ``DIMENSIONS``
+            window: Length of the window ending at ``now``
+            now: End of the window, UTC; defaults to the current time
+
+        Returns:
+            Per dimension value: count, cache hits and rate, and average,
+            p50, p95, p99 and maximum ``duration_ms`` where recorded
+        """
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown rollup dimension: {dimension}")
+        resolution = self._resolution_for(window)
+        seconds = RESOLUTIONS[resolution]
+        end = _epoch(now or datetime.now(timezone.utc))
+        start = end - int(window.total_seconds())
+        start -= start % seconds
+
+        totals: Dict[str, Tuple[int, int, Optional[LatencyHistogram]]] = {}
+        with self._lock:
+            for bucket_start, cells in self._buckets[resolution].items():
+                if not start <= bucket_start <= end:
+                    continue
+                for value, cell in cells[dimension].items():
+                    count, hits, histogram = totals.get(value, (0, 0, None))
+                    if cell.latency.count:
+                        histogram = histogram or LatencyHistogram()
+                        cell.latency.merge_into(histogram)
+                    totals[value] = (count + cell.count, hits + cell.cache_hits, histogram)
+
+        return {
+            value: self._describe(count, hits, histogram)
+            for value, (count, hits, histogram) in totals.items()
+        }
+
+    @staticmethod
+    def _describe(count: int, hits: int, histogram: Optional[LatencyHistogram]) -> Dict:
+        result = {
+            "count": count,
+            "cache_hits": hits,
+            "cache_hit_rate": hits / count if count else 0.0,
+        }
+        if histogram is not None and histogram.count:
+            p50, p95, p99 = histogram.percentiles(_PERCENTILES)
+            result.update(
+                {
+                    "total_duration_ms": histogram.sum_ns / 1e6,
+                    "avg_duration_ms": histogram.sum_ns / histogram.count / 1e6,
+                    "p50_duration_ms": p50 / 1e6,
+                    "p95_duration_ms": p95 / 1e6,
+                    "p99_duration_ms": p99 / 1e6,
+                    "max_duration_ms": histogram.max_ns / 1e6,
+                }
+            )
+        return result
+
+    def timeseries(
+        self, dimension: str, value: str, resolution: str = "hour"
+    ) -> List[Dict[str, Any]]:
+        """Get the retained buckets of one dimension value, oldest first."""
+        with self._lock:
+            rows = []
+            for bucket_start in sorted(self._buckets[resolution]):
+                cell = self._buckets[resolution][bucket_start][dimension].get(value)
+                if cell is None:
+                    continue
+                histogram = None
+                if cell.latency.count:
+                    histogram = LatencyHistogram()
+                    cell.latency.merge_into(histogram)
+                rows.append(
+                    {
+                        "start": datetime.fromtimestamp(bucket_start, timezone.utc).isoformat(),
+                        **self._describe(cell.count, cell.cache_hits, histogram),
+                    }
+                )
+        return rows
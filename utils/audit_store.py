@@ -0,0 +1,173 @@
+"""Persistent, indexed store of audit entries.
+
+The audit log files are append-only JSON lines: good for retention, useless
+for queries. The store keeps the same entries in an embedded SQLite table,
+filled by the audit writer thread one transaction per batch, with indexes on
+time and on user, event type and severity (each paired with time). Range and
+per-user queries over months of entries are index lookups, and ``iter_rows``
+pages through large results with keyset pagination so exports never hold
+more than one chunk in memory.
+
+Readers and the writer use separate connections (one per thread); the
+database runs in WAL mode so queries do not block the writer.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS audit_entries (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    action TEXT,
+    user TEXT,
+    severity TEXT NOT NULL,
+    correlation_id TEXT,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_audit_time ON audit_entries (timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_user ON audit_entries (user, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_type ON audit_entries (event_type, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_severity ON audit_entries (severity, timestamp);
+"""
+
+_COLUMNS = ("id", "timestamp", "event_type", "action", "user", "severity", "correlation_id")
+
+
+def _time_key(value: Any) -> str:
+    """Format a query bound like the stored ISO timestamps."""
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+class AuditStore:
+    """SQLite table of audit entries, indexed for time, user, type and severity."""
+
+    def __init__(self, path: Path):
+        """Open (creating if needed) the store at ``path``."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, reopened after a fork."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def add(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """Insert entries (``AuditEntry.to_dict()`` output) in one transaction.
+
+        Returns:
+            Number of entries inserted
+        """
+        rows = [
+            tuple(entry.get(column) for column in _COLUMNS)
+            + (json.dumps(entry.get("details") or {}, default=str),)
+            for entry in entries
+        ]
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT INTO audit_entries "
+                "(id, timestamp, event_type, action, user, severity, correlation_id, details) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    @staticmethod
+    def _where(
+        event_type: Optional[str] = None,
+        user: Optional[str] = None,
+        severity: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        for column, value in (("event_type", event_type), ("user", user), ("severity", severity)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(getattr(value, "value", value))
+        if start_time is not None:
+            clauses.append("timestamp >= ?")
+            params.append(_time_key(start_time))
+        if end_time is not None:
+            clauses.append("timestamp <= ?")
+            params.append(_time_key(end_time))
+        return " AND ".join(clauses) or "1", params
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        entry = {column: row[column] for column in _COLUMNS}
+        entry["details"] = json.loads(row["details"]) if row["details"] else {}
+        return entry
+
+    def query(self, limit: Optional[int] = 100, **filters) -> List[Dict[str, Any]]:
+        """Get the newest entries matching the filters.
+
+        Args:
+            limit: Maximum number of entries; None for all
+            **filters: event_type, user, severity, start_time, end_time
+
+        Returns:
+            Entries as dictionaries, newest first
+        """
+        where, params = self._where(**filters)
+        sql = f"SELECT * FROM audit_entries WHERE {where} ORDER BY timestamp DESC, seq DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        rows = self._connection().execute(sql, params).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def count(self, **filters) -> int:
+        """Count the entries matching the filters."""
+        where, params = self._where(**filters)
+        sql = f"SELECT COUNT(*) FROM audit_entries WHERE {where}"
+        return self._connection().execute(sql, params).fetchone()[0]
+
+    def iter_rows(self, chunk_size: int = 1000, **filters) -> Iterator[List[Dict[str, Any]]]:
+        """Yield matching entries oldest first, one chunk at a time.
+
+        Pages by ``(timestamp, seq)`` so each chunk is an index range scan,
+        not an ever-growing OFFSET.
+        """
+        where, params = self._where(**filters)
+        sql = (
+            f"SELECT * FROM audit_entries WHERE {where} AND (timestamp, seq) > (?, ?) "
+            "ORDER BY timestamp, seq LIMIT ?"
+        )
+        after = ("", 0)
+        while True:
+            # Streaming responses may resume the generator on another thread
+            rows = self._connection().execute(sql, [*params, *after, chunk_size]).fetchall()
+            if not rows:
+                return
+            after = (rows[-1]["timestamp"], rows[-1]["seq"])
+            yield [self._to_dict(row) for row in rows]
+            if len(rows) < chunk_size:
+                return
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,338 @@
+"""Background writer for the audit log.
+
+``AuditLogger.log`` runs on request threads, on every API call and every
+permission check. The writer keeps disk work off that path: callers append
+the entry to a bounded in-memory queue and return. A daemon thread drains the
+queue in batches, serializes the entries and appends them to the log file
+through one buffered file object.
+
+- The queue is a ``collections.deque``. Its ``append`` and ``popleft`` are
+  atomic, so producers never take a lock.
+- Files are fsynced at most every ``fsync_interval`` seconds, and on
+  ``flush`` and ``close``.
+- Rotation is decided from a running byte count; the file is only stat'ed
+  when it is opened.
+- When the queue is full, the ``OverflowPolicy`` decides whether the new
+  entry is dropped, the oldest queued entry is dropped, or the caller
+  blocks for a bounded time.
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Live writers, closed at exit and reset in forked children
+_writers: "weakref.WeakSet[AuditWriter]" = weakref.WeakSet()
+
+
+class OverflowPolicy(Enum):
+    """What ``AuditWriter.submit`` does when the queue is full."""
+
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+    BLOCK = "block"
+
+
+class AuditWriter:
+    """Batches audit entries onto disk from a background thread."""
+
+    def __init__(
+        self,
+        log_dir: Path,
+        serialize: Callable[[Any], str],
+        rotation_bytes: int = 100 * 1024 * 1024,
+        queue_size: int = 10000,
+        batch_size: int = 256,
+        flush_interval: float = 0.2,
+        fsync_interval: float = 1.0,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_NEWEST,
+        block_timeout: float = 1.0,
+        on_batch: Optional[Callable[[List[Any]], None]] = None,
+    ):
+        """Initialize the writer; its thread starts on the first entry.
+
+        Args:
+            log_dir: Directory of the daily ``audit_<date>.log`` files
+            serialize: Turns an entry into one line of text
+            rotation_bytes: Rotate the current file once it reaches this size
+            queue_size: Maximum number of entries waiting to be written
+            batch_size: Maximum number of entries written per batch
+            flush_interval: Seconds the writer sleeps between idle checks
+            fsync_interval: Minimum seconds between fsyncs
+            overflow_policy: Behaviour when the queue is full
+            block_timeout: Longest a caller blocks under ``BLOCK`` before
+                the entry is dropped
+            on_batch: Called on the writer thread with each written batch
+        """
+        self.log_dir = Path(log_dir)
+        self.serialize = serialize
+        self.rotation_bytes = rotation_bytes
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.block_timeout = block_timeout
+        self.on_batch = on_batch
+
+        self._start_lock = threading.Lock()
+        self._drop_lock = threading.Lock()
+        self._reset()
+        _writers.add(self)
+
+    def _reset(self) -> None:
+        """Set up an idle writer with an empty queue."""
+        self._queue: deque = deque()
+        self._wakeup = threading.Event()
+        self._space = threading.Event()
+        self._progress = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._busy = False
+        self._sync_requested = False
+
+        self._file = None
+        self._file_path: Optional[Path] = None
+        self._file_date: Optional[str] = None
+        self._file_bytes = 0
+        self._unsynced = False
+        self._last_sync = time.monotonic()
+
+        self.stats = {
+            "written": 0,
+            "batches": 0,
+            "dropped": 0,
+            "bytes_written": 0,
+            "fsyncs": 0,
+            "rotations": 0,
+            "errors": 0,
+            "max_queue_depth": 0,
+        }
+
+    @property
+    def current_file(self) -> Path:
+        """Path of the file entries are appended to."""
+        return self._file_path or self._path_for(datetime.now().strftime("%Y-%m-%d"))
+
+    def _path_for(self, date_str: str) -> Path:
+        return self.log_dir / f"audit_{date_str}.log"
+
+    def submit(self, entry: Any) -> bool:
+        """Queue an entry for writing.
+
+        Returns:
+            False if the entry was dropped because the queue was full
+        """
+        if self._thread is None:
+            self._start()
+        if len(self._queue) >= self.queue_size and not self._make_room():
+            self._count_drop()
+            return False
+        self._queue.append(entry)
+        if len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def _make_room(self) -> bool:
+        """Apply the overflow policy; True if the entry may be queued."""
+        if self.overflow_policy is OverflowPolicy.DROP_OLDEST:
+            try:
+                self._queue.popleft()
+                self._count_drop()
+            except IndexError:
+                pass
+            return True
+        if self.overflow_policy is OverflowPolicy.BLOCK:
+            deadline = time.monotonic() + self.block_timeout
+            while len(self._queue) >= self.queue_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._space.clear()
+                self._wakeup.set()
+                self._space.wait(remaining)
+            return True
+        return False
+
+    def _count_drop(self) -> None:
+        with self._drop_lock:
+            self.stats["dropped"] += 1
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._drain()
+        self._drain()
+        self._close_file()
+
+    def _drain(self) -> None:
+        """Write out everything queued, then sync if due or requested."""
+        self._busy = True
+        try:
+            depth = len(self._queue)
+            if depth > self.stats["max_queue_depth"]:
+                self.stats["max_queue_depth"] = depth
+            while self._queue:
+                batch = []
+                try:
+                    while len(batch) < self.batch_size:
+                        batch.append(self._queue.popleft())
+                except IndexError:
+                    pass
+                self._write_batch(batch)
+                self._space.set()
+
+            now = time.monotonic()
+            if self._unsynced and (
+                self._sync_requested or now - self._last_sync >= self.fsync_interval
+            ):
+                self._sync()
+        finally:
+            with self._progress:
+                self._busy = False
+                if not self._unsynced:
+                    self._sync_requested = False
+                self._progress.notify_all()
+
+    def _write_batch(self, batch: List[Any]) -> None:
+        lines = []
+        for entry in batch:
+            try:
+                lines.append(self.serialize(entry))
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"Could not serialize audit entry: {e}")
+        data = ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+
+        try:
+            self._ensure_file()
+            self._file.write(data)
+        except OSError as e:
+            self.stats["errors"] += 1
+            logger.error(f"Could not write {len(lines)} audit entries: {e}")
+            return
+
+        self._file_bytes += len(data)
+        self._unsynced = True
+        self.stats["written"] += len(lines)
+        self.stats["batches"] += 1
+        self.stats["bytes_written"] += len(data)
+
+        if self.on_batch is not None:
+            try:
+                self.on_batch(batch)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"Audit batch callback failed: {e}")
+
+    def _ensure_file(self) -> None:
+        """Open today's file, rotating on date change or size."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        if self._file is not None and today != self._file_date:
+            self._close_file()
+        if self._file is not None and self._file_bytes >= self.rotation_bytes:
+            self._close_file()
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            self._file_path.rename(self.log_dir / f"{self._file_path.stem}_{stamp}.log")
+            self.stats["rotations"] += 1
+        if self._file is None:
+            self._file_path = self._path_for(today)
+            self._file_date = today
+            self._file = open(self._file_path, "ab", buffering=1 << 16)
+            self._file_bytes = os.fstat(self._file.fileno()).st_size
+
+    def _sync(self) -> None:
+        if self._file is None:
+            return
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.stats["fsyncs"] += 1
+        except OSError as e:
+            self.stats["errors"] += 1
+            logger.error(f"Could not sync audit log: {e}")
+        self._unsynced = False
+        self._last_sync = time.monotonic()
+
+    def _close_file(self) -> None:
+        if self._file is None:
+            return
+        if self._unsynced:
+            self._sync()
+        self._file.close()
+        self._file = None
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Write and fsync every entry submitted so far.
+
+        Returns:
+            False if the writer did not catch up within ``timeout``
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return not self._queue
+        deadline = time.monotonic() + timeout
+        with self._progress:
+            self._sync_requested = True
+            while self._queue or self._busy or self._sync_requested:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._wakeup.set()
+                self._progress.wait(min(remaining, self.flush_interval))
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write out the queue, sync and close the file, and stop the thread."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer counters and the current queue depth."""
+        return {
+            **self.stats,
+            "queued": len(self._queue),
+            "queue_size": self.queue_size,
+            "overflow_policy": self.overflow_policy.value,
+            "current_file": str(self.current_file),
+        }
+
+
+def _close_all() -> None:
+    for writer in list(_writers):
+        writer.close()
+
+
+def _reset_after_fork() -> None:
+    # The writer thread does not survive fork; children start their own
+    for writer in list(_writers):
+        writer._reset()
+        writer._start_lock = threading.Lock()
+        writer._drop_lock = threading.Lock()
+
+
+atexit.register(_close_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
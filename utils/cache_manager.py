@@ -7,15 +7,21 @@ to improve performance for expensive calculations.
 import functools
 import hashlib
 import json
+import threading
 import time
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
 import logging
 
+from performance.telemetry import register_cache_layer
+
 logger = logging.getLogger(__name__)
 
 
 class CacheManager:
-    """Simple in-memory cache manager with TTL support."""
+    """Simple in-memory cache manager with TTL support.
+    
+    Keys are usually made with ``_make_key`` but may be any hashable value.
+    """
     
     def __init__(self, max_size: int = 1000, default_ttl: int = 3600):
         """Initialize cache manager.
@@ -24,11 +30,12 @@ class CacheManager:
             max_size: Maximum number of items to store in cache
             default_ttl: Default time-to-live in seconds
         """
-        self.cache: Dict[str, Tuple[Any, float]] = {}
+        self.cache: Dict[Hashable, Tuple[Any, float]] = {}
         self.max_size = max_size
         self.default_ttl = default_ttl
         self.hits = 0
         self.misses = 0
+        self._lock = threading.Lock()
         
     def _make_key(self, func_name: str, args: tuple, kwargs: dict) -> str:
         """Create a cache key from function name and arguments."""
@@ -42,36 +49,39 @@ class CacheManager:
         # Create a hash for the key
         return hashlib.sha256(key_str.encode()).hexdigest()
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """Get value from cache if it exists and is not expired."""
-        if key in self.cache:
-            value, timestamp = self.cache[key]
-            if time.time() - timestamp < self.default_ttl:
-                self.hits += 1
-                return value
-            else:
-                # Expired, remove from cache
-                del self.cache[key]
-        
-        self.misses += 1
-        return None
+        with self._lock:
+            if key in self.cache:
+                value, timestamp = self.cache[key]
+                if time.time() - timestamp < self.default_ttl:
+                    self.hits += 1
+                    return value
+                else:
+                    # Expired, remove from cache
+                    del self.cache[key]
+            
+            self.misses += 1
+            return None
     
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: Hashable, value: Any) -> None:
         """Set value in cache with current timestamp."""
-        # Check cache size and evict oldest if necessary
-        if len(self.cache) >= self.max_size:
-            # Simple eviction: remove oldest entry
-            oldest_key = min(self.cache.keys(), 
-                           key=lambda k: self.cache[k][1])
-            del self.cache[oldest_key]
-        
-        self.cache[key] = (value, time.time())
+        with self._lock:
+            # Check cache size and evict oldest if necessary
+            if key in self.cache:
+                del self.cache[key]
+            elif len(self.cache) >= self.max_size:
+                # Entries are kept in insertion order, so the first is the oldest
+                del self.cache[next(iter(self.cache))]
+
+            self.cache[key] = (value, time.time())
     
     def clear(self) -> None:
         """Clear all cached values."""
-        self.cache.clear()
-        self.hits = 0
-        self.misses = 0
+        with self._lock:
+            self.cache.clear()
+            self.hits = 0
+            self.misses = 0
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
@@ -90,6 +100,8 @@ class CacheManager:
 # Global cache instances
 calculation_cache = CacheManager(max_size=500, default_ttl=1800)  # 30 minutes
 monte_carlo_cache = CacheManager(max_size=100, default_ttl=3600)  # 1 hour
+# Rows of the batch endpoints, sized to hold a repeated maximum-size batch
+batch_cache = CacheManager(max_size=100000, default_ttl=1800)  # 30 minutes
 
 
 def cache_financial_calculation(ttl: Optional[int] = None):
@@ -158,6 +170,7 @@ def clear_all_caches():
     """Clear all cache instances."""
     calculation_cache.clear()
     monte_carlo_cache.clear()
+    batch_cache.clear()
     logger.info("All caches cleared")
 
 
@@ -165,5 +178,12 @@ def get_cache_statistics() -> Dict[str, Dict[str, Any]]:
     """Get statistics for all cache instances."""
     return {
         'calculation_cache': calculation_cache.get_stats(),
-        'monte_carlo_cache': monte_carlo_cache.get_stats()
-    }
\ No newline at end of file
+        'monte_carlo_cache': monte_carlo_cache.get_stats(),
+        'batch_cache': batch_cache.get_stats()
+    }
+
+
+# Report the calculation caches in the unified performance telemetry
+register_cache_layer("calculation", calculation_cache.get_stats, calculation_cache.clear)
+register_cache_layer("monte_carlo", monte_carlo_cache.get_stats, monte_carlo_cache.clear)
+register_cache_layer("batch", batch_cache.get_stats, batch_cache.clear)